@@ -2,12 +2,15 @@
 import discord
 import os
 import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import numpy as np
 import io
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers, ProfitData, ServerProfit
+from Cogs.utils.mongo import Users, Servers, ServerProfit, usernames, profit_charts
+from Cogs.utils.user_cache import user_cache
+from Cogs.utils.http_client import http
+from Cogs.utils.render_service import render_service
+from Cogs.utils.edit_scheduler import edits
+from Cogs.utils.settlement import settlement
+from Cogs.games.limbo import roll_meter
 from Cogs.utils.emojis import emoji
 
 class AdminCommands(commands.Cog):
@@ -16,9 +19,6 @@ class AdminCommands(commands.Cog):
         self.admin_ids = self.load_admin_ids()
         self.blacklisted_ids = self.load_blacklisted_ids()
         
-        # Set default matplotlib style
-        plt.style.use('dark_background')
-        
         # Add command check for blacklisted users
         self.bot.add_check(self.check_blacklist)
 
@@ -96,7 +96,7 @@ class AdminCommands(commands.Cog):
         
         # Get the user's current balance
         db = Users()
-        user_data = db.fetch_user(user.id)
+        user_data = await db.fetch_user(user.id)
         
         # If user doesn't exist, register them
         if not user_data:
@@ -104,8 +104,8 @@ class AdminCommands(commands.Cog):
                    "total_deposit_amount": 0, "total_withdraw_amount": 0, "total_spent": 0, 
                    "total_earned": 0, 'total_played': 0, 'total_won': 0, 'total_lost': 0,
                    "primary_coin": "BTC", "wallet": {"BTC": 0, "SOL": 0, "ETH": 0, "LTC": 0, "USDT": 0}}
-            db.register_new_user(dump)
-            user_data = db.fetch_user(user.id)
+            await db.register_new_user(dump)
+            user_data = await db.fetch_user(user.id)
         
         # Get current balance and primary coin
         current_points = user_data.get("points", 0)
@@ -119,7 +119,7 @@ class AdminCommands(commands.Cog):
             new_balance = 0
             
         # Update points balance
-        db.update_balance(user.id, new_balance, "points", "$set")
+        await db.update_balance(user.id, new_balance, "points", "$set")
         
         # Also update the wallet for the primary coin
         crypto_values = {
@@ -134,7 +134,7 @@ class AdminCommands(commands.Cog):
         crypto_amount = new_balance * crypto_values[primary_coin]
         
         # Update wallet
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": user.id},
             {"$set": {f"wallet.{primary_coin}": crypto_amount}}
         )
@@ -157,7 +157,7 @@ class AdminCommands(commands.Cog):
             "admin_id": ctx.author.id
         }
         
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": user.id},
             {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}  # Keep last 100 entries
         )
@@ -193,7 +193,7 @@ class AdminCommands(commands.Cog):
         
         # Get server data from database
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
         
         if not server_data:
             embed = discord.Embed(
@@ -217,7 +217,7 @@ class AdminCommands(commands.Cog):
         server_admins.append(user.id)
         
         # Update database
-        db.collection.update_one(
+        await db.collection.update_one(
             {"server_id": ctx.guild.id},
             {"$set": {"server_admins": server_admins}}
         )
@@ -250,7 +250,7 @@ class AdminCommands(commands.Cog):
         # If server_id is provided, get that server's admins
         if server_id:
             db = Servers()
-            server_data = db.fetch_server(server_id)
+            server_data = await db.fetch_server(server_id)
             
             if not server_data:
                 embed = discord.Embed(
@@ -325,7 +325,7 @@ class AdminCommands(commands.Cog):
         
         # Get server data from database
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
         
         if not server_data:
             embed = discord.Embed(
@@ -349,7 +349,7 @@ class AdminCommands(commands.Cog):
         server_admins.remove(user.id)
         
         # Update database
-        db.collection.update_one(
+        await db.collection.update_one(
             {"server_id": ctx.guild.id},
             {"$set": {"server_admins": server_admins}}
         )
@@ -381,7 +381,7 @@ class AdminCommands(commands.Cog):
         
         # Get server data from database
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
         
         if not server_data:
             embed = discord.Embed(
@@ -496,7 +496,7 @@ class AdminCommands(commands.Cog):
             # Get user data from database
             #print(f"[DEBUG] Fetching user data from database for ID: {user_id}")
             db = Users()
-            user_data = db.fetch_user(user_id)
+            user_data = await db.fetch_user(user_id)
             #print(f"[DEBUG] Database result: {user_data is not None}")
             
             if not user_data:
@@ -746,13 +746,10 @@ class AdminCommands(commands.Cog):
                 inline=False
             )
         else:
-            blacklist_entries = []
-            for user_id in self.blacklisted_ids:
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    blacklist_entries.append(f"{user.mention} (`{user.id}`)")
-                except:
-                    blacklist_entries.append(f"Unknown User (`{user_id}`)")
+            names = await usernames.resolve_many(list(self.blacklisted_ids))
+            blacklist_entries = [
+                f"<@{user_id}> {names[user_id]} (`{user_id}`)" for user_id in self.blacklisted_ids
+            ]
             
             # Split into chunks if there are many entries
             chunks = [blacklist_entries[i:i+15] for i in range(0, len(blacklist_entries), 15)]
@@ -770,231 +767,21 @@ class AdminCommands(commands.Cog):
         
     async def generate_profit_graph(self, view_type="daily"):
         """Generate a profit graph based on the time frame"""
-        # Get profit data from MongoDB
-        profit_db = ProfitData()
-        profit_data = profit_db.get_profit_data()
-        
-        if not profit_data:
-            raise ValueError("No profit data available")
-        
-        # Prepare data based on view type
-        dates = []
-        profits = []
-        cumulative_profits = []
-        total_profit = 0
-        
-        # Set time frame data
-        if view_type == "daily":
-            # Get last 30 days
-            end_date = datetime.datetime.now().date()
-            start_date = end_date - datetime.timedelta(days=30)
-            
-            # Create a date range for the last 30 days
-            date_range = {}
-            current_date = start_date
-            while current_date <= end_date:
-                date_range[current_date] = 0
-                current_date += datetime.timedelta(days=1)
-            
-            # Fill in available data
-            for item in profit_data:
-                date_str = item.get("date")
-                # Convert string date to datetime.date if needed
-                if isinstance(date_str, str):
-                    try:
-                        date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    except ValueError:
-                        continue
-                elif isinstance(date_str, datetime.date):
-                    date = date_str
-                else:
-                    continue
-                
-                if start_date <= date <= end_date:
-                    date_range[date] = item.get("total_profit", 0)
-            
-            # Convert to lists
-            for date, profit in sorted(date_range.items()):
-                dates.append(date)
-                profits.append(profit * 0.0212)  # Convert tokens to USD (1 token = 0.0212$)
-                total_profit += profit
-                cumulative_profits.append(total_profit * 0.0212)  # Convert tokens to USD
-            
-            x_label = "Day"
-            title = "Daily Profit (Last 30 Days)"
-            
-        elif view_type == "monthly":
-            # Group by month
-            monthly_data = {}
-            
-            for item in profit_data:
-                date_str = item.get("date")
-                # Convert string date to datetime.date if needed
-                if isinstance(date_str, str):
-                    try:
-                        date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    except ValueError:
-                        continue
-                elif isinstance(date_str, datetime.date):
-                    date = date_str
-                else:
-                    continue
-                
-                # Create a key for year-month
-                month_key = datetime.date(date.year, date.month, 1)
-                    
-                if month_key not in monthly_data:
-                    monthly_data[month_key] = 0
-                    
-                monthly_data[month_key] += item.get("total_profit", 0)
-            
-            # Sort by date and convert to lists
-            for date, profit in sorted(monthly_data.items()):
-                dates.append(date)
-                profits.append(profit * 0.0212)  # Convert tokens to USD
-                total_profit += profit
-                cumulative_profits.append(total_profit * 0.0212)  # Convert tokens to USD
-            
-            x_label = "Month"
-            title = "Monthly Profit"
-            
-        else:  # all_time
-            # Group by date (keep all records, but ensure they're sorted)
-            all_data = {}
-            
-            for item in profit_data:
-                date_str = item.get("date")
-                # Convert string date to datetime.date if needed
-                if isinstance(date_str, str):
-                    try:
-                        date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    except ValueError:
-                        continue
-                elif isinstance(date_str, datetime.date):
-                    date = date_str
-                else:
-                    continue
-                
-                if date not in all_data:
-                    all_data[date] = 0
-                    
-                    all_data[date] += item.get("total_profit", 0)
-            
-            # Sort by date and convert to lists
-            for date, profit in sorted(all_data.items()):
-                dates.append(date)
-                profits.append(profit * 0.0212)  # Convert tokens to USD
-                total_profit += profit
-                cumulative_profits.append(total_profit * 0.0212)  # Convert tokens to USD
-            
-            x_label = "Date"
-            title = "All-Time Profit"
-        
-        # Create the plot with a modern gray background
-        fig, ax = plt.subplots(figsize=(12, 6), dpi=100)
-        fig.patch.set_facecolor('#2B2D31')  # Modern dark gray for outer background
-        ax.set_facecolor('#36393F')  # Slightly lighter gray for plot area
-        
-        # Plot the profit trend with a nice gradient fill
+        # Data and the rendered chart come from the cache unless profit_data changed
+        series, png = await profit_charts.chart(view_type)
+        cumulative_profits = series["cumulative_profits"]
+        x_label = series["x_label"]
+        title = series["title"]
+
         if cumulative_profits:
-            # Create gradient fill
-            line, = ax.plot(dates, cumulative_profits, color='#00FFAE', linewidth=2.5, marker='', zorder=3)
-            
-            # Fill area under the curve with gradient
-            ax.fill_between(dates, cumulative_profits, color='#00FFAE', alpha=0.2)
-            
-            # Get the highest value for annotation
-            max_idx = np.argmax(cumulative_profits)
-            max_date = dates[max_idx]
-            max_value = cumulative_profits[max_idx]
-            
-            # Add a dot marker at the highest value with annotation
-            ax.plot(max_date, max_value, 'o', color='white', markersize=8, zorder=4)
-            
-            # Add a "tooltip" annotation with black background
-            bbox_props = dict(boxstyle="round,pad=0.5", facecolor='black', alpha=0.8, edgecolor='gray')
-            cumulative_text = f"{max_date.strftime('%d %b %Y')}\nCumulative: ${max_value:,.2f}"
-            ax.annotate(cumulative_text, 
-                        (max_date, max_value),
-                        xytext=(10, 10),
-                        textcoords="offset points",
-                        bbox=bbox_props,
-                        color='white',
-                        zorder=5)
-            
-            # Format the y-axis with dollar signs
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-            
-            # Format x-axis dates
-            if view_type == "daily":
-                ax.xaxis.set_major_locator(mdates.DayLocator(interval=5))
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%d %b'))
-            elif view_type == "monthly":
-                ax.xaxis.set_major_locator(mdates.MonthLocator())
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-            else:
-                ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%d %b'))
-                
-            # Customize grid
-            ax.grid(True, linestyle='--', alpha=0.3, zorder=1)
-            
-            # Add labels and title with white text
-            ax.set_xlabel(x_label, color='white', fontsize=12)
-            ax.set_ylabel('Profit (USD)', color='white', fontsize=12)
-            
             # Calculate total profit and growth percentage
-            first_value = cumulative_profits[0] if cumulative_profits else 0
-            last_value = cumulative_profits[-1] if cumulative_profits else 0
+            first_value = cumulative_profits[0]
+            last_value = cumulative_profits[-1]
             growth_pct = ((last_value - first_value) / first_value * 100) if first_value > 0 else 0
-            
-            # Title with accumulated amount and growth percentage
-            title_text = f"Total Revenue\n${last_value:,.2f}"
             growth_text = f"+{growth_pct:.2f}%" if growth_pct >= 0 else f"{growth_pct:.2f}%"
-            
-            # Set the main title with Helvetica font
-            from matplotlib.font_manager import FontProperties
-            try:
-                # Try to load Helvetica font
-                helvetica_font = FontProperties(fname="Helvetica-Bold.ttf")
-                ax.set_title(title_text, size=32, color='white', pad=20, fontproperties=helvetica_font)
-            except:
-                # Fallback to default font if Helvetica.ttf cannot be loaded
-                print("Could not load Helvetica font, using default")
-                ax.set_title(title_text, fontsize=20, color='white', pad=20)
-            
-            # Add the growth percentage text with color based on value
-            text_color = '#4CAF50' if growth_pct >= 0 else '#FF5252'
-            #fig.text(0.15, 0.86, growth_text, fontsize=12, color=text_color)
-            
-            # Add the time period text
-            #fig.text(0.15, 0.82, f"• {title}", fontsize=10, color='white', alpha=0.7)
-            
-            # Style the axes and ticks
-            ax.tick_params(colors='white', which='both')
-            for spine in ax.spines.values():
-                spine.set_edgecolor('#555555')
-            
-            # Add BetSync watermark
-            plt.figtext(0.5, 0.01, "BetSync Casino", fontsize=10, color='white', alpha=0.4, ha='center')
-            
-            # Adjust layout for better padding
-            plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-            
-            # Add a subtle shadow effect for the frame
-            # This is done by adding a rectangle patch with a gradient alpha
-            from matplotlib.patches import Rectangle
-            shadow = Rectangle((0, 0), 1, 1, transform=fig.transFigure, 
-                              facecolor='black', alpha=0.2, zorder=-1)
-            fig.patches.append(shadow)
-            
-            # Save to bytes buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', facecolor=fig.get_facecolor())
-            buf.seek(0)
-            
+
             # Create Discord file and embed
-            file = discord.File(buf, filename="profit_graph.png")
+            file = discord.File(io.BytesIO(png), filename="profit_graph.png")
             
             embed = discord.Embed(
                 title=f"BetSync Casino {title}", 
@@ -1022,9 +809,6 @@ class AdminCommands(commands.Cog):
             embed.set_image(url="attachment://profit_graph.png")
             embed.set_footer(text="Click the buttons below to change the time period")
             
-            # Close the figure to prevent memory leaks
-            plt.close(fig)
-            
             return embed, file
         else:
             # If no data available
@@ -1033,15 +817,7 @@ class AdminCommands(commands.Cog):
                 description="There is no profit data available for the selected time period.",
                 color=0xFF0000
             )
-            
-            # Create empty plot for attachment
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', facecolor=fig.get_facecolor())
-            buf.seek(0)
-            file = discord.File(buf, filename="no_data.png")
-            
-            # Close the figure to prevent memory leaks
-            plt.close(fig)
+            file = discord.File(io.BytesIO(png), filename="no_data.png")
             
             return embed, file
     
@@ -1079,7 +855,7 @@ class AdminCommands(commands.Cog):
         
         # Check if server exists in the database
         db = Servers()
-        server_data = db.fetch_server(server_id)
+        server_data = await db.fetch_server(server_id)
         
         if not server_data:
             embed = discord.Embed(
@@ -1112,7 +888,7 @@ class AdminCommands(commands.Cog):
             await self.bot.wait_for('message', check=check, timeout=30.0)
             
             # Leave the server and delete data
-            success = db.collection.delete_one({"server_id": server_id})
+            success = await db.collection.delete_one({"server_id": server_id})
             
             # Create final embed
             if success.deleted_count > 0:
@@ -1276,6 +1052,228 @@ class AdminCommands(commands.Cog):
             )
             await ctx.reply(embed=error_embed)
             
+    @commands.command(name="cachestats")
+    async def cachestats(self, ctx):
+        """Show user cache hit/miss counters (Admin only)
+
+        Usage: !cachestats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = user_cache.stats()
+        embed = discord.Embed(
+            title="🗄️ User Cache",
+            description="Shared in-process cache of user documents",
+            color=0x00FFAE
+        )
+        embed.add_field(
+            name="📊 Lookups",
+            value=f"```\nHits: {stats['hits']:,}\nMisses: {stats['misses']:,}\nHit rate: {stats['hit_rate'] * 100:.1f}%```",
+            inline=False
+        )
+        embed.add_field(
+            name="📦 Entries",
+            value=f"```\nUsers cached: {stats['size']:,} / {stats['max_size']:,}\nTTL: {stats['ttl']}s\nInvalidations: {stats['invalidations']:,}```",
+            inline=False
+        )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="httpstats")
+    async def httpstats(self, ctx):
+        """Show outbound HTTP metrics per upstream host (Admin only)
+
+        Usage: !httpstats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = http.stats()
+        embed = discord.Embed(
+            title="🌐 Outbound HTTP",
+            description="Shared HTTP client metrics per upstream host",
+            color=0x00FFAE
+        )
+        if not stats:
+            embed.add_field(name="No Requests", value="No outbound requests since startup.", inline=False)
+        # Busiest upstreams first; embeds are capped at 25 fields
+        for host, upstream in sorted(stats.items(), key=lambda item: item[1]["requests"], reverse=True)[:25]:
+            embed.add_field(
+                name=host,
+                value=(
+                    f"```\nRequests: {upstream['requests']:,}\nErrors: {upstream['errors']:,}\n"
+                    f"429s: {upstream['rate_limited']:,}\nRetries: {upstream['retries']:,}\n"
+                    f"Latency: {upstream['avg_latency_ms']:.0f}ms avg / {upstream['max_latency_ms']:.0f}ms max```"
+                ),
+                inline=True
+            )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="renderstats")
+    async def renderstats(self, ctx):
+        """Show image render latency and queue depth per renderer (Admin only)
+
+        Usage: !renderstats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = render_service.stats()
+        embed = discord.Embed(
+            title="🖼️ Image Rendering",
+            description=f"Render pool metrics per renderer\nIn flight: **{render_service.in_flight}** (peak {render_service.max_in_flight}, limit {render_service.max_queue})",
+            color=0x00FFAE
+        )
+        if not stats:
+            embed.add_field(name="No Renders", value="No images rendered since startup.", inline=False)
+        # Busiest renderers first; embeds are capped at 25 fields
+        for name, renderer in sorted(stats.items(), key=lambda item: item[1]["renders"], reverse=True)[:25]:
+            cache_line = f"Cache hits: {renderer['cache_hits']:,}"
+            if "cached_frames" in renderer:
+                cache_line += f" ({renderer['cached_frames']:,} frames, {renderer['cache_bytes'] / 1024:.0f}KB)"
+            embed.add_field(
+                name=name,
+                value=(
+                    f"```\nRenders: {renderer['renders']:,}\nFailures: {renderer['failures']:,}\n"
+                    f"Cancelled: {renderer['cancelled']:,}\nQueued: {renderer['queued']} (peak {renderer['max_queued']})\n"
+                    f"Latency: {renderer['avg_latency_ms']:.0f}ms avg / {renderer['max_latency_ms']:.0f}ms max\n"
+                    f"Render: {renderer['avg_render_ms']:.0f}ms avg\n{cache_line}```"
+                ),
+                inline=True
+            )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="editstats")
+    async def editstats(self, ctx):
+        """Show how many message edits were sent, coalesced and rate limited (Admin only)
+
+        Usage: !editstats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = edits.stats()
+        embed = discord.Embed(
+            title="✏️ Message Edits",
+            description=f"Edit scheduler metrics since startup\nLimit: **{edits.rate}** edits per **{edits.per:g}s** per channel",
+            color=0x00FFAE
+        )
+        embed.add_field(
+            name="Frames",
+            value=(
+                f"```\nSubmitted: {stats['submitted']:,}\nSent: {stats['sent']:,}\n"
+                f"Dropped: {stats['dropped']:,}\nPending: {stats['pending']}```"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Rate Limits",
+            value=(
+                f"```\n429s: {stats['rate_limited']:,}\nFailures: {stats['failures']:,}\n"
+                f"Throttled: {stats['throttled_seconds']:,.1f}s```"
+            ),
+            inline=True
+        )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="settlestats")
+    async def settlestats(self, ctx):
+        """Show settlements, payouts and settle latency per game (Admin only)
+
+        Usage: !settlestats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = settlement.stats()
+        embed = discord.Embed(
+            title="🧾 Game Settlement",
+            description="Settlement engine metrics per game since startup",
+            color=0x00FFAE
+        )
+        if not stats:
+            embed.add_field(name="No Settlements", value="No games settled since startup.", inline=False)
+        # Busiest games first; embeds are capped at 25 fields
+        for game, game_stats in sorted(stats.items(), key=lambda item: item[1]["settlements"], reverse=True)[:25]:
+            embed.add_field(
+                name=game,
+                value=(
+                    f"```\nSettled: {game_stats['settlements']:,} ({game_stats['rounds']:,} rounds)\n"
+                    f"W/L/P: {game_stats['wins']:,}/{game_stats['losses']:,}/{game_stats['pushes']:,}\n"
+                    f"Wagered: {game_stats['wagered']:,.2f}\nPaid: {game_stats['paid']:,.2f}\n"
+                    f"RTP: {game_stats['rtp'] * 100:.2f}%\nFailures: {game_stats['failures']:,}\n"
+                    f"Latency: {game_stats['avg_latency_ms']:.0f}ms avg / {game_stats['max_latency_ms']:.0f}ms max```"
+                ),
+                inline=True
+            )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="limbostats")
+    async def limbostats(self, ctx):
+        """Show Limbo roll throughput per player (Admin only)
+
+        Usage: !limbostats
+        """
+        if not self.is_admin(ctx.author.id):
+            embed = discord.Embed(
+                title="<:no:1344252518305234987> | Access Denied",
+                description="This command is restricted to administrators only.",
+                color=0xFF0000
+            )
+            return await ctx.reply(embed=embed)
+
+        stats = roll_meter.stats()
+        embed = discord.Embed(
+            title="🚀 Limbo Throughput",
+            description="Rolls per second per player since startup",
+            color=0x00FFAE
+        )
+        if not stats:
+            embed.add_field(name="No Rolls", value="No Limbo games played since startup.", inline=False)
+        # Busiest players first; embeds are capped at 25 fields
+        for user_id, user_stats in sorted(stats.items(), key=lambda item: item[1]["rolls"], reverse=True)[:25]:
+            embed.add_field(
+                name=str(user_id),
+                value=(
+                    f"```\nRolls: {user_stats['rolls']:,}\n"
+                    f"Rolling: {user_stats['seconds']:,.1f}s\n"
+                    f"Rate: {user_stats['rolls_per_sec']:.2f} rolls/sec```"
+                ),
+                inline=True
+            )
+        embed.set_footer(text=f"Requested by {ctx.author.name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+        await ctx.reply(embed=embed)
+
     @commands.command(name="adminpanel", aliases=["ap"])
     async def adminpanel(self, ctx, page: int = 1):
         """Display all available admin commands with pagination (Admin only)
@@ -1312,6 +1310,12 @@ class AdminCommands(commands.Cog):
                 ("manageinvites", "Manage user invite counts", "!manageinvites add @user 5"),
                 ("leave", "Make the bot leave a server and delete its data", "!leave server_id"),
                 ("uptime", "Show bot uptime and system information", "!uptime"),
+                ("cachestats", "Show user cache hit/miss statistics", "!cachestats"),
+                ("httpstats", "Show outbound HTTP metrics per upstream", "!httpstats"),
+                ("renderstats", "Show image render latency and queue depth", "!renderstats"),
+                ("editstats", "Show message edit throughput and dropped frames", "!editstats"),
+                ("settlestats", "Show payouts and settle latency per game", "!settlestats"),
+                ("limbostats", "Show Limbo rolls/sec per player", "!limbostats"),
                 ("sp", "Display server profit data with rankings", "!sp [YYYY-MM-DD]"),
                 ("tp", "Display total profit graph", "!tp [daily/monthly/all_time]"),
                 ("game_np", "Check game performance statistics", "!game_np [game_name]"),
@@ -1413,7 +1417,7 @@ class AdminCommands(commands.Cog):
             date = datetime.datetime.now().date().strftime("%Y-%m-%d")
             
         # Get all server profits for the date
-        server_profits = server_profit_db.get_all_server_profits(date)
+        server_profits = await server_profit_db.get_all_server_profits(date)
         
         if not server_profits:
             raise ValueError(f"No server profit data available for {date}")
@@ -1700,16 +1704,15 @@ class AdminCommands(commands.Cog):
     
     async def execute_cleardb(self, interaction, target):
         """Execute the database clearing operation"""
-        from pymongo import MongoClient
-        import os
+        from Cogs.utils.mongo import mongodb
         
-        # Connect to MongoDB
-        mongodb = MongoClient(os.environ["MONGO"])
+        # Use the shared MongoDB client
         db = mongodb["BetSync"]
         
         try:
             if target == "users":
-                result = db["users"].delete_many({})
+                result = await db["users"].delete_many({})
+                user_cache.clear()
                 embed = discord.Embed(
                     title="✅ | Users Data Cleared",
                     description=f"Successfully deleted {result.deleted_count} user records.",
@@ -1717,7 +1720,7 @@ class AdminCommands(commands.Cog):
                 )
                 
             elif target == "servers":
-                result = db["servers"].delete_many({})
+                result = await db["servers"].delete_many({})
                 embed = discord.Embed(
                     title="✅ | Servers Data Cleared",
                     description=f"Successfully deleted {result.deleted_count} server records.",
@@ -1725,7 +1728,8 @@ class AdminCommands(commands.Cog):
                 )
                 
             elif target == "profit_data":
-                result = db["profit_data"].delete_many({})
+                result = await db["profit_data"].delete_many({})
+                profit_charts.invalidate()
                 embed = discord.Embed(
                     title="✅ | Profit Data Cleared",
                     description=f"Successfully deleted {result.deleted_count} profit records.",
@@ -1733,7 +1737,7 @@ class AdminCommands(commands.Cog):
                 )
                 
             elif target == "server_profit":
-                result = db["server_profit"].delete_many({})
+                result = await db["server_profit"].delete_many({})
                 embed = discord.Embed(
                     title="✅ | Server Profit Data Cleared",
                     description=f"Successfully deleted {result.deleted_count} server profit records.",
@@ -1741,7 +1745,7 @@ class AdminCommands(commands.Cog):
                 )
                 
             elif target == "net_profit":
-                result = db["net_profit"].delete_many({})
+                result = await db["net_profit"].delete_many({})
                 embed = discord.Embed(
                     title="✅ | Net Profit Data Cleared",
                     description=f"Successfully deleted {result.deleted_count} net profit records.",
@@ -1749,8 +1753,8 @@ class AdminCommands(commands.Cog):
                 )
                 
             elif target == "referrals":
-                referral_result = db["referrals"].delete_many({})
-                invite_cache_result = db["invite_cache"].delete_many({})
+                referral_result = await db["referrals"].delete_many({})
+                invite_cache_result = await db["invite_cache"].delete_many({})
                 total_deleted = referral_result.deleted_count + invite_cache_result.deleted_count
                 embed = discord.Embed(
                     title="✅ | Referral Data Cleared",
@@ -1789,22 +1793,22 @@ class AdminCommands(commands.Cog):
     
     async def execute_cleardb_all(self, ctx):
         """Execute complete database wipe"""
-        from pymongo import MongoClient
-        import os
+        from Cogs.utils.mongo import mongodb
         
-        # Connect to MongoDB
-        mongodb = MongoClient(os.environ["MONGO"])
+        # Use the shared MongoDB client
         db = mongodb["BetSync"]
         
         try:
             # Get all collections
-            collections = db.list_collection_names()
+            collections = await db.list_collection_names()
             total_deleted = 0
             
             # Delete from each collection
             for collection_name in collections:
-                result = db[collection_name].delete_many({})
+                result = await db[collection_name].delete_many({})
                 total_deleted += result.deleted_count
+            user_cache.clear()
+            profit_charts.invalidate()
             
             embed = discord.Embed(
                 title="💥 | DATABASE COMPLETELY WIPED",
@@ -1841,22 +1845,22 @@ class FinalConfirmationView(discord.ui.View):
             return
         
         # Execute complete database wipe
-        from pymongo import MongoClient
-        import os
+        from Cogs.utils.mongo import mongodb
         
-        # Connect to MongoDB
-        mongodb = MongoClient(os.environ["MONGO"])
+        # Use the shared MongoDB client
         db = mongodb["BetSync"]
         
         try:
             # Get all collections
-            collections = db.list_collection_names()
+            collections = await db.list_collection_names()
             total_deleted = 0
             
             # Delete from each collection
             for collection_name in collections:
-                result = db[collection_name].delete_many({})
+                result = await db[collection_name].delete_many({})
                 total_deleted += result.deleted_count
+            user_cache.clear()
+            profit_charts.invalidate()
             
             embed = discord.Embed(
                 title="💥 | DATABASE COMPLETELY WIPED",
@@ -1927,7 +1931,7 @@ class FinalConfirmationView(discord.ui.View):
             if game:
                 # Get stats for a specific game
                 game = game.lower()  # Normalize game name
-                game_data = db.get_np(game)
+                game_data = await db.get_np(game)
                 
                 if not game_data:
                     embed = discord.Embed(
@@ -1996,7 +2000,7 @@ class FinalConfirmationView(discord.ui.View):
                 game_stats = []
                 
                 for game_name in game_list:
-                    game_data = db.get_np(game_name)
+                    game_data = await db.get_np(game_name)
                     if game_data:
                         profit = game_data.get("total_profit", 0)
                         game_stats.append((game_name, profit))
@@ -2183,6 +2187,12 @@ class AdminPanelPaginator(discord.ui.View):
             ("manageinvites", "Manage user invite counts", "!manageinvites add @user 5"),
             ("leave", "Make the bot leave a server and delete its data", "!leave server_id"),
             ("uptime", "Show bot uptime and system information", "!uptime"),
+            ("cachestats", "Show user cache hit/miss statistics", "!cachestats"),
+            ("httpstats", "Show outbound HTTP metrics per upstream", "!httpstats"),
+            ("renderstats", "Show image render latency and queue depth", "!renderstats"),
+            ("editstats", "Show message edit throughput and dropped frames", "!editstats"),
+            ("settlestats", "Show payouts and settle latency per game", "!settlestats"),
+            ("limbostats", "Show Limbo rolls/sec per player", "!limbostats"),
             ("sp", "Display server profit data with rankings", "!sp [YYYY-MM-DD]"),
             ("tp", "Display total profit graph", "!tp [daily/monthly/all_time]"),
             ("game_np", "Check game performance statistics", "!game_np [game_name]"),
@@ -2,7 +2,7 @@
 import discord
 import asyncio
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, Servers, usernames
 from Cogs.utils.emojis import emoji
 
 class AdminCurseCog(commands.Cog):
@@ -173,13 +173,11 @@ class AdminCurseCog(commands.Cog):
                 inline=False
             )
         else:
-            curse_entries = []
-            for user_id, remaining_losses in self.cursed_players.items():
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    curse_entries.append(f"{user.mention} - **{remaining_losses}** losses remaining")
-                except:
-                    curse_entries.append(f"Unknown User (`{user_id}`) - **{remaining_losses}** losses remaining")
+            names = await usernames.resolve_many(list(self.cursed_players))
+            curse_entries = [
+                f"<@{user_id}> {names[user_id]} - **{remaining_losses}** losses remaining"
+                for user_id, remaining_losses in self.cursed_players.items()
+            ]
             
             # Split into chunks if there are many entries
             chunks = [curse_entries[i:i+15] for i in range(0, len(curse_entries), 15)]
@@ -3,13 +3,11 @@
 import discord
 from discord.ext import commands, tasks
 import os
-import requests
 import qrcode
 import io
 import asyncio
 import datetime
 import time
-import aiohttp
 import json
 import re
 from dotenv import load_dotenv
@@ -21,6 +19,9 @@ from Cogs.utils.mongo import Users
 from Cogs.utils.notifier import Notifier
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import get_crypto_price
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.qr_cache import qr_codes
 
 # Load environment variables
 load_dotenv()
@@ -54,15 +55,15 @@ def generate_qr_code(address: str, username: str):
     qr_width, qr_height = qr_img.size
 
     try:
-        title_font = ImageFont.truetype("Helvetica-Bold.ttf", 30)
-        subtitle_font = ImageFont.truetype("Helvetica.ttf", 18)
-        brand_font = ImageFont.truetype("Helvetica-Bold.ttf", 36)
+        title_font = atlas.font("Helvetica-Bold.ttf", 30)
+        subtitle_font = atlas.font("Helvetica.ttf", 18)
+        brand_font = atlas.font("Helvetica-Bold.ttf", 36)
     except IOError:
         print(f"{Fore.YELLOW}[!] Warning: Font files not found. Using default font.{Style.RESET_ALL}")
         try:
-            title_font = ImageFont.truetype("arial.ttf", 30)
-            subtitle_font = ImageFont.truetype("arial.ttf", 18)
-            brand_font = ImageFont.truetype("arial.ttf", 36)
+            title_font = atlas.font("arial.ttf", 30)
+            subtitle_font = atlas.font("arial.ttf", 18)
+            brand_font = atlas.font("arial.ttf", 36)
         except IOError:
             title_font = ImageFont.load_default()
             subtitle_font = ImageFont.load_default()
@@ -164,7 +165,7 @@ class DepositView(discord.ui.View):
             return
 
         # Check if user's primary currency is set to BTC (fetch fresh data)
-        fresh_user_data = self.cog.users_db.fetch_user(self.user_id)
+        fresh_user_data = await self.cog.users_db.fetch_user(self.user_id)
         if not fresh_user_data:
             await interaction.response.send_message("Error: User data not found.", ephemeral=True)
             return
@@ -226,7 +227,7 @@ class DepositView(discord.ui.View):
                     )
 
                 # Show new balance
-                updated_user = self.cog.users_db.fetch_user(self.user_id)
+                updated_user = await self.cog.users_db.fetch_user(self.user_id)
                 btc_balance = updated_user.get("wallet", {}).get("BTC", "N/A") if updated_user else "N/A"
                 main_embed.add_field(name="New BTC Balance", value=f"<:btc:1339343483089063976> {btc_balance:,.8f} BTC", inline=True)
                 
@@ -309,14 +310,14 @@ class BtcDeposit(commands.Cog):
             print(f"{Fore.YELLOW}[!] WARNING: DEPOSIT_WEBHOOK_URL not found. Deposit notifications will not be sent.{Style.RESET_ALL}")
 
     async def _get_next_address_index(self, user_id: int) -> int:
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if user_data and 'btc_address_index' in user_data:
             return user_data.get('btc_address_index', -1) + 1
         else:
             return 0
 
     async def _generate_btc_address(self, user_id: int) -> tuple[str | None, str | None]:
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
 
         if user_data and user_data.get("btc_address"):
             if 'btc_address_index' not in user_data:
@@ -327,7 +328,7 @@ class BtcDeposit(commands.Cog):
             return None, "BTC_XPUB environment variable is not configured."
 
         try:
-            highest_index_user = self.users_db.collection.find_one(
+            highest_index_user = await self.users_db.collection.find_one(
                 {"btc_address_index": {"$exists": True}},
                 sort=[("btc_address_index", -1)]
             )
@@ -364,12 +365,12 @@ class BtcDeposit(commands.Cog):
             }
 
             if not user_data:
-                result = self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                result = await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
                 if result.matched_count == 0:
                     print(f"{Fore.RED}[!] Failed to store address for user {user_id} - user document not found.{Style.RESET_ALL}")
                     return None, "User document not found to store address."
             else:
-                self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
 
             print(f"{Fore.GREEN}[+] Generated BTC address {address} (Index: {next_index}) for user {user_id}{Style.RESET_ALL}")
             return address, None
@@ -391,81 +392,45 @@ class BtcDeposit(commands.Cog):
             if current_time - self._last_api_call < 1.0:  # 1 second minimum between calls
                 await asyncio.sleep(1.0 - (current_time - self._last_api_call))
             self._last_api_call = time.time()
-            user_data = self.users_db.fetch_user(user_id)
+            user_data = await self.users_db.fetch_user(user_id)
             if not user_data:
                 print(f"{Fore.RED}[!] User data not found for user {user_id} at start of deposit check.{Style.RESET_ALL}")
                 return "error", {"error": "User data not found."}
 
-            # Retry logic for API calls
-            max_retries = 2
-            retry_delay = 1.0
-            
-            for attempt in range(max_retries + 1):
+            # Timeouts, rate limits and 5xx responses are retried with backoff by the shared client
+            try:
+                txs_url = f"{MEMPOOL_API_URL}/address/{address}/txs"
+                response = await http.get(txs_url, timeout=30)
+                if response.status == 429:  # Still rate limited after retries
+                    return "error", {"error": "API rate limit exceeded. Please try again later."}
+                if response.status != 200:
+                    print(f"{Fore.RED}[!] Mempool API Error ({response.status}) fetching transactions for {address}. Response: {response.text()}{Style.RESET_ALL}")
+                    return "error", {"error": f"API Error ({response.status}) fetching transactions."}
+
                 try:
-                    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                        txs_url = f"{MEMPOOL_API_URL}/address/{address}/txs"
-                        async with session.get(txs_url) as response:
-                            if response.status == 429:  # Rate limited
-                                if attempt < max_retries:
-                                    print(f"{Fore.YELLOW}[!] Rate limited, retrying in {retry_delay} seconds...{Style.RESET_ALL}")
-                                    await asyncio.sleep(retry_delay)
-                                    retry_delay *= 2
-                                    continue
-                                else:
-                                    return "error", {"error": "API rate limit exceeded. Please try again later."}
-                            
-                            if response.status != 200:
-                                error_text = await response.text()
-                                print(f"{Fore.RED}[!] Mempool API Error ({response.status}) fetching transactions for {address}. Response: {error_text}{Style.RESET_ALL}")
-                                if attempt < max_retries:
-                                    await asyncio.sleep(retry_delay)
-                                    continue
-                                return "error", {"error": f"API Error ({response.status}) fetching transactions after {max_retries + 1} attempts."}
-
-                            try:
-                                transactions = await response.json()
-                            except Exception as e:
-                                print(f"{Fore.RED}[!] Error parsing transactions for {address}: {e}{Style.RESET_ALL}")
-                                if attempt < max_retries:
-                                    await asyncio.sleep(retry_delay)
-                                    continue
-                                return "error", {"error": "Failed to parse transaction data"}
-
-                        tip_url = f"{MEMPOOL_API_URL}/blocks/tip/height"
-                        async with session.get(tip_url) as tip_response:
-                            if tip_response.status != 200:
-                                error_text = await tip_response.text()
-                                print(f"{Fore.RED}[!] API Error ({tip_response.status}) fetching block height. Response: {error_text}{Style.RESET_ALL}")
-                                if attempt < max_retries:
-                                    await asyncio.sleep(retry_delay)
-                                    continue
-                                return "error", {"error": f"API Error ({tip_response.status}) fetching block height after {max_retries + 1} attempts."}
-                            
-                            try:
-                                current_block_height = int(await tip_response.text())
-                            except ValueError as e:
-                                print(f"{Fore.RED}[!] Error parsing block height: {e}{Style.RESET_ALL}")
-                                if attempt < max_retries:
-                                    await asyncio.sleep(retry_delay)
-                                    continue
-                                return "error", {"error": "Failed to parse block height"}
-
-                    break  # Success, exit retry loop
-
-                except asyncio.TimeoutError:
-                    print(f"{Fore.YELLOW}[!] API timeout on attempt {attempt + 1}/{max_retries + 1}{Style.RESET_ALL}")
-                    if attempt < max_retries:
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
-                    return "error", {"error": "API timeout after multiple attempts"}
+                    transactions = response.json()
                 except Exception as e:
-                    print(f"{Fore.RED}[!] Unexpected API error on attempt {attempt + 1}: {e}{Style.RESET_ALL}")
-                    if attempt < max_retries:
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
-                    return "error", {"error": f"API connection failed after {max_retries + 1} attempts"}
+                    print(f"{Fore.RED}[!] Error parsing transactions for {address}: {e}{Style.RESET_ALL}")
+                    return "error", {"error": "Failed to parse transaction data"}
+
+                tip_url = f"{MEMPOOL_API_URL}/blocks/tip/height"
+                tip_response = await http.get(tip_url, timeout=30)
+                if tip_response.status != 200:
+                    print(f"{Fore.RED}[!] API Error ({tip_response.status}) fetching block height. Response: {tip_response.text()}{Style.RESET_ALL}")
+                    return "error", {"error": f"API Error ({tip_response.status}) fetching block height."}
+
+                try:
+                    current_block_height = int(tip_response.text())
+                except ValueError as e:
+                    print(f"{Fore.RED}[!] Error parsing block height: {e}{Style.RESET_ALL}")
+                    return "error", {"error": "Failed to parse block height"}
+
+            except asyncio.TimeoutError:
+                print(f"{Fore.YELLOW}[!] API timeout checking {address}{Style.RESET_ALL}")
+                return "error", {"error": "API timeout after multiple attempts"}
+            except Exception as e:
+                print(f"{Fore.RED}[!] Unexpected API error checking {address}: {e}{Style.RESET_ALL}")
+                return "error", {"error": "API connection failed after multiple attempts"}
 
             if not transactions:
                 return "no_new", {}
@@ -554,7 +519,7 @@ class BtcDeposit(commands.Cog):
                     }
 
                     # Atomic operation that updates wallet, points, processed txids, and history in one go
-                    update_result_wallet = self.users_db.collection.update_one(
+                    update_result_wallet = await self.users_db.collection.update_one(
                         {
                             "discord_id": user_id,
                             "processed_btc_txids": {"$ne": txid}  # Only update if txid is NOT already processed
@@ -610,7 +575,7 @@ class BtcDeposit(commands.Cog):
             # --- Loop finished ---
             if new_deposit_processed_in_this_check:
                 # Get updated user data to show accurate totals
-                updated_user_data = self.users_db.fetch_user(user_id)
+                updated_user_data = await self.users_db.fetch_user(user_id)
                 if not updated_user_data:
                     return "error", {"error": "Could not fetch updated user data after processing."}
                 
@@ -681,7 +646,7 @@ class BtcDeposit(commands.Cog):
             return "error", {"error": "An internal error occurred during check."}
 
     async def _show_deposit_history(self, user_id: int) -> discord.Embed:
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if not user_data:
             return discord.Embed(title="Error", description="Could not fetch user data.", color=discord.Color.red())
 
@@ -780,7 +745,7 @@ class BtcDeposit(commands.Cog):
             return
 
         try:
-            qr_buffer = await asyncio.to_thread(generate_qr_code, address, ctx.author.name)
+            qr_buffer = await qr_codes.get("BTC", address, ctx.author.name, generate_qr_code, address, ctx.author.name)
             qr_file = discord.File(qr_buffer, filename="btc_deposit_qr.png")
         except Exception as qr_err:
             print(f"{Fore.RED}[!] Failed to generate QR code for {address}: {qr_err}{Style.RESET_ALL}")
@@ -114,7 +114,7 @@ class WithdrawView(discord.ui.View):
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed, ephemeral=True)
-            self.cog.users_db.update_balance(self.user_id, self.amount)
+            await self.cog.users_db.update_balance(self.user_id, self.amount)
             self.cog.pending_withdrawals.discard(self.user_id)
 
     @discord.ui.button(label="Deny", style=discord.ButtonStyle.red, emoji="❌", custom_id="withdraw_deny")
@@ -126,7 +126,7 @@ class WithdrawView(discord.ui.View):
             await interaction.respond(type=6)  # DEFER
         
         # Refund points
-        self.cog.users_db.update_balance(self.user_id, self.amount)
+        await self.cog.users_db.update_balance(self.user_id, self.amount)
         self.cog.pending_withdrawals.discard(self.user_id)
         
         # Update embed
@@ -170,7 +170,7 @@ class BtcWithdraw(commands.Cog):
         self.pending_withdrawals = set()
 
     async def get_btc_price(self) -> float:
-        prices = self.fetches.get_crypto_prices()
+        prices = await self.fetches.get_crypto_prices()
         return prices.get("bitcoin", {}).get("usd", 0) if prices else 0
 
     def validate_btc_address(self, address: str) -> bool:
@@ -200,7 +200,7 @@ class BtcWithdraw(commands.Cog):
             )
             return await ctx.reply(embed=embed)
             
-        user_data = self.users_db.fetch_user(ctx.author.id)
+        user_data = await self.users_db.fetch_user(ctx.author.id)
             
         # Split args into amount and address
         parts = args.split()
@@ -273,7 +273,7 @@ class BtcWithdraw(commands.Cog):
             )
             return await ctx.reply(embed=embed)
             
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if not user_data:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | Account Not Found",
@@ -288,7 +288,7 @@ class BtcWithdraw(commands.Cog):
             usd_value = btc_amount * (await self.get_btc_price())
             
             # Deduct points
-            self.users_db.update_balance(user_id, -amount)
+            await self.users_db.update_balance(user_id, -amount)
             self.pending_withdrawals.add(user_id)
             
             embed = discord.Embed(
@@ -332,7 +332,7 @@ class BtcWithdraw(commands.Cog):
         usd_value = btc_amount * (await self.get_btc_price())
         
         # Deduct points
-        self.users_db.update_balance(user_id, -amount)
+        await self.users_db.update_balance(user_id, -amount)
         self.pending_withdrawals.add(user_id)
         
         embed = discord.Embed(
@@ -45,7 +45,7 @@ class ChannelManagementCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             return True
@@ -119,7 +119,7 @@ class ChannelManagementCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             embed = discord.Embed(
@@ -145,7 +145,7 @@ class ChannelManagementCog(commands.Cog):
         disabled_channels.append(channel.id)
 
         # Update database
-        db.collection.update_one(
+        await db.collection.update_one(
             {"server_id": ctx.guild.id},
             {"$set": {"disabled_channels": disabled_channels}}
         )
@@ -221,7 +221,7 @@ class ChannelManagementCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             embed = discord.Embed(
@@ -247,7 +247,7 @@ class ChannelManagementCog(commands.Cog):
         disabled_channels.remove(channel.id)
 
         # Update database
-        db.collection.update_one(
+        await db.collection.update_one(
             {"server_id": ctx.guild.id},
             {"$set": {"disabled_channels": disabled_channels}}
         )
@@ -279,7 +279,7 @@ class ChannelManagementCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             embed = discord.Embed(
@@ -386,7 +386,7 @@ class ChannelManagementCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             embed = discord.Embed(
@@ -75,7 +75,7 @@ class Daily(commands.Cog):
 
         # Get user data
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id)
         
         if not user_data:
             error_embed = discord.Embed(
@@ -178,10 +178,10 @@ class Daily(commands.Cog):
         reward_amount = 1.0
 
         # Add the reward to user's points balance
-        db.update_balance(ctx.author.id, reward_amount, "points", "$inc")
+        await db.update_balance(ctx.author.id, reward_amount, "points", "$inc")
 
         # Update last daily claim date
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": ctx.author.id},
             {"$set": {"last_daily_claim": datetime.datetime.now().isoformat()}}
         )
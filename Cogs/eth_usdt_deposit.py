@@ -3,13 +3,10 @@
 import discord
 from discord.ext import commands, tasks
 import os
-import requests
 import qrcode
 import io
-import asyncio
 import datetime
 import time
-import aiohttp
 import json
 import re
 from dotenv import load_dotenv
@@ -22,6 +19,9 @@ from Cogs.utils.mongo import Users
 from Cogs.utils.notifier import Notifier
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import get_crypto_price
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.qr_cache import qr_codes
 
 # Load environment variables
 load_dotenv()
@@ -56,15 +56,15 @@ def generate_qr_code(address: str, username: str, currency: str):
     qr_width, qr_height = qr_img.size
 
     try:
-        title_font = ImageFont.truetype("Helvetica-Bold.ttf", 30)
-        subtitle_font = ImageFont.truetype("Helvetica.ttf", 18)
-        brand_font = ImageFont.truetype("Helvetica-Bold.ttf", 36)
+        title_font = atlas.font("Helvetica-Bold.ttf", 30)
+        subtitle_font = atlas.font("Helvetica.ttf", 18)
+        brand_font = atlas.font("Helvetica-Bold.ttf", 36)
     except IOError:
         print(f"{Fore.YELLOW}[!] Warning: Font files not found. Using default font.{Style.RESET_ALL}")
         try:
-            title_font = ImageFont.truetype("arial.ttf", 30)
-            subtitle_font = ImageFont.truetype("arial.ttf", 18)
-            brand_font = ImageFont.truetype("arial.ttf", 36)
+            title_font = atlas.font("arial.ttf", 30)
+            subtitle_font = atlas.font("arial.ttf", 18)
+            brand_font = atlas.font("arial.ttf", 36)
         except IOError:
             title_font = ImageFont.load_default()
             subtitle_font = ImageFont.load_default()
@@ -178,7 +178,7 @@ class DepositView(discord.ui.View):
                 total_points = sum(d.get('points_credited', 0) for d in deposits)
                 
                 if total_points > 0:
-                    update_result = self.cog.users_db.update_balance(self.user_id, total_points, operation="$inc")
+                    update_result = await self.cog.users_db.update_balance(self.user_id, total_points, operation="$inc")
                     if not update_result or update_result.matched_count == 0:
                         print(f"{Fore.RED}[!] Failed to update balance for user {self.user_id} after successful deposit check.{Style.RESET_ALL}")
                         await interaction.followup.send("Deposit detected, but failed to update your balance. Please contact support.", ephemeral=True)
@@ -198,10 +198,10 @@ class DepositView(discord.ui.View):
                             "confirmations": deposit.get('confirmations', REQUIRED_CONFIRMATIONS),
                             "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
                         }
-                        self.cog.users_db.update_history(self.user_id, history_entry)
+                        await self.cog.users_db.update_history(self.user_id, history_entry)
                         
                         if usd_value:
-                            self.cog.users_db.collection.update_one(
+                            await self.cog.users_db.collection.update_one(
                                 {"discord_id": self.user_id},
                                 {"$inc": {"total_deposit_amount_usd": usd_value}}
                             )
@@ -228,7 +228,7 @@ class DepositView(discord.ui.View):
                         inline=False
                     )
 
-                updated_user = self.cog.users_db.fetch_user(self.user_id)
+                updated_user = await self.cog.users_db.fetch_user(self.user_id)
                 balance = updated_user.get("wallet", {}).get(self.currency.upper(), "N/A") if updated_user else "N/A"
                 main_embed.add_field(name=f"New {self.currency.upper()} Balance", value=f"<:{self.currency}:1339343445675868191> {balance:,.8f} {self.currency.upper()}", inline=True)
                 
@@ -316,7 +316,7 @@ class EthUsdtDeposit(commands.Cog):
 
     async def _generate_eth_address(self, user_id: int, currency: str) -> tuple[str | None, str | None]:
         """Generates or retrieves a unique ETH/USDT deposit address for the user."""
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
 
         # Check if address already exists
         address_key = f"{currency}_address"
@@ -328,7 +328,7 @@ class EthUsdtDeposit(commands.Cog):
 
         try:
             # Find the highest index used for this currency
-            highest_index_user = self.users_db.collection.find_one(
+            highest_index_user = await self.users_db.collection.find_one(
                 {f"{currency}_address_index": {"$exists": True}},
                 sort=[(f"{currency}_address_index", -1)]
             )
@@ -355,12 +355,12 @@ class EthUsdtDeposit(commands.Cog):
             }
 
             if not user_data:
-                result = self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                result = await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
                 if result.matched_count == 0:
                     print(f"{Fore.RED}[!] Failed to store address for user {user_id} - user document not found.{Style.RESET_ALL}")
                     return None, "User document not found to store address."
             else:
-                self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
 
             print(f"{Fore.GREEN}[+] Generated {currency.upper()} address {address} (Index: {next_index}) for user {user_id}{Style.RESET_ALL}")
             return address, None
@@ -374,7 +374,7 @@ class EthUsdtDeposit(commands.Cog):
     async def _check_for_deposits(self, user_id: int, address: str, currency: str) -> tuple[str, dict]:
         """Checks Etherscan API for confirmed deposits to the address."""
         try:
-            user_data = self.users_db.fetch_user(user_id)
+            user_data = await self.users_db.fetch_user(user_id)
             if not user_data:
                 print(f"{Fore.RED}[!] User data not found for user {user_id} at start of deposit check.{Style.RESET_ALL}")
                 return "error", {"error": "User data not found."}
@@ -388,21 +388,20 @@ class EthUsdtDeposit(commands.Cog):
                 api_url = f"https://api.etherscan.io/api?module=account&action=tokentx&contractaddress={USDT_CONTRACT_ADDRESS}&address={address}&startblock=0&endblock=99999999&sort=desc&apikey={ETHERSCAN_API_KEY}"
 
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(api_url) as response:
-                        if response.status != 200:
-                            print(f"{Fore.RED}[!] Etherscan API Error ({response.status}) fetching transactions for {address}.{Style.RESET_ALL}")
-                            return "error", {"error": "Failed to check deposits. Please try again later."}
-
-                        data = await response.json()
-                        if data.get('status') != '1':
-                            error_msg = data.get('message', 'Etherscan API error')
-                            if "No transactions found" in error_msg:
-                                return "no_new", {}
-                            print(f"{Fore.RED}[!] Etherscan API returned error: {error_msg}{Style.RESET_ALL}")
-                            return "error", {"error": "Failed to check deposits. Please try again later."}
-
-                        transactions = data.get('result', [])
+                response = await http.get(api_url)
+                if response.status != 200:
+                    print(f"{Fore.RED}[!] Etherscan API Error ({response.status}) fetching transactions for {address}.{Style.RESET_ALL}")
+                    return "error", {"error": "Failed to check deposits. Please try again later."}
+
+                data = response.json()
+                if data.get('status') != '1':
+                    error_msg = data.get('message', 'Etherscan API error')
+                    if "No transactions found" in error_msg:
+                        return "no_new", {}
+                    print(f"{Fore.RED}[!] Etherscan API returned error: {error_msg}{Style.RESET_ALL}")
+                    return "error", {"error": "Failed to check deposits. Please try again later."}
+
+                transactions = data.get('result', [])
             except Exception as e:
                 print(f"{Fore.RED}[!] Error during API check for {address}: {e}{Style.RESET_ALL}")
                 return "error", {"error": f"API request failed: {e}"}
@@ -470,7 +469,7 @@ class EthUsdtDeposit(commands.Cog):
 
     async def _show_deposit_history(self, user_id: int, currency: str) -> discord.Embed:
         """Shows deposit history for the user."""
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if not user_data:
             return discord.Embed(
                 title="<:no:1344252518305234987> | Error",
@@ -540,7 +539,7 @@ class EthUsdtDeposit(commands.Cog):
 
         # Generate QR code
         try:
-            qr_buffer = await asyncio.to_thread(generate_qr_code, address, ctx.author.name, currency)
+            qr_buffer = await qr_codes.get(currency, address, ctx.author.name, generate_qr_code, address, ctx.author.name, currency)
         except Exception as e:
             print(f"{Fore.RED}[!] Error generating QR code for user {user_id}: {e}{Style.RESET_ALL}")
             qr_buffer = None
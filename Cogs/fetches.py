@@ -1,33 +1,47 @@
 import os
-import requests
+from Cogs.utils.price_oracle import price_oracle
 import discord
 import json
 import datetime
-from discord.ext import commands
+from discord.ext import commands, tasks
 from Cogs.utils.emojis import emoji
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, Servers, Leaderboards, usernames
 from colorama import Fore, Back, Style
 
+LEADERBOARD_REFRESH_INTERVAL = float(os.getenv("LEADERBOARD_REFRESH_INTERVAL", "300"))
+
 class Fetches(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.refresh_leaderboards.start()
 
-    def get_crypto_prices(self):
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        params = {
-            "ids": "bitcoin,ethereum,litecoin,solana,tether,dogecoin",
-            "vs_currencies": "usd"
-        }
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"{Fore.RED}[-] {Fore.WHITE}Failed to fetch crypto prices. Status Code: {Fore.RED}{response.status_code}{Fore.WHITE}")
+    def cog_unload(self):
+        self.refresh_leaderboards.cancel()
+
+    @tasks.loop(seconds=LEADERBOARD_REFRESH_INTERVAL)
+    async def refresh_leaderboards(self):
+        """Rebuild the leaderboard snapshots so pages and rank lookups stay cheap"""
+        await Leaderboards().rebuild_all()
+
+    @refresh_leaderboards.before_loop
+    async def before_refresh_leaderboards(self):
+        await self.bot.wait_until_ready()
+
+    async def get_crypto_prices(self):
+        """Current USD prices from the price oracle, CoinGecko-shaped ({"bitcoin": {"usd": ...}})"""
+        prices = await price_oracle.get_prices()
+        if not prices:
+            print(f"{Fore.RED}[-] {Fore.WHITE}No crypto prices available yet{Fore.WHITE}")
             return None
+        return prices
+
+    async def calculate_total_usd(self, user_data, prices=None):
+        """Calculate total USD value for a user's wallet including all cryptos
 
-    def calculate_total_usd(self, user_data):
-        """Calculate total USD value for a user's wallet including all cryptos"""
-        prices = self.get_crypto_prices()
+        Pass prices when valuing many wallets so they are fetched only once.
+        """
+        if prices is None:
+            prices = await self.get_crypto_prices()
         if not prices:
             print(f"{Fore.RED}[-] {Fore.WHITE}Failed to get crypto prices for USD calculation{Style.RESET_ALL}")
             return 0.0
@@ -73,7 +87,7 @@ class Fetches(commands.Cog):
             return await ctx.message.reply(embed=embed)
 
         currency = currency.upper()
-        prices = self.get_crypto_prices()
+        prices = await self.get_crypto_prices()
 
         if not prices:
             embed = discord.Embed(
@@ -136,7 +150,7 @@ class Fetches(commands.Cog):
         user = ctx.author
         user_id = user.id
         db = Users()
-        info = db.fetch_user(user_id)
+        info = await db.fetch_user(user_id)
         if info == False:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | User Not Registered", description="wait for autoregister to take place then use this command again", color=0xFF0000)
@@ -186,7 +200,7 @@ class Fetches(commands.Cog):
         """
         user = ctx.author
         db = Users()
-        db.save(ctx.author.id)
+        await db.save(ctx.author.id)
         #Check if a user was mentioned or ID provided
         mentioned_user = None
         if param:
@@ -205,7 +219,7 @@ class Fetches(commands.Cog):
                 pass
 
         # Fetch user info
-        info = db.fetch_user(user.id)
+        info = await db.fetch_user(user.id, "wallet")
         if not info:
             # Create embed with appropriate message based on whether it's the author or mentioned user
             if user == ctx.author:
@@ -289,7 +303,7 @@ class Fetches(commands.Cog):
         # Get live prices using crypto utility
         try:
             from Cogs.utils.crypto_utils import get_crypto_prices
-            live_prices = get_crypto_prices()
+            live_prices = await get_crypto_prices()
         except ImportError:
             # Fallback if crypto_utils doesn't exist
             live_prices = {}
@@ -359,7 +373,7 @@ class Fetches(commands.Cog):
         # so we don't need these redundant fields anymore.
 
         embed.set_footer(text="Use !setbal to change your primary currency", icon_url=self.bot.user.avatar.url)
-        db.save(ctx.author.id)
+        await db.save(ctx.author.id)
         await ctx.reply(embed=embed)
 
     @commands.command(aliases=["wa"]) # Added alias for convenience
@@ -368,7 +382,7 @@ class Fetches(commands.Cog):
         target_user = user or ctx.author # Default to command author if no user is mentioned
         db = Users()
 
-        info = db.fetch_user(target_user.id)
+        info = await db.fetch_user(target_user.id, "wallet")
         if not info:
             # Use a more informative embed for non-registered users
             embed = discord.Embed(
@@ -392,7 +406,7 @@ class Fetches(commands.Cog):
         }
 
         # Calculate total USD value
-        total_usd = self.calculate_total_usd(info)
+        total_usd = await self.calculate_total_usd(info)
 
         # Prepare currency emojis (ensure consistency)
         emoji_map = {
@@ -507,17 +521,18 @@ class Fetches(commands.Cog):
 
     # Leaderboard Pagination View
     class LeaderboardView(discord.ui.View):
-        def __init__(self, author_id, all_data, page_size=10, timeout=60):
+        def __init__(self, cog, author_id, metric, info, page_size=10, timeout=60):
             super().__init__(timeout=timeout)
+            self.cog = cog
             self.author_id = author_id
-            self.all_data = all_data
+            self.metric = metric
             self.page_size = page_size
             self.current_page = 0
-            self.total_pages = max(1, (len(all_data["users"]) + page_size - 1) // page_size)
+            self.total_pages = max(1, (info.get("total", 0) + page_size - 1) // page_size)
+            self.updated_at = info.get("updated_at")
+            self.page_entries = []
+            self.author_entry = None
             self.message = None
-            self.scope = all_data.get("scope", "global")
-            self.leaderboard_type = all_data.get("type", "stats")
-            self.stat_type = all_data.get("stat_type", "wins")
 
             # Disable buttons if not needed
             self.update_buttons()
@@ -529,70 +544,52 @@ class Fetches(commands.Cog):
             self.next_button.disabled = self.current_page >= self.total_pages - 1
             self.last_page_button.disabled = self.current_page >= self.total_pages - 1
 
-        @discord.ui.button(label="<<", style=discord.ButtonStyle.gray, custom_id="first_page")
-        async def first_page_button(self, button, interaction):
+        async def load_page(self):
+            """Fetch the current page from the leaderboard snapshot and name its rows"""
+            boards = Leaderboards()
+            if self.author_entry is None:
+                self.author_entry = await boards.rank_of(self.metric, self.author_id) or {}
+            entries = await boards.fetch_page(self.metric, self.current_page, self.page_size)
+            names = await usernames.resolve_many([entry["discord_id"] for entry in entries])
+            for entry in entries:
+                entry["name"] = names[entry["discord_id"]]
+            self.page_entries = entries
+            self.update_buttons()
+
+        async def show_page(self, interaction, page):
             if interaction.user.id != self.author_id:
                 return await interaction.response.send_message("This is not your leaderboard!", ephemeral=True)
 
-            self.current_page = 0
-            self.update_buttons()
+            self.current_page = max(0, min(self.total_pages - 1, page))
+            await self.load_page()
             await interaction.response.edit_message(embed=self.get_current_page_embed(), view=self)
 
+        @discord.ui.button(label="<<", style=discord.ButtonStyle.gray, custom_id="first_page")
+        async def first_page_button(self, button, interaction):
+            await self.show_page(interaction, 0)
+
         @discord.ui.button(label="<", style=discord.ButtonStyle.gray, custom_id="prev_page")
         async def prev_button(self, button, interaction):
-            if interaction.user.id != self.author_id:
-                return await interaction.response.send_message("This is not your leaderboard!", ephemeral=True)
-
-            self.current_page = max(0, self.current_page - 1)
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_current_page_embed(), view=self)
+            await self.show_page(interaction, self.current_page - 1)
 
         @discord.ui.button(label=">", style=discord.ButtonStyle.gray, custom_id="next_page")
         async def next_button(self, button, interaction):
-            if interaction.user.id != self.author_id:
-                return await interaction.response.send_message("This is not your leaderboard!", ephemeral=True)
-
-            self.current_page = min(self.total_pages - 1, self.current_page + 1)
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_current_page_embed(), view=self)
+            await self.show_page(interaction, self.current_page + 1)
 
         @discord.ui.button(label=">>", style=discord.ButtonStyle.gray, custom_id="last_page")
         async def last_page_button(self, button, interaction):
-            if interaction.user.id != self.author_id:
-                return await interaction.response.send_message("This is not your leaderboard!", ephemeral=True)
-
-            self.current_page = self.total_pages - 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_current_page_embed(), view=self)
+            await self.show_page(interaction, self.total_pages - 1)
 
         def get_current_page_embed(self):
-            # Get data for current page
-            start_idx = self.current_page * self.page_size
-            end_idx = min(start_idx + self.page_size, len(self.all_data["users"]))
-            current_page_data = self.all_data["users"][start_idx:end_idx]
-
-            # Create leaderboard embed
-            return self.create_leaderboard_embed(current_page_data, start_idx)
-
-        def create_leaderboard_embed(self, users_data, start_idx):
-            # Find user's position in the full leaderboard
-            user_id = self.all_data.get("author_id")
-            user_position = None
-            user_amount = 0
-            for i, user in enumerate(self.all_data["users"]):
-                if user["id"] == user_id:
-                    user_position = i + 1
-                    user_amount = user["amount"]
-                    break
+            user_position = self.author_entry.get("rank") if self.author_entry else None
+            user_amount = self.author_entry.get("amount", 0) if self.author_entry else 0
 
             # Determine title and format based on leaderboard type
-            leaderboard_type = self.all_data.get("type", "usd")
-            
-            if leaderboard_type == "wins":
+            if self.metric == "wins":
                 title = "<:yes:1355501647538815106> | Most Wins Leaderboard"
                 description = f"Your Rank: #{user_position} ({user_amount:,} wins)" if user_position else None
                 value_format = lambda x: f"`{x:,} wins`"
-            elif leaderboard_type == "wagered":
+            elif self.metric == "wagered":
                 title = "💰 | Total Wagered Leaderboard"
                 description = f"Your Rank: #{user_position} (${user_amount:,.2f} wagered)" if user_position else None
                 value_format = lambda x: f"`${x:,.2f}`"
@@ -607,22 +604,21 @@ class Fetches(commands.Cog):
                 color=0x00FFAE
             )
 
-            if not users_data:
+            if not self.page_entries:
                 embed.description = "No users found on this page."
 
-            for i, user_data in enumerate(users_data):
-                # Calculate actual position on leaderboard
-                position = start_idx + i + 1
-
+            for entry in self.page_entries:
                 embed.add_field(
-                    name=f"#{position}. {user_data['name']}",
-                    value=value_format(user_data['amount']),
+                    name=f"#{entry['rank']}. {entry['name']}",
+                    value=value_format(entry['amount']),
                     inline=False
                 )
 
-            # Footer with pagination info
+            # Footer with pagination info; the timestamp shows when the snapshot was built
             footer_text = f"Page {self.current_page + 1} of {self.total_pages} • BetSync Casino"
-            embed.set_footer(text=footer_text, icon_url=self.all_data.get("bot_avatar", ""))
+            embed.set_footer(text=footer_text, icon_url=self.cog.bot.user.avatar.url)
+            if self.updated_at:
+                embed.timestamp = self.updated_at.replace(tzinfo=datetime.timezone.utc)
             return embed
 
         async def on_timeout(self):
@@ -636,6 +632,29 @@ class Fetches(commands.Cog):
                 except:
                     pass
 
+    async def build_leaderboard_view(self, metric, author_id):
+        """
+        Loads the first page of a leaderboard snapshot.
+
+        Returns:
+            LeaderboardView: The loaded view, or None if nobody is ranked.
+        """
+        info = await Leaderboards().info(metric)
+        if not info or not info.get("total"):
+            return None
+        view = self.LeaderboardView(self, author_id, metric, info)
+        await view.load_page()
+        return view
+
+    def combine_with_dropdown(self, leaderboard_view, author_id, metric):
+        """Attach the leaderboard type dropdown above the pagination buttons"""
+        dropdown_view = self.LeaderboardDropdownView(author_id, metric)
+        combined_view = discord.ui.View(timeout=60)
+        combined_view.add_item(dropdown_view.children[0])  # Add dropdown
+        for item in leaderboard_view.children:  # Add pagination buttons
+            combined_view.add_item(item)
+        return dropdown_view, combined_view
+
     @commands.command(aliases=["lb", "top"])
     async def leaderboard(self, ctx, leaderboard_type: str = None):
         """View leaderboards with dropdown selection or direct access"""
@@ -667,10 +686,9 @@ class Fetches(commands.Cog):
 
     async def show_wins_leaderboard_with_dropdown(self, ctx, loading_message):
         """Show wins leaderboard with dropdown for switching"""
-        db = Users()
-        all_users = list(db.collection.find())
+        leaderboard_view = await self.build_leaderboard_view("wins", ctx.author.id)
 
-        if not all_users:
+        if leaderboard_view is None:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | No Users Found",
                 description="No users found in the database.",
@@ -679,97 +697,25 @@ class Fetches(commands.Cog):
             await loading_message.edit(embed=embed)
             return
 
-        # Calculate wins for each user
-        formatted_users = []
-        for user_data in all_users:
-            total_wins = user_data.get("total_wins", 0)
-            if total_wins > 0:  # Only include users with wins
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": total_wins,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by wins descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        # Create the data structure for the paginated view
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "wins",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": ctx.author.id
-        }
-
-        # Create dropdown view and pagination view
-        dropdown_view = self.LeaderboardDropdownView(ctx.author.id, "wins")
-        leaderboard_view = self.LeaderboardView(ctx.author.id, leaderboard_data)
-        
-        # Combine views
-        combined_view = discord.ui.View(timeout=60)
-        combined_view.add_item(dropdown_view.children[0])  # Add dropdown
-        for item in leaderboard_view.children:  # Add pagination buttons
-            combined_view.add_item(item)
-
-        embed = leaderboard_view.get_current_page_embed()
-        await loading_message.edit(embed=embed, view=combined_view)
+        dropdown_view, combined_view = self.combine_with_dropdown(leaderboard_view, ctx.author.id, "wins")
+        await loading_message.edit(embed=leaderboard_view.get_current_page_embed(), view=combined_view)
         dropdown_view.message = loading_message
 
-    async def show_wins_leaderboard(self, ctx):
-        """Show wins leaderboard without dropdown"""
-        db = Users()
-        all_users = list(db.collection.find())
-
-        if not all_users:
-            return await ctx.reply("No users found in the database.")
+    async def show_metric_leaderboard(self, ctx, metric):
+        """Show a leaderboard without dropdown"""
+        view = await self.build_leaderboard_view(metric, ctx.author.id)
 
-        # Calculate wins for each user
-        formatted_users = []
-        for user_data in all_users:
-            total_wins = user_data.get("total_wins", 0)
-            if total_wins > 0:  # Only include users with wins
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": total_wins,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by wins descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        # Create the data structure for the paginated view
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "wins",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": ctx.author.id
-        }
+        if view is None:
+            return await ctx.reply("No users found in the leaderboard.")
 
-        # Create and send the paginated view
-        view = self.LeaderboardView(ctx.author.id, leaderboard_data)
         message = await ctx.reply(embed=view.get_current_page_embed(), view=view)
         view.message = message
 
-    async def show_wins_leaderboard_response(self, interaction, message):
-        """Show wins leaderboard as interaction response"""
-        db = Users()
-        all_users = list(db.collection.find())
+    async def show_metric_leaderboard_response(self, interaction, message, metric):
+        """Show a leaderboard as interaction response"""
+        leaderboard_view = await self.build_leaderboard_view(metric, interaction.user.id)
 
-        if not all_users:
+        if leaderboard_view is None:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | No Users Found",
                 description="No users found in the database.",
@@ -778,237 +724,33 @@ class Fetches(commands.Cog):
             await interaction.edit_original_response(embed=embed, view=None)
             return
 
-        # Calculate wins for each user
-        formatted_users = []
-        for user_data in all_users:
-            total_wins = user_data.get("total_wins", 0)
-            if total_wins > 0:
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": total_wins,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by wins descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "wins",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": interaction.user.id
-        }
+        dropdown_view, combined_view = self.combine_with_dropdown(leaderboard_view, interaction.user.id, metric)
+        await interaction.edit_original_response(embed=leaderboard_view.get_current_page_embed(), view=combined_view)
+        dropdown_view.message = message
 
-        dropdown_view = self.LeaderboardDropdownView(interaction.user.id, "wins")
-        leaderboard_view = self.LeaderboardView(interaction.user.id, leaderboard_data)
-        
-        combined_view = discord.ui.View(timeout=60)
-        combined_view.add_item(dropdown_view.children[0])
-        for item in leaderboard_view.children:
-            combined_view.add_item(item)
+    async def show_wins_leaderboard(self, ctx):
+        """Show wins leaderboard without dropdown"""
+        await self.show_metric_leaderboard(ctx, "wins")
 
-        embed = leaderboard_view.get_current_page_embed()
-        await interaction.edit_original_response(embed=embed, view=combined_view)
-        dropdown_view.message = message
+    async def show_wins_leaderboard_response(self, interaction, message):
+        """Show wins leaderboard as interaction response"""
+        await self.show_metric_leaderboard_response(interaction, message, "wins")
 
     async def show_wagered_leaderboard(self, ctx):
         """Show total wagered leaderboard"""
-        db = Users()
-        all_users = list(db.collection.find())
-
-        if not all_users:
-            return await ctx.reply("No users found in the database.")
-
-        # Calculate total wagered for each user
-        formatted_users = []
-        for user_data in all_users:
-            total_wagered = user_data.get("total_spent", 0)
-            if total_wagered > 0:  # Only include users with wagered amount
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": total_wagered,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by wagered amount descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        # Create the data structure for the paginated view
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "wagered",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": ctx.author.id
-        }
-
-        # Create and send the paginated view
-        view = self.LeaderboardView(ctx.author.id, leaderboard_data)
-        message = await ctx.reply(embed=view.get_current_page_embed(), view=view)
-        view.message = message
+        await self.show_metric_leaderboard(ctx, "wagered")
 
     async def show_wagered_leaderboard_response(self, interaction, message):
         """Show wagered leaderboard as interaction response"""
-        db = Users()
-        all_users = list(db.collection.find())
-
-        if not all_users:
-            embed = discord.Embed(
-                title="<:no:1344252518305234987> | No Users Found",
-                description="No users found in the database.",
-                color=0xFF0000
-            )
-            await interaction.edit_original_response(embed=embed, view=None)
-            return
-
-        # Calculate total wagered for each user
-        formatted_users = []
-        for user_data in all_users:
-            total_wagered = user_data.get("total_spent", 0)
-            if total_wagered > 0:
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": total_wagered,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by wagered amount descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "wagered",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": interaction.user.id
-        }
-
-        dropdown_view = self.LeaderboardDropdownView(interaction.user.id, "wagered")
-        leaderboard_view = self.LeaderboardView(interaction.user.id, leaderboard_data)
-        
-        combined_view = discord.ui.View(timeout=60)
-        combined_view.add_item(dropdown_view.children[0])
-        for item in leaderboard_view.children:
-            combined_view.add_item(item)
-
-        embed = leaderboard_view.get_current_page_embed()
-        await interaction.edit_original_response(embed=embed, view=combined_view)
-        dropdown_view.message = message
+        await self.show_metric_leaderboard_response(interaction, message, "wagered")
 
     async def show_global_usd_leaderboard_response(self, interaction, message):
         """Show USD leaderboard as interaction response"""
-        db = Users()
-        all_users = list(db.collection.find())
-
-        if not all_users:
-            embed = discord.Embed(
-                title="<:no:1344252518305234987> | No Users Found",
-                description="No users found in the database.",
-                color=0xFF0000
-            )
-            await interaction.edit_original_response(embed=embed, view=None)
-            return
-
-        # Calculate USD value for each user and filter out 0 balances
-        formatted_users = []
-        for user_data in all_users:
-            usd_value = self.calculate_total_usd(user_data)
-            if usd_value > 0:  # Only include users with positive balance
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": usd_value,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by USD value descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "usd",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": interaction.user.id
-        }
-
-        dropdown_view = self.LeaderboardDropdownView(interaction.user.id, "usd")
-        leaderboard_view = self.LeaderboardView(interaction.user.id, leaderboard_data)
-        
-        combined_view = discord.ui.View(timeout=60)
-        combined_view.add_item(dropdown_view.children[0])
-        for item in leaderboard_view.children:
-            combined_view.add_item(item)
-
-        embed = leaderboard_view.get_current_page_embed()
-        await interaction.edit_original_response(embed=embed, view=combined_view)
-        dropdown_view.message = message
+        await self.show_metric_leaderboard_response(interaction, message, "usd")
 
     async def show_global_usd_leaderboard(self, ctx):
         """Show global leaderboard sorted by USD wallet value"""
-        db = Users()
-        all_users = list(db.collection.find())
-
-        if not all_users:
-            return await ctx.reply("No users found in the leaderboard.")
-
-        # Calculate USD value for each user and filter out 0 balances
-        formatted_users = []
-        for user_data in all_users:
-            usd_value = self.calculate_total_usd(user_data)
-            if usd_value > 0:  # Only include users with positive balance
-                try:
-                    user = await self.bot.fetch_user(user_data["discord_id"])
-                    user_name = user.name if user else f"User {user_data['discord_id']}"
-                    formatted_users.append({
-                        "name": user_name,
-                        "amount": usd_value,
-                        "id": user_data["discord_id"]
-                    })
-                except Exception as e:
-                    print(f"Error getting user: {e}")
-                    continue
-
-        # Sort by USD value descending
-        formatted_users.sort(key=lambda x: x["amount"], reverse=True)
-
-        # Create the data structure for the paginated view
-        leaderboard_data = {
-            "users": formatted_users,
-            "scope": "global",
-            "type": "usd",
-            "bot_avatar": self.bot.user.avatar.url,
-            "author_id": ctx.author.id
-        }
-
-        # Create and send the paginated view
-        view = self.LeaderboardView(ctx.author.id, leaderboard_data)
-        message = await ctx.reply(embed=view.get_current_page_embed(), view=view)
-        view.message = message
+        await self.show_metric_leaderboard(ctx, "usd")
 
     async def show_leaderboard_usage(self, ctx):
         """Show usage information for leaderboard command"""
@@ -1043,7 +785,7 @@ class Fetches(commands.Cog):
             user = ctx.author
 
         db = Users()
-        user_data = db.fetch_user(user.id)
+        user_data = await db.fetch_user(user.id, "progression")
 
         if not user_data:
             embed = discord.Embed(
@@ -1189,7 +931,7 @@ class Fetches(commands.Cog):
 
             # Process the claim
             db = Users()
-            user_data = db.fetch_user(self.user_id)
+            user_data = await db.fetch_user(self.user_id, "progression")
 
             if not user_data:
                 print(f"{Back.RED}  {Style.DIM}{self.user_id}{Style.RESET_ALL}{Back.RESET}{Fore.RED}    ERROR    {Fore.WHITE}User data not found when claiming rakeback{Style.RESET_ALL}")
@@ -1206,13 +948,13 @@ class Fetches(commands.Cog):
             print(f"{Back.CYAN}  {Style.DIM}{self.user_id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.GREEN}Claiming {rakeback_tokens:.2f} rakeback tokens{Style.RESET_ALL}  {Fore.MAGENTA}rakeback_claim{Fore.WHITE}")
 
             # Update rakeback tokens to 0
-            update_result = db.collection.update_one(
+            update_result = await db.collection.update_one(
                 {"discord_id": self.user_id},
                 {"$set": {"rakeback_tokens": 0}}
             )
 
             # Add the rakeback tokens to user's tokens
-            balance_result = db.update_balance(self.user_id, rakeback_tokens, operation="$inc")
+            balance_result = await db.update_balance(self.user_id, rakeback_tokens, operation="$inc")
 
             # Log after claiming
             print(f"{Back.GREEN}  {Style.DIM}{self.user_id}{Style.RESET_ALL}{Back.RESET}{Fore.GREEN}    SUCCESS    {Fore.WHITE}Rakeback claimed: {rakeback_tokens:.2f} points | DB updates: {update_result.modified_count}, {balance_result}{Style.RESET_ALL}")
@@ -1239,7 +981,7 @@ class Fetches(commands.Cog):
             )
 
             # Add a field showing new balance
-            new_balance = db.fetch_user(self.user_id).get('points', 0)
+            new_balance = (await db.fetch_user(self.user_id)).get('points', 0)
             claim_embed.add_field(
                 name="💵 New points Balance",
                 value=f"**{new_balance:,.2f} tokens**",
@@ -1257,7 +999,7 @@ class Fetches(commands.Cog):
             user = ctx.author
 
         db = Users()
-        user_data = db.fetch_user(user.id)
+        user_data = await db.fetch_user(user.id, "progression")
 
         if not user_data:
             embed = discord.Embed(
@@ -1386,7 +1128,7 @@ class Fetches(commands.Cog):
         Usage: !setbal [currency] - Set primary currency or show dropdown menu
         """
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id)
 
         if not user_data:
             embed = discord.Embed(
@@ -1476,7 +1218,7 @@ class Fetches(commands.Cog):
             "SOL": 0.0001442
         }
 
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id)
         current_primary = user_data.get("primary_coin", "BTC")
         current_points = user_data.get("points", 0)
         wallet = user_data.get("wallet", {})
@@ -1498,7 +1240,7 @@ class Fetches(commands.Cog):
         new_points = new_amount / new_rate if new_rate > 0 else 0
 
         # Update database
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": ctx.author.id},
             {
                 "$set": {
@@ -1590,7 +1332,7 @@ class CurrencyDropdownView(discord.ui.View):
             "LTC": 0.00023
         }
 
-        user_data = self.db.fetch_user(self.user_id)
+        user_data = await self.db.fetch_user(self.user_id)
         current_primary = user_data.get("primary_coin", "BTC")
         current_points = user_data.get("points", 0)
         wallet = user_data.get("wallet", {})
@@ -1612,7 +1354,7 @@ class CurrencyDropdownView(discord.ui.View):
         new_points = new_amount / new_rate if new_rate > 0 else 0
 
         # Update database
-        self.db.collection.update_one(
+        await self.db.collection.update_one(
             {"discord_id": self.user_id},
             {
                 "$set": {
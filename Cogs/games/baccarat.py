@@ -2,13 +2,14 @@
 import discord
 import asyncio
 import random
-import datetime
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 import time
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import BACCARAT_PAYOUTS
 
 class BaccaratView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, timeout=180):
@@ -199,7 +200,7 @@ class BaccaratGame(commands.Cog):
                     # Refund the bet
                     user_db = Users()
                     #if tokens_used > 0:
-                    user_db.update_balance(ctx.author.id, tokens_used, "points", "$inc")
+                    await user_db.update_balance(ctx.author.id, tokens_used, "points", "$inc")
                     #user_db.save(ctx.author.id)
                     #if credits_used > 0:
                         #user_db.update_balance(ctx.author.id, credits_used, "credits", "$inc")
@@ -270,13 +271,11 @@ class BaccaratGame(commands.Cog):
                 # Normal game logic
                 if player_score > banker_score:
                     winner = "player"
-                    win_multiplier = 1.85 if bet_on == "player" else 0
                 elif banker_score > player_score:
                     winner = "banker"
-                    win_multiplier = 1.85 if bet_on == "banker" else 0
                 else:
                     winner = "tie"
-                    win_multiplier = 4 if bet_on == "tie" else 0
+                win_multiplier = BACCARAT_PAYOUTS[bet_on] if bet_on == winner else 0
             
             # Calculate winnings
             win_amount = total_bet * win_multiplier
@@ -328,28 +327,11 @@ class BaccaratGame(commands.Cog):
             result_embed.set_footer(text="BetSync Casino • Use the Play Again button to play another round")
             
             # Process game result in the database
-            user_db = Users()
-            server_db = Servers()
-            
-            # Timestamp for history entries
-            timestamp = int(datetime.datetime.now().timestamp())
-            
-            if win_amount > 0:
-                # Player wins - add winnings to balance
-                user_db.update_balance(ctx.author.id, win_amount, "points", "$inc")
-                
+            await settlement.settle(ctx.author, ctx.guild, "baccarat", total_bet, win_amount, {
+                "bet_on": bet_on,
+                "winner": winner,
+            })
 
-                
-                # Update server stats - casino loses
-                server_db.update_server_profit(ctx, ctx.guild.id, -(win_amount - total_bet), game="baccarat")
-                
-                
-            else:
-                
-                # Update server stats - casino wins
-                server_db.update_server_profit(ctx, ctx.guild.id, total_bet, game="baccarat")
-                
-                
             #user_db.save(ctx.author.id)
             # Remove game from ongoing games
             if ctx.author.id in self.ongoing_games:
@@ -401,8 +383,7 @@ class BaccaratGame(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -2,12 +2,15 @@ import discord
 import random
 import os
 import io
-import datetime
 import time
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
+from Cogs.utils.edit_scheduler import edits
 from PIL import Image, ImageDraw, ImageFont
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
 
 # Card values
@@ -16,6 +19,229 @@ CARD_VALUES = {
     'J': 10, 'Q': 10, 'K': 10, 'A': 11
 }
 
+def render_table(player_cards, dealer_cards, show_dealer=False):
+    """Generate game image showing card hands, styled like the provided image"""
+    # Image dimensions and settings
+    width, height = 1000, 600
+    bg_color = (8, 28, 40)  # Darker navy blue background to match reference image
+    background_image = atlas.background("bjbackground.jpg", (width, height))
+    image = background_image.copy() if background_image else Image.new('RGB', (width, height), bg_color)
+    draw = ImageDraw.Draw(image)
+
+    try:
+        # Load fonts
+        title_font = atlas.font("roboto.ttf", 26) 
+        subtitle_font = atlas.font("roboto.ttf", 22)
+        value_font = atlas.font("roboto.ttf", 26)
+    except:
+        # Fallback fonts
+        title_font = ImageFont.load_default()
+        subtitle_font = ImageFont.load_default()
+        value_font = ImageFont.load_default()
+
+    # Card sizes and positioning
+    card_width = 120
+    card_height = 170
+    card_offset = 60  # Increased card spread for better visibility
+
+    # Draw ribbon-style banner
+    banner_width = 350
+    banner_height = 40
+    banner_x = (width - banner_width) // 2
+    banner_y = 280
+
+    # Draw ribbon with slight gradient
+    banner_color = (48, 58, 68)
+    draw.rectangle(
+        (banner_x, banner_y, banner_x + banner_width, banner_y + banner_height),
+        fill=banner_color,
+        outline=(58, 68, 78)
+    )
+
+    # Add ribbon ends
+    ribbon_end_width = 15
+    ribbon_end_height = 20
+
+    # Left ribbon end
+    draw.polygon(
+        [(banner_x, banner_y), 
+         (banner_x - ribbon_end_width, banner_y + (banner_height//2)), 
+         (banner_x, banner_y + banner_height)],
+        fill=banner_color
+    )
+
+    # Right ribbon end
+    draw.polygon(
+        [(banner_x + banner_width, banner_y), 
+         (banner_x + banner_width + ribbon_end_width, banner_y + (banner_height//2)), 
+         (banner_x + banner_width, banner_y + banner_height)],
+        fill=banner_color
+    )
+
+    # Draw the title text
+    draw.text(
+        (width // 2, banner_y + (banner_height // 2)),
+        "BLACKJACK PAYS 3 TO 2",
+        font=title_font,
+        fill=(220, 220, 220),
+        anchor="mm"  # Center alignment
+    )
+
+    # Function to draw a card hand with value bubble
+    def draw_hand(cards, y_position, is_dealer=False):
+        # Calculate total displayed width for centering
+        num_cards = len(cards if show_dealer or not is_dealer else [cards[0]])
+        total_width = card_width + ((num_cards - 1) * card_offset)
+        start_x = (width - total_width) // 2
+
+        # Calculate hand value
+        if is_dealer and not show_dealer:
+            # Only show value of first card if dealer's hand is hidden
+            value = CARD_VALUES[cards[0][0]]
+            displayed_cards = [cards[0]]
+        else:
+            displayed_cards = cards
+            # Calculate hand value
+            value = 0
+            aces = 0
+
+            for card in cards:
+                rank = card[0]
+                if rank == 'A':
+                    aces += 1
+                    value += 11
+                else:
+                    value += CARD_VALUES[rank]
+
+            # Adjust for Aces if needed
+            while value > 21 and aces > 0:
+                value -= 10
+                aces -= 1
+
+        # Draw the hand value in a pill-shaped bubble like in the reference
+        bubble_width = 50
+        bubble_height = 34
+        bubble_x = start_x + total_width + 30
+        bubble_y = y_position + (card_height // 2) - (bubble_height // 2)
+
+        # Draw rounded rect for value bubble
+        draw.rounded_rectangle(
+            (bubble_x, bubble_y, bubble_x + bubble_width, bubble_y + bubble_height),
+            radius=17,
+            fill=(52, 68, 82)
+        )
+
+        # Draw value text
+        value_text = str(value)
+        draw.text(
+            (bubble_x + (bubble_width // 2), bubble_y + (bubble_height // 2)),
+            value_text,
+            font=value_font,
+            fill=(220, 220, 220),
+            anchor="mm"  # Center alignment
+        )
+
+        # Draw the cards with increased spacing, more like the reference image
+        for i, card in enumerate(reversed(displayed_cards)):
+            # Calculate position with more space between cards
+            idx = len(displayed_cards) - 1 - i
+            x = start_x + (idx * card_offset)
+
+            try:
+                # Pre-scaled card image; back card for the dealer's hidden card
+                if is_dealer and idx > 0 and not show_dealer:
+                    card_img = atlas.card_back((card_width, card_height))
+                else:
+                    card_img = atlas.card(card[0], card[1], (card_width, card_height))
+
+                # Create white background for card with subtle shadow effect
+                card_bg = Image.new('RGB', (card_width, card_height), (255, 255, 255))
+                card_bg.paste(card_img, (0, 0), card_img)
+
+                # Add card to main image
+                image.paste(card_bg, (x, y_position))
+
+            except Exception as e:
+                # Fallback to drawing basic card if image loading fails
+                # Draw card with rounded corners
+                draw.rounded_rectangle(
+                    (x, y_position, x + card_width, y_position + card_height),
+                    radius=10,
+                    fill=(255, 255, 255),
+                    outline=(220, 220, 220)
+                )
+
+                # Draw rank and suit
+                rank = card[0]
+                suit = card[1]
+
+                # Determine color based on suit
+                text_color = (0, 0, 0)
+                if suit in ['hearts', 'diamonds']:
+                    text_color = (220, 30, 30)
+
+                # Get suit symbol
+                suit_symbol = "♠"
+                if suit == 'hearts':
+                    suit_symbol = "♥"
+                elif suit == 'diamonds':
+                    suit_symbol = "♦"
+                elif suit == 'clubs':
+                    suit_symbol = "♣"
+
+                # Draw large symbol in center
+                draw.text(
+                    (x + (card_width // 2), y_position + (card_height // 2)),
+                    suit_symbol,
+                    font=title_font,
+                    fill=text_color,
+                    anchor="mm"
+                )
+
+                # Draw rank at top-left
+                draw.text(
+                    (x + 10, y_position + 10),
+                    rank,
+                    font=title_font,
+                    fill=text_color
+                )
+
+                # Draw small suit under rank
+                draw.text(
+                    (x + 10, y_position + 40),
+                    suit_symbol,
+                    font=subtitle_font,
+                    fill=text_color
+                )
+
+                # Draw inverted rank and suit at bottom-right
+                draw.text(
+                    (x + card_width - 25, y_position + card_height - 40),
+                    rank,
+                    font=title_font,
+                    fill=text_color
+                )
+                draw.text(
+                    (x + card_width - 25, y_position + card_height - 70),
+                    suit_symbol,
+                    font=subtitle_font,
+                    fill=text_color
+                )
+
+    # Draw dealer's hand at top (moved up to avoid overlapping with banner)
+    draw_hand(dealer_cards, 70, True)
+
+    # Draw player's hand at bottom
+    draw_hand(player_cards, 400)
+
+    # Save to bytes
+    img_byte_array = io.BytesIO()
+    image.save(img_byte_array, format="PNG")
+    img_byte_array.seek(0)
+
+    return img_byte_array
+
+
 class BlackjackView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, currency_used, timeout=60):
         super().__init__(timeout=timeout)
@@ -170,8 +396,7 @@ class BlackjackView(discord.ui.View):
             play_again_view = self.cog.create_play_again_view(self.ctx.author.id, self.bet_amount, self.currency_used)
 
             # Update message with result and play again button
-            await interaction.message.edit(embed=embed, view=play_again_view)
-            await interaction.message.edit(file=file)
+            await edits.edit(interaction.message, embed=embed, view=play_again_view, file=file)
 
         else:
             # Update game view with new card
@@ -195,8 +420,7 @@ class BlackjackView(discord.ui.View):
             embed.add_field(name="Dealer's Hand", value=f"{dealer_first_card_text} ?\nShowing: {dealer_first_value}", inline=True)
             embed.set_image(url="attachment://blackjack_game.png")
 
-            await interaction.message.edit(embed=embed, view=self)
-            await interaction.message.edit(file=file)
+            await edits.edit(interaction.message, embed=embed, view=self, file=file)
 
     @discord.ui.button(label="Stand", style=discord.ButtonStyle.secondary, custom_id="stand")
     async def stand_button(self, button, interaction):
@@ -279,8 +503,7 @@ class BlackjackView(discord.ui.View):
         play_again_view = self.cog.create_play_again_view(self.ctx.author.id, self.bet_amount, self.currency_used)
 
         # Update message with result and play again button
-        await interaction.message.edit(embed=embed, view=play_again_view)
-        await interaction.message.edit(file=file)
+        await edits.edit(interaction.message, embed=embed, view=play_again_view, file=file)
 
     #@discord.ui.button(label="Double Down", style=discord.ButtonStyle.danger, custom_id="double")
     async def double_button(self, button, interaction):
@@ -293,7 +516,7 @@ class BlackjackView(discord.ui.View):
         #Check if player has enough balance to double down
         #await interaction.response.defer()
         db = Users()
-        user_data = db.fetch_user(self.ctx.author.id)
+        user_data = await db.fetch_user(self.ctx.author.id, {self.currency_used: 1})
 
         if not user_data:
             return await interaction.response.send_message("User not found in database.", ephemeral=True)
@@ -307,7 +530,7 @@ class BlackjackView(discord.ui.View):
         await interaction.response.defer()
 
         # Deduct additional bet amount
-        db.update_balance(self.ctx.author.id, -self.bet_amount, self.currency_used, "$inc")
+        await db.update_balance(self.ctx.author.id, -self.bet_amount, self.currency_used, "$inc")
 
         # Double the bet
         original_bet = self.bet_amount
@@ -393,8 +616,7 @@ class BlackjackView(discord.ui.View):
 
         try:
             # Update message with result and play again button
-            await interaction.edit_original_response(embed=embed, view=play_again_view)
-            await interaction.message.edit(file=file)
+            await edits.edit(interaction.message, embed=embed, view=play_again_view, file=file)
         except Exception as e:
             print(f"Error updating message: {e}")
             # Fallback method if edit fails
@@ -463,8 +685,7 @@ class Blackjack(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -538,7 +759,7 @@ class Blackjack(commands.Cog):
             # Handle "all", "max", and "half" bet amounts
             db = Users()
             if bet_amount.lower() in ["all", "max", "half"]:
-                user_data = db.fetch_user(ctx.author.id)
+                user_data = await db.fetch_user(ctx.author.id, "balance")
                 if user_data == False:
                     await loading_message.delete()
                     embed = discord.Embed(
@@ -722,240 +943,8 @@ class Blackjack(commands.Cog):
             await ctx.reply(embed=error_embed)
 
     async def generate_game_image(self, player_cards, dealer_cards, show_dealer=False):
-        """Generate game image showing card hands, styled like the provided image"""
-        # Image dimensions and settings
-        width, height = 1000, 600
-        bg_color = (8, 28, 40)  # Darker navy blue background to match reference image
-        image = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-
-        try:
-            # Load fonts
-            title_font = ImageFont.truetype("roboto.ttf", 26) 
-            subtitle_font = ImageFont.truetype("roboto.ttf", 22)
-            value_font = ImageFont.truetype("roboto.ttf", 26)
-        except:
-            # Fallback fonts
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            value_font = ImageFont.load_default()
-
-        # Card sizes and positioning
-        card_width = 120
-        card_height = 170
-        card_offset = 60  # Increased card spread for better visibility
-
-        # Draw ribbon-style banner
-        banner_width = 350
-        banner_height = 40
-        banner_x = (width - banner_width) // 2
-        banner_y = 280
-
-        # Draw ribbon with slight gradient
-        banner_color = (48, 58, 68)
-        draw.rectangle(
-            (banner_x, banner_y, banner_x + banner_width, banner_y + banner_height),
-            fill=banner_color,
-            outline=(58, 68, 78)
-        )
-
-        # Add ribbon ends
-        ribbon_end_width = 15
-        ribbon_end_height = 20
-
-        # Left ribbon end
-        draw.polygon(
-            [(banner_x, banner_y), 
-             (banner_x - ribbon_end_width, banner_y + (banner_height//2)), 
-             (banner_x, banner_y + banner_height)],
-            fill=banner_color
-        )
-
-        # Right ribbon end
-        draw.polygon(
-            [(banner_x + banner_width, banner_y), 
-             (banner_x + banner_width + ribbon_end_width, banner_y + (banner_height//2)), 
-             (banner_x + banner_width, banner_y + banner_height)],
-            fill=banner_color
-        )
-
-        # Draw the title text
-        draw.text(
-            (width // 2, banner_y + (banner_height // 2)),
-            "BLACKJACK PAYS 3 TO 2",
-            font=title_font,
-            fill=(220, 220, 220),
-            anchor="mm"  # Center alignment
-        )
-
-        # Function to draw a card hand with value bubble
-        def draw_hand(cards, y_position, is_dealer=False):
-            # Calculate total displayed width for centering
-            num_cards = len(cards if show_dealer or not is_dealer else [cards[0]])
-            total_width = card_width + ((num_cards - 1) * card_offset)
-            start_x = (width - total_width) // 2
-
-            # Calculate hand value
-            if is_dealer and not show_dealer:
-                # Only show value of first card if dealer's hand is hidden
-                value = CARD_VALUES[cards[0][0]]
-                displayed_cards = [cards[0]]
-            else:
-                displayed_cards = cards
-                # Calculate hand value
-                value = 0
-                aces = 0
-
-                for card in cards:
-                    rank = card[0]
-                    if rank == 'A':
-                        aces += 1
-                        value += 11
-                    else:
-                        value += CARD_VALUES[rank]
-
-                # Adjust for Aces if needed
-                while value > 21 and aces > 0:
-                    value -= 10
-                    aces -= 1
-
-            # Draw the hand value in a pill-shaped bubble like in the reference
-            bubble_width = 50
-            bubble_height = 34
-            bubble_x = start_x + total_width + 30
-            bubble_y = y_position + (card_height // 2) - (bubble_height // 2)
-
-            # Draw rounded rect for value bubble
-            draw.rounded_rectangle(
-                (bubble_x, bubble_y, bubble_x + bubble_width, bubble_y + bubble_height),
-                radius=17,
-                fill=(52, 68, 82)
-            )
-
-            # Draw value text
-            value_text = str(value)
-            draw.text(
-                (bubble_x + (bubble_width // 2), bubble_y + (bubble_height // 2)),
-                value_text,
-                font=value_font,
-                fill=(220, 220, 220),
-                anchor="mm"  # Center alignment
-            )
-
-            # Draw the cards with increased spacing, more like the reference image
-            for i, card in enumerate(reversed(displayed_cards)):
-                # Calculate position with more space between cards
-                idx = len(displayed_cards) - 1 - i
-                x = start_x + (idx * card_offset)
-
-                # Determine which card image to use
-                if is_dealer and idx > 0 and not show_dealer:
-                    # Use back card for dealer's hidden card
-                    card_path = "assests/back_card.png"
-                else:
-                    card_path = f"assests/{card[1]}_{card[0]}.png"
-
-                try:
-                    # Load and resize card image
-                    card_img = Image.open(card_path).convert('RGBA')
-                    card_img = card_img.resize((card_width, card_height))
-
-                    # Create white background for card with subtle shadow effect
-                    card_bg = Image.new('RGB', (card_width, card_height), (255, 255, 255))
-                    card_bg.paste(card_img, (0, 0), card_img)
-
-                    # Add card to main image
-                    image.paste(card_bg, (x, y_position))
-
-                except Exception as e:
-                    # Fallback to drawing basic card if image loading fails
-                    # Draw card with rounded corners
-                    draw.rounded_rectangle(
-                        (x, y_position, x + card_width, y_position + card_height),
-                        radius=10,
-                        fill=(255, 255, 255),
-                        outline=(220, 220, 220)
-                    )
-
-                    # Draw rank and suit
-                    rank = card[0]
-                    suit = card[1]
-
-                    # Determine color based on suit
-                    text_color = (0, 0, 0)
-                    if suit in ['hearts', 'diamonds']:
-                        text_color = (220, 30, 30)
-
-                    # Get suit symbol
-                    suit_symbol = "♠"
-                    if suit == 'hearts':
-                        suit_symbol = "♥"
-                    elif suit == 'diamonds':
-                        suit_symbol = "♦"
-                    elif suit == 'clubs':
-                        suit_symbol = "♣"
-
-                    # Draw large symbol in center
-                    draw.text(
-                        (x + (card_width // 2), y_position + (card_height // 2)),
-                        suit_symbol,
-                        font=title_font,
-                        fill=text_color,
-                        anchor="mm"
-                    )
-
-                    # Draw rank at top-left
-                    draw.text(
-                        (x + 10, y_position + 10),
-                        rank,
-                        font=title_font,
-                        fill=text_color
-                    )
-
-                    # Draw small suit under rank
-                    draw.text(
-                        (x + 10, y_position + 40),
-                        suit_symbol,
-                        font=subtitle_font,
-                        fill=text_color
-                    )
-
-                    # Draw inverted rank and suit at bottom-right
-                    draw.text(
-                        (x + card_width - 25, y_position + card_height - 40),
-                        rank,
-                        font=title_font,
-                        fill=text_color
-                    )
-                    draw.text(
-                        (x + card_width - 25, y_position + card_height - 70),
-                        suit_symbol,
-                        font=subtitle_font,
-                        fill=text_color
-                    )
-
-        # Draw dealer's hand at top (moved up to avoid overlapping with banner)
-        draw_hand(dealer_cards, 70, True)
-
-        # Draw player's hand at bottom
-        draw_hand(player_cards, 400)
-
-        # Load the background image
-        try:
-            background_image = Image.open("assests/bjbackground.jpg").convert('RGB')
-            background_image = background_image.resize((width, height))
-            image = background_image.copy()
-            image.paste(image, (0, 0), image)
-            draw = ImageDraw.Draw(image)
-        except:
-            pass
-
-        # Save to bytes
-        img_byte_array = io.BytesIO()
-        image.save(img_byte_array, format="PNG")
-        img_byte_array.seek(0)
-
-        return img_byte_array
+        """Generate game image showing card hands, rendered off the event loop"""
+        return await render_service.render_file("blackjack", render_table, player_cards, dealer_cards, show_dealer)
 
     def create_play_again_view(self, user_id, bet_amount, currency_used):
         """Create a view with a play again button"""
@@ -998,127 +987,17 @@ class Blackjack(commands.Cog):
         if user_id in self.ongoing_games:
             del self.ongoing_games[user_id]
 
-        # Get database instances
-        user_db = Users()
-        server_db = Servers()
-
         # Calculate win amount
         win_amount = 0
         if result == "win":
             win_amount = bet_amount * 1.80
         elif result == "blackjack":
             win_amount = bet_amount * 1.3
-
-        # Timestamp for history entries
-        timestamp = int(datetime.datetime.now().timestamp())
-
-        if result == "push":
+        elif result == "push":
             # Push - return bet amount only
-            user_db.update_balance(user_id, bet_amount, "points", "$inc")
-
-            history_entry = {
-                "type": "push",
-                "game": "blackjack",
-                "amount": bet_amount,
-                "bet": bet_amount,
-                "multiplier": 1.0,
-                "timestamp": timestamp
-            }
-
-            user_db.collection.update_one(
-                {"discord_id": user_id},
-                {
-                    "$push": {"history": {"$each": [history_entry], "$slice": -100}},
-                    "$inc": {"total_played": 1}
-                }
-            )
-
-            # No server profit change for push
-            server_history_entry = {
-                "type": "push",
-                "game": "blackjack",
-                "user_id": user_id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "amount": bet_amount,
-                "multiplier": 1.0,
-                "timestamp": timestamp
-            }
-            server_db.update_history(ctx.guild.id, server_history_entry)
-
-        elif result == "win" or result == "blackjack":
-            # Player wins - add winnings to balance
-            user_db.update_balance(user_id, win_amount, "points", "$inc")
-
-            # Add win to history
-            multiplier = 1.3 if result == "blackjack" else 1.80
-            history_entry = {
-                "type": "win",
-                "game": "blackjack",
-                "amount": win_amount,
-                "bet": bet_amount,
-                "multiplier": multiplier,
-                "timestamp": timestamp
-            }
-
-            user_db.collection.update_one(
-                {"discord_id": user_id},
-                {
-                    "$push": {"history": {"$each": [history_entry], "$slice": -100}},
-                    "$inc": {"total_earned": win_amount, "total_won": 1, "total_played": 1}
-                }
-            )
-
-            # Update server stats - casino loses
-            server_db.update_server_profit(ctx, ctx.guild.id, -(win_amount - bet_amount), game="blackjack")
-
-            # Add to server history
-            server_history_entry = {
-                "type": "win",
-                "game": "blackjack",
-                "user_id": user_id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "amount": win_amount,
-                "multiplier": multiplier,
-                "timestamp": timestamp
-            }
-            server_db.update_history(ctx.guild.id, server_history_entry)
-
-        elif result == "loss":
-            # Player loses - already deducted bet when starting game
-            history_entry = {
-                "type": "loss",
-                "game": "blackjack",
-                "amount": bet_amount,
-                "multiplier": 0,
-                "timestamp": timestamp
-            }
-
-            user_db.collection.update_one(
-                {"discord_id": user_id},
-                {
-                    "$push": {"history": {"$each": [history_entry], "$slice": -100}},
-                    "$inc": {"total_spent": bet_amount, "total_lost": 1, "total_played": 1}
-                }
-            )
-
-            # Update server stats - casino wins
-            server_db.update_server_profit(ctx, ctx.guild.id, bet_amount, game="blackjack")
-
-            # Add to server history
-            server_history_entry = {
-                "type": "loss",
-                "game": "blackjack",
-                "user_id": user_id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "amount": bet_amount,
-                "multiplier": 0,
-                "timestamp": timestamp
-            }
-            server_db.update_history(ctx.guild.id, server_history_entry)
+            win_amount = bet_amount
 
+        await settlement.settle(ctx.author, ctx.guild, "blackjack", bet_amount, win_amount)
 
 
 def setup(bot):
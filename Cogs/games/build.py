@@ -3,9 +3,9 @@ import discord
 import random
 import asyncio
 import time
-import datetime
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
+from Cogs.utils.paytables import BUILD_BLOCK_TYPES, BUILD_MAX_LEVELS
 from colorama import Fore
 
 class PlayAgainView(discord.ui.View):
@@ -44,18 +44,12 @@ class BuildGameView(discord.ui.View):
         self.bet_amount = bet_amount
         self.message = None
         self.current_level = 0
-        self.max_levels = 15
+        self.max_levels = BUILD_MAX_LEVELS
         self.game_over = False
         self.tower_blocks = []
         self.selected_blocks = []
         
-        # Block types with different risk/reward ratios (10% house edge built in)
-        self.block_types = {
-            "🟢": {"name": "Safe Block", "success_rate": 0.85, "multiplier": 1.12},
-            "🟡": {"name": "Balanced Block", "success_rate": 0.70, "multiplier": 1.25},
-            "🟠": {"name": "Risky Block", "success_rate": 0.55, "multiplier": 1.45},
-            "🔴": {"name": "Extreme Block", "success_rate": 0.40, "multiplier": 1.80}
-        }
+        self.block_types = BUILD_BLOCK_TYPES
         
         self.current_multiplier = 1.0
         self.total_multiplier = 1.0
@@ -310,54 +304,11 @@ class BuildGameView(discord.ui.View):
     async def process_cashout(self, interaction):
         payout = self.calculate_payout()
         
-        db = Users()
-        try:
-            # Update user balance
-            db.update_balance(self.ctx.author.id, payout, "points", "$inc")
-            
-            # Create win history entry
-            win_entry = {
-                "type": "win",
-                "game": "build",
-                "bet": self.bet_amount,
-                "amount": payout,
-                "multiplier": self.total_multiplier,
-                "levels": self.current_level,
-                "timestamp": int(datetime.datetime.now().timestamp())
-            }
-            
-            # Update user stats
-            db.collection.update_one(
-                {"discord_id": self.ctx.author.id},
-                {
-                    "$push": {"history": {"$each": [win_entry], "$slice": -100}},
-                    "$inc": {
-                        "total_played": 1,
-                        "total_won": 1,
-                        "total_earned": payout
-                    }
-                }
-            )
-            
-            # Update server stats
-            if isinstance(self.ctx.channel, discord.TextChannel):
-                server_db = Servers()
-                server_profit = self.bet_amount - payout
-                server_db.update_server_profit(self.ctx, self.ctx.guild.id, server_profit, game="build")
-                
-                server_bet_entry = win_entry.copy()
-                server_bet_entry.update({
-                    "user_id": self.ctx.author.id,
-                    "user_name": self.ctx.author.name
-                })
-                
-                server_db.collection.update_one(
-                    {"server_id": self.ctx.guild.id},
-                    {"$push": {"server_bet_history": {"$each": [server_bet_entry], "$slice": -100}}}
-                )
-                
-        except Exception as e:
-            print(f"Error processing cashout: {e}")
+        settled = await settlement.settle(self.ctx.author, self.ctx.guild, "build", self.bet_amount, payout, {
+            "multiplier": self.total_multiplier,
+            "levels": self.current_level,
+        })
+        if settled is None:
             return False
 
         # Create play again view
@@ -373,48 +324,9 @@ class BuildGameView(discord.ui.View):
         return True
 
     async def process_loss(self):
-        # Create loss entry
-        loss_entry = {
-            "type": "loss",
-            "game": "build",
-            "bet": self.bet_amount,
-            "amount": self.bet_amount,
+        await settlement.settle(self.ctx.author, self.ctx.guild, "build", self.bet_amount, 0, {
             "levels": self.current_level,
-            "timestamp": int(datetime.datetime.now().timestamp())
-        }
-        
-        # Update user stats
-        db = Users()
-        db.collection.update_one(
-            {"discord_id": self.ctx.author.id},
-            {
-                "$push": {"history": {"$each": [loss_entry], "$slice": -100}},
-                "$inc": {
-                    "total_played": 1,
-                    "total_lost": 1,
-                    "total_spent": self.bet_amount
-                }
-            }
-        )
-        
-        # Update server stats
-        try:
-            if isinstance(self.ctx.channel, discord.TextChannel):
-                server_db = Servers()
-                server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="build")
-                
-                server_bet_entry = loss_entry.copy()
-                server_bet_entry.update({
-                    "user_id": self.ctx.author.id,
-                    "user_name": self.ctx.author.name
-                })
-                
-                server_db.collection.update_one(
-                    {"server_id": self.ctx.guild.id},
-                    {"$push": {"server_bet_history": {"$each": [server_bet_entry], "$slice": -100}}}
-                )
-        except Exception as e:
-            print(f"Error updating server stats: {e}")
+        })
 
         # Create play again view
         play_again_view = PlayAgainView(self.cog, self.ctx, self.bet_amount, timeout=15)
@@ -493,13 +405,6 @@ class BuildCog(commands.Cog):
 
         total_bet = bet_info["total_bet_amount"]
 
-        # Record game stats
-        db = Users()
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$inc": {"total_played": 1, "total_spent": total_bet}}
-        )
-
         # Create game view
         game_view = BuildGameView(self, ctx, total_bet, timeout=180)
 
@@ -4,11 +4,125 @@ import random
 import asyncio
 from discord.ext import commands
 from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import process_bet_amount
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
 from PIL import Image, ImageDraw, ImageFont
 import io
 
+
+def draw_rounded_rectangle(draw, xy, radius, fill=None, outline=None, width=1):
+    """Draw a rounded rectangle"""
+    x1, y1, x2, y2 = xy
+    
+    # Draw four corners
+    draw.ellipse((x1, y1, x1 + radius * 2, y1 + radius * 2), fill=fill, outline=outline, width=width)
+    draw.ellipse((x2 - radius * 2, y1, x2, y1 + radius * 2), fill=fill, outline=outline, width=width)
+    draw.ellipse((x1, y2 - radius * 2, x1 + radius * 2, y2), fill=fill, outline=outline, width=width)
+    draw.ellipse((x2 - radius * 2, y2 - radius * 2, x2, y2), fill=fill, outline=outline, width=width)
+    
+    # Draw four sides
+    draw.rectangle((x1 + radius, y1, x2 - radius, y2), fill=fill, outline=None)
+    draw.rectangle((x1, y1 + radius, x2, y2 - radius), fill=fill, outline=None)
+    
+    # Draw outline if specified
+    if outline:
+        draw.line((x1 + radius, y1, x2 - radius, y1), fill=outline, width=width)  # Top
+        draw.line((x1 + radius, y2, x2 - radius, y2), fill=outline, width=width)  # Bottom
+        draw.line((x1, y1 + radius, x1, y2 - radius), fill=outline, width=width)  # Left
+        draw.line((x2, y1 + radius, x2, y2 - radius), fill=outline, width=width)  # Right
+
+
+def render_duel(player1_name, player2_name, player1_card, player2_card):
+    """Generate an image showing the card draw game result"""
+    # Create image with dark background
+    width, height = 1000, 500
+    image = Image.new("RGB", (width, height), (30, 30, 50))
+    draw = ImageDraw.Draw(image)
+    
+    # Load fonts
+    try:
+        title_font = atlas.font("roboto.ttf", 36)
+        name_font = atlas.font("roboto.ttf", 28)
+        card_font = atlas.font("roboto.ttf", 48)
+        vs_font = atlas.font("roboto.ttf", 42)
+    except:
+        # Fall back to default if font not found
+        title_font = ImageFont.load_default()
+        name_font = ImageFont.load_default()
+        card_font = ImageFont.load_default()
+        vs_font = ImageFont.load_default()
+    
+    # Draw title
+    draw.text((width // 2, 50), "Card Draw Duel", fill=(255, 255, 255), font=title_font, anchor="mm")
+    
+    # Draw player names and VS text
+    draw.text((width // 4, 120), player1_name, fill=(200, 200, 255), font=name_font, anchor="mm")
+    draw.text((width // 2, height // 2), "VS", fill=(255, 50, 50), font=vs_font, anchor="mm")
+    draw.text((width * 3 // 4, 120), player2_name, fill=(200, 200, 255), font=name_font, anchor="mm")
+    
+    # Draw player cards
+    p1_card_text = f"{player1_card[0]} of {player1_card[1]}"
+    p2_card_text = f"{player2_card[0]} of {player2_card[1]}"
+    
+    # Create card backgrounds
+    card_width = 250
+    card_height = 200
+    card_radius = 20
+    
+    # Draw Player 1's card
+    p1_card_x = width // 4 - card_width // 2
+    p1_card_y = height // 2 - card_height // 2
+    draw_rounded_rectangle(draw, (p1_card_x, p1_card_y, p1_card_x + card_width, p1_card_y + card_height), 
+                                card_radius, fill=(255, 255, 255), outline=(50, 50, 50), width=5)
+    
+    # Draw Player 2's card
+    p2_card_x = width * 3 // 4 - card_width // 2
+    p2_card_y = height // 2 - card_height // 2
+    draw_rounded_rectangle(draw, (p2_card_x, p2_card_y, p2_card_x + card_width, p2_card_y + card_height), 
+                                card_radius, fill=(255, 255, 255), outline=(50, 50, 50), width=5)
+    
+    # Draw card values
+    # Color based on suit
+    p1_color = (0, 0, 0)  # Default black
+    if player1_card[1] in ['hearts', 'diamonds']:
+        p1_color = (200, 0, 0)  # Red for hearts/diamonds
+        
+    p2_color = (0, 0, 0)  # Default black
+    if player2_card[1] in ['hearts', 'diamonds']:
+        p2_color = (200, 0, 0)  # Red for hearts/diamonds
+        
+    # Draw suit symbols and values
+    p1_text = player1_card[0]
+    p2_text = player2_card[0]
+    
+    # Add emoji based on suit
+    p1_suit = "♠️" if player1_card[1] == "spades" else "♣️" if player1_card[1] == "clubs" else "♥️" if player1_card[1] == "hearts" else "♦️"
+    p2_suit = "♠️" if player2_card[1] == "spades" else "♣️" if player2_card[1] == "clubs" else "♥️" if player2_card[1] == "hearts" else "♦️"
+    
+    # Draw card values in center of cards
+    draw.text((p1_card_x + card_width // 2, p1_card_y + card_height // 2 - 30), 
+              p1_text, fill=p1_color, font=card_font, anchor="mm")
+    draw.text((p1_card_x + card_width // 2, p1_card_y + card_height // 2 + 30), 
+              p1_suit, fill=p1_color, font=card_font, anchor="mm")
+    
+    draw.text((p2_card_x + card_width // 2, p2_card_y + card_height // 2 - 30), 
+              p2_text, fill=p2_color, font=card_font, anchor="mm")
+    draw.text((p2_card_x + card_width // 2, p2_card_y + card_height // 2 + 30), 
+              p2_suit, fill=p2_color, font=card_font, anchor="mm")
+    
+    # Draw BetSync Casino at bottom
+    draw.text((width // 2, height - 30), "BetSync Casino", fill=(150, 150, 150), font=name_font, anchor="mm")
+    
+    # Save image to buffer
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer
+
+
 class CardDrawGameView(discord.ui.View):
     def __init__(self, cog, ctx, opponent, bet_amount, currency_type, timeout=30):
         super().__init__(timeout=timeout)
@@ -47,9 +161,9 @@ class CardDrawGameView(discord.ui.View):
         
         # Process refund based on bet information
         if self.bet_amount["tokens_used"] > 0:
-            db.update_balance(self.ctx.author.id, self.bet_amount["tokens_used"], "tokens", "$inc")
+            await db.update_balance(self.ctx.author.id, self.bet_amount["tokens_used"], "tokens", "$inc")
         if self.bet_amount["credits_used"] > 0:
-            db.update_balance(self.ctx.author.id, self.bet_amount["credits_used"], "credits", "$inc")
+            await db.update_balance(self.ctx.author.id, self.bet_amount["credits_used"], "credits", "$inc")
         
         decline_embed = discord.Embed(
             title="❌ Challenge Declined",
@@ -69,9 +183,9 @@ class CardDrawGameView(discord.ui.View):
             
             # Process refund based on bet information
             if self.bet_amount["tokens_used"] > 0:
-                db.update_balance(self.ctx.author.id, self.bet_amount["tokens_used"], "tokens", "$inc")
+                await db.update_balance(self.ctx.author.id, self.bet_amount["tokens_used"], "tokens", "$inc")
             if self.bet_amount["credits_used"] > 0:
-                db.update_balance(self.ctx.author.id, self.bet_amount["credits_used"], "credits", "$inc")
+                await db.update_balance(self.ctx.author.id, self.bet_amount["credits_used"], "credits", "$inc")
             
             timeout_embed = discord.Embed(
                 title="⏰ Challenge Expired",
@@ -227,9 +341,9 @@ class CardDraw(commands.Cog):
             # Refund challenger
             db = Users()
             if bet_info["tokens_used"] > 0:
-                db.update_balance(ctx.author.id, bet_info["tokens_used"], "tokens", "$inc")
+                await db.update_balance(ctx.author.id, bet_info["tokens_used"], "tokens", "$inc")
             if bet_info["credits_used"] > 0:
-                db.update_balance(ctx.author.id, bet_info["credits_used"], "credits", "$inc")
+                await db.update_balance(ctx.author.id, bet_info["credits_used"], "credits", "$inc")
                 
             await loading_message.delete()
             return await ctx.reply(embed=error_embed)
@@ -277,48 +391,16 @@ class CardDraw(commands.Cog):
             result = "draw"
         
         # Process result
-        db = Users()
-        
         if result == "win":
             # Calculate winnings (1.96x bet)
             winnings = winner_bet_info["total_bet_amount"] * 1.96
             
-            # Update winner's balance
-            db.update_balance(winner.id, winnings, "credits", "$inc")
-            
-            # Update stats
-            db.collection.update_one(
-                {"discord_id": winner.id},
-                {"$inc": {"total_earned": winnings, "total_won": 1, "total_played": 1}}
-            )
-            db.collection.update_one(
-                {"discord_id": loser.id},
-                {"$inc": {"total_lost": 1, "total_played": 1}}
-            )
-            
-            # Add to history
-            winner_history = {
-                "type": "win",
-                "game": "carddraw",
-                "amount": winnings,
-                "bet": winner_bet_info["total_bet_amount"],
-                "timestamp": int(ctx.message.created_at.timestamp())
-            }
-            loser_history = {
-                "type": "loss",
-                "game": "carddraw",
-                "amount": loser_bet_info["total_bet_amount"],
-                "timestamp": int(ctx.message.created_at.timestamp())
-            }
-            
-            db.collection.update_one(
-                {"discord_id": winner.id},
-                {"$push": {"history": {"$each": [winner_history], "$slice": -100}}}
-            )
-            db.collection.update_one(
-                {"discord_id": loser.id},
-                {"$push": {"history": {"$each": [loser_history], "$slice": -100}}}
-            )
+            await settlement.settle(winner, ctx.guild, "carddraw", winner_bet_info["total_bet_amount"], winnings, {
+                "opponent_id": loser.id,
+            })
+            await settlement.settle(loser, ctx.guild, "carddraw", loser_bet_info["total_bet_amount"], 0, {
+                "opponent_id": winner.id,
+            })
             
             # Create result embed
             result_embed = discord.Embed(
@@ -353,43 +435,12 @@ class CardDraw(commands.Cog):
             
         else:  # Draw
             # Refund both players
-            if bet_info["tokens_used"] > 0:
-                db.update_balance(ctx.author.id, bet_info["tokens_used"], "tokens", "$inc")
-            if bet_info["credits_used"] > 0:
-                db.update_balance(ctx.author.id, bet_info["credits_used"], "credits", "$inc")
-                
-            if opponent_bet_info["tokens_used"] > 0:
-                db.update_balance(opponent.id, opponent_bet_info["tokens_used"], "tokens", "$inc")
-            if opponent_bet_info["credits_used"] > 0:
-                db.update_balance(opponent.id, opponent_bet_info["credits_used"], "credits", "$inc")
-            
-            # Update stats
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$inc": {"total_played": 1}}
-            )
-            db.collection.update_one(
-                {"discord_id": opponent.id},
-                {"$inc": {"total_played": 1}}
-            )
-            
-            # Add to history
-            draw_history = {
-                "type": "draw",
-                "game": "carddraw",
-                "amount": 0,
-                "bet": bet_info["total_bet_amount"],
-                "timestamp": int(ctx.message.created_at.timestamp())
-            }
-            
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$push": {"history": {"$each": [draw_history], "$slice": -100}}}
-            )
-            db.collection.update_one(
-                {"discord_id": opponent.id},
-                {"$push": {"history": {"$each": [draw_history], "$slice": -100}}}
-            )
+            await settlement.settle(ctx.author, ctx.guild, "carddraw", bet_info["total_bet_amount"], bet_info["total_bet_amount"], {
+                "opponent_id": opponent.id,
+            }, outcome="draw")
+            await settlement.settle(opponent, ctx.guild, "carddraw", opponent_bet_info["total_bet_amount"], opponent_bet_info["total_bet_amount"], {
+                "opponent_id": ctx.author.id,
+            }, outcome="draw")
             
             # Create result embed
             result_embed = discord.Embed(
@@ -425,112 +476,10 @@ class CardDraw(commands.Cog):
         return (value, suit)
     
     async def generate_game_image(self, player1, player2, player1_card, player2_card):
-        """Generate an image showing the card draw game result"""
-        # Create image with dark background
-        width, height = 1000, 500
-        image = Image.new("RGB", (width, height), (30, 30, 50))
-        draw = ImageDraw.Draw(image)
-        
-        # Load fonts
-        try:
-            title_font = ImageFont.truetype("roboto.ttf", 36)
-            name_font = ImageFont.truetype("roboto.ttf", 28)
-            card_font = ImageFont.truetype("roboto.ttf", 48)
-            vs_font = ImageFont.truetype("roboto.ttf", 42)
-        except:
-            # Fall back to default if font not found
-            title_font = ImageFont.load_default()
-            name_font = ImageFont.load_default()
-            card_font = ImageFont.load_default()
-            vs_font = ImageFont.load_default()
-        
-        # Draw title
-        draw.text((width // 2, 50), "Card Draw Duel", fill=(255, 255, 255), font=title_font, anchor="mm")
-        
-        # Draw player names and VS text
-        draw.text((width // 4, 120), player1.name, fill=(200, 200, 255), font=name_font, anchor="mm")
-        draw.text((width // 2, height // 2), "VS", fill=(255, 50, 50), font=vs_font, anchor="mm")
-        draw.text((width * 3 // 4, 120), player2.name, fill=(200, 200, 255), font=name_font, anchor="mm")
-        
-        # Draw player cards
-        p1_card_text = f"{player1_card[0]} of {player1_card[1]}"
-        p2_card_text = f"{player2_card[0]} of {player2_card[1]}"
-        
-        # Create card backgrounds
-        card_width = 250
-        card_height = 200
-        card_radius = 20
-        
-        # Draw Player 1's card
-        p1_card_x = width // 4 - card_width // 2
-        p1_card_y = height // 2 - card_height // 2
-        self.draw_rounded_rectangle(draw, (p1_card_x, p1_card_y, p1_card_x + card_width, p1_card_y + card_height), 
-                                    card_radius, fill=(255, 255, 255), outline=(50, 50, 50), width=5)
-        
-        # Draw Player 2's card
-        p2_card_x = width * 3 // 4 - card_width // 2
-        p2_card_y = height // 2 - card_height // 2
-        self.draw_rounded_rectangle(draw, (p2_card_x, p2_card_y, p2_card_x + card_width, p2_card_y + card_height), 
-                                    card_radius, fill=(255, 255, 255), outline=(50, 50, 50), width=5)
-        
-        # Draw card values
-        # Color based on suit
-        p1_color = (0, 0, 0)  # Default black
-        if player1_card[1] in ['hearts', 'diamonds']:
-            p1_color = (200, 0, 0)  # Red for hearts/diamonds
-            
-        p2_color = (0, 0, 0)  # Default black
-        if player2_card[1] in ['hearts', 'diamonds']:
-            p2_color = (200, 0, 0)  # Red for hearts/diamonds
-            
-        # Draw suit symbols and values
-        p1_text = player1_card[0]
-        p2_text = player2_card[0]
-        
-        # Add emoji based on suit
-        p1_suit = "♠️" if player1_card[1] == "spades" else "♣️" if player1_card[1] == "clubs" else "♥️" if player1_card[1] == "hearts" else "♦️"
-        p2_suit = "♠️" if player2_card[1] == "spades" else "♣️" if player2_card[1] == "clubs" else "♥️" if player2_card[1] == "hearts" else "♦️"
-        
-        # Draw card values in center of cards
-        draw.text((p1_card_x + card_width // 2, p1_card_y + card_height // 2 - 30), 
-                  p1_text, fill=p1_color, font=card_font, anchor="mm")
-        draw.text((p1_card_x + card_width // 2, p1_card_y + card_height // 2 + 30), 
-                  p1_suit, fill=p1_color, font=card_font, anchor="mm")
-        
-        draw.text((p2_card_x + card_width // 2, p2_card_y + card_height // 2 - 30), 
-                  p2_text, fill=p2_color, font=card_font, anchor="mm")
-        draw.text((p2_card_x + card_width // 2, p2_card_y + card_height // 2 + 30), 
-                  p2_suit, fill=p2_color, font=card_font, anchor="mm")
-        
-        # Draw BetSync Casino at bottom
-        draw.text((width // 2, height - 30), "BetSync Casino", fill=(150, 150, 150), font=name_font, anchor="mm")
-        
-        # Save image to buffer
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        buffer.seek(0)
-        return buffer
-    
-    def draw_rounded_rectangle(self, draw, xy, radius, fill=None, outline=None, width=1):
-        """Draw a rounded rectangle"""
-        x1, y1, x2, y2 = xy
-        
-        # Draw four corners
-        draw.ellipse((x1, y1, x1 + radius * 2, y1 + radius * 2), fill=fill, outline=outline, width=width)
-        draw.ellipse((x2 - radius * 2, y1, x2, y1 + radius * 2), fill=fill, outline=outline, width=width)
-        draw.ellipse((x1, y2 - radius * 2, x1 + radius * 2, y2), fill=fill, outline=outline, width=width)
-        draw.ellipse((x2 - radius * 2, y2 - radius * 2, x2, y2), fill=fill, outline=outline, width=width)
-        
-        # Draw four sides
-        draw.rectangle((x1 + radius, y1, x2 - radius, y2), fill=fill, outline=None)
-        draw.rectangle((x1, y1 + radius, x2, y2 - radius), fill=fill, outline=None)
-        
-        # Draw outline if specified
-        if outline:
-            draw.line((x1 + radius, y1, x2 - radius, y1), fill=outline, width=width)  # Top
-            draw.line((x1 + radius, y2, x2 - radius, y2), fill=outline, width=width)  # Bottom
-            draw.line((x1, y1 + radius, x1, y2 - radius), fill=outline, width=width)  # Left
-            draw.line((x2, y1 + radius, x2, y2 - radius), fill=outline, width=width)  # Right
+        """Render both drawn cards off the event loop"""
+        return await render_service.render_file(
+            "carddraw", render_duel, player1.name, player2.name, player1_card, player2_card
+        )
 
 def setup(bot):
     bot.add_cog(CardDraw(bot))
@@ -3,10 +3,13 @@ import asyncio
 import random
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.edit_scheduler import edits
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import COINFLIP_MULTIPLIER
 
 
 class PlayAgainView(discord.ui.View):
@@ -119,7 +122,7 @@ class CoinflipCog(commands.Cog):
 
         # Process bet amount
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id, "balance")
 
         if user_data == False:
             await loading_message.delete()
@@ -222,60 +225,13 @@ class CoinflipCog(commands.Cog):
             user_won = side == result
 
             # Calculate winnings (1.90x multiplier)
-            multiplier = 1.90
+            multiplier = COINFLIP_MULTIPLIER
             win_amount = round(bet_amount_value * multiplier, 2)
 
-            # Add winnings if user won (always in credits)
-            if user_won:
-                db = Users()  # Reinstantiate db to ensure we have a fresh connection
-                db.update_balance(ctx.author.id, win_amount, "points", "$inc")
-                # Update server history and profit
-                server_db = Servers()
-                #server_data = server_db.fetch_server(ctx.guild.id)
-                server_db.update_server_profit(ctx, ctx.guild.id, (bet_amount_value - win_amount), game="coinflip")
-            else:
-                server_db = Servers()
-                server_db.update_server_profit(ctx, ctx.guild.id, bet_amount_value, game="coinflip")
-    
-
-            
-
-         
-
-                
+            await settlement.settle(ctx.author, ctx.guild, "coinflip", bet_amount_value, win_amount if user_won else 0, {
+                "multiplier": multiplier if user_won else 0,
+            })
 
-                
-
-            
-            # Add to user history
-            timestamp = int(time.time())
-            if user_won:
-                history_entry = {
-                    "type": "win",
-                    "game": "coinflip",
-                    "amount": win_amount,
-                    "bet": bet_amount_value,
-                    "multiplier": multiplier,
-                    "timestamp": timestamp
-                }
-            else:
-                history_entry = {
-                    "type": "loss",
-                    "game": "coinflip",
-                    "amount": bet_amount_value,
-                    "bet": bet_amount_value,
-                    "multiplier": 0,
-                    "timestamp": timestamp
-                }
-
-            db = Users()  # Reinstantiate db
-            db.update_history(ctx.author.id, history_entry)
-
-            # Get user balance after the game
-            db = Users()  # Reinstantiate db
-            user_data = db.fetch_user(ctx.author.id)
-
-            
             currency_display = f"`{bet_amount_value} {currency_used}`"
 
             # Prepare result embed
@@ -310,7 +266,7 @@ class CoinflipCog(commands.Cog):
             play_again_view = PlayAgainView(self, ctx, bet_amount_value, side, currency_used)
 
             # Make sure to update the message with the view properly attached
-            await message.edit(embed=result_embed, view=play_again_view)
+            await edits.edit(message, embed=result_embed, view=play_again_view)
 
             # Store message reference in view for timeout handling
             play_again_view.message = message
@@ -353,8 +309,7 @@ class CoinflipCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
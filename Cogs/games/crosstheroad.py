@@ -4,11 +4,12 @@ import random
 import asyncio
 import time
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from colorama import Fore
 from Cogs.utils.emojis import emoji
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.multiplier_tables import CTR_DIFFICULTIES, CTR_MULTIPLIERS, MAX_LANES
 
 class PlayAgainView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, difficulty, timeout=15):
@@ -58,23 +59,12 @@ class CrossTheRoadGame(discord.ui.View):
         self.message = None
         self.current_lane = 0
         self.lanes_crossed = 0
-        self.max_lanes = 25
+        self.max_lanes = MAX_LANES
         self.cashout_clicked = False
         self.game_over = False
 
         # Set difficulty-specific parameters
-        if self.difficulty == "easy":
-            self.hit_chance = 0.16  # 9% chance to hit a car
-            self.multiplier_increment = 1.10
-        elif self.difficulty == "medium":
-            self.hit_chance = 0.25  # 17% chance to hit a car
-            self.multiplier_increment = 1.30
-        elif self.difficulty == "hard":
-            self.hit_chance = 0.37  # 25% chance to hit a car
-            self.multiplier_increment = 1.50
-        elif self.difficulty == "extreme":
-            self.hit_chance = 0.47  # 45% chance to hit a car
-            self.multiplier_increment = 1.70
+        self.hit_chance = CTR_DIFFICULTIES[self.difficulty][0]
 
         # Current multiplier (starts at 1.00x)
         self.current_multiplier = 1.00
@@ -234,22 +224,11 @@ class CrossTheRoadGame(discord.ui.View):
         self.game_over = True
         self.cashout_clicked = True
 
-        # Update database with winnings (always in credits)
-        db = Users()
-        db.update_balance(self.ctx.author.id, payout, "credits", "$inc")
-
-        # Create history entry for user
-
-
-        # Also update server stats if available
-        try:
-            server_db = Servers()
-            server_profit = self.bet_amount - payout
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, server_profit, game="crosstheroad")
-
-            # Add bet to server history with all required fiel
-        except Exception as e:
-            print(f"Error updating server history: {e}")
+        await settlement.settle(self.ctx.author, self.ctx.guild, "crosstheroad", self.bet_amount, payout, {
+            "multiplier": self.current_multiplier,
+            "lanes_crossed": self.lanes_crossed,
+            "difficulty": self.difficulty,
+        })
 
         # Create play again view
         play_again_view = PlayAgainView(
@@ -291,8 +270,7 @@ class CrossTheRoadGame(discord.ui.View):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -302,15 +280,10 @@ class CrossTheRoadGame(discord.ui.View):
         # Mark game as complete
         self.game_over = True
 
-
-        # Also update server stats if available
-        try:
-            server_db = Servers()
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="crosstheroad")
-
-            # Add bet to server history with all required fields
-        except Exception as e:
-            print(f"Error updating server history: {e}")
+        await settlement.settle(self.ctx.author, self.ctx.guild, "crosstheroad", self.bet_amount, 0, {
+            "lanes_crossed": self.lanes_crossed,
+            "difficulty": self.difficulty,
+        })
 
         # Create play again view
         play_again_view = PlayAgainView(
@@ -364,7 +337,7 @@ class CrossTheRoadGame(discord.ui.View):
         self.lanes_crossed += 1
 
         # Update multiplier
-        self.current_multiplier *= self.multiplier_increment
+        self.current_multiplier = CTR_MULTIPLIERS[self.difficulty][self.lanes_crossed]
 
         # Check if reached maximum lanes
         if self.lanes_crossed >= self.max_lanes:
@@ -430,10 +403,10 @@ class CrossTheRoadCog(commands.Cog):
             )
             return await ctx.reply(embed=embed)
 
-        if not difficulty or difficulty.lower() not in ["easy", "medium", "hard", "expert"]:
+        if not difficulty or difficulty.lower() not in CTR_DIFFICULTIES:
             error_embed = discord.Embed(
                 title="<:no:1344252518305234987> | Invalid Difficulty",
-                description="Valid difficulties are: easy, medium, hard, expert",
+                description=f"Valid difficulties are: {', '.join(CTR_DIFFICULTIES)}",
                 color=0xFF0000
             )
             return await ctx.reply(embed=error_embed)
@@ -3,10 +3,12 @@ import random
 import time
 import asyncio
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.edit_scheduler import edits
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import DICE_TIE_MULTIPLIER, DICE_WIN_MULTIPLIER
 
 class PlayAgainView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount):
@@ -65,8 +67,7 @@ class DiceCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -187,8 +188,8 @@ class DiceCog(commands.Cog):
             user_won = user_roll > dealer_roll
 
             # Define the multiplier (for a win)
-            win_multiplier = 1.90  # 1.9x multiplier for wins
-            tie_multiplier = 0.80  # 0.8x multiplier for ties
+            win_multiplier = DICE_WIN_MULTIPLIER
+            tie_multiplier = DICE_TIE_MULTIPLIER
 
             # Create result embed
             if is_draw:
@@ -209,12 +210,6 @@ class DiceCog(commands.Cog):
                     color=0xFFD700  # Gold color for draws
                 )
 
-                # Add tie winnings to user
-                db = Users()
-                db.update_balance(ctx.author.id, tie_winnings, "credits", "$inc")
-
-                # Add to history as a draw
-
             elif user_won:
                 # Calculate winnings
                 winnings = round(total_bet * win_multiplier, 2)
@@ -233,18 +228,6 @@ class DiceCog(commands.Cog):
                     color=0x00FF00
                 )
 
-                # Update user balance
-                db = Users()
-                db.update_balance(ctx.author.id, winnings, "credits", "$inc")
-
-                # Update server profit (negative value because server loses when player wins)
-                servers_db = Servers()
-                server_profit = -profit  # Server loses money when player wins
-                servers_db.update_server_profit(ctx, ctx.guild.id, server_profit, game="dice")
-
-                # Add to history
-
-
             else:
                 # Consume curse if player was cursed
                 if player_cursed and curse_cog:
@@ -262,69 +245,27 @@ class DiceCog(commands.Cog):
                     color=0xFF0000
                 )
 
-                # Update history for loss
-                db = Users()
-                servers_db = Servers()
-
-
-
-                # Update server profit
-                servers_db.update_server_profit(ctx, ctx.guild.id, total_bet, game="dice")
-
-            # Update server profit for ties
-            if is_draw:
-                servers_db = Servers()
-                tie_server_profit = total_bet - tie_winnings  # Server keeps the difference
-                servers_db.update_server_profit(ctx, ctx.guild.id, tie_server_profit, game="dice")
-
             currency_used = "points"
 
             bet_display = f"`{total_bet} {currency_used}`"
 
-            # Add to history
-            timestamp = int(time.time())
+            # Settle the round; ties pay back 0.8x and are recorded as a push
+            rolls = {"user_roll": user_roll, "dealer_roll": dealer_roll}
             if is_draw:
-                history_entry = {
-                    "type": "push",
-                    "game": "dice",
-                    "amount": tie_winnings,
-                    "bet": total_bet,
-                    "multiplier": tie_multiplier,
-                    "user_roll": user_roll,
-                    "dealer_roll": dealer_roll,
-                    "timestamp": timestamp
-                }
+                await settlement.settle(ctx.author, ctx.guild, "dice", total_bet, tie_winnings,
+                                        {"multiplier": tie_multiplier, **rolls}, outcome="push")
             elif user_won:
-                history_entry = {
-                    "type": "win",
-                    "game": "dice",
-                    "amount": winnings,
-                    "bet": total_bet,
-                    "multiplier": win_multiplier,
-                    "user_roll": user_roll,
-                    "dealer_roll": dealer_roll,
-                    "timestamp": timestamp
-                }
+                await settlement.settle(ctx.author, ctx.guild, "dice", total_bet, winnings,
+                                        {"multiplier": win_multiplier, **rolls})
             else:
-                history_entry = {
-                    "type": "loss",
-                    "game": "dice",
-                    "amount": total_bet,
-                    "bet": total_bet,
-                    "multiplier": 0,
-                    "user_roll": user_roll,
-                    "dealer_roll": dealer_roll,
-                    "timestamp": timestamp
-                }
-
-            db.update_history(ctx.author.id, history_entry)
+                await settlement.settle(ctx.author, ctx.guild, "dice", total_bet, 0, rolls)
 
             # Add play again button that expires after 15 seconds
             play_again_view = PlayAgainView(self, ctx, total_bet)
 
             # Update the message with result
             result_embed.set_footer(text="BetSync Casino", icon_url=self.bot.user.avatar.url)
-            await message.edit(embed=result_embed, view=play_again_view)
+            await edits.edit(message, embed=result_embed, view=play_again_view)
 
             # Store message reference in view for timeout handling
             play_again_view.message = message
@@ -346,7 +287,7 @@ class DiceCog(commands.Cog):
             description=f"**You rolled:** {player_roll}\n**Dealer rolled:** {dealer_roll}\n\n{'**TIE!** ' if player_roll == dealer_roll else ''}You lost {bet_amount:.2f} points!{curse_text}",
             color=0xFF0000
         )
-        await message.edit(embed=embed)
+        await edits.edit(message, embed=embed)
 
 def setup(bot):
     bot.add_cog(DiceCog(bot))
\ No newline at end of file
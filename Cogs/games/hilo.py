@@ -2,14 +2,16 @@ import os
 import discord
 import random
 import asyncio
-import time
 import io
+from array import array
 from PIL import Image, ImageDraw, ImageFont
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import process_bet_amount
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
 
 class PlayAgainView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount):
@@ -70,6 +72,61 @@ class PlayAgainView(discord.ui.View):
             )
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
+SUITS = ("hearts", "diamonds", "clubs", "spades")
+RANKS = 13
+
+
+class HiloDeck:
+    """
+    A shuffled deck dealt from the front that keeps how many cards of each
+    rank are left, so the odds of the next card never need a pass over it.
+    Cards are stored as bytes (rank * 4 + suit) to keep a game's state small.
+    """
+    __slots__ = ("cards", "position", "counts")
+
+    def __init__(self):
+        self.cards = array("B", range(RANKS * len(SUITS)))
+        random.shuffle(self.cards)
+        self.position = 0
+        self.counts = array("B", [len(SUITS)] * RANKS)
+
+    def __len__(self):
+        return len(self.cards) - self.position
+
+    def draw(self):
+        """
+        Deal the next card.
+
+        Returns:
+            tuple: (value, suit), value 1 (Ace) to 13 (King).
+        """
+        card = self.cards[self.position]
+        self.position += 1
+        rank = card // len(SUITS)
+        self.counts[rank] -= 1
+        return rank + 1, SUITS[card % len(SUITS)]
+
+    def win_chance(self, value, choice):
+        """
+        Chance the next card wins a guess against a card of `value`.
+
+        Args:
+            value (int): Value of the current card, which is no longer in the deck.
+            choice (str): "high" (higher or same value, every card of the same
+                value left has another suit) or "low" (lower).
+
+        Returns:
+            float: 0 when the deck is empty.
+        """
+        if not len(self):
+            return 0
+        if choice == "high":
+            return sum(self.counts[value - 1:]) / len(self)
+        if choice == "low":
+            return sum(self.counts[:value - 1]) / len(self)
+        return 0
+
+
 class HiLoView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, deck, current_card, current_multiplier=1.0, timeout=240):
         super().__init__(timeout=timeout)
@@ -100,7 +157,7 @@ class HiLoView(discord.ui.View):
         # Refund the bet amount in the appropriate currency
         try:
             # Process refund
-            db.update_balance(self.ctx.author.id, self.bet_amount)
+            await db.update_balance(self.ctx.author.id, self.bet_amount)
 
             # Create timeout message
             embed = discord.Embed(
@@ -168,16 +225,14 @@ class HiLoView(discord.ui.View):
                                                      0, 0, winnings,
                                                      cashed_out=True, current_winnings=self.current_winnings)
 
-        # Get database connections
-        from Cogs.utils.mongo import Users, Servers
-        db = Users()
-
-        # Process winnings directly with mongo
         try:
-            # Update user's balance
-            update_success = db.update_balance(self.ctx.author.id, winnings)
+            settled = await settlement.settle(self.ctx.author, self.ctx.guild, "hilo", self.bet_amount, winnings, {
+                "multiplier": self.current_multiplier,
+                "cards_revealed": len(self.previous_cards) + 1,
+                "final_card": self.get_card_emoji(self.current_card),
+            })
 
-            if not update_success:
+            if settled is None:
                 # Handle the error
                 error_embed = discord.Embed(
                     title="⚠️ Error Processing Winnings",
@@ -186,12 +241,6 @@ class HiLoView(discord.ui.View):
                 )
                 return await interaction.response.edit_message(embed=error_embed)
 
-            # Update user stats
-            db.collection.update_one(
-                {"discord_id": self.ctx.author.id},
-                {"$inc": {"total_won": 1, "total_earned": winnings}}
-            )
-
             # Update the embed
             embed = discord.Embed(
                 title="<:yes:1355501647538815106> CASHED OUT",
@@ -237,31 +286,6 @@ class HiLoView(discord.ui.View):
             file = discord.File(fp=game_image, filename="hilo_game.png")
             embed.set_image(url="attachment://hilo_game.png")
 
-            # Add to user and server history
-            timestamp = int(time.time())
-            history_entry = {
-                "type": "win",
-                "game": "hilo",
-                "amount": winnings,
-                "bet": self.bet_amount,
-                "multiplier": self.current_multiplier,
-                "cards_revealed": len(self.previous_cards) + 1,
-                "final_card": self.get_card_emoji(self.current_card),
-                "timestamp": timestamp
-            }
-
-            db = Users()
-            db.update_history(self.ctx.author.id, history_entry)
-
-            # Update server history
-            server_db = Servers()
-            server_history_entry = history_entry.copy()
-            server_history_entry.update({
-                "user_id": self.ctx.author.id,
-                "user_name": self.ctx.author.name
-            })
-            server_db.update_history(self.ctx.guild.id, server_history_entry)
-
             # Remove from ongoing games
             if self.ctx.author.id in self.cog.ongoing_games:
                 del self.cog.ongoing_games[self.ctx.author.id]
@@ -292,7 +316,7 @@ class HiLoView(discord.ui.View):
             return
 
         # Get the next card
-        new_card = self.deck.pop(0)
+        new_card = self.deck.draw()
 
         # Skip just changes the card without affecting winnings
         if choice == "skip":
@@ -448,31 +472,11 @@ class HiLoView(discord.ui.View):
             file = discord.File(fp=game_image, filename="hilo_game.png")
             embed.set_image(url="attachment://hilo_game.png")
 
-            # Add to history
-            timestamp = int(time.time())
-            history_entry = {
-                "type": "loss",
-                "game": "hilo",
-                "amount": self.bet_amount,
-                "bet": self.bet_amount,
-                "multiplier": 0,
+            await settlement.settle(self.ctx.author, self.ctx.guild, "hilo", self.bet_amount, 0, {
                 "cards_revealed": len(self.previous_cards) + 1,
                 "final_card": self.get_card_emoji(new_card),
                 "choice": choice,
-                "timestamp": timestamp
-            }
-
-            db = Users()
-            db.update_history(self.ctx.author.id, history_entry)
-
-            # Update server history
-            server_db = Servers()
-            server_history_entry = history_entry.copy()
-            server_history_entry.update({
-                "user_id": self.ctx.author.id,
-                "user_name": self.ctx.author.name
             })
-            server_db.update_history(self.ctx.guild.id, server_history_entry)
 
             # Remove from ongoing games
             if self.ctx.author.id in self.cog.ongoing_games:
@@ -572,30 +576,7 @@ class HiLoView(discord.ui.View):
 
     def calculate_probability(self, choice):
         """Calculate probability of winning based on current card and choice"""
-        current_value = self.get_card_value(self.current_card)
-
-        # Count higher, lower, and equal cards in the deck
-        higher_count = 0
-        lower_count = 0
-        equal_count = 0
-
-        for card in self.deck:
-            card_value = self.get_card_value(card)
-            if card_value > current_value:
-                higher_count += 1
-            elif card_value < current_value:
-                lower_count += 1
-            else:
-                # Same value, different suit
-                if card[1] != self.current_card[1]:
-                    equal_count += 1
-
-        # Calculate probability based on choice
-        if choice == "high":
-            return (higher_count + equal_count) / len(self.deck) if len(self.deck) > 0 else 0
-        elif choice == "low":
-            return lower_count / len(self.deck) if len(self.deck) > 0 else 0
-        return 0
+        return self.deck.win_chance(self.get_card_value(self.current_card), choice)
 
     def calculate_multiplier(self, probability):
         """Calculate round multiplier based on probability"""
@@ -635,317 +616,250 @@ class HiLoView(discord.ui.View):
             "embeds": [embed.to_dict()]
         }
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                await session.post(webhook_url, json=payload)
-            except Exception as e:
-                print(f"Error sending webhook: {e}")
+        try:
+            await http.post(webhook_url, json=payload)
+        except Exception as e:
+            print(f"Error sending webhook: {e}")
+
+
+# The current card is drawn 20% larger than the 120x180 card faces
+CARD_SIZE = (144, 216)
+
+
+def load_card_image(card):
+    """Get the pre-scaled card image from the asset atlas"""
+    value, suit = card
+
+    # Convert card value to filename format
+    value_map = {1: "A", 11: "J", 12: "Q", 13: "K"}
+    card_value = value_map.get(value, str(value))
+
+    try:
+        return atlas.card(card_value, suit, CARD_SIZE)
+    except Exception as e:
+        print(f"Error loading card image: {e}")
+        # Create a blank white card as fallback
+        card_img = Image.new("RGBA", CARD_SIZE, (255, 255, 255, 255))
+        draw = ImageDraw.Draw(card_img)
+
+        # Add card value and suit text
+        suit_symbol = {"hearts": "♥", "diamonds": "♦", "clubs": "♣", "spades": "♠"}
+        text_color = (255, 0, 0) if suit in ["hearts", "diamonds"] else (0, 0, 0)
+
+        draw.text((CARD_SIZE[0] // 2, CARD_SIZE[1] // 2), f"{card_value}\n{suit_symbol.get(suit, '')}", 
+                 fill=text_color, anchor="mm")
+        return card_img
+
+
+def format_multiplier(value):
+    """Format multiplier to show 2 decimal places"""
+    if isinstance(value, (int, float)):
+        return f"{value:.2f}"
+    return "0.00"
+
+
+def draw_card_guides(draw, width, large_font, small_font):
+    """Draw the card value guides (K and A) with explanations"""
+    # Card guide styling
+    guide_border_color = (30, 40, 50)
+    guide_text_color = (120, 140, 150)
+
+    # Left side - K guide (larger and more visible)
+    guide_width, guide_height = 120, 150
+    left_x = 120
+    guide_y = 150
+
+    # Draw rounded rectangle for K guide
+    draw.rectangle(
+        [left_x - guide_width//2, guide_y, left_x + guide_width//2, guide_y + guide_height], 
+        fill=(20, 30, 40),
+        outline=guide_border_color, 
+        width=2
+    )
+
+    # Draw K and arrow
+    draw.text((left_x, guide_y + 40), "K", fill=guide_text_color, font=large_font, anchor="mm")
+    #draw.text((left_x, guide_y + 80), "↑", fill=guide_text_color, font=large_font, anchor="mm")
+
+    # Draw explanation text below guide box
+    draw.text(
+        (left_x, guide_y + guide_height + 30), 
+        "KING BEING", 
+        fill=guide_text_color, 
+        font=small_font, 
+        anchor="mm"
+    )
+    draw.text(
+        (left_x, guide_y + guide_height + 50), 
+        "THE HIGHEST", 
+        fill=guide_text_color, 
+        font=small_font, 
+        anchor="mm"
+    )
+
+    # Right side - A guide (larger and more visible)
+    right_x = width - 120
+
+    # Draw rounded rectangle for A guide
+    draw.rectangle(
+        [right_x - guide_width//2, guide_y, right_x + guide_width//2, guide_y + guide_height], 
+        fill=(20, 30, 40),
+        outline=guide_border_color, 
+        width=2
+    )
+
+    # Draw A and arrow
+    draw.text((right_x, guide_y + 40), "A", fill=guide_text_color, font=large_font, anchor="mm")
+    #draw.text((right_x, guide_y + 80), "↓", fill=guide_text_color, font=large_font, anchor="mm")
+
+    # Draw explanation text below guide box
+    draw.text(
+        (right_x, guide_y + guide_height + 30), 
+        "ACE BEING", 
+        fill=guide_text_color, 
+        font=small_font, 
+        anchor="mm"
+    )
+    draw.text(
+        (right_x, guide_y + guide_height + 50), 
+        "THE LOWEST", 
+        fill=guide_text_color, 
+        font=small_font, 
+        anchor="mm"
+    )
+
+
+def draw_profit_bar(draw, width, height, high_profit, low_profit, total_profit, font, current_winnings):
+    """Draw the profit information bar with improved styling matching reference"""
+    # Draw profit bar background
+    bar_y = 420
+    bar_height = 70
+    draw.rectangle([20, bar_y, width - 20, bar_y + bar_height], fill=(25, 35, 45))
+
+    # Divide into three sections
+    section_width = (width - 40) // 3
+
+    # Helper function to format profit values
+    def format_profit(value):
+        return f"{value:.2f}"  # Always 2 decimal places
+
+    # Try to load arial font for profit bar text
+    try:
+        profit_font_small = atlas.font("arial.ttf", 16)
+        profit_font_large = atlas.font("arial.ttf", 18)
+    except Exception:
+        # Fallback to default/provided font if arial.ttf can't be loaded
+        profit_font_small = font
+        profit_font_large = font
+
+    # Higher profit section
+    high_multiplier = high_profit/total_profit if total_profit else 0
+    draw.text(
+        (30 + section_width//2, bar_y + 20), 
+        f"Profit Higher ({format_multiplier(high_multiplier)}×)", 
+        fill=(180, 200, 220), 
+        font=profit_font_small, 
+        anchor="mm"
+    )
+    draw.text(
+        (30 + section_width//2, bar_y + 50), 
+        f"{format_profit(high_profit)} points", 
+        fill=(255, 255, 255), 
+        font=profit_font_large, 
+        anchor="mm"
+    )
+
+    # Lower profit section
+    low_multiplier = low_profit/total_profit if total_profit else 0
+    draw.text(
+        (30 + section_width + section_width//2, bar_y + 20), 
+        f"Profit Lower ({format_multiplier(low_multiplier)}×)", 
+        fill=(180, 200, 220), 
+        font=profit_font_small, 
+        anchor="mm"
+    )
+    draw.text(
+        (30 + section_width + section_width//2, bar_y + 50), 
+        f"{format_profit(low_profit)} points", 
+        fill=(255, 255, 255), 
+        font=profit_font_large, 
+        anchor="mm"
+    )
+
+    # Total profit section with current multiplier
+    #current_mult = total_profit/current_winnings if current_winnings and total_profit != current_winnings else 1.0
+    draw.text(
+        (30 + 2*section_width + section_width//2, bar_y + 20), 
+        "Current Winnings", 
+        fill=(180, 200, 220), 
+        font=profit_font_small, 
+        anchor="mm"
+    )
+    draw.text(
+        (30 + 2*section_width + section_width//2, bar_y + 50), 
+        f"{format_profit(total_profit)} points", 
+        fill=(255, 255, 255), 
+        font=profit_font_large, 
+        anchor="mm"
+    )
+
+
+def render_game_image(current_card, high_profit, low_profit, total_profit, current_winnings=0):
+    """Generate the game image similar to the provided example"""
+    # Create base canvas (dark blue background)
+    width, height = 1000, 500  # Reduced height since we're not showing previous cards
+    bg_color = (12, 26, 38)  # Darker blue background matching reference
+    image = Image.new("RGB", (width, height), bg_color)
+    draw = ImageDraw.Draw(image)
+
+    # Try to load font, fall back to default if not found
+    try:
+        font_path = "roboto.ttf"
+        small_font = atlas.font(font_path, 16)
+        medium_font = atlas.font(font_path, 20)
+        large_font = atlas.font(font_path, 28)  # Increased font size for card guides
+    except Exception:
+        small_font = ImageFont.load_default()
+        medium_font = ImageFont.load_default()
+        large_font = ImageFont.load_default()
+
+    # Draw card value guides at the left and right (K and A) - larger with better styling
+    draw_card_guides(draw, width, large_font, small_font)
+
+    # Draw the current card in the center - larger size
+    current_card_img = load_card_image(current_card)
+    new_width, new_height = current_card_img.size
+    current_card_pos = (width//2 - new_width//2, height//2 - 180)
+    image.paste(current_card_img, current_card_pos, current_card_img)
+
+    # Draw profit information bar
+    draw_profit_bar(draw, width, height, high_profit, low_profit, total_profit, small_font, current_winnings)
+
+    # Convert to bytes for Discord
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    buffer.seek(0)
+
+    return buffer
+
 
 class HiLo(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.ongoing_games = {}
-        self.card_cache = {}  # Cache for loaded card images
 
     async def create_game_image(self, current_card, previous_cards, high_profit, low_profit, total_profit, 
                                game_over=False, lost_choice=None, cashed_out=False, current_winnings=0):
-        """Generate the game image similar to the provided example"""
-        # Create base canvas (dark blue background)
-        width, height = 1000, 500  # Reduced height since we're not showing previous cards
-        bg_color = (12, 26, 38)  # Darker blue background matching reference
-        image = Image.new("RGB", (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-
-        # Try to load font, fall back to default if not found
-        try:
-            font_path = "roboto.ttf"
-            small_font = ImageFont.truetype(font_path, 16)
-            medium_font = ImageFont.truetype(font_path, 20)
-            large_font = ImageFont.truetype(font_path, 28)  # Increased font size for card guides
-        except Exception:
-            small_font = ImageFont.load_default()
-            medium_font = ImageFont.load_default()
-            large_font = ImageFont.load_default()
-
-        # Draw card value guides at the left and right (K and A) - larger with better styling
-        self.draw_card_guides(draw, width, large_font, small_font)
-
-        # Draw the current card in the center - larger size
-        current_card_img = await self.get_card_image(current_card)
-        # Make current card 20% larger
-        new_width, new_height = int(current_card_img.width * 1.2), int(current_card_img.height * 1.2)
-        current_card_img = current_card_img.resize((new_width, new_height))
-        current_card_pos = (width//2 - new_width//2, height//2 - 180)
-        image.paste(current_card_img, current_card_pos, current_card_img.convert("RGBA"))
-
-        # Draw profit information bar
-        self.draw_profit_bar(draw, width, height, high_profit, low_profit, total_profit, small_font, current_winnings)
-
-        # Convert to bytes for Discord
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        return buffer
-
-    def draw_card_guides(self, draw, width, large_font, small_font):
-        """Draw the card value guides (K and A) with explanations"""
-        # Card guide styling
-        guide_border_color = (30, 40, 50)
-        guide_text_color = (120, 140, 150)
-
-        # Left side - K guide (larger and more visible)
-        guide_width, guide_height = 120, 150
-        left_x = 120
-        guide_y = 150
-
-        # Draw rounded rectangle for K guide
-        draw.rectangle(
-            [left_x - guide_width//2, guide_y, left_x + guide_width//2, guide_y + guide_height], 
-            fill=(20, 30, 40),
-            outline=guide_border_color, 
-            width=2
-        )
-
-        # Draw K and arrow
-        draw.text((left_x, guide_y + 40), "K", fill=guide_text_color, font=large_font, anchor="mm")
-        #draw.text((left_x, guide_y + 80), "↑", fill=guide_text_color, font=large_font, anchor="mm")
-
-        # Draw explanation text below guide box
-        draw.text(
-            (left_x, guide_y + guide_height + 30), 
-            "KING BEING", 
-            fill=guide_text_color, 
-            font=small_font, 
-            anchor="mm"
-        )
-        draw.text(
-            (left_x, guide_y + guide_height + 50), 
-            "THE HIGHEST", 
-            fill=guide_text_color, 
-            font=small_font, 
-            anchor="mm"
-        )
-
-        # Right side - A guide (larger and more visible)
-        right_x = width - 120
-
-        # Draw rounded rectangle for A guide
-        draw.rectangle(
-            [right_x - guide_width//2, guide_y, right_x + guide_width//2, guide_y + guide_height], 
-            fill=(20, 30, 40),
-            outline=guide_border_color, 
-            width=2
-        )
-
-        # Draw A and arrow
-        draw.text((right_x, guide_y + 40), "A", fill=guide_text_color, font=large_font, anchor="mm")
-        #draw.text((right_x, guide_y + 80), "↓", fill=guide_text_color, font=large_font, anchor="mm")
-
-        # Draw explanation text below guide box
-        draw.text(
-            (right_x, guide_y + guide_height + 30), 
-            "ACE BEING", 
-            fill=guide_text_color, 
-            font=small_font, 
-            anchor="mm"
-        )
-        draw.text(
-            (right_x, guide_y + guide_height + 50), 
-            "THE LOWEST", 
-            fill=guide_text_color, 
-            font=small_font, 
-            anchor="mm"
-        )
-
-    def draw_profit_bar(self, draw, width, height, high_profit, low_profit, total_profit, font, current_winnings):
-        """Draw the profit information bar with improved styling matching reference"""
-        # Draw profit bar background
-        bar_y = 420
-        bar_height = 70
-        draw.rectangle([20, bar_y, width - 20, bar_y + bar_height], fill=(25, 35, 45))
-
-        # Divide into three sections
-        section_width = (width - 40) // 3
-
-        # Helper function to format profit values
-        def format_profit(value):
-            return f"{value:.2f}"  # Always 2 decimal places
-
-        # Try to load arial font for profit bar text
-        try:
-            profit_font_small = ImageFont.truetype("arial.ttf", 16)
-            profit_font_large = ImageFont.truetype("arial.ttf", 18)
-        except Exception:
-            # Fallback to default/provided font if arial.ttf can't be loaded
-            profit_font_small = font
-            profit_font_large = font
-
-        # Higher profit section
-        high_multiplier = high_profit/total_profit if total_profit else 0
-        draw.text(
-            (30 + section_width//2, bar_y + 20), 
-            f"Profit Higher ({self.format_multiplier(high_multiplier)}×)", 
-            fill=(180, 200, 220), 
-            font=profit_font_small, 
-            anchor="mm"
-        )
-        draw.text(
-            (30 + section_width//2, bar_y + 50), 
-            f"{format_profit(high_profit)} points", 
-            fill=(255, 255, 255), 
-            font=profit_font_large, 
-            anchor="mm"
-        )
-
-        # Lower profit section
-        low_multiplier = low_profit/total_profit if total_profit else 0
-        draw.text(
-            (30 + section_width + section_width//2, bar_y + 20), 
-            f"Profit Lower ({self.format_multiplier(low_multiplier)}×)", 
-            fill=(180, 200, 220), 
-            font=profit_font_small, 
-            anchor="mm"
-        )
-        draw.text(
-            (30 + section_width + section_width//2, bar_y + 50), 
-            f"{format_profit(low_profit)} points", 
-            fill=(255, 255, 255), 
-            font=profit_font_large, 
-            anchor="mm"
+        """Generate the game image off the event loop"""
+        return await render_service.render_file(
+            "hilo", render_game_image, current_card, high_profit, low_profit, total_profit, current_winnings
         )
 
-        # Total profit section with current multiplier
-        #current_mult = total_profit/current_winnings if current_winnings and total_profit != current_winnings else 1.0
-        draw.text(
-            (30 + 2*section_width + section_width//2, bar_y + 20), 
-            "Current Winnings", 
-            fill=(180, 200, 220), 
-            font=profit_font_small, 
-            anchor="mm"
-        )
-        draw.text(
-            (30 + 2*section_width + section_width//2, bar_y + 50), 
-            f"{format_profit(total_profit)} points", 
-            fill=(255, 255, 255), 
-            font=profit_font_large, 
-            anchor="mm"
-        )
-
-    def format_multiplier(self, value):
-        """Format multiplier to show 2 decimal places"""
-        if isinstance(value, (int, float)):
-            return f"{value:.2f}"
-        return "0.00"
-
     # Previous cards drawing method removed as requested - now displaying in embed
 
-    async def get_card_image(self, card):
-        """Get the card image from assets folder or cache"""
-        value, suit = card
-
-        # Convert card value to filename format
-        value_map = {1: "A", 11: "J", 12: "Q", 13: "K"}
-        card_value = value_map.get(value, str(value))
-
-        # Generate file path
-        card_key = f"{suit}_{card_value}"
-
-        # Check if card is in cache
-        if card_key in self.card_cache:
-            return self.card_cache[card_key]
-
-        # Load the card image
-        try:
-            card_path = f"assests/{suit}_{card_value}.png"
-            card_img = Image.open(card_path).convert("RGBA")
-
-            # Resize to standard size
-            card_img = card_img.resize((120, 180))
-
-            # Store in cache
-            self.card_cache[card_key] = card_img
-            return card_img
-        except Exception as e:
-            print(f"Error loading card image: {e}")
-            # Create a blank white card as fallback
-            card_img = Image.new("RGBA", (120, 180), (255, 255, 255, 255))
-            draw = ImageDraw.Draw(card_img)
-
-            # Add card value and suit text
-            suit_symbol = {"hearts": "♥", "diamonds": "♦", "clubs": "♣", "spades": "♠"}
-            text_color = (255, 0, 0) if suit in ["hearts", "diamonds"] else (0, 0, 0)
-
-            draw.text((60, 90), f"{card_value}\n{suit_symbol.get(suit, '')}", 
-                     fill=text_color, anchor="mm")
-
-            self.card_cache[card_key] = card_img
-            return card_img
-
-    def get_card_image_sync(self, card):
-        """Synchronous version of get_card_image to use when drawing multiple cards"""
-        value, suit = card
-
-        # Convert card value to filenameformat
-        value_map = {1: "A", 11: "J", 12: "Q", 13: "K"}
-        card_value = value_map.get(value, str(value))
-
-        # Generate file path
-        card_key = f"{suit}_{card_value}"
-
-        # Check if card is in cache
-        if card_key in self.card_cache:
-            return self.card_cache[card_key]
-
-        # Load the card image
-        try:
-            card_path = f"assests/{suit}_{card_value}.png"
-            card_img = Image.open(card_path).convert("RGBA")
-
-            # Resize to standard size
-            card_img = card_img.resize((120, 180))
-
-            # Store in cache
-            self.card_cache[card_key] = card_img
-            return card_img
-        except Exception as e:
-            print(f"Error loading card image: {e}")
-            # Create a blank white card as fallback
-            card_img = Image.new("RGBA", (120, 180), (255, 255, 255, 255))
-            draw = ImageDraw.Draw(card_img)
-
-            # Add card value and suit text
-            suit_symbol = {"hearts": "♥", "diamonds": "♦", "clubs": "♣", "spades": "♠"}
-            text_color = (255, 0, 0) if suit in ["hearts", "diamonds"] else (0, 0, 0)
-
-            draw.text((60, 90), f"{card_value}\n{suit_symbol.get(suit, '')}", 
-                     fill=text_color, anchor="mm")
-
-            self.card_cache[card_key] = card_img
-            return card_img
-
-    def add_to_history(self, ctx, user_id, server_id, amount, bet_amount, result_type, game):
-        """Add game result to user and server history"""
-        try:
-            server_db = Servers()
-
-            # Update server profit
-            if result_type == "win":
-                server_db.update_server_profit(ctx, server_id, (bet_amount - amount), game="hilo")
-            else:
-                server_db.update_server_profit(ctx, server_id, bet_amount, game="hilo")
-
-        except Exception as e:
-            print(f"Error updating history: {e}")
-
     def create_deck(self):
-        """Create a standard deck of cards"""
-        values = list(range(1, 14))  # 1 to 13 (Ace to King)
-        suits = ["hearts", "diamonds", "clubs", "spades"]
-
-        deck = [(value, suit) for value in values for suit in suits]
-        random.shuffle(deck)
-        return deck
+        """Create a shuffled standard deck of cards"""
+        return HiloDeck()
 
     @commands.command(aliases=["hl"])
     async def hilo(self, ctx, bet_amount: str = None):
@@ -1013,7 +927,7 @@ class HiLo(commands.Cog):
             deck = self.create_deck()
 
             # Draw the first card
-            current_card = deck.pop(0)
+            current_card = deck.draw()
 
             # Create game view
             view = HiLoView(self, ctx, int(bet_amount), deck, current_card)
@@ -6,28 +6,18 @@ import discord
 import asyncio
 import datetime
 import time
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import KENO_PAYOUTS
 from colorama import Fore
 
-# Payouts based on number of picks and hits
-PAYOUTS = {
-    1: {1: 3.72},
-    2: {1: 1, 2: 10},
-    3: {1: 0.5, 2: 1.5, 3: 25},
-    4: {1: 0.0, 2: 1.35, 3: 10.0, 4: 100},
-    5: {1: 0.0, 2: 0.0, 3: 3, 4: 50.0, 5: 100.0},
-    6: {1: 0.0, 2: 0.5, 3: 3.0, 4: 12.0, 5: 300.0},
-    7: {1: 0.0, 2: 0.0, 3: 2.0, 4: 8.0, 5: 100.0},
-    8: {1: 0.0, 2: 0.0, 3: 1.5, 4: 5.0, 5: 50.0},
-    9: {1: 0.0, 2: 0.0, 3: 1.0, 4: 3.0, 5: 30.0},
-    10: {1: 0.0, 2: 0.0, 3: 0.5, 4: 2.0, 5: 20.0}
-}
-
 def generate_paytable_image():
     """Generate a visually appealing payout table image"""
     # Image dimensions and settings - larger size for better fit
@@ -45,10 +35,10 @@ def generate_paytable_image():
 
     try:
         # Try to load fonts - better sizes for readability
-        title_font = ImageFont.truetype("arial.ttf", 42)
-        header_font = ImageFont.truetype("arial.ttf", 24)
-        cell_font = ImageFont.truetype("arial.ttf", 22)
-        subtitle_font = ImageFont.truetype("arial.ttf", 20)
+        title_font = atlas.font("arial.ttf", 42)
+        header_font = atlas.font("arial.ttf", 24)
+        cell_font = atlas.font("arial.ttf", 22)
+        subtitle_font = atlas.font("arial.ttf", 20)
     except:
         # Fallback fonts
         title_font = ImageFont.load_default()
@@ -127,7 +117,7 @@ def generate_paytable_image():
 
             # Get multiplier value
             hits = col - 1  # Adjust: 1st column is 0 hits, 2nd is 1 hit...
-            multiplier = PAYOUTS.get(row, {}).get(hits, 0)
+            multiplier = KENO_PAYOUTS.get(row, {}).get(hits, 0)
 
             # Format multiplier text
             if multiplier == 0:
@@ -179,6 +169,230 @@ PROBABILITIES = {
     10: {1: 13.54, 2: 34.84, 3: 34.84, 4: 13.54, 5: 1.63}
 }
 
+def render_mini_paytable(num_picks):
+    """Create a mini paytable image focused on the selected number of picks"""
+    # Image dimensions and settings - better size with more breathing room
+    width, height = 600, 200  # Larger dimensions for better fit
+    bg_color = (25, 25, 25)  # Dark background
+    header_color = (40, 40, 40) 
+    cell_color = (34, 34, 34)
+    highlight_color = (128, 0, 255)  # Purple for highlights
+    text_color = (255, 255, 255)
+    accent_color = (147, 51, 234)  # Purple accent color
+
+    # Create image and draw object
+    image = Image.new('RGB', (width, height), bg_color)
+    draw = ImageDraw.Draw(image)
+
+    try:
+        # Try to load fonts - better sizing
+        title_font = atlas.font("arial.ttf", 24)  # Larger title font
+        header_font = atlas.font("arial.ttf", 20)
+        cell_font = atlas.font("arial.ttf", 20)
+    except:
+        # Fallback fonts
+        title_font = ImageFont.load_default()
+        header_font = ImageFont.load_default()
+        cell_font = ImageFont.load_default()
+
+    # Draw title
+    title = f"PAYOUTS FOR {num_picks} PICKS"
+    title_width = draw.textlength(title, font=title_font)
+    draw.text(((width - title_width) // 2, 20), title, font=title_font, fill=highlight_color)
+
+    # Table layout - better margins
+    table_margin = 50  # Increased margin for breathing room
+    start_y = 60
+    table_width = width - (2 * table_margin)
+
+    # Determine number of columns (hits)
+    max_hits = min(num_picks, 5)  # Maximum 5 hits
+    cols = max_hits + 1  # Hits columns + 1 for label column
+
+    cell_width = table_width // cols
+    cell_height = 50  # Slightly larger cells
+
+    # Draw header row
+    header_labels = ["Picks"] + [f"{i} Hit{'' if i == 1 else 's'}" for i in range(1, max_hits + 1)]
+
+    for col in range(cols):
+        x = table_margin + (col * cell_width)
+        y = start_y
+
+        # Draw header cell with rounded corners
+        draw.rectangle((x, y, x + cell_width, y + cell_height), fill=header_color)
+
+        # Draw header text with better centering
+        text = header_labels[col]
+        text_width = draw.textlength(text, font=header_font)
+        text_x = x + (cell_width - text_width) // 2
+
+        # Better vertical centering using font metrics
+        text_bbox = header_font.getbbox(text)
+        text_height = text_bbox[3] - text_bbox[1]
+        text_y = y + ((cell_height - text_height) // 2)
+
+        draw.text((text_x, text_y), text, font=header_font, fill=highlight_color)
+
+    # Draw data row - just the selected number of picks
+    # First column (picks)
+    x = table_margin
+    y = start_y + cell_height
+
+    # Draw cell with accent color to highlight
+    draw.rectangle((x, y, x + cell_width, y + cell_height), fill=accent_color)
+
+    # Draw pick number with better centering
+    text = str(num_picks)
+    text_width = draw.textlength(text, font=cell_font)
+    text_bbox = cell_font.getbbox(text)
+    text_height = text_bbox[3] - text_bbox[1]
+
+    text_x = x + (cell_width - text_width) // 2
+    text_y = y + ((cell_height - text_height) // 2)
+
+    draw.text((text_x, text_y), text, font=cell_font, fill=(255, 255, 255))  # White text on purple
+
+    # Draw multipliers for each hit
+    for col in range(1, cols):
+        hits = col  # First data column is 1 hit
+        x = table_margin + (col * cell_width)
+
+        # Get multiplier
+        multiplier = KENO_PAYOUTS.get(num_picks, {}).get(hits, 0)
+
+        # Draw cell
+        draw.rectangle((x, y, x + cell_width, y + cell_height), fill=cell_color)
+
+        # Format multiplier text
+        if multiplier == 0:
+            text = "-"
+            text_color_cell = (100, 100, 100)  # Gray
+        else:
+            text = f"{multiplier}x"
+            # Use purple color scheme for higher values
+            if multiplier > 100:
+                text_color_cell = (221, 160, 221)  # Light purple for high values
+            elif multiplier > 10:
+                text_color_cell = (147, 112, 219)  # Medium purple
+            else:
+                text_color_cell = text_color
+
+        # Better text centering
+        text_width = draw.textlength(text, font=cell_font)
+        text_bbox = cell_font.getbbox(text)
+        text_height = text_bbox[3] - text_bbox[1]
+
+        text_x = x + (cell_width - text_width) // 2
+        text_y = y + ((cell_height - text_height) // 2)
+
+        draw.text((text_x, text_y), text, font=cell_font, fill=text_color_cell)
+
+    # Save to bytes
+    img_byte_array = io.BytesIO()
+    image.save(img_byte_array, format="PNG")
+    img_byte_array.seek(0)
+
+    return img_byte_array
+
+
+def render_keno_board(selected_numbers, winning_numbers=None, game_over=False):
+    """Generate the Keno board image"""
+    # Set colors
+    dark_bg = (26, 32, 44)
+    tile_bg = (45, 55, 72)
+    selected_color = (128, 0, 255)  # Purple for selections
+    matching_color = (0, 255, 0)    # Green for matches
+    unmatched_winning_color = (255, 0, 0)  # Red for unselected winning numbers
+    text_color = (255, 255, 255)
+
+    # Image dimensions for 20 numbers (4x5 grid)
+    width, height = 900, 700  # Slightly larger for better spacing
+    tile_size = 110
+    margin = 25
+
+    # Calculate total grid width and height to center the entire grid
+    grid_width = 5 * tile_size + 4 * margin
+    grid_height = 4 * tile_size + 3 * margin
+
+    # Calculate starting position to center the grid in the image
+    start_x = (width - grid_width) // 2
+    start_y = (height - grid_height) // 2
+
+    # Create image and draw object
+    image = Image.new('RGB', (width, height), dark_bg)
+    draw = ImageDraw.Draw(image)
+
+    # Load font
+    try:
+        # Use a slightly larger font
+        font = atlas.font("arial.ttf", 46)
+        # Get exact text dimensions for perfect centering
+        test_text = "88"  # Use a double digit for better estimation
+        text_bbox = font.getbbox(test_text)
+        font_height = text_bbox[3] - text_bbox[1]
+    except:
+        font = ImageFont.load_default()
+        font_height = 30  # Approximation for default font
+
+    # Draw grid of numbers
+    for i in range(1, 21):
+        row = (i-1) // 5
+        col = (i-1) % 5
+
+        # Calculate position with the new centered grid
+        x = start_x + col * (tile_size + margin)
+        y = start_y + row * (tile_size + margin)
+
+        # Determine tile color based on game state
+        if game_over:
+            if i in selected_numbers and i in winning_numbers:
+                # Matching numbers are green
+                tile_color = matching_color
+                text_col = (0, 0, 0)  # Black text on green
+            elif i in winning_numbers:
+                # Winning but not selected are red
+                tile_color = unmatched_winning_color
+                text_col = text_color
+            elif i in selected_numbers:
+                # Selected but not winning stays purple
+                tile_color = selected_color
+                text_col = text_color
+            else:
+                # Other tiles stay default
+                tile_color = tile_bg
+                text_col = text_color
+        else:
+            # During selection phase
+            if i in selected_numbers:
+                tile_color = selected_color
+            else:
+                tile_color = tile_bg
+            text_col = text_color
+
+        # Draw tile
+        draw.rectangle((x, y, x + tile_size, y + tile_size), fill=tile_color)
+
+        # Draw number with perfect centering
+        text = str(i)
+        text_bbox = font.getbbox(text)
+        text_width = text_bbox[2] - text_bbox[0]
+        text_height = text_bbox[3] - text_bbox[1]
+
+        # Calculate exact center position
+        text_x = x + (tile_size - text_width) // 2
+        text_y = y + (tile_size - text_height) // 2
+
+        draw.text((text_x, text_y), text, font=font, fill=text_col)
+
+    # Save to bytes
+    img_byte_array = io.BytesIO()
+    image.save(img_byte_array, format="PNG")
+    img_byte_array.seek(0)
+
+    return img_byte_array
+
+
 class KenoView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, timeout=120):
         super().__init__(timeout=timeout)
@@ -242,7 +456,7 @@ class KenoView(discord.ui.View):
         # Cancel the game and refund the user by adding the bet amount back
         await interaction.response.defer()
         db = Users()
-        db.update_balance(self.ctx.author.id, self.bet_amount)
+        await db.update_balance(self.ctx.author.id, self.bet_amount)
 
         for child in self.children:
             child.disabled = True
@@ -272,12 +486,7 @@ class KenoView(discord.ui.View):
                 # If user didn't select any numbers, count it as a loss
                 if len(self.selected_numbers) == 0:
                     # Record loss in database
-                    db = Users()
-
-
-                    # Update server profit (positive for casino win)
-                    server_db = Servers()
-                    server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="keno")
+                    await settlement.settle(self.ctx.author, self.ctx.guild, "keno", self.bet_amount, 0, {"spots": 0})
 
                     embed = discord.Embed(
                         title="<:no:1344252518305234987> | Game Timed Out",
@@ -338,7 +547,7 @@ class KenoNumberButton(discord.ui.Button):
 
         # Generate paytable image for the current selection
         if view.selected_numbers:
-            paytable_bytes = view.cog.create_mini_paytable_for_selections(len(view.selected_numbers))
+            paytable_bytes = await view.cog.create_mini_paytable_for_selections(len(view.selected_numbers))
             paytable_file = discord.File(paytable_bytes, filename="keno_paytable_selection.png")
             await interaction.response.edit_message(embed=embed, file=paytable_file, view=view)
         else:
@@ -350,20 +559,6 @@ import io
 from PIL import Image, ImageDraw, ImageFont
 import random
 
-# Define payouts for different selections and hits
-PAYOUTS = {
-    1: {1: 3.72},
-    2: {1: 1, 2: 10},
-    3: {1: 0.5, 2: 1.5, 3: 25},
-    4: {1: 0.0, 2: 1.35, 3: 10.0, 4: 100},
-    5: {1: 0.0, 2: 0.0, 3: 3, 4: 50.0, 5: 100.0},
-    6: {1: 0.0, 2: 0.5, 3: 3.0, 4: 12.0, 5: 300.0},
-    7: {1: 0.0, 2: 0.0, 3: 2.0, 4: 8.0, 5: 100.0},
-    8: {1: 0.0, 2: 0.0, 3: 1.5, 4: 5.0, 5: 50.0},
-    9: {1: 0.0, 2: 0.0, 3: 1.0, 4: 3.0, 5: 30.0},
-    10: {1: 0.0, 2: 0.0, 3: 0.5, 4: 2.0, 5: 20.0}
-}
-
 # Probability percentages for different picks and hits
 PROBABILITIES = {
     1: {1: 25.00},
@@ -403,8 +598,7 @@ class Keno(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -419,7 +613,7 @@ class Keno(commands.Cog):
         # Show help if no bet amount
         if not bet_amount:
             # Generate paytable image
-            paytable_image = generate_paytable_image()
+            paytable_image = await render_service.render_file("keno_paytable", generate_paytable_image)
             paytable_file = discord.File(paytable_image, filename="keno_paytable.png")
 
             embed = discord.Embed(
@@ -495,7 +689,7 @@ class Keno(commands.Cog):
             initial_embed = self.create_options_embed(ctx.author, bet_amount_value, [1], currency_used)
 
             # Generate initial paytable image for selected number
-            paytable_bytes = self.create_mini_paytable_for_selections(1)
+            paytable_bytes = await self.create_mini_paytable_for_selections(1)
             paytable_file = discord.File(paytable_bytes, filename="keno_paytable_selection.png")
 
             # Delete loading message and start the game
@@ -542,9 +736,6 @@ class Keno(commands.Cog):
 
         # Add payout info if numbers are selected
         if num_picks > 0:
-            # Create a highlight-only mini paytable image for the selected number of picks
-            paytable_bytes = self.create_mini_paytable_for_selections(num_picks)
-
             # Set the footer text
             probability_text = ""
             for hits in range(1, min(num_picks + 1, 6)):
@@ -561,227 +752,13 @@ class Keno(commands.Cog):
         embed.set_footer(text="BetSync Casino • Select 1-10 numbers, then press PLAY")
         return embed
 
-    def create_mini_paytable_for_selections(self, num_picks):
-        """Create a mini paytable image focused on the selected number of picks"""
-        # Image dimensions and settings - better size with more breathing room
-        width, height = 600, 200  # Larger dimensions for better fit
-        bg_color = (25, 25, 25)  # Dark background
-        header_color = (40, 40, 40) 
-        cell_color = (34, 34, 34)
-        highlight_color = (128, 0, 255)  # Purple for highlights
-        text_color = (255, 255, 255)
-        accent_color = (147, 51, 234)  # Purple accent color
-
-        # Create image and draw object
-        image = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-
-        try:
-            # Try to load fonts - better sizing
-            title_font = ImageFont.truetype("arial.ttf", 24)  # Larger title font
-            header_font = ImageFont.truetype("arial.ttf", 20)
-            cell_font = ImageFont.truetype("arial.ttf", 20)
-        except:
-            # Fallback fonts
-            title_font = ImageFont.load_default()
-            header_font = ImageFont.load_default()
-            cell_font = ImageFont.load_default()
-
-        # Draw title
-        title = f"PAYOUTS FOR {num_picks} PICKS"
-        title_width = draw.textlength(title, font=title_font)
-        draw.text(((width - title_width) // 2, 20), title, font=title_font, fill=highlight_color)
-
-        # Table layout - better margins
-        table_margin = 50  # Increased margin for breathing room
-        start_y = 60
-        table_width = width - (2 * table_margin)
-
-        # Determine number of columns (hits)
-        max_hits = min(num_picks, 5)  # Maximum 5 hits
-        cols = max_hits + 1  # Hits columns + 1 for label column
-
-        cell_width = table_width // cols
-        cell_height = 50  # Slightly larger cells
-
-        # Draw header row
-        header_labels = ["Picks"] + [f"{i} Hit{'' if i == 1 else 's'}" for i in range(1, max_hits + 1)]
-
-        for col in range(cols):
-            x = table_margin + (col * cell_width)
-            y = start_y
-
-            # Draw header cell with rounded corners
-            draw.rectangle((x, y, x + cell_width, y + cell_height), fill=header_color)
-
-            # Draw header text with better centering
-            text = header_labels[col]
-            text_width = draw.textlength(text, font=header_font)
-            text_x = x + (cell_width - text_width) // 2
-
-            # Better vertical centering using font metrics
-            text_bbox = header_font.getbbox(text)
-            text_height = text_bbox[3] - text_bbox[1]
-            text_y = y + ((cell_height - text_height) // 2)
-
-            draw.text((text_x, text_y), text, font=header_font, fill=highlight_color)
-
-        # Draw data row - just the selected number of picks
-        # First column (picks)
-        x = table_margin
-        y = start_y + cell_height
-
-        # Draw cell with accent color to highlight
-        draw.rectangle((x, y, x + cell_width, y + cell_height), fill=accent_color)
-
-        # Draw pick number with better centering
-        text = str(num_picks)
-        text_width = draw.textlength(text, font=cell_font)
-        text_bbox = cell_font.getbbox(text)
-        text_height = text_bbox[3] - text_bbox[1]
-
-        text_x = x + (cell_width - text_width) // 2
-        text_y = y + ((cell_height - text_height) // 2)
-
-        draw.text((text_x, text_y), text, font=cell_font, fill=(255, 255, 255))  # White text on purple
-
-        # Draw multipliers for each hit
-        for col in range(1, cols):
-            hits = col  # First data column is 1 hit
-            x = table_margin + (col * cell_width)
-
-            # Get multiplier
-            multiplier = PAYOUTS.get(num_picks, {}).get(hits, 0)
-
-            # Draw cell
-            draw.rectangle((x, y, x + cell_width, y + cell_height), fill=cell_color)
-
-            # Format multiplier text
-            if multiplier == 0:
-                text = "-"
-                text_color_cell = (100, 100, 100)  # Gray
-            else:
-                text = f"{multiplier}x"
-                # Use purple color scheme for higher values
-                if multiplier > 100:
-                    text_color_cell = (221, 160, 221)  # Light purple for high values
-                elif multiplier > 10:
-                    text_color_cell = (147, 112, 219)  # Medium purple
-                else:
-                    text_color_cell = text_color
-
-            # Better text centering
-            text_width = draw.textlength(text, font=cell_font)
-            text_bbox = cell_font.getbbox(text)
-            text_height = text_bbox[3] - text_bbox[1]
-
-            text_x = x + (cell_width - text_width) // 2
-            text_y = y + ((cell_height - text_height) // 2)
-
-            draw.text((text_x, text_y), text, font=cell_font, fill=text_color_cell)
-
-        # Save to bytes
-        img_byte_array = io.BytesIO()
-        image.save(img_byte_array, format="PNG")
-        img_byte_array.seek(0)
-
-        return img_byte_array
+    async def create_mini_paytable_for_selections(self, num_picks):
+        """Render the payout table for a pick count off the event loop"""
+        return await render_service.render_file("keno_paytable", render_mini_paytable, num_picks)
 
     async def generate_keno_image(self, selected_numbers, winning_numbers=None, game_over=False):
-        """Generate the Keno board image"""
-        # Set colors
-        dark_bg = (26, 32, 44)
-        tile_bg = (45, 55, 72)
-        selected_color = (128, 0, 255)  # Purple for selections
-        matching_color = (0, 255, 0)    # Green for matches
-        unmatched_winning_color = (255, 0, 0)  # Red for unselected winning numbers
-        text_color = (255, 255, 255)
-
-        # Image dimensions for 20 numbers (4x5 grid)
-        width, height = 900, 700  # Slightly larger for better spacing
-        tile_size = 110
-        margin = 25
-
-        # Calculate total grid width and height to center the entire grid
-        grid_width = 5 * tile_size + 4 * margin
-        grid_height = 4 * tile_size + 3 * margin
-
-        # Calculate starting position to center the grid in the image
-        start_x = (width - grid_width) // 2
-        start_y = (height - grid_height) // 2
-
-        # Create image and draw object
-        image = Image.new('RGB', (width, height), dark_bg)
-        draw = ImageDraw.Draw(image)
-
-        # Load font
-        try:
-            # Use a slightly larger font
-            font = ImageFont.truetype("arial.ttf", 46)
-            # Get exact text dimensions for perfect centering
-            test_text = "88"  # Use a double digit for better estimation
-            text_bbox = font.getbbox(test_text)
-            font_height = text_bbox[3] - text_bbox[1]
-        except:
-            font = ImageFont.load_default()
-            font_height = 30  # Approximation for default font
-
-        # Draw grid of numbers
-        for i in range(1, 21):
-            row = (i-1) // 5
-            col = (i-1) % 5
-
-            # Calculate position with the new centered grid
-            x = start_x + col * (tile_size + margin)
-            y = start_y + row * (tile_size + margin)
-
-            # Determine tile color based on game state
-            if game_over:
-                if i in selected_numbers and i in winning_numbers:
-                    # Matching numbers are green
-                    tile_color = matching_color
-                    text_col = (0, 0, 0)  # Black text on green
-                elif i in winning_numbers:
-                    # Winning but not selected are red
-                    tile_color = unmatched_winning_color
-                    text_col = text_color
-                elif i in selected_numbers:
-                    # Selected but not winning stays purple
-                    tile_color = selected_color
-                    text_col = text_color
-                else:
-                    # Other tiles stay default
-                    tile_color = tile_bg
-                    text_col = text_color
-            else:
-                # During selection phase
-                if i in selected_numbers:
-                    tile_color = selected_color
-                else:
-                    tile_color = tile_bg
-                text_col = text_color
-
-            # Draw tile
-            draw.rectangle((x, y, x + tile_size, y + tile_size), fill=tile_color)
-
-            # Draw number with perfect centering
-            text = str(i)
-            text_bbox = font.getbbox(text)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-
-            # Calculate exact center position
-            text_x = x + (tile_size - text_width) // 2
-            text_y = y + (tile_size - text_height) // 2
-
-            draw.text((text_x, text_y), text, font=font, fill=text_col)
-
-        # Save to bytes
-        img_byte_array = io.BytesIO()
-        image.save(img_byte_array, format="PNG")
-        img_byte_array.seek(0)
-
-        return img_byte_array
+        """Render the number grid off the event loop"""
+        return await render_service.render_file("keno", render_keno_board, selected_numbers, winning_numbers, game_over)
 
     async def run_keno_game(self, ctx, view, message):
         """Run the Keno game after numbers are selected"""
@@ -845,7 +822,7 @@ class Keno(commands.Cog):
                 num_matches = 0
 
             # Calculate winnings
-            multiplier = PAYOUTS.get(num_selected, {}).get(num_matches, 0)
+            multiplier = KENO_PAYOUTS.get(num_selected, {}).get(num_matches, 0)
             winnings = bet_amount * multiplier
 
             # Generate results image
@@ -918,36 +895,13 @@ class Keno(commands.Cog):
             # Edit the message with new embed and view
             await message.edit(embed=embed, file=file, view=play_again_view)
 
-            # Update user balance and history
-            db = Users()
-            user_data = db.fetch_user(user_id)
-
-            if not user_data:
-                del self.ongoing_games[user_id]
-                return
-
-            # Handle win
-            if num_matches > 0 and multiplier > 0:
-                # Update user balance
-                db.update_balance(user_id, winnings)
-
-
-
-                # Update server profit (negative for casino loss)
-                server_db = Servers()
-                server_db.update_server_profit(ctx, ctx.guild.id, -1 * (winnings - bet_amount), game="keno")
-
-                # Add to server bet history
-
-            else:
-                # Add loss to history
-
-
-                # Update server profit (positive for casino win)
-                server_db = Servers()
-                server_db.update_server_profit(ctx, ctx.guild.id, bet_amount, game="keno")
-
-                # Add to server bet history
+            # Settle the round
+            payout = winnings if num_matches > 0 and multiplier > 0 else 0
+            await settlement.settle(ctx.author, ctx.guild, "keno", bet_amount, payout, {
+                "multiplier": multiplier if payout else 0,
+                "spots": num_selected,
+                "matches": num_matches,
+            })
 
             # Clean up
             del self.ongoing_games[user_id]
@@ -4,11 +4,143 @@ import asyncio
 import time
 import io
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.edit_scheduler import edits
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
 from PIL import Image, ImageDraw, ImageFont
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, usernames
+from Cogs.utils.settlement import settlement
+from Cogs.utils.currency_helper import authorize_bets
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import LIMBO_AUTO_ROLL_RANGE, LIMBO_FIXED_ROLL_RANGE, roll_multipliers
+
+# Frames are fully determined by (rolled multiplier, won, target), so they are kept as PNG bytes
+frame_cache = render_service.cache("limbo", int(float(os.getenv("LIMBO_FRAME_CACHE_MB", "16")) * 1024 * 1024))
+# Auto mode renders the frames for this many of the likeliest rolls (1.00x, 1.01x, ...) up front; 0 disables
+PRERENDER_FRAMES = int(os.getenv("LIMBO_PRERENDER_FRAMES", "0"))
+# Auto mode debits, rolls and settles this many rolls per display tick, one tick every TICK_SECONDS
+ROLLS_PER_TICK = max(1, int(os.getenv("LIMBO_ROLLS_PER_TICK", "1")))
+TICK_SECONDS = float(os.getenv("LIMBO_TICK_SECONDS", "1.0"))
+
+
+class RollMeter:
+    """Limbo rolls per second for each player, over the time their games spent rolling."""
+
+    def __init__(self):
+        self._users = {}  # user id -> [rolls, seconds]
+
+    def record(self, user_id, rolls, seconds):
+        totals = self._users.setdefault(user_id, [0, 0.0])
+        totals[0] += rolls
+        totals[1] += seconds
+
+    def stats(self):
+        return {
+            user_id: {"rolls": rolls, "seconds": seconds, "rolls_per_sec": rolls / seconds if seconds else 0.0}
+            for user_id, (rolls, seconds) in self._users.items()
+        }
+
+
+roll_meter = RollMeter()
+
+
+def render_multiplier(multiplier, won, target_multiplier):
+    """Generate an image showing the multiplier in BetRush style"""
+    # Create a new image with dark background
+    width, height = 600, 300
+    background_color = (45, 60, 75)  # Dark blue-grey background
+
+    img = Image.new('RGB', (width, height), background_color)
+    draw = ImageDraw.Draw(img)
+
+    # Load fonts
+    try:
+        title_font = atlas.font("roboto.ttf", 24)
+        multiplier_font = atlas.font("roboto.ttf", 80)
+        small_font = atlas.font("roboto.ttf", 18)
+    except:
+        title_font = ImageFont.load_default()
+        multiplier_font = ImageFont.load_default()
+        small_font = ImageFont.load_default()
+
+    # Colors
+    white_color = (255, 255, 255)
+    grey_color = (150, 150, 150)
+
+    # Determine multiplier color based on value and win/loss
+    if multiplier >= 10.0:
+        multiplier_color = (79, 172, 254)  # Blue for high multipliers
+    elif multiplier >= 2.0:
+        multiplier_color = (79, 172, 254)  # Blue for medium multipliers
+    else:
+        multiplier_color = (255, 165, 0)  # Orange for low multipliers
+
+    # Draw "BetSync" watermark in top left
+    draw.text((20, 20), "BetSync", font=title_font, fill=grey_color)
+
+    # Draw "Target: X.XXx" in top right
+    target_text = f"Target: {target_multiplier:.2f}x"
+    target_bbox = draw.textbbox((0, 0), target_text, font=title_font)
+    target_width = target_bbox[2] - target_bbox[0]
+    draw.text((width - target_width - 20, 20), target_text, font=title_font, fill=grey_color)
+
+    # Draw "CRASHED AT" text
+    crashed_text = "CRASHED AT"
+    crashed_bbox = draw.textbbox((0, 0), crashed_text, font=small_font)
+    crashed_width = crashed_bbox[2] - crashed_bbox[0]
+    draw.text(((width - crashed_width) // 2, 70), crashed_text, font=small_font, fill=grey_color)
+
+    # Draw the main multiplier
+    multiplier_text = f"{multiplier:.2f}x"
+    multiplier_bbox = draw.textbbox((0, 0), multiplier_text, font=multiplier_font)
+    multiplier_width = multiplier_bbox[2] - multiplier_bbox[0]
+    multiplier_height = multiplier_bbox[3] - multiplier_bbox[1]
+
+    # Center the multiplier text
+    multiplier_x = (width - multiplier_width) // 2
+    multiplier_y = (height - multiplier_height) // 2 - 10
+    draw.text((multiplier_x, multiplier_y), multiplier_text, font=multiplier_font, fill=multiplier_color)
+
+    # Draw progress bar
+    bar_width = 400
+    bar_height = 8
+    bar_x = (width - bar_width) // 2
+    bar_y = height - 60
+
+    # Background bar (dark)
+    draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + bar_height], 
+                  fill=(30, 40, 50))
+
+    # Calculate progress based on multiplier vs target
+    if target_multiplier > 0:
+        progress = min(multiplier / target_multiplier, 1.0)
+    else:
+        progress = 0.5
+
+    progress_width = int(bar_width * progress)
+
+    # Progress bar (colored)
+    if progress_width > 0:
+        draw.rectangle([bar_x, bar_y, bar_x + progress_width, bar_y + bar_height], 
+                      fill=multiplier_color)
+
+    # Draw circle indicator on progress bar
+    circle_x = bar_x + progress_width
+    circle_y = bar_y + bar_height // 2
+    circle_radius = 8
+    draw.ellipse([circle_x - circle_radius, circle_y - circle_radius,
+                 circle_x + circle_radius, circle_y + circle_radius], 
+                fill=white_color)
+
+    # Save to bytes
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='PNG')
+    img_bytes.seek(0)
+
+    return img_bytes
+
 
 class LimboGame:
     def __init__(self, cog, ctx, bet_amount, target_multiplier, user_id, rolls=None):
@@ -27,6 +159,7 @@ class LimboGame:
         self.current_multiplier = 0
         self.roll_mode = "auto" if rolls is None else "fixed"
         self.rolls_remaining = rolls
+        self.started = None  # perf_counter() when the rolls being timed for roll_meter began
 
     async def start_game(self):
         try:
@@ -50,10 +183,46 @@ class LimboGame:
             if self.user_id in self.cog.ongoing_games:
                 del self.cog.ongoing_games[self.user_id]
 
+    def roll_batch(self, count, roll_range):
+        """
+        Rolls `count` multipliers at once, applying an admin curse roll by
+        roll for as long as it lasts.
+
+        Args:
+            count (int): How many rolls.
+            roll_range (float): LIMBO_FIXED_ROLL_RANGE or LIMBO_AUTO_ROLL_RANGE.
+
+        Returns:
+            list: (rolled multiplier, won) per roll, in order.
+        """
+        rolls = roll_multipliers(count, roll_range)
+        curse_cog = self.cog.bot.get_cog('AdminCurseCog')
+        if curse_cog:
+            for i in range(count):
+                if not curse_cog.is_player_cursed(self.user_id):
+                    break
+                # 90% chance to stop just before target (0.85-0.98 of it); the other 10% keep their normal roll
+                if random.random() < 0.9:
+                    rolls[i] = round(self.target_multiplier * random.uniform(0.85, 0.98), 2)
+
+                    # Consume curse
+                    forced_loss, curse_complete = curse_cog.force_loss(self.user_id)
+                    asyncio.create_task(self.send_curse_webhook("limbo", self.bet_amount, float(rolls[i]), self.target_multiplier))
+        return [(float(multiplier), bool(multiplier >= self.target_multiplier)) for multiplier in rolls]
+
+    def record_rolls(self, results):
+        """Adds rolled results to the running totals; returns the (bet, payout) rounds to settle."""
+        rounds = []
+        for rolled, won in results:
+            winnings = self.bet_amount * self.target_multiplier if won else 0
+            self.total_profit += winnings - self.bet_amount
+            self.total_bets += 1
+            self.current_multiplier = rolled
+            rounds.append((self.bet_amount, winnings))
+        return rounds
+
     async def run_fixed_mode_game(self, db):
         """Run fixed number of rolls without animation"""
-        server_db = Servers()
-        server_data = server_db.fetch_server(self.ctx.guild.id)
         original_rolls = self.rolls_remaining
 
         # Create initial embed to show we're calculating
@@ -66,180 +235,34 @@ class LimboGame:
 
         self.message = await self.ctx.reply(embed=loading_embed)
 
-        # Process all the rolls at once
-        wins = 0
-        losses = 0
-        win_entries = []
-        loss_entries = []
-        server_win_entries = []
-        server_loss_entries = []
-
-        current_timestamp = int(time.time())
-        # First roll is already paid for in process_bet_amount
-        # For subsequent rolls, calculate additional funds needed
-        total_funds_needed = self.bet_amount * (self.rolls_remaining -1) if self.rolls_remaining > 1 else 0
-        user_data = db.fetch_user(self.user_id)
-        available_funds = user_data['points']
-
-
-        if self.rolls_remaining > 1 and available_funds < total_funds_needed:
-            # Calculate max rolls including the first paid roll
-            max_rolls = 1 + int(available_funds / self.bet_amount)
-            if max_rolls <=1:
-                insufficient_embed = self.create_embed()
-                insufficient_embed.title = "<:no:1344252518305234987> | Game Over - Insufficient Funds"
-                insufficient_embed.description = f"You don't have enough points to place even a single bet of {self.bet_amount}."
-                insufficient_embed.color = 0xFF0000
-                self.message = await self.ctx.reply(embed=insufficient_embed)
-                self.running = False
-
-                # Clean up the game from ongoing_games
-                if self.user_id in self.cog.ongoing_games:
-                    del self.cog.ongoing_games[self.user_id]
-                return
-
-            self.rolls_remaining = max_rolls
-
+        # The first roll is already paid for in process_bet_amount; the rest are debited together.
+        # Like the first bet, every extra roll accrues XP, levels and rakeback
+        self.rolls_remaining = 1 + await authorize_bets(self.user_id, self.bet_amount, original_rolls - 1)
+        if self.rolls_remaining < original_rolls:
             insufficient_embed = discord.Embed(
                 title="⚠️ | Insufficient Funds for All Rolls",
-                description=f"You don't have enough funds for {original_rolls} rolls. Running {max_rolls} rolls instead.",
+                description=f"You don't have enough funds for {original_rolls} rolls. Running {self.rolls_remaining} rolls instead.",
                 color=0xFFA500
             )
             await self.message.edit(embed=insufficient_embed)
             await asyncio.sleep(2)  # Give user time to see the message
 
-        # For the first bet, use the already deducted amount
-        first_bet_tokens = self.tokens_used
-        #first_bet_credits = self.credits_used
-
-        # For remaining rolls, calculate additional funds needed
-        remaining_rolls = self.rolls_remaining - 1  # Subtract 1 for the already deducted first bet
-        if remaining_rolls > 0:
-            additional_tokens_used = min(user_data['points'], self.bet_amount * remaining_rolls)
-            #additional_credits_used = min(user_data['credits'], self.bet_amount * remaining_rolls - additional_tokens_used)
-
-            # Update balances for additional rolls
-            if additional_tokens_used > 0:
-                db.update_balance(self.user_id, -additional_tokens_used)
-
-
-            # Add to the already used amounts
-            tokens_used = first_bet_tokens + additional_tokens_used
-            #credits_used = first_bet_credits + additional_credits_used
-        else:
-            # Only one roll, so just use the amounts already deducted
-            tokens_used = first_bet_tokens
-            #credits_used = first_bet_credits
-
-        # Keep track of the total funds used
-        self.tokens_used = tokens_used
-        #self.credits_used = credits_used
-        remaining_funds = tokens_used 
-
-        # Process all rolls
-        last_roll_multiplier = 1.00
-        last_roll_won = False
-        all_rolls = []  # Store all results to display in history
-
-        for i in range(self.rolls_remaining):
-            # Check if we have enough funds for this roll
-            if remaining_funds < self.bet_amount:
-                # Stop simulation if we run out of funds
-                break
-
-            # Check for curse and manipulate roll
-            curse_cog = self.cog.bot.get_cog('AdminCurseCog')
-            if curse_cog and curse_cog.is_player_cursed(self.user_id):
-                # 90% chance to stop just before target
-                if random.random() < 0.9:
-                    # Generate multiplier just below target (0.85-0.98 of target)
-                    reduction_factor = random.uniform(0.85, 0.98)
-                    rolled_multiplier = self.target_multiplier * reduction_factor
-                    rounded_multiplier = round(rolled_multiplier, 2)
-                    
-                    # Consume curse
-                    forced_loss, curse_complete = curse_cog.force_loss(self.user_id)
-                    
-                    # Send webhook notification (async in fixed mode)
-                    asyncio.create_task(self.send_curse_webhook("limbo", self.bet_amount, rounded_multiplier, self.target_multiplier))
-                else:
-                    # Normal roll for the 10%
-                    r = random.random() * 0.90
-                    rolled_multiplier = 1.0 / (1.0 - r)
-                    rounded_multiplier = round(rolled_multiplier, 2)
-            else:
-                # Roll the multiplier (with 10% house edge)
-                # The formula: rolled_mult = 1.0 / (1.0 - R) where R is [0, 0.90)
-                r = random.random() * 0.90
-                rolled_multiplier = 1.0 / (1.0 - r)
-                rounded_multiplier = round(rolled_multiplier, 2)  # Round to 2 decimal places
-
-            # Determine if user won
-            won = rounded_multiplier >= self.target_multiplier
-            all_rolls.append((rounded_multiplier, won))
-
-            # Save the last roll for display
-            last_roll_multiplier = rounded_multiplier
-            last_roll_won = won
-
-            # Update total stats
-            self.total_bets += 1
-            self.current_multiplier = rounded_multiplier
-
-            # Deduct bet amount from remaining funds
-            remaining_funds -= self.bet_amount
-
-            # Calculate winnings
-            if won:
-                wins += 1
-                winnings = self.bet_amount * self.target_multiplier
-                self.total_profit += winnings - self.bet_amount
-
-                # Add winnings to remaining funds
-                remaining_funds += winnings
-
-                # Add to win history
-                win_entry = {
-                    "type": "win",
-                    "game": "limbo",
-                    "amount": winnings,
-                    "bet": self.bet_amount,
-                    "multiplier": self.target_multiplier,
-                    "rolled_multiplier": rounded_multiplier,
-                    "timestamp": current_timestamp
-                }
-                win_entries.append(win_entry)
-
-            else:
-                losses += 1
-                self.total_profit -= self.bet_amount
-
-                # Add to loss history
-                loss_entry = {
-                    "type": "loss",
-                    "game": "limbo",
-                    "amount": self.bet_amount,
-                    "bet": self.bet_amount,
-                    "multiplier": 0,
-                    "target_multiplier": self.target_multiplier,
-                    "rolled_multiplier": rounded_multiplier,
-                    "timestamp": current_timestamp
-                }
-                loss_entries.append(loss_entry)
-
-        # Bulk update database
-        # Credit user with total winnings
-        total_winnings = (self.bet_amount * self.total_bets) + self.total_profit
-        if total_winnings > 0:
-            db.update_balance(self.user_id, total_winnings)
-
-
-
-            # Calculate server profit/loss
-            server_profit = losses * self.bet_amount - wins * (self.bet_amount * self.target_multiplier - self.bet_amount)
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, server_profit, game="limbo")
-
-        # Now display the final result with the last roll
+        # Roll everything at once and settle every roll with one credit
+        self.started = time.perf_counter()
+        results = self.roll_batch(self.rolls_remaining, LIMBO_FIXED_ROLL_RANGE)
+        wins = sum(1 for _, won in results if won)
+        losses = len(results) - wins
+        settled_rounds = self.record_rolls(results)
+        await settlement.settle_rounds(self.ctx.author, self.ctx.guild, "limbo", settled_rounds, {
+            "target_multiplier": self.target_multiplier,
+            "wins": wins,
+            "losses": losses,
+        })
+        roll_meter.record(self.user_id, len(results), time.perf_counter() - self.started)
+
+        # Show the latest rolls, newest first, and the last one as the image
+        self.history = list(reversed(results[-10:]))
+        last_roll_multiplier, last_roll_won = results[-1]
         embed = self.create_embed()
         file = await self.generate_multiplier_image(last_roll_multiplier, last_roll_won)
         embed.set_image(url="attachment://limbo_result.png")
@@ -269,151 +292,53 @@ class LimboGame:
             embed.set_image(url="attachment://limbo_result.png")
 
             self.message = await self.ctx.reply(embed=embed, file=file, view=LimboControlView(self))
+            if PRERENDER_FRAMES:
+                asyncio.create_task(self.prerender_frames())
 
-            # Start betting loop (first bet already deducted)
-            is_first_bet = True
+            # Start betting loop (first bet already deducted by currency_helper)
+            paid_bets = 1
+            self.started = time.perf_counter()
 
             while self.running:
-                # Only check balance after the first bet (first bet was handled by currency_helper)
-                if not is_first_bet:
-                    # Deduct bet amount for subsequent bets
-                    user_data = db.fetch_user(self.user_id)
-                    tokens_balance = user_data['points']
-                    #credits_balance = user_data['credits']
-
-                    # Determine which currency to use
-                    tokens_used = 0
-                    #credits_used = 0
-
-                    # Auto determine what to use
-                    if self.bet_amount <= tokens_balance:
-                        tokens_used = self.bet_amount
-
-                    else:
-                        # Not enough funds to continue
-                        embed = self.create_embed()
-                        embed.title = "<:no:1344252518305234987> | Game Over - Insufficient Funds"
-                        embed.description = f"You don't have enough funds to continue betting {self.bet_amount}.\nGame stopped."
-                        embed.color = 0xFF0000
-                        # Keep using the existing rolled multiplier image in the embed
-                        #embed.set_image(url="attachment://limbo_result.png")
-                        await self.message.edit(embed=embed, view=None)
-                        self.running = False
-                        break
-
-                    # Update balances
-                    if tokens_used > 0:
-                        db.update_balance(self.user_id, tokens_balance - tokens_used)
-
-                else:
-                    # Use the tokens/credits that were already deducted
-                    tokens_used = self.tokens_used
-                    #credits_used = self.credits_used
-                    is_first_bet = False  # Mark first bet as processed
-
-                # Check for curse and manipulate roll
-                curse_cog = self.cog.bot.get_cog('AdminCurseCog')
-                if curse_cog and curse_cog.is_player_cursed(self.user_id):
-                    # 90% chance to stop just before target
-                    if random.random() < 0.9:
-                        # Generate multiplier just below target (0.85-0.98 of target)
-                        reduction_factor = random.uniform(0.85, 0.98)
-                        rolled_multiplier = self.target_multiplier * reduction_factor
-                        rounded_multiplier = round(rolled_multiplier, 2)
-                        
-                        # Consume curse
-                        forced_loss, curse_complete = curse_cog.force_loss(self.user_id)
-                        
-                        # Send webhook notification
-                        await self.send_curse_webhook("limbo", self.bet_amount, rounded_multiplier, self.target_multiplier)
-                    else:
-                        # Normal roll for the 10%
-                        r = random.random() * 0.85
-                        rolled_multiplier = 1.0 / (1.0 - r)
-                        rounded_multiplier = round(rolled_multiplier, 2)
-                else:
-                    # Roll the multiplier (with 15% house edge)
-                    # The formula: rolled_mult = 1.0 / (1.0 - R) where R is [0, 0.85)
-                    r = random.random() * 0.85
-                    rolled_multiplier = 1.0 / (1.0 - r)
-                    rounded_multiplier = round(rolled_multiplier, 2)  # Round to 2 decimal places
-
-                # Determine if user won
-                won = rounded_multiplier >= self.target_multiplier
-
-                # Update history
-                self.history.insert(0, (rounded_multiplier, won))
-                if len(self.history) > 10:
-                    self.history.pop()
-
-                # Update total stats
-                self.total_bets += 1
-                self.current_multiplier = rounded_multiplier
-
-                # Calculate winnings
-                if won:
-                    winnings = self.bet_amount * self.target_multiplier
-                    self.total_profit += winnings - self.bet_amount
-
-                    # Credit the user with winnings
-                    db.update_balance(self.user_id, winnings)
-
-                    # Add to win history
-                    win_entry = {
-                        "type": "win",
-                        "game": "limbo",
-                        "amount": winnings,
-                        "bet": self.bet_amount,
-                        "multiplier": self.target_multiplier,
-                        "rolled_multiplier": rounded_multiplier,
-                        "timestamp": int(time.time())
-                    }
-                    #win_entries.append(win_entry) # This is auto mode, so no win_entries list
-
-                    # Update server history
-                    server_db = Servers()
-
-
-                    # Update server profit (user won)
-                    loss = winnings - self.bet_amount
-                    server_db.update_server_profit(self.ctx, self.ctx.guild.id, -loss)
+                # Each display tick debits, rolls and settles its rolls as one batch; every roll accrues XP
+                paid_bets += await authorize_bets(self.user_id, self.bet_amount, ROLLS_PER_TICK - paid_bets)
+                if paid_bets == 0:
+                    # Not enough funds to continue
+                    embed = self.create_embed()
+                    embed.title = "<:no:1344252518305234987> | Game Over - Insufficient Funds"
+                    embed.description = f"You don't have enough funds to continue betting {self.bet_amount}.\nGame stopped."
+                    embed.color = 0xFF0000
+                    # Keep using the existing rolled multiplier image in the embed
+                    await edits.edit(self.message, embed=embed, view=None)
+                    self.running = False
+                    break
+
+                results = self.roll_batch(paid_bets, LIMBO_AUTO_ROLL_RANGE)
+                paid_bets = 0
+                settled_rounds = self.record_rolls(results)
+                rolled, won = results[-1]
+                metadata = {"target_multiplier": self.target_multiplier}
+                if len(results) == 1:
+                    metadata["rolled_multiplier"] = rolled
                 else:
-                    self.total_profit -= self.bet_amount
-
-                    # Add to loss history
-                    loss_entry = {
-                        "type": "loss",
-                        "game": "limbo",
-                        "amount": self.bet_amount,
-                        "bet": self.bet_amount,
-                        "multiplier": 0,
-                        "target_multiplier": self.target_multiplier,
-                        "rolled_multiplier": rounded_multiplier,
-                        "timestamp": int(time.time())
-                    }
-                    #loss_entries.append(loss_entry) # This is auto mode, so no loss_entries list
-
-                    # Update server history
-                    server_db = Servers()
-                    server_data = server_db.fetch_server(self.ctx.guild.id)
-
-                    if server_data:
-
-
-                        # Update server profit (user lost)
-                        server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="limbo")
-
+                    metadata["wins"] = sum(1 for _, result_won in results if result_won)
+                    metadata["losses"] = len(results) - metadata["wins"]
+                await settlement.settle_rounds(self.ctx.author, self.ctx.guild, "limbo", settled_rounds, metadata)
+                roll_meter.record(self.user_id, len(results), time.perf_counter() - self.started)
+                self.started = time.perf_counter()
 
+                # Update history, newest first
+                self.history = (list(reversed(results)) + self.history)[:10]
 
                 # Update display
                 embed = self.create_embed()
-                file = await self.generate_multiplier_image(rounded_multiplier, won)
+                file = await self.generate_multiplier_image(rolled, won)
                 embed.set_image(url="attachment://limbo_result.png")
 
-                await self.message.edit(embed=embed, file=file, view=LimboControlView(self))
+                await edits.edit(self.message, embed=embed, file=file, view=LimboControlView(self))
 
-                # Wait before next roll
-                await asyncio.sleep(1.0)  # Normal speed for auto mode
+                # Wait before next tick
+                await asyncio.sleep(TICK_SECONDS)
 
         except Exception as e:
             print(f"Error in Limbo game: {e}")
@@ -473,99 +398,30 @@ class LimboGame:
         return embed
 
     async def generate_multiplier_image(self, multiplier, won):
-        """Generate an image showing the multiplier in BetRush style"""
-        # Create a new image with dark background
-        width, height = 600, 300
-        background_color = (45, 60, 75)  # Dark blue-grey background
-
-        img = Image.new('RGB', (width, height), background_color)
-        draw = ImageDraw.Draw(img)
-
-        # Load fonts
-        try:
-            title_font = ImageFont.truetype("roboto.ttf", 24)
-            multiplier_font = ImageFont.truetype("roboto.ttf", 80)
-            small_font = ImageFont.truetype("roboto.ttf", 18)
-        except:
-            title_font = ImageFont.load_default()
-            multiplier_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-
-        # Colors
-        white_color = (255, 255, 255)
-        grey_color = (150, 150, 150)
-
-        # Determine multiplier color based on value and win/loss
-        if multiplier >= 10.0:
-            multiplier_color = (79, 172, 254)  # Blue for high multipliers
-        elif multiplier >= 2.0:
-            multiplier_color = (79, 172, 254)  # Blue for medium multipliers
-        else:
-            multiplier_color = (255, 165, 0)  # Orange for low multipliers
-
-        # Draw "BetSync" watermark in top left
-        draw.text((20, 20), "BetSync", font=title_font, fill=grey_color)
-
-        # Draw "Target: X.XXx" in top right
-        target_text = f"Target: {self.target_multiplier:.2f}x"
-        target_bbox = draw.textbbox((0, 0), target_text, font=title_font)
-        target_width = target_bbox[2] - target_bbox[0]
-        draw.text((width - target_width - 20, 20), target_text, font=title_font, fill=grey_color)
-
-        # Draw "CRASHED AT" text
-        crashed_text = "CRASHED AT"
-        crashed_bbox = draw.textbbox((0, 0), crashed_text, font=small_font)
-        crashed_width = crashed_bbox[2] - crashed_bbox[0]
-        draw.text(((width - crashed_width) // 2, 70), crashed_text, font=small_font, fill=grey_color)
-
-        # Draw the main multiplier
-        multiplier_text = f"{multiplier:.2f}x"
-        multiplier_bbox = draw.textbbox((0, 0), multiplier_text, font=multiplier_font)
-        multiplier_width = multiplier_bbox[2] - multiplier_bbox[0]
-        multiplier_height = multiplier_bbox[3] - multiplier_bbox[1]
-
-        # Center the multiplier text
-        multiplier_x = (width - multiplier_width) // 2
-        multiplier_y = (height - multiplier_height) // 2 - 10
-        draw.text((multiplier_x, multiplier_y), multiplier_text, font=multiplier_font, fill=multiplier_color)
-
-        # Draw progress bar
-        bar_width = 400
-        bar_height = 8
-        bar_x = (width - bar_width) // 2
-        bar_y = height - 60
-
-        # Background bar (dark)
-        draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + bar_height], 
-                      fill=(30, 40, 50))
-
-        # Calculate progress based on multiplier vs target
-        if self.target_multiplier > 0:
-            progress = min(multiplier / self.target_multiplier, 1.0)
-        else:
-            progress = 0.5
-
-        progress_width = int(bar_width * progress)
-
-        # Progress bar (colored)
-        if progress_width > 0:
-            draw.rectangle([bar_x, bar_y, bar_x + progress_width, bar_y + bar_height], 
-                          fill=multiplier_color)
-
-        # Draw circle indicator on progress bar
-        circle_x = bar_x + progress_width
-        circle_y = bar_y + bar_height // 2
-        circle_radius = 8
-        draw.ellipse([circle_x - circle_radius, circle_y - circle_radius,
-                     circle_x + circle_radius, circle_y + circle_radius], 
-                    fill=white_color)
-
-        # Save to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-
-        return discord.File(img_bytes, filename="limbo_result.png")
+        """Render the multiplier image off the event loop, or reuse the frame if it was drawn before"""
+        multiplier, target = round(multiplier, 2), round(self.target_multiplier, 2)
+        png = await render_service.render_cached(
+            "limbo", (multiplier, won, target), render_multiplier, multiplier, won, target
+        )
+        return discord.File(io.BytesIO(png), filename="limbo_result.png")
+
+    async def prerender_frames(self):
+        """Render the frames for the likeliest rolls ahead of time, one at a time"""
+        target = round(self.target_multiplier, 2)
+        for i in range(PRERENDER_FRAMES):
+            multiplier = round(1 + i / 100, 2)
+            won = multiplier >= self.target_multiplier
+            if (multiplier, won, target) in frame_cache:
+                continue
+            if not self.running:
+                return
+            try:
+                await render_service.render_cached(
+                    "limbo", (multiplier, won, target), render_multiplier, multiplier, won, target
+                )
+            except Exception as e:
+                print(f"Error pre-rendering limbo frames: {e}")
+                return
 
     def stop_game(self):
         """Stop the game"""
@@ -578,13 +434,13 @@ class LimboGame:
             return
         
         try:
-            user = await self.ctx.bot.fetch_user(self.user_id)
+            name = await usernames.resolve(self.user_id)
             embed = {
                 "title": "🎯 Curse Triggered",
                 "description": f"A cursed player has been forced to lose",
                 "color": 0x8B0000,
                 "fields": [
-                    {"name": "User", "value": f"{user.name} ({user.id})", "inline": False},
+                    {"name": "User", "value": f"{name} ({self.user_id})", "inline": False},
                     {"name": "Game", "value": game.capitalize(), "inline": True},
                     {"name": "Bet Amount", "value": f"{bet_amount:.2f} points", "inline": True},
                     {"name": "Target Multiplier", "value": f"{target_multiplier:.2f}x", "inline": True},
@@ -593,8 +449,7 @@ class LimboGame:
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -4,19 +4,20 @@ import asyncio
 import datetime
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 from discord.ext import commands
-from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import MATCH_BOARD_COLUMNS, MATCH_BOARD_ROWS, MATCH_MULTIPLIERS, match_board_tiles
 
 class MatchGame:
     """A game where players reveal multipliers on a 4x5 grid and win based on matching multipliers."""
     def __init__(self, bet_amount, user_id):
         self.bet_amount = bet_amount
         self.user_id = user_id
-        self.rows = 4
-        self.cols = 5
-        self.multipliers = [0.2, 0.5, 1.25, 1.75, 2.0, 3.0]
+        self.rows = MATCH_BOARD_ROWS
+        self.cols = MATCH_BOARD_COLUMNS
+        self.multipliers = MATCH_MULTIPLIERS
         self.board = self.create_board()
         self.revealed = [[False for _ in range(self.cols)] for _ in range(self.rows)]
         self.matched_multiplier = None
@@ -26,15 +27,8 @@ class MatchGame:
 
     def create_board(self):
         """Create a 4x5 board with 3 of each multiplier randomly placed"""
-        # Create a list of all multipliers (3 of each)
-        all_multipliers = []
-        for multi in self.multipliers:
-            all_multipliers.extend([multi] * 3)
-        
-        # Add 1 extra 0.2x and 1 extra 0.5x multiplier to fill the remaining 2 spots
-        all_multipliers.append(0.2)
-        all_multipliers.append(0.5)
-        
+        all_multipliers = match_board_tiles()
+
         # Shuffle the multipliers
         random.shuffle(all_multipliers)
         
@@ -188,7 +182,7 @@ class MatchButton(discord.ui.Button):
                         child.style = discord.ButtonStyle.success  # Green for high multipliers
 
             # Process the game result
-            await self.match_cog.process_game_result(interaction, self.match_game, self.ctx.guild.id)
+            await self.match_cog.process_game_result(interaction, self.match_game, self.ctx)
         else:
             # Just update the view
             await interaction.response.edit_message(view=self.view)
@@ -261,8 +255,7 @@ class Match(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -350,10 +343,8 @@ class Match(commands.Cog):
         # Set message reference for timeout handling
         view.message = message
 
-    async def process_game_result(self, interaction, match_game, s):
+    async def process_game_result(self, interaction, match_game, ctx):
         """Process the game result when the game is over"""
-        db = Users()
-        user = await self.bot.fetch_user(match_game.user_id)
 
         # Get match result
         matched_multiplier = match_game.matched_multiplier
@@ -384,21 +375,6 @@ class Match(commands.Cog):
                 value=f"**Bet Amount:** `{match_game.bet_amount} {currency_used}`\n**Multiplier:** {matched_multiplier}x\n**Winnings:** `{winnings} {currency_used}`",
                 inline=False
             )
-
-            # Update user balance and history
-            if winnings > 0:
-                db.update_balance(match_game.user_id, winnings)
-
-                # Adjust profit ratio for house edge calculations
-                profit = match_game.bet_amount - winnings
-                from Cogs.utils.mongo import Servers
-                dbb = Servers()
-                dbb.update_server_profit(self.ctx,s, profit, game="match")
-                
-                
-            else:
-                # If they matched but didn't win anything (unlikely but possible with very low multipliers)
-                pass
         else:
             # Player didn't match any multiplier
             embed = discord.Embed(
@@ -415,6 +391,10 @@ class Match(commands.Cog):
 
             
 
+        await settlement.settle(ctx.author, ctx.guild, "match", match_game.bet_amount, winnings, {
+            "multiplier": matched_multiplier or 0,
+        })
+
         # No balance field needed
 
         # Create a new view that reveals all tiles and adds Play Again button
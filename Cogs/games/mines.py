@@ -3,11 +3,13 @@ import asyncio
 import random
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import process_bet_amount
+from Cogs.utils.multiplier_tables import mines_tables
 
 
 class MineButton(discord.ui.Button):
@@ -224,8 +226,7 @@ class MineButton(discord.ui.Button):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -254,7 +255,7 @@ class PlayAgainView(discord.ui.View):
 
         # Check if user can afford the same bet
         db = Users()
-        user_data = db.fetch_user(interaction.user.id)
+        user_data = await db.fetch_user(interaction.user.id, "balance")
         if not user_data:
             return await interaction.followup.send("Your account couldn't be found. Please try again later.", ephemeral=True)
 
@@ -297,6 +298,8 @@ class MinesTileView(discord.ui.View):
         self.game_over = False
         self.cashed_out = False
         self.current_multiplier = 1.0
+        # Multiplier after each number of safe tiles for this board and mine count
+        self.multipliers = mines_tables(board_size * board_size)[0][mines_count]
         self.message = None
 
         # Generate buttons for the 5x5 grid
@@ -332,38 +335,8 @@ class MinesTileView(discord.ui.View):
             self.mine_locations.append(row)
 
     def update_multiplier(self):
-        """Calculate current multiplier based on revealed tiles"""
-        # Get total grid size and number of mines
-        total_cells = self.board_size * self.board_size
-        safe_cells = total_cells - self.mines_count
-        revealed_count = len(self.revealed_tiles)
-
-        # If no tiles revealed yet, multiplier is 1.0
-        if revealed_count == 0:
-            self.current_multiplier = 1.0
-            return
-
-        # Calculate proper probability-based multiplier
-        # Formula: 1 / (probability of getting this far without hitting a mine)
-        # For each revealed tile, we need to calculate probability of not hitting a mine
-        multiplier = 1.0
-
-        # Loop over each tile revealed
-        for i in range(revealed_count):
-            # Probability of not hitting a mine for the i-th pick
-            # = (safe_cells - i) / (total_cells - i)
-            probability = (safe_cells - i) / (total_cells - i)
-            multiplier /= probability
-
-        # Apply house edge (~8%)
-        house_edge = 0.92
-        multiplier *= house_edge
-
-        # Round to 2 decimal places
-        self.current_multiplier = round(multiplier, 2)
-
-        # Ensure minimum is 1.0
-        self.current_multiplier = max(1.0, self.current_multiplier)
+        """Look up the multiplier for the tiles revealed so far"""
+        self.current_multiplier = self.multipliers[len(self.revealed_tiles)]
 
     def create_embed(self, status="playing", payout=None, multiplier=None):
         """Create the game embed based on current state"""
@@ -425,87 +398,19 @@ class MinesTileView(discord.ui.View):
 
     async def process_win(self, ctx):
         """Process win for the player"""
-        # Calculate winnings
         winnings = self.bet_amount * self.current_multiplier
-
-        # Get database connection
-        db = Users()
-
-        # Add credits to user (always give credits for winnings)
-        db.update_balance(ctx.author.id, winnings)
-        
-        # Only update server profit if in a guild context
-        if ctx.guild:
-            server_db = Servers()
-            # Update server profit (negative value because server loses when player wins)
-            profit = winnings - self.bet_amount
-            if ctx.guild:
-                server_db.update_server_profit(ctx, ctx.guild.id, -profit, game="mines")
-
-        # Add to history
-        timestamp = int(time.time())
-        history_entry = {
-            "type": "win",
-            "game": "mines",
-            "amount": winnings,
-            "bet": self.bet_amount,
+        await settlement.settle(ctx.author, ctx.guild, "mines", self.bet_amount, winnings, {
             "multiplier": self.current_multiplier,
             "mines_count": self.mines_count,
             "tiles_revealed": len(self.revealed_tiles),
-            "timestamp": timestamp
-        }
-        
-        db.update_history(ctx.author.id, history_entry)
-        
-        # Update server history only if in guild context
-        if ctx.guild:
-            server_db = Servers()
-            server_history_entry = history_entry.copy()
-            server_history_entry.update({
-                "user_id": ctx.author.id,
-                "user_name": ctx.author.name
-            })
-            server_db.update_history(ctx.guild.id, server_history_entry)
-
-        # Update user stats
-        
+        })
 
     async def process_loss(self, ctx):
         """Process loss for the player"""
-        # Get database connection
-        db = Users()
-
-        # Add to history
-        timestamp = int(time.time())
-        history_entry = {
-            "type": "loss",
-            "game": "mines",
-            "amount": self.bet_amount,
-            "bet": self.bet_amount,
-            "multiplier": 0,
+        await settlement.settle(ctx.author, ctx.guild, "mines", self.bet_amount, 0, {
             "mines_count": self.mines_count,
             "tiles_revealed": len(self.revealed_tiles),
-            "timestamp": timestamp
-        }
-        
-        db.update_history(ctx.author.id, history_entry)
-
-        # Update server history only if in guild context
-        if ctx.guild:
-            server_db = Servers()
-            server_data = server_db.fetch_server(ctx.guild.id)
-
-            if server_data:
-                server_history_entry = history_entry.copy()
-                server_history_entry.update({
-                    "user_id": ctx.author.id,
-                    "user_name": ctx.author.name
-                })
-                server_db.update_history(ctx.guild.id, server_history_entry)
-                
-                server_db.update_server_profit(ctx, ctx.guild.id, self.bet_amount, game="mines")
-
-        
+        })
 
     async def on_timeout(self):
         """Handle timeout - auto cash out if player has revealed tiles"""
@@ -3,10 +3,11 @@ import discord
 import random
 import os
 import time
-import aiohttp
+from Cogs.utils.http_client import http
 from discord.ext import commands
 from datetime import datetime
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
+from Cogs.utils.paytables import PENALTY_KEEPER_MULTIPLIER, PENALTY_STRIKER_MULTIPLIER
 import uuid
 
 class RoleSelectionView(discord.ui.View):
@@ -218,8 +219,7 @@ class PenaltyCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -328,12 +328,12 @@ class PenaltyCog(commands.Cog):
                 
                 f"**🥅 Goalkeeper Challenge:**\n"
                 f"> • Dive and save the penalty shot\n"
-                f"> • **Win: {bet_amount*2.1:,.2f} points** (2.1x)\n"
+                f"> • **Win: {bet_amount*PENALTY_KEEPER_MULTIPLIER:,.2f} points** (2.1x)\n"
                 f"> • High risk, high reward! 💎\n\n"
                 
                 f"**⚽ Striker Challenge:**\n"
                 f"> • Score past the goalkeeper\n"
-                f"> • **Win: {bet_amount*1.45:,.2f} points** (1.45x)\n"
+                f"> • **Win: {bet_amount*PENALTY_STRIKER_MULTIPLIER:,.2f} points** (1.45x)\n"
                 f"> • Aim true and score! 🎯\n\n"
                 
                 f"```diff\n"
@@ -454,14 +454,14 @@ class PenaltyCog(commands.Cog):
             
             # Consume curse and send webhook
             curse_cog.consume_curse(ctx.author.id)
-            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, 1.45)
+            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, PENALTY_STRIKER_MULTIPLIER)
 
         # Direction emojis for visual representation
         direction_emojis = {"left": "⬅️", "middle": "⬆️", "right": "➡️"}
         direction_names = {"left": "Left Corner", "middle": "Center Goal", "right": "Right Corner"}
 
         # Calculate winnings
-        multiplier = 1.45
+        multiplier = PENALTY_STRIKER_MULTIPLIER
         winnings = bet_amount * multiplier if goal_scored else 0
 
         # Create result embed
@@ -488,10 +488,6 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1355501647538815106.png")
 
-            # Update user balance with winnings
-            db = Users()
-            db.update_balance(ctx.author.id, winnings)
-
         else:
             embed = discord.Embed(
                 title=f"<:no:1344252518305234987> | **SAVED!** 🥅",
@@ -514,21 +510,10 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1344252518305234987.png")
 
-            # Update statistics
-            db = Users()
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$inc": {"total_played": 1, "total_lost": 1, "total_spent": bet_amount}}
-            )
-
         embed.set_footer(text="⚽ BetSync Casino • Want another shot?", icon_url=self.bot.user.avatar.url)
 
-        # Add betting history
-        self.update_bet_history(ctx, "penalty_taker", bet_amount, shot_direction, goalkeeper_direction, goal_scored, multiplier, winnings)
-
-        # Update server profit
-        nnn = Servers()
-        nnn.update_server_profit(ctx, ctx.guild.id, bet_amount, game="penalty")
+        # Pay out and record the round
+        await self.settle_round(ctx, "penalty_taker", bet_amount, shot_direction, goalkeeper_direction, goal_scored, multiplier, winnings)
 
         # Create "Play Again" button
         play_again_view = PlayAgainView(self, ctx, bet_amount, timeout=15)
@@ -561,14 +546,14 @@ class PenaltyCog(commands.Cog):
             
             # Consume curse and send webhook
             curse_cog.consume_curse(ctx.author.id)
-            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, 2.1)
+            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, PENALTY_KEEPER_MULTIPLIER)
 
         # Direction emojis for visual representation
         direction_emojis = {"left": "⬅️", "middle": "⬆️", "right": "➡️"}
         direction_names = {"left": "Left Corner", "middle": "Center Goal", "right": "Right Corner"}
 
         # Calculate winnings
-        multiplier = 2.1
+        multiplier = PENALTY_KEEPER_MULTIPLIER
         winnings = bet_amount * multiplier if save_made else 0
 
         # Create result embed
@@ -595,13 +580,6 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1355501647538815106.png")
 
-            # Update user balance with winnings
-            db = Users()
-            db.update_balance(ctx.author.id, winnings)
-
-            nnn = Servers()
-            nnn.update_server_profit(ctx, ctx.guild.id, -winnings, game="penalty")
-
         else:
             embed = discord.Embed(
                 title=f"<:no:1344252518305234987> | **GOAL CONCEDED!** ⚽",
@@ -624,18 +602,11 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1344252518305234987.png")
 
-            # Update statistics
-            db = Users()
-
         embed.set_footer(text="🥅 BetSync Casino • Ready for another challenge?", icon_url=self.bot.user.avatar.url)
 
-        # Add betting history
-        self.update_bet_history(ctx, "penalty_goalkeeper", bet_amount, dive_direction, striker_direction, save_made, multiplier, winnings)
+        # Pay out and record the round
+        await self.settle_round(ctx, "penalty_goalkeeper", bet_amount, dive_direction, striker_direction, save_made, multiplier, winnings)
         
-        # Update server profit
-        nnn = Servers()
-        nnn.update_server_profit(ctx, ctx.guild.id, bet_amount, game="penalty")
-
         # Create "Play Again" button
         play_again_view = PlayAgainView(self, ctx, bet_amount, timeout=15)
         message = await loading_message.edit(embed=embed, view=play_again_view)
@@ -648,7 +619,7 @@ class PenaltyCog(commands.Cog):
             description=(
                 f"```\n"
                 f"💰 Your Bet: {bet_amount:,.2f} points\n"
-                f"🎯 Potential Win: {bet_amount*1.45:,.2f} points\n"
+                f"🎯 Potential Win: {bet_amount*PENALTY_STRIKER_MULTIPLIER:,.2f} points\n"
                 f"```\n"
                 f"**🔥 TIME TO SCORE! 🔥**\n\n"
                 
@@ -682,7 +653,7 @@ class PenaltyCog(commands.Cog):
             description=(
                 f"```\n"
                 f"💰 Your Bet: {bet_amount:,.2f} points\n"
-                f"🏆 Potential Win: {bet_amount*2.1:,.2f} points\n"
+                f"🏆 Potential Win: {bet_amount*PENALTY_KEEPER_MULTIPLIER:,.2f} points\n"
                 f"```\n"
                 f"**🛡️ MAKE THE SAVE! 🛡️**\n\n"
                 
@@ -734,14 +705,14 @@ class PenaltyCog(commands.Cog):
             
             # Consume curse and send webhook
             curse_cog.consume_curse(ctx.author.id)
-            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, 1.45)
+            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, PENALTY_STRIKER_MULTIPLIER)
 
         # Direction emojis for visual representation
         direction_emojis = {"left": "⬅️", "middle": "⬆️", "right": "➡️"}
         direction_names = {"left": "Left Corner", "middle": "Center Goal", "right": "Right Corner"}
 
         # Calculate winnings
-        multiplier = 1.45
+        multiplier = PENALTY_STRIKER_MULTIPLIER
         winnings = bet_amount * multiplier if goal_scored else 0
 
         # Create result embed
@@ -768,10 +739,6 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1355501647538815106.png")
 
-            # Update user balance with winnings
-            db = Users()
-            db.update_balance(ctx.author.id, winnings)
-
         else:
             embed = discord.Embed(
                 title=f"<:no:1344252518305234987> | **SAVED!** 🥅",
@@ -794,21 +761,10 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1344252518305234987.png")
 
-            # Update statistics
-            db = Users()
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$inc": {"total_played": 1, "total_lost": 1, "total_spent": bet_amount}}
-            )
-
         embed.set_footer(text="⚽ BetSync Casino • Want another shot?", icon_url=self.bot.user.avatar.url)
 
-        # Add betting history
-        self.update_bet_history(ctx, "penalty_taker", bet_amount, shot_direction, goalkeeper_direction, goal_scored, multiplier, winnings)
-
-        # Update server profit
-        nnn = Servers()
-        nnn.update_server_profit(ctx, ctx.guild.id, bet_amount, game="penalty")
+        # Pay out and record the round
+        await self.settle_round(ctx, "penalty_taker", bet_amount, shot_direction, goalkeeper_direction, goal_scored, multiplier, winnings)
 
         # Create "Play Again" button
         play_again_view = PlayAgainView(self, ctx, bet_amount, timeout=15)
@@ -841,14 +797,14 @@ class PenaltyCog(commands.Cog):
             
             # Consume curse and send webhook
             curse_cog.consume_curse(ctx.author.id)
-            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, 2.1)
+            await self.send_curse_webhook(ctx.author, "penalty", bet_amount, PENALTY_KEEPER_MULTIPLIER)
 
         # Direction emojis for visual representation
         direction_emojis = {"left": "⬅️", "middle": "⬆️", "right": "➡️"}
         direction_names = {"left": "Left Corner", "middle": "Center Goal", "right": "Right Corner"}
 
         # Calculate winnings
-        multiplier = 2.1
+        multiplier = PENALTY_KEEPER_MULTIPLIER
         winnings = bet_amount * multiplier if save_made else 0
 
         # Create result embed
@@ -875,13 +831,6 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1355501647538815106.png")
 
-            # Update user balance with winnings
-            db = Users()
-            db.update_balance(ctx.author.id, winnings)
-
-            nnn = Servers()
-            nnn.update_server_profit(ctx, ctx.guild.id, -winnings, game="penalty")
-
         else:
             embed = discord.Embed(
                 title=f"<:no:1344252518305234987> | **GOAL CONCEDED!** ⚽",
@@ -904,26 +853,24 @@ class PenaltyCog(commands.Cog):
             )
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1344252518305234987.png")
 
-            # Update statistics
-            db = Users()
-
         embed.set_footer(text="🥅 BetSync Casino • Ready for another challenge?", icon_url=self.bot.user.avatar.url)
 
-        # Add betting history
-        self.update_bet_history(ctx, "penalty_goalkeeper", bet_amount, dive_direction, striker_direction, save_made, multiplier, winnings)
+        # Pay out and record the round
+        await self.settle_round(ctx, "penalty_goalkeeper", bet_amount, dive_direction, striker_direction, save_made, multiplier, winnings)
         
-        # Update server profit
-        nnn = Servers()
-        nnn.update_server_profit(ctx, ctx.guild.id, bet_amount, game="penalty")
-
         # Create "Play Again" button
         play_again_view = PlayAgainView(self, ctx, bet_amount, timeout=15)
         message = await interaction.message.edit(embed=embed, view=play_again_view)
         play_again_view.message = message
 
-    def update_bet_history(self, ctx, game_type, bet_amount, user_choice, ai_choice, won, multiplier, winnings):
-        """Update bet history in database"""
-        return
+    async def settle_round(self, ctx, game_type, bet_amount, user_choice, ai_choice, won, multiplier, winnings):
+        """Credit the winnings and record the round"""
+        await settlement.settle(ctx.author, ctx.guild, "penalty", bet_amount, winnings, {
+            "mode": game_type,
+            "choice": user_choice,
+            "opponent_choice": ai_choice,
+            "multiplier": multiplier if won else 0,
+        })
 
 
 def setup(bot):
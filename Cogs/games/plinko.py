@@ -1,50 +1,20 @@
 import discord
 import random
 import io
+import os
 import time
+from collections import OrderedDict
 from typing import List, Tuple
+import numpy as np
 from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFont
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
+from Cogs.utils.paytables import PLINKO_MULTIPLIER_TABLES
 import datetime
 
-# Define multiplier tables from the provided data
-MULTIPLIER_TABLES = {
-    "low_risk": {
-        "8_rows": [5.5, 2.0, 1.1, 1.0, 0.5, 1.0, 1.1, 2.0, 5.5],
-        "9_rows": [5.5, 2, 1.6, 1.0, 0.7, 0.7, 1.0, 1.6, 2.0, 5.5],
-        "10_rows": [8.8, 2.9, 1.4, 1.1, 0.9, 0.5, 0.9, 1.1, 1.4, 2.9, 8.8],
-        "11_rows": [8.3, 2.9, 1.9, 1.3, 1.0, 0.7, 0.7, 1.0, 1.3, 1.9, 2.9, 8.3],
-        "12_rows": [9.9, 3, 1.6, 1.4, 1.1, 1.0, 0.5, 1.0, 1.1, 1.4, 1.6, 3, 9.9],
-        "13_rows": [8, 4, 2.9, 1.8, 1.2, 0.9, 0.7, 0.7, 0.9, 1.2, 1.8, 2.9, 4, 8],
-        "14_rows": [7, 4, 1.8, 1.4, 1.3, 1.1, 1.0, 0.5, 1.0, 1.1, 1.3, 1.4, 1.8, 4, 7],
-        "15_rows": [15, 8, 3, 2, 1.5, 1.1, 1.0, 0.7, 0.7, 1.0, 1.1, 1.5, 2, 3, 8, 15],
-        "16_rows": [15.5, 9, 2, 1.4, 1.3, 1.2, 1.1, 1.0, 0.5, 1.0, 1.1, 1.2, 1.3, 1.4, 2, 9, 15.5]
-    },
-    "medium_risk": {
-        "8_rows": [12, 2.9, 1.3, 0.7, 0.4, 0.7, 1.3, 2.9, 12],
-        "9_rows": [17, 3.8, 1.7, 0.9, 0.5, 0.5, 0.9, 1.7, 3.8, 17],
-        "10_rows": [20, 4.8, 1.9, 1.4, 0.6, 0.4, 0.6, 1.4, 1.9, 4.8, 20],
-        "11_rows": [23, 5.8, 2.9, 1.7, 0.7, 0.5, 0.5, 0.7, 1.7, 2.9, 5.8, 23],
-        "12_rows": [30, 10.2, 3.8, 1.9, 1.1, 0.6, 0.3, 0.6, 1.1, 1.9, 3.8, 10.2, 30],
-        "13_rows": [40, 12, 5.7, 2.8, 1.3, 0.7, 0.4, 0.4, 0.7, 1.3, 2.8, 5.7, 12, 40],
-        "14_rows": [55.0, 15, 6.8, 3.7, 1.9, 1.0, 0.5, 0.2, 0.5, 1.0, 1.9, 3.7, 6.8, 15, 55],
-        "15_rows": [85, 17, 10.5, 5, 3, 1.3, 0.5, 0.3, 0.3, 0.5, 1.3, 3, 5, 10.5, 17, 85],
-        "16_rows": [105, 40, 10, 4.9, 3, 1.5, 1.0, 0.5, 0.3, 0.5, 1.0, 1.5, 3, 4.9, 10, 40, 105]
-    },
-    "high_risk": {
-        "8_rows": [28, 3.9, 1.5, 0.3, 0.2, 0.3, 1.5, 3.9, 28],
-        "9_rows": [41, 6.6, 2.0, 0.6, 0.2, 0.2, 0.6, 2.0, 6.6, 41],
-        "10_rows": [75, 9.5, 2.9, 0.9, 0.3, 0.2, 0.3, 0.9, 2.9, 9.5, 75],
-        "11_rows": [110, 13, 5.1, 1.4, 0.4, 0.2, 0.2, 0.4, 1.4, 5.1, 13, 110],
-        "12_rows": [165, 22, 7.9, 2.0, 0.7, 0.2, 0.2, 0.2, 0.7, 2.0, 7.9, 22, 165],
-        "13_rows": [250, 35, 10, 3.9, 1, 0.2, 0.2, 0.2, 0.2, 1, 3.9, 10, 35, 250],
-        "14_rows": [400, 52, 17, 4.9, 1.9, 0.3, 0.2, 0.2, 0.2, 0.3, 1.9, 4.9, 17, 52, 400],
-        "15_rows": [600, 80, 25, 7.8, 3, 0.5, 0.2, 0.2, 0.2, 0.2, 0.5, 3, 7.8, 25, 80, 600],
-        "16_rows": [950, 126, 24, 8.2, 3.8, 2.0, 0.2, 0.2, 0.2, 0.2, 0.2, 2.0, 3.8, 8.2, 24, 126, 950]
-    }
-}
-
 # Define risk colors for visual distinction
 RISK_COLORS = {
     "low_risk": 0x00AA00,  # Green
@@ -52,6 +22,221 @@ RISK_COLORS = {
     "high_risk": 0xFF0000   # Red
 }
 
+# Static boards are cached per render worker, least recently used evicted past the cap
+BOARD_CACHE_BYTES = int(float(os.getenv("PLINKO_BOARD_CACHE_MB", "48")) * 1024 * 1024)
+# Draw the latest ball's path through the pegs, not just where it landed
+DRAW_TRAIL = os.getenv("PLINKO_TRAIL", "0") == "1"
+
+_static_boards = OrderedDict()  # (rows, risk) -> (layout, RGBA image)
+_static_board_bytes = 0
+
+
+def board_layout(rows, num_slots):
+    """Sizes and spacing of the board for a row count"""
+    # Constants for board rendering - Adjust size based on row count
+    width = 1100 if rows >= 16 else 900 if rows >= 13 else 800
+    height = 1300 if rows >= 16 else 1100 if rows >= 13 else 1000
+    multiplier_height = 100 if rows >= 16 else 80  # Taller multiplier area for more rows
+    board_height = height - multiplier_height
+
+    # Calculate the actual display rows (user_rows + 2)
+    actual_rows = rows + 2
+    # Calculate vertical spacing with appropriate margins
+    vertical_spacing = board_height / (actual_rows + 1)  # +1 for margins
+
+    return {
+        "width": width,
+        "height": height,
+        "peg_radius": 6 if rows >= 16 else 7 if rows >= 13 else 8,  # Smaller pegs for larger boards
+        "ball_radius": 12,
+        "multiplier_height": multiplier_height,
+        "board_width": width,
+        "board_height": board_height,
+        "actual_rows": actual_rows,
+        "horizontal_spacing": width / (num_slots + 1),
+        "vertical_spacing": vertical_spacing,
+        # Buckets sit just below the last row of pegs
+        "bucket_y": vertical_spacing * (actual_rows + 0.5),
+    }
+
+
+def render_static_board(rows, multiplier_table):
+    """Draw everything that doesn't change between drops: pegs, buckets and watermarks"""
+    layout = board_layout(rows, len(multiplier_table))
+    width, height = layout["width"], layout["height"]
+    board_width, board_height = layout["board_width"], layout["board_height"]
+    peg_radius = layout["peg_radius"]
+    horizontal_spacing = layout["horizontal_spacing"]
+    vertical_spacing = layout["vertical_spacing"]
+
+    # Create a new image
+    img = Image.new('RGBA', (width, height), (40, 44, 52, 255))  # Dark background
+    draw = ImageDraw.Draw(img)
+
+    try:
+        # Try to load custom fonts
+        multiplier_font = atlas.font("roboto.ttf", 22 if rows >= 16 else 20)  # Slightly larger font for 16+ rows
+        watermark_font = atlas.font("roboto.ttf", 36)
+    except:
+        # Fallback to default font if custom font fails
+        multiplier_font = ImageFont.load_default()
+        watermark_font = ImageFont.load_default()
+
+    # Draw pegs - Start with 2 gaps at top (1 peg), increasing as we go down
+    for row in range(layout["actual_rows"]):
+        # First row has 1 peg (2 gaps), then each row adds 1 more peg
+        num_pegs = row + 1
+
+        # Calculate starting x position to center the pegs
+        start_x = (board_width - (num_pegs - 1) * horizontal_spacing) / 2
+        y = vertical_spacing * (row + 1)  # Proper spacing from top
+
+        for peg in range(num_pegs):
+            x = start_x + peg * horizontal_spacing
+            draw.ellipse((x - peg_radius, y - peg_radius, x + peg_radius, y + peg_radius), 
+                         fill=(230, 230, 230, 255))  # White pegs
+
+    # Draw multiplier buckets at the bottom - one for each multiplier
+    bucket_width = horizontal_spacing * 0.9
+    bucket_height = layout["multiplier_height"] * 0.8
+    bucket_y = layout["bucket_y"]
+
+    # Color mapping for multipliers
+    def get_multiplier_color(multiplier):
+        if multiplier >= 10:
+            return (255, 0, 102, 255)  # Bright pink for high multipliers
+        elif multiplier >= 3:
+            return (255, 165, 0, 255)  # Orange for medium multipliers
+        elif multiplier >= 1:
+            return (0, 191, 255, 255)  # Blue for neutral multipliers
+        else:
+            return (158, 158, 158, 255)  # Grey for low multipliers
+
+    # Draw multiplier buckets - there should be num_slots buckets
+    for i, multiplier in enumerate(multiplier_table):
+        x = horizontal_spacing * (i + 1)
+
+        # Adjust bucket width for more spacing between buckets when there are many slots
+        bucket_width_adjusted = bucket_width * (0.85 if rows >= 16 else 0.9)
+
+        # Draw bucket with slightly better spacing
+        bucket_color = get_multiplier_color(multiplier)
+        draw.rectangle(
+            (x - bucket_width_adjusted/2, bucket_y, x + bucket_width_adjusted/2, bucket_y + bucket_height),
+            fill=bucket_color,
+            outline=(255, 255, 255, 150)  # Slightly more visible outline
+        )
+
+        # Draw multiplier text with black outline for better visibility
+        text_color = (255, 255, 255, 255)  # White text
+        multiplier_text = f"{multiplier}x"
+        text_bbox = draw.textbbox((0, 0), multiplier_text, font=multiplier_font)
+        text_width = text_bbox[2] - text_bbox[0]
+        text_height = text_bbox[3] - text_bbox[1]
+        text_x = x - text_width / 2
+        text_y = bucket_y + (bucket_height - text_height) / 2
+
+        # Draw text outline (thin black border) by drawing the text multiple times with small offsets
+        outline_color = (0, 0, 0, 255)  # Black outline
+        outline_thickness = 1
+
+        # Draw outline by offsetting text in 4 directions
+        for dx, dy in [(outline_thickness, 0), (-outline_thickness, 0), (0, outline_thickness), (0, -outline_thickness)]:
+            draw.text((text_x + dx, text_y + dy), multiplier_text, font=multiplier_font, fill=outline_color)
+
+        # Draw the main text on top
+        draw.text((text_x, text_y), multiplier_text, font=multiplier_font, fill=text_color)
+
+    # Add subtle BetSync watermark in the middle
+    watermark_text = "BetSync"
+    watermark_bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
+    watermark_width = watermark_bbox[2] - watermark_bbox[0]
+    watermark_x = (width - watermark_width) / 2
+    watermark_y = board_height / 2 - 20
+    draw.text((watermark_x, watermark_y), watermark_text, font=watermark_font, fill=(255, 255, 255, 40))
+
+    # Add more visible BetSync watermark at the bottom right
+    bottom_watermark = "BetSync"
+    bottom_watermark_bbox = draw.textbbox((0, 0), bottom_watermark, font=multiplier_font)
+    bottom_watermark_width = bottom_watermark_bbox[2] - bottom_watermark_bbox[0]
+    bottom_watermark_x = width - bottom_watermark_width - 10
+    bottom_watermark_y = height - 25
+    draw.text((bottom_watermark_x, bottom_watermark_y), bottom_watermark, 
+              font=multiplier_font, fill=(255, 255, 255, 180))
+
+    return layout, img
+
+
+def static_board(rows, risk):
+    """The cached static layer for a row count and risk level ("low_risk", ...)"""
+    global _static_board_bytes
+    key = (rows, risk)
+    if key in _static_boards:
+        _static_boards.move_to_end(key)
+        return _static_boards[key]
+
+    board = render_static_board(rows, PLINKO_MULTIPLIER_TABLES[risk][f"{rows}_rows"])
+    _static_boards[key] = board
+    _static_board_bytes += board[1].width * board[1].height * 4
+    # Evict least recently used boards, always keeping the one just drawn
+    while _static_board_bytes > BOARD_CACHE_BYTES and len(_static_boards) > 1:
+        _, (_, evicted) = _static_boards.popitem(last=False)
+        _static_board_bytes -= evicted.width * evicted.height * 4
+    return board
+
+
+def trail_points(layout, path):
+    """
+    Pixel coordinates of a ball path, computed for the whole path at once.
+
+    path[i] is the gap the ball passed in peg row i (row i has i + 1 pegs
+    and i + 2 gaps); the last entry is the bucket it landed in.
+    """
+    rows = np.arange(len(path) - 1)
+    gaps = np.asarray(path[:-1], dtype=float)
+    xs = layout["board_width"] / 2 + (gaps - 0.5 - rows / 2) * layout["horizontal_spacing"]
+    ys = layout["vertical_spacing"] * (rows + 1)
+    final_x = layout["horizontal_spacing"] * (path[-1] + 1)
+    final_y = layout["bucket_y"] - layout["ball_radius"]
+    points = np.column_stack((np.append(xs, final_x), np.append(ys, final_y)))
+    return [tuple(point) for point in points.tolist()]
+
+
+def render_board(rows, risk, ball_paths, trail=DRAW_TRAIL):
+    """Composite the latest ball onto the cached static board"""
+    layout, board = static_board(rows, risk)
+    img = board.copy()
+
+    # Draw only the most recent ball
+    if ball_paths and len(ball_paths[-1]) > 0:
+        draw = ImageDraw.Draw(img)
+        path = ball_paths[-1]
+        ball_radius = layout["ball_radius"]
+
+        if trail and len(path) > 1:
+            draw.line(trail_points(layout, path), fill=(255, 80, 80, 255), width=4, joint="curve")
+
+        # Align with the multiplier buckets
+        final_x = layout["horizontal_spacing"] * (path[-1] + 1)
+        final_y = layout["bucket_y"] - ball_radius
+
+        # Draw the ball
+        draw.ellipse(
+            (final_x - ball_radius, final_y - ball_radius, 
+             final_x + ball_radius, final_y + ball_radius),
+            fill=(255, 255, 255, 255),  # White ball
+            outline=(255, 0, 0, 255)    # Red outline
+        )
+
+    # Save to a BytesIO object; encoding dominates the frame once the board is cached,
+    # and level 3 is roughly twice as fast as the default for a slightly larger file
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format='PNG', compress_level=3)
+    img_buffer.seek(0)
+
+    return img_buffer
+
+
 class PlinkoGame:
     def __init__(self, cog, ctx, bet_amount, difficulty, rows, user_id):
         self.cog = cog
@@ -72,14 +257,13 @@ class PlinkoGame:
 
         # Set colors based on difficulty
         if difficulty == "low":
-            self.color = RISK_COLORS["low_risk"]
-            self.multiplier_table = MULTIPLIER_TABLES["low_risk"][f"{rows}_rows"]
+            self.risk = "low_risk"
         elif difficulty == "medium":
-            self.color = RISK_COLORS["medium_risk"]
-            self.multiplier_table = MULTIPLIER_TABLES["medium_risk"][f"{rows}_rows"]
+            self.risk = "medium_risk"
         else:  # high
-            self.color = RISK_COLORS["high_risk"]
-            self.multiplier_table = MULTIPLIER_TABLES["high_risk"][f"{rows}_rows"]
+            self.risk = "high_risk"
+        self.color = RISK_COLORS[self.risk]
+        self.multiplier_table = PLINKO_MULTIPLIER_TABLES[self.risk][f"{rows}_rows"]
 
     async def start_game(self):
         """Initialize and start the Plinko game"""
@@ -101,7 +285,7 @@ class PlinkoGame:
             )
 
             # Generate initial board image
-            board_image = self.generate_board_image()
+            board_image = await self.generate_board_image()
             file = discord.File(board_image, filename="plinko_board.png")
             embed.set_image(url="attachment://plinko_board.png")
             embed.set_footer(text=f"BetSync Casino • {self.ctx.author.name}'s Plinko Game")
@@ -136,55 +320,15 @@ class PlinkoGame:
             win_for_this_ball = self.bet_amount * multiplier
             self.win_amount += win_for_this_ball
 
-            # Update database for the user's balance
+            # Each drop is its own bet: debit it, then settle the ball
             db = Users()
-            user_data = db.fetch_user(self.user_id)
-            
-            # Points will be deducted only when ball is dropped and multiplier > 0
-            points_used = self.bet_amount
-
-            # Update database - deduct points and add winnings if applicable
-            if multiplier > 0:
-                db_update = db.update_balance(self.user_id, -points_used, "points", "$inc")
-                win_update = db.update_balance(self.user_id, win_for_this_ball, "points", "$inc")
-
-            # Add to history
-            total_profit = self.win_amount - (self.drops * self.bet_amount)
-            
-            # Determine entry type based on profit
-            entry_type = "win" if total_profit > 0 else "loss" if total_profit < 0 else "push"
-
-            history_entry = {
-                "type": entry_type,
-                "game": "plinko",
-                "timestamp": int(time.time()),
-                "amount": self.win_amount if entry_type == "win" else self.bet_amount,
-                "bet": self.bet_amount,
-                "multiplier": self.multiplier_table[self.ball_paths[-1][-1]],
-                "profit": total_profit,
-                "details": {
-                    "difficulty": self.difficulty,
-                    "rows": self.rows,
-                    "balls_dropped": self.drops,
-                    "multipliers": [self.multiplier_table[p[-1]] for p in self.ball_paths],
-                    "points_used": points_used
-                }
-            }
-
-            db.update_history(self.user_id, history_entry)
-
-            # Also update server history
-            servers_db = Servers()
-            server_history_entry = history_entry.copy()
-            server_history_entry.update({
-                "user_id": self.user_id,
-                "user_name": self.ctx.author.name
+            await db.update_balance(self.user_id, -self.bet_amount, "points", "$inc")
+            await settlement.settle(self.ctx.author, self.ctx.guild, "plinko", self.bet_amount, win_for_this_ball, {
+                "multiplier": multiplier,
+                "difficulty": self.difficulty,
+                "rows": self.rows,
+                "balls_dropped": self.drops,
             })
-            servers_db.update_history(self.server_id, server_history_entry)
-
-            # Update server profit
-            server_profit = -total_profit  # Server profits when player loses
-            servers_db.update_server_profit(self.ctx, self.server_id, server_profit, "plinko")
 
             # Update the embed with the new ball drop
             await self.update_game_embed()
@@ -210,7 +354,7 @@ class PlinkoGame:
                 ),
                 color=self.color
             )
-            board_image = self.generate_board_image()
+            board_image = await self.generate_board_image()
             file = discord.File(board_image, filename="plinko_board.png")
             embed.set_image(url="attachment://plinko_board.png")
             embed.set_footer(text=f"BetSync Casino • {self.ctx.author.name}'s Plinko Game")
@@ -269,150 +413,9 @@ class PlinkoGame:
 
         return path, final_pos
 
-    def generate_board_image(self) -> io.BytesIO:
-        """Generate a visual representation of the Plinko board"""
-        # Constants for board rendering - Adjust size based on row count
-        width = 1100 if self.rows >= 16 else 900 if self.rows >= 13 else 800
-        height = 1300 if self.rows >= 16 else 1100 if self.rows >= 13 else 1000
-        peg_radius = 6 if self.rows >= 16 else 7 if self.rows >= 13 else 8  # Smaller pegs for larger boards
-        ball_radius = 12
-        multiplier_height = 100 if self.rows >= 16 else 80  # Taller multiplier area for more rows
-
-        # Calculate board dimensions
-        board_width = width
-        board_height = height - multiplier_height
-
-        # Create a new image
-        img = Image.new('RGBA', (width, height), (40, 44, 52, 255))  # Dark background
-        draw = ImageDraw.Draw(img)
-
-        try:
-            # Try to load custom fonts
-            title_font = ImageFont.truetype("roboto.ttf", 36)
-            multiplier_font = ImageFont.truetype("roboto.ttf", 22 if self.rows >= 16 else 20)  # Slightly larger font for 16+ rows
-            watermark_font = ImageFont.truetype("roboto.ttf", 36)
-        except:
-            # Fallback to default font if custom font fails
-            title_font = ImageFont.load_default()
-            multiplier_font = ImageFont.load_default()
-            watermark_font = ImageFont.load_default()
-
-        # Calculate the actual display rows (user_rows + 2)
-        actual_rows = self.rows + 2
-
-        # The number of slots/gaps at the bottom should be actual_rows - 1
-        # This ensures we have one more multiplier than the user-specified rows
-        num_slots = len(self.multiplier_table)
-        horizontal_spacing = board_width / (num_slots + 1)
-
-        # Calculate vertical spacing with appropriate margins
-        vertical_spacing = board_height / (actual_rows + 1)  # +1 for margins
-
-        # Draw pegs - Start with 2 gaps at top (1 peg), increasing as we go down
-        for row in range(actual_rows):
-            # First row has 1 peg (2 gaps), then each row adds 1 more peg
-            num_pegs = row + 1
-
-            # Calculate starting x position to center the pegs
-            start_x = (board_width - (num_pegs - 1) * horizontal_spacing) / 2
-            y = vertical_spacing * (row + 1)  # Proper spacing from top
-
-            for peg in range(num_pegs):
-                x = start_x + peg * horizontal_spacing
-                draw.ellipse((x - peg_radius, y - peg_radius, x + peg_radius, y + peg_radius), 
-                             fill=(230, 230, 230, 255))  # White pegs
-
-        # Draw multiplier buckets at the bottom - one for each multiplier
-        bucket_width = horizontal_spacing * 0.9
-        bucket_height = multiplier_height * 0.8
-
-        # Position buckets just below the last row of pegs
-        bucket_y = vertical_spacing * (actual_rows + 0.5)
-
-        # Color mapping for multipliers
-        def get_multiplier_color(multiplier):
-            if multiplier >= 10:
-                return (255, 0, 102, 255)  # Bright pink for high multipliers
-            elif multiplier >= 3:
-                return (255, 165, 0, 255)  # Orange for medium multipliers
-            elif multiplier >= 1:
-                return (0, 191, 255, 255)  # Blue for neutral multipliers
-            else:
-                return (158, 158, 158, 255)  # Grey for low multipliers
-
-        # Draw multiplier buckets - there should be num_slots buckets
-        for i, multiplier in enumerate(self.multiplier_table):
-            x = horizontal_spacing * (i + 1)
-
-            # Adjust bucket width for more spacing between buckets when there are many slots
-            bucket_width_adjusted = bucket_width * (0.85 if self.rows >= 16 else 0.9)
-
-            # Draw bucket with slightly better spacing
-            bucket_color = get_multiplier_color(multiplier)
-            draw.rectangle(
-                (x - bucket_width_adjusted/2, bucket_y, x + bucket_width_adjusted/2, bucket_y + bucket_height),
-                fill=bucket_color,
-                outline=(255, 255, 255, 150)  # Slightly more visible outline
-            )
-
-            # Draw multiplier text with black outline for better visibility
-            text_color = (255, 255, 255, 255)  # White text
-            multiplier_text = f"{multiplier}x"
-            text_bbox = draw.textbbox((0, 0), multiplier_text, font=multiplier_font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            text_x = x - text_width / 2
-            text_y = bucket_y + (bucket_height - text_height) / 2
-
-            # Draw text outline (thin black border) by drawing the text multiple times with small offsets
-            outline_color = (0, 0, 0, 255)  # Black outline
-            outline_thickness = 1
-
-            # Draw outline by offsetting text in 4 directions
-            for dx, dy in [(outline_thickness, 0), (-outline_thickness, 0), (0, outline_thickness), (0, -outline_thickness)]:
-                draw.text((text_x + dx, text_y + dy), multiplier_text, font=multiplier_font, fill=outline_color)
-
-            # Draw the main text on top
-            draw.text((text_x, text_y), multiplier_text, font=multiplier_font, fill=text_color)
-
-        # Add subtle BetSync watermark in the middle
-        watermark_text = "BetSync"
-        watermark_bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
-        watermark_width = watermark_bbox[2] - watermark_bbox[0]
-        watermark_x = (width - watermark_width) / 2
-        watermark_y = board_height / 2 - 20
-        draw.text((watermark_x, watermark_y), watermark_text, font=watermark_font, fill=(255, 255, 255, 40))
-
-        # Add more visible BetSync watermark at the bottom right
-        bottom_watermark = "BetSync"
-        bottom_watermark_bbox = draw.textbbox((0, 0), bottom_watermark, font=multiplier_font)
-        bottom_watermark_width = bottom_watermark_bbox[2] - bottom_watermark_bbox[0]
-        bottom_watermark_x = width - bottom_watermark_width - 10
-        bottom_watermark_y = height - 25
-        draw.text((bottom_watermark_x, bottom_watermark_y), bottom_watermark, 
-                  font=multiplier_font, fill=(255, 255, 255, 180))
-
-        # Draw only the most recent ball
-        if self.ball_paths and len(self.ball_paths[-1]) > 0:
-            final_pos = self.ball_paths[-1][-1]
-            # Align with the multiplier buckets
-            final_x = horizontal_spacing * (final_pos + 1)
-            final_y = bucket_y - ball_radius
-
-            # Draw the ball
-            draw.ellipse(
-                (final_x - ball_radius, final_y - ball_radius, 
-                 final_x + ball_radius, final_y + ball_radius),
-                fill=(255, 255, 255, 255),  # White ball
-                outline=(255, 0, 0, 255)    # Red outline
-            )
-
-        # Save to a BytesIO object
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-
-        return img_buffer
+    async def generate_board_image(self) -> io.BytesIO:
+        """Render the board and the latest ball path off the event loop"""
+        return await render_service.render_file("plinko", render_board, self.rows, self.risk, self.ball_paths)
 
     async def end_game(self, interaction=None):
         """End the Plinko game normally"""
@@ -443,7 +446,7 @@ class PlinkoGame:
                     color=self.color
                 )
 
-                board_image = self.generate_board_image()
+                board_image = await self.generate_board_image()
                 file = discord.File(board_image, filename="plinko_board.png")
                 embed.set_image(url="attachment://plinko_board.png")
                 embed.set_footer(text=f"BetSync Casino • Game Finished")
@@ -481,7 +484,7 @@ class PlinkoGame:
             for child in self.view.children:
                 child.disabled = True
 
-            board_image = self.generate_board_image()
+            board_image = await self.generate_board_image()
             file = discord.File(board_image, filename="plinko_board.png")
             embed.set_image(url="attachment://plinko_board.png")
             embed.set_footer(text=f"BetSync Casino • Game Timed Out")
@@ -550,7 +553,7 @@ class PlinkoView(discord.ui.View):
 
             # Check if user has enough balance for another bet
             db = Users()
-            user_data = db.fetch_user(self.game.user_id)
+            user_data = await db.fetch_user(self.game.user_id, "balance")
             
             # Check points balance - handle case where user_data might be False/None
             if not user_data or not isinstance(user_data, dict):
@@ -706,7 +709,7 @@ class Plinko(commands.Cog):
         try:
             # Check balance without deducting points
             db = Users()
-            user_data = db.fetch_user(ctx.author.id)
+            user_data = await db.fetch_user(ctx.author.id, "balance")
             if not user_data or not isinstance(user_data, dict):
                 user_balance = 0
             else:
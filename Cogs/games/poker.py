@@ -6,30 +6,23 @@ import time
 import asyncio
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 import io
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.render_service import render_service
 
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.poker_eval import card_id, evaluate, hand_name
+from Cogs.utils.paytables import POKER_PAYTABLE
 
-# Define the paytable with multipliers for each hand type
-paytable = {
-    "Royal Flush": 100,
-    "Straight Flush": 50,
-    "Four of a Kind": 30,
-    "Full House": 15,
-    "Flush": 10,
-    "Straight": 5,
-    "Three of a Kind": 3,
-    "Two Pair": 2,
-    "One Pair": 0,
-    "High Card": 0
-}
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+SUITS = ['hearts', 'diamonds', 'clubs', 'spades']
 
 class CardDeck:
     def __init__(self):
-        self.ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        self.suits = ['hearts', 'diamonds', 'clubs', 'spades']
+        self.ranks = RANKS
+        self.suits = SUITS
         self.deck = [(rank, suit) for suit in self.suits for rank in self.ranks]
         random.shuffle(self.deck)
 
@@ -190,186 +183,112 @@ class PlayAgainView(discord.ui.View):
         except:
             pass
 
-class Poker(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-        self.ongoing_games = {}
 
-    async def generate_game_image(self, cards, held_cards, is_final=False, win_type=None):
-        # Create background with modern gray
-        width, height = 1000, 500
-        bg_color = (40, 40, 40)  # Modern dark gray
-        image = Image.new("RGB", (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
+def render_hand(cards, held_cards, is_final=False, win_type=None):
+    # Create background with modern gray
+    width, height = 1000, 500
+    bg_color = (40, 40, 40)  # Modern dark gray
+    image = Image.new("RGB", (width, height), bg_color)
+    draw = ImageDraw.Draw(image)
+
+    # Try to load font
+    try:
+        small_font = atlas.font("roboto.ttf", 24)
+        medium_font = atlas.font("roboto.ttf", 32)
+        large_font = atlas.font("roboto.ttf", 48)
+    except Exception:
+        small_font = ImageFont.load_default()
+        medium_font = ImageFont.load_default()
+        large_font = ImageFont.load_default()
+
+    # Title at the top
+    draw.text((width//2, 50), "BetSync Poker", font=large_font, fill=(200, 200, 200), anchor="mm")
+
+    # Load and place cards
+    card_width = 150
+    card_height = 220
+    card_spacing = 20
+    total_width = (card_width * 5) + (card_spacing * 4)
+    start_x = (width - total_width) // 2
+    y_position = 150
+
+    for i, (rank, suit) in enumerate(cards):
+        # Convert J, Q, K, A to their full names for file paths
+        if rank == 'J':
+            card_rank = 'J'
+        elif rank == 'Q':
+            card_rank = 'Q'
+        elif rank == 'K':
+            card_rank = 'K'
+        elif rank == 'A':
+            card_rank = 'A'
+        else:
+            card_rank = rank
 
-        # Try to load font
         try:
-            small_font = ImageFont.truetype("roboto.ttf", 24)
-            medium_font = ImageFont.truetype("roboto.ttf", 32)
-            large_font = ImageFont.truetype("roboto.ttf", 48)
-        except Exception:
-            small_font = ImageFont.load_default()
-            medium_font = ImageFont.load_default()
-            large_font = ImageFont.load_default()
-
-        # Title at the top
-        draw.text((width//2, 50), "BetSync Poker", font=large_font, fill=(200, 200, 200), anchor="mm")
-
-        # Load and place cards
-        card_width = 150
-        card_height = 220
-        card_spacing = 20
-        total_width = (card_width * 5) + (card_spacing * 4)
-        start_x = (width - total_width) // 2
-        y_position = 150
-
-        for i, (rank, suit) in enumerate(cards):
-            # Convert J, Q, K, A to their full names for file paths
-            if rank == 'J':
-                card_rank = 'J'
-            elif rank == 'Q':
-                card_rank = 'Q'
-            elif rank == 'K':
-                card_rank = 'K'
-            elif rank == 'A':
-                card_rank = 'A'
-            else:
-                card_rank = rank
-
-            card_path = f"assests/{suit}_{card_rank}.png"
-
-            try:
-                card_img = Image.open(card_path)
-                card_img = card_img.resize((card_width, card_height), Image.Resampling.LANCZOS)
-                image.paste(card_img, (start_x + (i * (card_width + card_spacing)), y_position))
-            except Exception as e:
-                print(f"Error loading card image: {e}")
-                # Draw placeholder if image not found
-                placeholder_pos = (start_x + (i * (card_width + card_spacing)), y_position)
-                draw.rectangle(
-                    [placeholder_pos, (placeholder_pos[0] + card_width, placeholder_pos[1] + card_height)],
-                    outline=(255, 255, 255),
-                    width=2
-                )
-                draw.text(
-                    (placeholder_pos[0] + card_width//2, placeholder_pos[1] + card_height//2),
-                    f"{rank} of {suit}",
-                    font=small_font,
-                    fill=(255, 255, 255),
-                    anchor="mm"
-                )
-
-            # Add HOLD text below cards that are held
-            if held_cards[i]:
-                hold_pos = (start_x + (i * (card_width + card_spacing)) + card_width//2,
-                           y_position + card_height + 15)
-                draw.text(hold_pos, "held", font=small_font, fill=(255, 255, 255), anchor="mm")
-
-        # Add win type at the bottom if final
-        if is_final and win_type is not None:
-            if win_type != "High Card":
-                multiplier = paytable.get(win_type, 0)
-                draw.text(
-                    (width//2, height - 70),
-                    f"{win_type} - {multiplier}x",
-                    font=large_font,
-                    fill=(255, 255, 255),
-                    anchor="mm"
-                )
-            else:
-                draw.text(
-                    (width//2, height - 70),
-                    "No Win",
-                    font=large_font,
-                    fill=(255, 100, 100),
-                    anchor="mm"
-                )
-
-        # Save image to bytes
-        img_bytes = io.BytesIO()
-        image.save(img_bytes, format="PNG")
-        img_bytes.seek(0)
-        return img_bytes
-
-    def evaluate_hand(self, cards):
-        # Extract ranks and suits
-        ranks = [card[0] for card in cards]
-        suits = [card[1] for card in cards]
-
-        # Convert face cards to numbers for easier evaluation
-        rank_values = []
-        for rank in ranks:
-            if rank == 'A':
-                rank_values.append(14)
-            elif rank == 'K':
-                rank_values.append(13)
-            elif rank == 'Q':
-                rank_values.append(12)
-            elif rank == 'J':
-                rank_values.append(11)
-            else:
-                rank_values.append(int(rank))
-
-        # Count occurrences of each rank
-        rank_counts = {}
-        for r in rank_values:
-            if r in rank_counts:
-                rank_counts[r] += 1
-            else:
-                rank_counts[r] = 1
-
-        # Check for flush (all same suit)
-        is_flush = len(set(suits)) == 1
-
-        # Check for straight (sequential ranks)
-        sorted_values = sorted(rank_values)
-        is_straight = False
-
-        # Regular straight
-        if sorted_values == list(range(sorted_values[0], sorted_values[0] + 5)):
-            is_straight = True
-        # A-5 straight
-        elif sorted_values == [2, 3, 4, 5, 14]:
-            is_straight = True
-
-        # Royal flush
-        if is_flush and sorted_values == [10, 11, 12, 13, 14]:
-            return "Royal Flush"
-
-        # Straight flush
-        if is_straight and is_flush:
-            return "Straight Flush"
-
-        # Four of a kind
-        if 4 in rank_counts.values():
-            return "Four of a Kind"
-
-        # Full house (three of a kind and a pair)
-        if 3 in rank_counts.values() and 2 in rank_counts.values():
-            return "Full House"
+            card_img = atlas.card(card_rank, suit, (card_width, card_height))
+            image.paste(card_img, (start_x + (i * (card_width + card_spacing)), y_position))
+        except Exception as e:
+            print(f"Error loading card image: {e}")
+            # Draw placeholder if image not found
+            placeholder_pos = (start_x + (i * (card_width + card_spacing)), y_position)
+            draw.rectangle(
+                [placeholder_pos, (placeholder_pos[0] + card_width, placeholder_pos[1] + card_height)],
+                outline=(255, 255, 255),
+                width=2
+            )
+            draw.text(
+                (placeholder_pos[0] + card_width//2, placeholder_pos[1] + card_height//2),
+                f"{rank} of {suit}",
+                font=small_font,
+                fill=(255, 255, 255),
+                anchor="mm"
+            )
 
-        # Flush
-        if is_flush:
-            return "Flush"
+        # Add HOLD text below cards that are held
+        if held_cards[i]:
+            hold_pos = (start_x + (i * (card_width + card_spacing)) + card_width//2,
+                       y_position + card_height + 15)
+            draw.text(hold_pos, "held", font=small_font, fill=(255, 255, 255), anchor="mm")
+
+    # Add win type at the bottom if final
+    if is_final and win_type is not None:
+        if win_type != "High Card":
+            multiplier = POKER_PAYTABLE.get(win_type, 0)
+            draw.text(
+                (width//2, height - 70),
+                f"{win_type} - {multiplier}x",
+                font=large_font,
+                fill=(255, 255, 255),
+                anchor="mm"
+            )
+        else:
+            draw.text(
+                (width//2, height - 70),
+                "No Win",
+                font=large_font,
+                fill=(255, 100, 100),
+                anchor="mm"
+            )
 
-        # Straight
-        if is_straight:
-            return "Straight"
+    # Save image to bytes
+    img_bytes = io.BytesIO()
+    image.save(img_bytes, format="PNG")
+    img_bytes.seek(0)
+    return img_bytes
 
-        # Three of a kind
-        if 3 in rank_counts.values():
-            return "Three of a Kind"
 
-        # Two pair
-        if list(rank_counts.values()).count(2) == 2:
-            return "Two Pair"
+class Poker(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.ongoing_games = {}
 
-        # One pair
-        if 2 in rank_counts.values():
-            return "One Pair"
+    async def generate_game_image(self, cards, held_cards, is_final=False, win_type=None):
+        """Render the hand off the event loop"""
+        return await render_service.render_file("poker", render_hand, cards, held_cards, is_final, win_type)
 
-        # High card
-        return "High Card"
+    def evaluate_hand(self, cards):
+        return hand_name(evaluate([card_id(RANKS.index(rank), SUITS.index(suit)) for rank, suit in cards]))
 
     def get_winning_cards(self, cards, hand_type):
         # Return indices of the cards that make up the winning hand
@@ -585,8 +504,7 @@ class Poker(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -622,7 +540,7 @@ class Poker(commands.Cog):
 
         # Evaluate the final hand
         hand_type = self.evaluate_hand(final_cards)
-        multiplier = paytable.get(hand_type, 0)
+        multiplier = POKER_PAYTABLE.get(hand_type, 0)
 
         # Force loss if cursed
         if forced_loss and multiplier > 0:
@@ -647,25 +565,13 @@ class Poker(commands.Cog):
         file = discord.File(image_bytes, filename="poker_result.png")
 
         # Update database
-        db = Users()
-        server_db = Servers()
-
-
+        await settlement.settle(ctx.author, ctx.guild, "poker", bet_amount, winnings if multiplier > 1 else 0, {
+            "multiplier": multiplier if multiplier > 1 else 0,
+            "hand": hand_type,
+        })
 
         if multiplier > 1:
             # Win
-            db.update_balance(ctx.author.id, winnings)
-
-
-
-            # Update server profit (negative because server loses when player wins)
-            try:
-                profit = bet_amount - winnings  # Server profit is negative when player wins
-                server_db.update_server_profit(ctx, ctx.guild.id, profit, game="poker")
-
-            except Exception as e:
-                print(f"Error updating server profit for win: {e}")
-
             # Use red color for One Pair, green for other winning hands
             embed_color = 0xFF0000 if hand_type == "One Pair" else 0x00FF00
 
@@ -680,44 +586,6 @@ class Poker(commands.Cog):
                 color=embed_color
             )
         elif multiplier == 0:
-            db.update_balance(ctx.author.id, bet_amount*multiplier)
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$inc": {"total_lost": 1, "total_played": 1, "total_spent": bet_amount*multiplier}}
-            )
-
-            # Create loss entry for history
-            loss_entry = {
-                "type": "loss",
-                "game": "poker",
-                "bet": bet_amount,
-                "amount": bet_amount*multiplier,
-                "multiplier": multiplier,
-                "hand": hand_type,
-                "timestamp": int(time.time())
-            }
-
-            # Add to history
-            history_entry = loss_entry.copy()
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}
-            )
-
-            # Update server profit for loss (positive for server when player loses)
-            try:
-                server_db.update_server_profit(ctx, ctx.guild.id, bet_amount*multiplier, game="poker")
-
-                # Add to server history
-                server_loss_entry = loss_entry.copy()
-                server_loss_entry.update({
-                    "user_id": ctx.author.id,
-                    "user_name": ctx.author.name
-                })
-                server_db.update_history(ctx.guild.id, server_loss_entry)
-            except Exception as e:
-                print(f"Error updating server profit for loss: {e}")
-
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | You Lost",
                 description=(
@@ -738,44 +606,6 @@ class Poker(commands.Cog):
 
         elif multiplier < 0.5:
             # Loss
-            # Update stats directly in the collection
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$inc": {"total_lost": 1, "total_played": 1, "total_spent": bet_amount}}
-            )
-
-            # Create loss entry for history
-            loss_entry = {
-                "type": "loss",
-                "game": "poker",
-                "bet": bet_amount,
-                "amount": bet_amount,
-                "multiplier": 0,
-                "hand": hand_type,
-                "timestamp": int(time.time())
-            }
-
-            # Add to history
-            history_entry = loss_entry.copy()
-            db.collection.update_one(
-                {"discord_id": ctx.author.id},
-                {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}
-            )
-
-            # Update server profit for loss (positive for server when player loses)
-            try:
-                server_db.update_server_profit(ctx, ctx.guild.id, bet_amount, game="poker")
-
-                # Add to server history
-                server_loss_entry = loss_entry.copy()
-                server_loss_entry.update({
-                    "user_id": ctx.author.id,
-                    "user_name": ctx.author.name
-                })
-                server_db.update_history(ctx.guild.id, server_loss_entry)
-            except Exception as e:
-                print(f"Error updating server profit for loss: {e}")
-
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | No Win",
                 description=(
@@ -1,10 +1,11 @@
 import discord
 import asyncio
 import random
-import time
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import PCF_FLIP_MULTIPLIER, PCF_MAX_FLIPS
 
 class PCFView(discord.ui.View):
     def __init__(self, cog, ctx, message, bet_amount, initial_multiplier=1, timeout=30):
@@ -16,7 +17,7 @@ class PCFView(discord.ui.View):
         self.currency_used = "points"
         self.current_flips = 0
         self.current_multiplier = initial_multiplier
-        self.max_flips = 15
+        self.max_flips = PCF_MAX_FLIPS
         self.choice = None
         self.last_result = None
 
@@ -79,7 +80,7 @@ class PCFView(discord.ui.View):
         if result == self.choice:
             # Player guessed correctly
             self.current_flips += 1
-            self.current_multiplier *= 1.96  # Multiply by 1.96 for each correct guess
+            self.current_multiplier *= PCF_FLIP_MULTIPLIER
 
             # Create updated embed
             # Use custom coin emojis
@@ -161,45 +162,7 @@ class PCFView(discord.ui.View):
             await interaction.message.edit(view=play_again_view)
             play_again_view.message = interaction.message
 
-            # Process loss (if they've already flipped some coins)
-            if self.current_flips > 0:
-                # Register the loss in history
-                db = Users()
-
-                loss_entry = {
-                    "type": "loss",
-                    "game": "progressive_coinflip",
-                    "bet": self.bet_amount,
-                    "flips": self.current_flips,
-                    "multiplier": self.current_multiplier,
-                    "timestamp": int(time.time())
-                }
-                db.collection.update_one(
-                    {"discord_id": self.ctx.author.id},
-                    {"$push": {"history": {"$each": [loss_entry], "$slice": -100}}}
-                )
-
-                # Update server history if available
-                server_db = Servers()
-                server_data = server_db.fetch_server(self.ctx.guild.id)
-
-                if server_data:
-                    server_loss_entry = {
-                        "type": "loss",
-                        "game": "progressive_coinflip",
-                        "user_id": self.ctx.author.id,
-                        "user_name": self.ctx.author.name,
-                        "bet": self.bet_amount,
-                        "flips": self.current_flips,
-                        "timestamp": int(time.time())
-                    }
-                    server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="progressivecoinflip")
-
-                # Update user stats
-                db.collection.update_one(
-                    {"discord_id": self.ctx.author.id},
-                    {"$inc": {"total_lost": 1}}
-                )
+            await self.cog.process_loss(self.ctx, self.bet_amount, self.current_flips)
 
             # Remove from ongoing games
             if self.ctx.author.id in self.cog.ongoing_games:
@@ -408,7 +371,7 @@ class ProgressiveCoinflipCog(commands.Cog):
 
         # Process bet amount
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id, "balance")
 
         if user_data == False:
             await loading_message.delete()
@@ -513,54 +476,7 @@ class ProgressiveCoinflipCog(commands.Cog):
         play_again_view.message = message
 
         # Process win
-        # Add credits to user
-        db = Users()
-        db.update_balance(ctx.author.id, winnings, "credits", "$inc")
-
-        # Add to win history
-        win_entry = {
-            "type": "win",
-            "game": "progressive_coinflip",
-            "bet": bet_amount,
-            "amount": winnings,
-            "flips": flips,
-            "multiplier": multiplier,
-            "timestamp": int(time.time())
-        }
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$push": {"history": {"$each": [win_entry], "$slice": -100}}}
-        )
-
-        # Update server history
-        server_db = Servers()
-        server_data = server_db.fetch_server(ctx.guild.id)
-
-        if server_data:
-            server_win_entry = {
-                "type": "win",
-                "game": "progressive_coinflip",
-                "user_id": ctx.author.id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "amount": winnings,
-                "flips": flips,
-                "multiplier": multiplier,
-                "timestamp": int(time.time())
-            }
-            server_db.collection.update_one(
-                {"server_id": ctx.guild.id},
-                {"$push": {"server_bet_history": {"$each": [server_win_entry], "$slice": -100}}}
-            )
-
-            # Update server profit (negative because player won)
-            server_db.update_server_profit(ctx, ctx.guild.id, (bet_amount - winnings), game="progressivecoinflip")
-
-        # Update user stats
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$inc": {"total_won": 1, "total_earned": winnings, "total_played": 1}}
-        )
+        await self.process_win(ctx, bet_amount, multiplier, flips)
 
         # Remove from ongoing games
         if ctx.author.id in self.ongoing_games:
@@ -640,7 +556,7 @@ class ProgressiveCoinflipCog(commands.Cog):
         # Create result embed
         if user_won:
             # Calculate new multiplier (multiply by 1.96)
-            new_multiplier = round(current_multiplier * 1.96, 2)
+            new_multiplier = round(current_multiplier * PCF_FLIP_MULTIPLIER, 2)
 
             # Calculate current potential winnings
             potential_winnings = round(bet_amount * new_multiplier, 2)
@@ -663,7 +579,7 @@ class ProgressiveCoinflipCog(commands.Cog):
                     flip_visualization += "⬜ "
 
             # Check if max flips reached
-            max_flips_reached = current_flips >= 15
+            max_flips_reached = current_flips >= PCF_MAX_FLIPS
 
             if max_flips_reached:
                 # Auto cash out at max flips
@@ -774,108 +690,16 @@ class ProgressiveCoinflipCog(commands.Cog):
 
     async def process_win(self, ctx, bet_amount, multiplier, flips):
         """Process win for progressive coinflip"""
-        # Calculate winnings
-        winnings = bet_amount * multiplier
-
-        # Get database connection
-        db = Users()
-
-        # Add credits to user (always give credits for winnings)
-        db.update_balance(ctx.author.id, winnings, "credits", "$inc")
-
-        # Add to win history
-        win_entry = {
-            "type": "win",
-            "game": "pcf",
-            "bet": bet_amount,
-            "amount": winnings,
+        await settlement.settle(ctx.author, ctx.guild, "progressive_coinflip", bet_amount, bet_amount * multiplier, {
             "multiplier": multiplier,
             "flips": flips,
-            "timestamp": int(time.time())
-        }
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$push": {"history": {"$each": [win_entry], "$slice": -100}}}
-        )
-
-        # Update server history
-        server_db = Servers()
-        server_data = server_db.fetch_server(ctx.guild.id)
-
-        if server_data:
-            server_win_entry = {
-                "type": "win",
-                "game": "pcf",
-                "user_id": ctx.author.id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "amount": winnings,
-                "multiplier": multiplier,
-                "flips": flips,
-                "timestamp": int(time.time())
-            }
-            server_db.collection.update_one(
-                {"server_id": ctx.guild.id},
-                {"$push": {"server_bet_history": {"$each": [server_win_entry], "$slice": -100}}}
-            )
-
-            # Update server profit (negative value because server loses when player wins)
-            profit = winnings - bet_amount
-            server_db.update_server_profit(ctx, ctx.guild.id, -profit)
-
-        # Update user stats
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$inc": {"total_won": 1, "total_earned": winnings}}
-        )
+        })
 
     async def process_loss(self, ctx, bet_amount, flips):
         """Process loss for progressive coinflip"""
-        # Get database connection
-        db = Users()
-
-        # Add to loss history
-        loss_entry = {
-            "type": "loss",
-            "game": "pcf",
-            "bet": bet_amount,
-            "amount": bet_amount,
+        await settlement.settle(ctx.author, ctx.guild, "progressive_coinflip", bet_amount, 0, {
             "flips": flips,
-            "timestamp": int(time.time())
-        }
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$push": {"history": {"$each": [loss_entry], "$slice": -100}}}
-        )
-
-        # Update server history
-        server_db = Servers()
-        server_data = server_db.fetch_server(ctx.guild.id)
-
-        if server_data:
-            server_loss_entry = {
-                "type": "loss",
-                "game": "pcf",
-                "user_id": ctx.author.id,
-                "user_name": ctx.author.name,
-                "bet": bet_amount,
-                "flips": flips,
-                "timestamp": int(time.time())
-            }
-            server_db.collection.update_one(
-                {"server_id": ctx.guild.id},
-                {"$push": {"server_bet_history": {"$each": [server_loss_entry], "$slice": -100}}}
-            )
-
-            # Update server profit
-            server_db.update_server_profit(ctx, ctx.guild.id, bet_amount)
-
-        # Update user stats
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$inc": {"total_lost": 1}}
-        )
-
+        })
 
 
 def setup(bot):
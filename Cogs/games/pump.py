@@ -3,13 +3,15 @@ import random
 import asyncio
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 #from PIL import Image, ImageDraw #Removed as no longer needed
 from discord.ext import commands
 from Cogs.utils.currency_helper import process_bet_amount
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from colorama import Fore
 from Cogs.utils.emojis import emoji
+from Cogs.utils.multiplier_tables import MAX_PUMPS, PUMP_MULTIPLIERS, PUMP_POP_CHANCES
 
 class PlayAgainView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, difficulty, timeout=15):
@@ -58,23 +60,12 @@ class PumpGameView(discord.ui.View):
         self.currency_type = "points"  # Always pay out in credits
         self.message = None
         self.current_pumps = 0
-        self.max_pumps = 12
+        self.max_pumps = MAX_PUMPS
         self.game_over = False
         self.cashout_clicked = False
 
         # Set difficulty-specific parameters
-        if self.difficulty == "easy":
-            self.probability = 0.75
-            self.multipliers = [1.00, 1.27, 1.69, 2.25, 3.00, 4.00, 5.34, 7.13, 9.49, 12.65, 16.87, 22.49, 29.98]
-        elif self.difficulty == "medium":
-            self.probability = 0.50
-            self.multipliers = [1.00, 1.90, 3.80, 7.60, 15.20, 30.40, 60.80, 121.60, 243.20, 486.40, 972.80, 1945.60, 3891.20]
-        elif self.difficulty == "hard":
-            self.probability = 0.30
-            self.multipliers = [1.00, 3.17, 10.56, 35.19, 117.28, 390.95, 1303.15, 4344.32, 14480.00, 48288.50, 161019.30, 536257.00, 1788234.00]
-        elif self.difficulty == "extreme":
-            self.probability = 0.15
-            self.multipliers = [1.00, 6.33, 42.22, 281.48, 1876.54, 12511.60, 83333.34, 556206.00, 3707317.00, 24675324.70, 164502000.00, 1099530000.00, 7330200000.00]
+        self.multipliers = PUMP_MULTIPLIERS[self.difficulty]
 
         # Current multiplier (starts at 1x)
         self.current_multiplier = self.multipliers[0]
@@ -257,23 +248,8 @@ class PumpGameView(discord.ui.View):
             curse_cog.consume_curse(self.ctx.author.id)
             await self.send_curse_webhook(self.ctx.author, "pump", self.bet_amount, self.current_multiplier)
         else:
-            # Calculate pop chance based on difficulty and pumps
-            self.difficulty_rates = {
-                "easy": 0.25,
-                "medium": 0.50,
-                "hard": 0.70,
-                "extreme": 0.85
-            }
-            # Calculate pop chance based on difficulty and pumps
-            base_failure_rate = self.difficulty_rates[self.difficulty]
-            # Increase failure rate with each pump (exponential growth)
-            failure_rate = base_failure_rate * (1.1 ** self.current_pumps)
-
-            # Cap at 95% to always give some chance
-            failure_rate = min(failure_rate, 0.95)
-
             # Check if balloon pops
-            balloon_popped = random.random() < failure_rate
+            balloon_popped = random.random() < PUMP_POP_CHANCES[self.difficulty][self.current_pumps]
 
         if balloon_popped:
             # Pump failed - balloon pops
@@ -346,57 +322,12 @@ class PumpGameView(discord.ui.View):
         """Process cashout - update database and end game"""
         payout = self.calculate_payout()
 
-        db = Users()
-        try:
-            # Update user's balance
-            db.update_balance(self.ctx.author.id, payout, "credits", "$inc")
-
-            # Create win history entry
-            win_entry = {
-                "type": "win",
-                "game": "pump",
-                "bet": self.bet_amount,
-                "amount": payout,
-                "multiplier": self.current_multiplier,
-                "pumps": self.current_pumps,
-                "difficulty": self.difficulty,
-                "timestamp": int(time.time())
-            }
-
-            # Update user history and stats
-            db.collection.update_one(
-                {"discord_id": self.ctx.author.id},
-                {
-                    "$push": {"history": {"$each": [win_entry], "$slice": -100}},
-                    "$inc": {
-                        "total_played": 1,
-                        "total_won": 1,
-                        "total_earned": payout
-                    }
-                }
-            )
-
-            # Update server stats if in a guild
-            if isinstance(self.ctx.channel, discord.TextChannel):
-                server_db = Servers()
-                server_profit = self.bet_amount - payout
-
-                # Update server profit
-                server_db.update_server_profit(self.ctx, self.ctx.guild.id, server_profit, game="pump")
-
-                # Add to server history
-                server_bet_entry = win_entry.copy()
-                server_bet_entry.update({
-                    "user_id": self.ctx.author.id,
-                    "user_name": self.ctx.author.name
-                })
-
-                server_db.collection.update_one(
-                    {"server_id": self.ctx.guild.id},
-                    {"$push": {"server_bet_history": {"$each": [server_bet_entry], "$slice": -100}}}
-                )
-        except Exception as e:
-            print(f"Error processing cashout: {e}")
+        settled = await settlement.settle(self.ctx.author, self.ctx.guild, "pump", self.bet_amount, payout, {
+            "multiplier": self.current_multiplier,
+            "pumps": self.current_pumps,
+            "difficulty": self.difficulty,
+        })
+        if settled is None:
             return False
 
         # Create cashout embed with appropriate status
@@ -423,52 +354,10 @@ class PumpGameView(discord.ui.View):
 
     async def process_loss(self):
         """Process loss - update database and end game"""
-        db = Users()
-
-        # Create loss history entry
-        loss_entry = {
-            "type": "loss",
-            "game": "pump",
-            "bet": self.bet_amount,
-            "amount": self.bet_amount,
-            "multiplier": 0,
+        await settlement.settle(self.ctx.author, self.ctx.guild, "pump", self.bet_amount, 0, {
             "pumps": self.current_pumps,
             "difficulty": self.difficulty,
-            "timestamp": int(time.time())
-        }
-
-        # Update user history and stats directly in one operation
-        db.collection.update_one(
-            {"discord_id": self.ctx.author.id},
-            {
-                "$push": {"history": {"$each": [loss_entry], "$slice": -100}},
-                "$inc": {
-                    "total_played": 1,
-                    "total_lost": 1,
-                    "total_spent": self.bet_amount
-                }
-            }
-        )
-
-        # Update server stats if in a guild
-        if isinstance(self.ctx.channel, discord.TextChannel):
-            server_db = Servers()
-
-            # Update server profit directly
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="pump")
-
-            # Add to server history
-            server_bet_entry = loss_entry.copy()
-            server_bet_entry.update({
-                "user_id": self.ctx.author.id,
-                "user_name": self.ctx.author.name
-            })
-
-            # Update server history directly
-            server_db.collection.update_one(
-                {"server_id": self.ctx.guild.id},
-                {"$push": {"server_bet_history": {"$each": [server_bet_entry], "$slice": -100}}}
-            )
+        })
 
         # Create play again view
         play_again_view = PlayAgainView(
@@ -508,8 +397,7 @@ class PumpGameView(discord.ui.View):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -3,10 +3,12 @@ import random
 import asyncio
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.edit_scheduler import edits
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.paytables import RACE_CAR_MOVES, RACE_TRACK_LENGTH, RACE_WIN_MULTIPLIER
 
 class RacePlayAgainView(discord.ui.View):
     """View with a Play Again button that shows after a game ends"""
@@ -38,7 +40,7 @@ class RaceCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.ongoing_games = {}
-        self.track_length = 15  # Length of the race track
+        self.track_length = RACE_TRACK_LENGTH  # Length of the race track
 
     @commands.command(aliases=["carrace"])
     async def race(self, ctx, bet_amount: str = None):
@@ -235,7 +237,7 @@ class RaceCog(commands.Cog):
             # Move all cars simultaneously and check for winner immediately
             for i in range(4):
                 # More varied speed with better randomization
-                move = random.choice([1, 1, 2, 2, 3])  # Weighted toward 1-2, occasional 3
+                move = random.choice(RACE_CAR_MOVES)
                 car_positions[i] = min(car_positions[i] + move, self.track_length)
 
                 # Check if this car won (first to reach finish line)
@@ -286,7 +288,8 @@ class RaceCog(commands.Cog):
                 )
 
             updated_embed.set_footer(text="BetSync Casino", icon_url=self.bot.user.avatar.url)
-            await message.edit(embed=updated_embed)
+            # Frames the channel can't take yet are replaced by newer ones instead of queueing
+            edits.submit(message, embed=updated_embed)
 
             # Slower delay between updates
             await asyncio.sleep(0.8)
@@ -300,56 +303,13 @@ class RaceCog(commands.Cog):
         win_amount = 0
 
         if user_won:
-            win_amount = bet_amount * 3
-
-        # Update MongoDB
-        db = Users()
-
-        # Update gameplay statistics
-        db.collection.update_one(
-            {"discord_id": author.id},
-            {"$inc": {
-                "total_played": 1,
-                "total_won": 1 if user_won else 0,
-                "total_lost": 0 if user_won else 1,
-                "total_spent": bet_amount,
-                "total_earned": win_amount
-            }}
-        )
+            win_amount = bet_amount * RACE_WIN_MULTIPLIER
 
-        # Add to user's credits if they won
-        if user_won:
-            db.update_balance(author.id, win_amount, "credits", "$inc")
-
-        # Update server profit statistics if in a server
-        if hasattr(ctx, 'guild') and ctx.guild:
-            server_db = Servers()
-            server_profit = bet_amount - win_amount
-            server_db.update_server_profit(ctx, ctx.guild.id, server_profit, game="race")
-
-            # Add game to server history
-            history_entry = {
-                "game": "race",
-                "user_id": author.id,
-                "username": author.name,
-                "bet_amount": bet_amount,
-                "currency": currency_used,
-                "result": "win" if user_won else "loss",
-                "profit": server_profit,
-                "timestamp": int(discord.utils.utcnow().timestamp())
-            }
-            server_db.update_history(ctx.guild.id, history_entry)
-
-        # Add game to user history
-        history_entry = {
-            "game": "race",
-            "bet_amount": bet_amount,
-            "currency": currency_used,
-            "result": "win" if user_won else "loss",
-            "win_amount": win_amount,
-            "timestamp": int(discord.utils.utcnow().timestamp())
-        }
-        db.update_history(author.id, history_entry)
+        # Settle the race
+        await settlement.settle(author, getattr(ctx, "guild", None), "race", bet_amount, win_amount, {
+            "selected_car": selected_car,
+            "winner": winner,
+        })
 
         # Final results embed with improved visuals
         if user_won:
@@ -401,7 +361,8 @@ class RaceCog(commands.Cog):
         if author.id in self.ongoing_games:
             del self.ongoing_games[author.id]
 
-        # Delete the race in progress message
+        # Delete the race in progress message, dropping any frame still queued for it
+        edits.cancel(message)
         try:
             await message.delete()
         except Exception as e:
@@ -432,8 +393,7 @@ class RaceCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -1,14 +1,17 @@
 import discord
-import random
 import asyncio
 import datetime
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
+from Cogs.utils.edit_scheduler import edits
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import process_bet_amount
+from Cogs.utils.spin_engine import SlotsEngine
+from Cogs.utils.paytables import SLOTS_HOUSE_EDGE, SLOTS_SYMBOLS
 
 
 class SlotsResultView(discord.ui.View):
@@ -78,18 +81,8 @@ class SlotsCog(commands.Cog):
         self.bot = bot
         self.ongoing_games = {}
 
-        # Reduced payout symbols with lower weights for better house edge
-        self.symbols = {
-            "🍎": {"weight": 30, "payout": 1.1, "rarity": "Common"},
-            "🍊": {"weight": 28, "payout": 1.2, "rarity": "Common"},
-            "🍋": {"weight": 25, "payout": 1.3, "rarity": "Common"},
-            "🍇": {"weight": 20, "payout": 1.8, "rarity": "Uncommon"},
-            "🍒": {"weight": 15, "payout": 2.2, "rarity": "Uncommon"},
-            "🔔": {"weight": 8, "payout": 3.5, "rarity": "Rare"},
-            "💎": {"weight": 3, "payout": 6.0, "rarity": "Epic"},
-            "🍀": {"weight": 1, "payout": 15.0, "rarity": "Legendary"},
-            "🎰": {"weight": 0.2, "payout": 35.0, "rarity": "Mythic"}
-        }
+        self.symbols = SLOTS_SYMBOLS
+        self.engine = SlotsEngine(SLOTS_SYMBOLS, SLOTS_HOUSE_EDGE)
 
     async def send_curse_webhook(self, user, game, bet_amount, multiplier):
         """Send curse trigger notification to webhook"""
@@ -111,96 +104,10 @@ class SlotsCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
-    def generate_slot_result(self):
-        """Generate optimized 3x5 slot machine result"""
-        symbol_list = []
-        weights = []
-
-        for symbol, data in self.symbols.items():
-            symbol_list.append(symbol)
-            weights.append(data["weight"])
-
-        # Generate 15 symbols with bias towards losing combinations
-        result = []
-        for _ in range(15):
-            symbol = random.choices(symbol_list, weights=weights)[0]
-            result.append(symbol)
-
-        return result
-
-    def calculate_winnings(self, symbols, bet_amount):
-        """Enhanced winning calculation with multiple paylines"""
-        grid = [symbols[i:i+5] for i in range(0, 15, 5)]
-
-        total_multiplier = 0
-        winning_combinations = []
-        winning_positions = set()
-
-        # Horizontal paylines (3 rows)
-        for row_idx, row in enumerate(grid):
-            line_wins, positions = self.check_payline(row, f"Row {row_idx + 1}", row_idx * 5)
-            for win in line_wins:
-                total_multiplier += win["multiplier"]
-                winning_combinations.append(win)
-                winning_positions.update(positions)
-
-        # Vertical paylines (5 columns)
-        for col_idx in range(5):
-            column = [grid[row][col_idx] for row in range(3)]
-            positions = [col_idx + row * 5 for row in range(3)]
-            line_wins, win_positions = self.check_payline(column, f"Column {col_idx + 1}", 0, positions)
-            for win in line_wins:
-                total_multiplier += win["multiplier"]
-                winning_combinations.append(win)
-                winning_positions.update(win_positions)
-
-        # Apply house edge (10% reduction)
-        house_edge = 0.90
-        final_multiplier = total_multiplier * house_edge
-        winnings = bet_amount * final_multiplier
-
-        return winnings, winning_combinations, final_multiplier, list(winning_positions)
-
-    def check_payline(self, line, line_name, start_pos=0, custom_positions=None):
-        """Check for winning combinations in a payline"""
-        wins = []
-        winning_positions = []
-
-        for symbol, data in self.symbols.items():
-            count = line.count(symbol)
-            if count >= 3:
-                base_payout = data["payout"]
-
-                # Reduced bonus multipliers
-                if count == 4:
-                    multiplier = base_payout * 1.3
-                elif count == 5:
-                    multiplier = base_payout * 2.0
-                else:
-                    multiplier = base_payout
-
-                wins.append({
-                    "symbol": symbol,
-                    "count": count,
-                    "multiplier": multiplier,
-                    "line": line_name,
-                    "rarity": data["rarity"]
-                })
-
-                # Track winning positions
-                if custom_positions:
-                    symbol_positions = [pos for i, pos in enumerate(custom_positions) if line[i] == symbol]
-                else:
-                    symbol_positions = [start_pos + i for i, s in enumerate(line) if s == symbol]
-                winning_positions.extend(symbol_positions[:count])
-
-        return wins, winning_positions
-
     def create_beautiful_embed(self, title, description, color, bet_amount=None, winnings=None, 
                              multiplier=None, winning_combinations=None, footer_text=None):
         """Create a polished, professional-looking embed"""
@@ -311,7 +218,7 @@ class SlotsCog(commands.Cog):
 
         # Process bet amount
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id, "balance")
 
         if not user_data:
             await loading_message.delete()
@@ -362,7 +269,7 @@ class SlotsCog(commands.Cog):
                 return await ctx.reply(embed=embed)
 
             # Deduct total bet amount upfront for multiple spins
-            result = db.update_balance(ctx.author.id, -total_bet, "points", "$inc")
+            result = await db.update_balance(ctx.author.id, -total_bet, "points", "$inc")
         else:
             # For single spin, use process_bet_amount (which already deducts the bet)
             success, bet_info, error_embed = await process_bet_amount(ctx, bet_amount, loading_message)
@@ -376,10 +283,10 @@ class SlotsCog(commands.Cog):
 
         # Double-check that balance didn't go negative (only for multiple spins)
         if spins > 1:
-            updated_user_data = db.fetch_user(ctx.author.id)
+            updated_user_data = await db.fetch_user(ctx.author.id, "balance")
             if updated_user_data.get("points", 0) < 0:
                 # Refund the bet and show error
-                db.update_balance(ctx.author.id, total_bet, "points", "$inc")
+                await db.update_balance(ctx.author.id, total_bet, "points", "$inc")
                 await loading_message.delete()
                 embed = discord.Embed(
                     title="<:no:1344252518305234987> | Transaction Failed",
@@ -395,8 +302,18 @@ class SlotsCog(commands.Cog):
         }
 
         try:
-            total_winnings = 0
-            all_results = []
+            # Draw and score every spin at once; a cursed player loses spins while the curse lasts
+            spun = self.engine.spin(spins)
+            curse_cog = self.bot.get_cog('AdminCurseCog')
+            for spin_num in range(spins):
+                if curse_cog and curse_cog.is_player_cursed(ctx.author.id):
+                    # Consume curse and send webhook
+                    curse_cog.consume_curse(ctx.author.id)
+                    await self.send_curse_webhook(ctx.author, "slots", bet_per_spin, 0)
+                    spun.void(spin_num)
+            spin_winnings = spun.winnings(bet_per_spin).tolist()
+            total_winnings = sum(spin_winnings)
+            winning_spins = spun.winning_spins()
 
             for spin_num in range(spins):
                 # Update to spinning state
@@ -409,82 +326,26 @@ class SlotsCog(commands.Cog):
                 )
 
                 spinning_view = SlotsSpinningView()
-                await loading_message.edit(embed=spinning_embed, view=spinning_view)
+                # Spinning frames the channel can't take yet are replaced by newer ones
+                edits.submit(loading_message, embed=spinning_embed, view=spinning_view)
 
                 # Wait between spins
                 await asyncio.sleep(2.0 if spins == 1 else 1.5)
 
-                # Generate results
-                slot_symbols = self.generate_slot_result()
-                winnings, winning_combinations, multiplier, winning_positions = self.calculate_winnings(slot_symbols, bet_per_spin)
-              # Check for curse
-                curse_cog = self.bot.get_cog('AdminCurseCog')
-                cursed_player = False
-
-                if curse_cog and curse_cog.is_player_cursed(ctx.author.id):
-                    cursed_player = True
-                    # Consume curse and send webhook
-                    curse_cog.consume_curse(ctx.author.id)
-                    await self.send_curse_webhook(ctx.author, "slots", bet_per_spin, 0)
-
-                # Generate slot results
-                if cursed_player:
-                    # Force a losing spin
-                    slot_symbols = self.generate_slot_result()
-                    winnings, winning_combinations, multiplier, winning_positions = 0, [], 0, []
-                else:
-                    slot_symbols = self.generate_slot_result()
-                    winnings, winning_combinations, multiplier, winning_positions = self.calculate_winnings(slot_symbols, bet_per_spin)
-
-
-                all_results.append({
-                    "symbols": slot_symbols,
-                    "winnings": winnings,
-                    "combinations": winning_combinations,
-                    "multiplier": multiplier,
-                    "winning_positions": winning_positions
-                })
-
-                total_winnings += winnings
-
-            # Add winnings to balance
-            if total_winnings > 0:
-                db.update_balance(ctx.author.id, total_winnings, "points", "$inc")
-
-            # Update server profit
-            server_db = Servers()
-            server_profit = total_bet - total_winnings
-            server_db.update_server_profit(ctx, ctx.guild.id, server_profit, game="slots")
-
-            # Add to history
-            history_entry = {
-                "type": "win" if total_winnings > 0 else "loss",
-                "game": "slots",
-                "amount": total_winnings if total_winnings > 0 else total_bet,
-                "bet": total_bet,
-                "multiplier": sum(r['multiplier'] for r in all_results),
+            # Settle every spin with one credit
+            await settlement.settle_rounds(ctx.author, ctx.guild, "slots", [(bet_per_spin, winnings) for winnings in spin_winnings], {
                 "spins": spins,
-                "winning_spins": sum(1 for r in all_results if r['winnings'] > 0),
-                "total_combinations": sum(len(r['combinations']) for r in all_results),
-                "timestamp": int(time.time())
-            }
-            db.update_history(ctx.author.id, history_entry)
-
-            # Update server history
-            server_history_entry = history_entry.copy()
-            server_history_entry.update({
-                "user_id": ctx.author.id,
-                "user_name": ctx.author.name
+                "winning_spins": winning_spins,
+                "total_combinations": spun.combination_count(),
             })
-            server_db.update_history(ctx.guild.id, server_history_entry)
 
             # Show final result
             user_won = total_winnings > 0
-            last_result = all_results[-1]
+            last_result = spun.result(spins - 1, bet_per_spin)
 
             if user_won:
                 title = "<:yes:1355501647538815106> | You Won!"
-                description = f"🌟 **Congratulations!** Won on {sum(1 for r in all_results if r['winnings'] > 0)}/{spins} spins! 🌟"
+                description = f"🌟 **Congratulations!** Won on {winning_spins}/{spins} spins! 🌟"
                 color = 0x00FF00
             else:
                 title = "<:no:1344252518305234987> | You Lost"
@@ -497,7 +358,7 @@ class SlotsCog(commands.Cog):
                 color=color,
                 bet_amount=total_bet,
                 winnings=total_winnings if user_won else 0,
-                multiplier=sum(r['multiplier'] for r in all_results) if user_won else 0,
+                multiplier=float(spun.multipliers.sum()) if user_won else 0,
                 winning_combinations=last_result["combinations"] if user_won else None
             )
 
@@ -509,7 +370,7 @@ class SlotsCog(commands.Cog):
                 user_won, 
                 last_result["winning_positions"]
             )
-            await loading_message.edit(embed=result_embed, view=result_view)
+            await edits.edit(loading_message, embed=result_embed, view=result_view)
 
         except Exception as e:
             print(f"Slots game error: {e}")
@@ -521,7 +382,7 @@ class SlotsCog(commands.Cog):
             await ctx.reply(embed=error_embed)
 
             # Refund the bet
-            db.update_balance(ctx.author.id, total_bet, "points", "$inc")
+            await db.update_balance(ctx.author.id, total_bet, "points", "$inc")
 
         finally:
             # Clean up ongoing game
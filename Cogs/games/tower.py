@@ -3,11 +3,13 @@ import random
 import asyncio
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 from discord.ext import commands
 from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.settlement import settlement
 from colorama import Fore
 from Cogs.utils import emojis
+from Cogs.utils.multiplier_tables import TOWER_DIFFICULTIES, TOWER_LEVELS, TOWER_MULTIPLIERS
 import datetime
 
 class PlayAgainView(discord.ui.View):
@@ -57,32 +59,16 @@ class TowerGameView(discord.ui.View):
         self.currency_type = "points"  # Always pay out in credits
         self.message = None
         self.current_level = 0
-        self.max_levels = 9
+        self.max_levels = TOWER_LEVELS
         self.game_over = False
         self.cashout_clicked = False
         self.last_diamonds = [] # Added to store diamond positions
 
         # Set difficulty-specific parameters
-        if self.difficulty == "easy":
-            self.tiles_per_row = 4
-            self.diamonds_per_row = 3
-            self.multipliers = [1.27, 1.69, 2.25, 3.00, 4.00, 5.34, 7.12, 9.49, 12.65]
-        elif self.difficulty == "medium":
-            self.tiles_per_row = 3
-            self.diamonds_per_row = 2
-            self.multipliers = [1.43, 2.14, 3.21, 4.81, 7.21, 10.82, 16.23, 24.35, 36.52]
-        elif self.difficulty == "hard":
-            self.tiles_per_row = 2
-            self.diamonds_per_row = 1
-            self.multipliers = [1.90, 3.80, 7.60, 15.20, 30.40, 60.80, 121.60, 243.20, 486.40]
-        elif self.difficulty == "expert":
-            self.tiles_per_row = 2
-            self.diamonds_per_row = 1
-            self.multipliers = [2.85, 8.55, 25.65, 76.95, 230.85, 693.55, 2077.65, 6232.95, 18798.85]
-        elif self.difficulty == "master":
-            self.tiles_per_row = 4
-            self.diamonds_per_row = 1
-            self.multipliers = [3.80, 15.20, 60.80, 243.20, 972.80, 3891.20, 15564.80, 62259.20, 249036.80]
+        settings = TOWER_DIFFICULTIES[self.difficulty]
+        self.tiles_per_row = settings["tiles"]
+        self.diamonds_per_row = settings["diamonds"]
+        self.multipliers = settings["multipliers"]
 
         # Current level and multiplier tracking
         self.current_level = 0
@@ -325,8 +311,7 @@ class TowerGameView(discord.ui.View):
             self.current_level += 1
 
             # Update the current multiplier based on the level
-            if self.current_level < len(self.multipliers):
-                self.current_multiplier = self.multipliers[self.current_level - 1]  # Use previous level's multiplier
+            self.current_multiplier = TOWER_MULTIPLIERS[self.difficulty][self.current_level]
 
             # If player reached the top of the tower, they win
             if self.current_level == self.max_levels:
@@ -403,57 +388,11 @@ class TowerGameView(discord.ui.View):
         payout = self.calculate_payout()
         bet_currency = self.currency_type
 
-        db = Users()
-        try:
-            # Update user's balance
-            db.update_balance(self.ctx.author.id, payout, "credits", "$inc")
-
-            # Create win history entry
-            win_entry = {
-                "type": "win",
-                "game": "tower",
-                "bet": self.bet_amount,
-                "amount": payout,
-                "multiplier": self.current_multiplier,
-                "level": self.current_level,
-                "timestamp": int(time.time())
-            }
-
-            # Update user history and stats directly in one operation
-            db.collection.update_one(
-                {"discord_id": self.ctx.author.id},
-                {
-                    "$push": {"history": {"$each": [win_entry], "$slice": -100}},
-                    "$inc": {
-                        "total_played": 1,
-                        "total_won": 1,
-                        "total_earned": payout
-                    }
-                }
-            )
-
-            # Update server stats if in a guild
-            #if isinstance(self.ctx.channel, discord.TextChannel):
-            server_db = Servers()
-            server_profit = self.bet_amount - payout
-
-                # Update server profit directly
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, server_profit, game="tower")
-
-                # Add to server history
-            server_bet_entry = win_entry.copy()
-            server_bet_entry.update({
-                    "user_id": self.ctx.author.id,
-                    "user_name": self.ctx.author.name
-                })
-
-                # Update server history directly
-            server_db.collection.update_one(
-                    {"server_id": self.ctx.guild.id},
-                    {"$push": {"server_bet_history": {"$each": [server_bet_entry], "$slice": -100}}}
-                )
-        except Exception as e:
-            print(f"Error processing cashout: {e}")
+        settled = await settlement.settle(self.ctx.author, self.ctx.guild, "tower", self.bet_amount, payout, {
+            "multiplier": self.current_multiplier,
+            "level": self.current_level,
+        })
+        if settled is None:
             return False
 
         # Create play again view
@@ -477,44 +416,10 @@ class TowerGameView(discord.ui.View):
 
     async def process_loss(self):
         """Process loss - update database and end game"""
-        # Create loss entry
-        loss_entry = {
-            "game": "tower",
-            "type": "loss",
-            "bet": self.bet_amount,
-            "amount": self.bet_amount,
+        await settlement.settle(self.ctx.author, self.ctx.guild, "tower", self.bet_amount, 0, {
             "level": self.current_level + 1,
             "difficulty": self.difficulty,
-            "timestamp": int(time.time())
-        }
-
-        # Update user history
-        db = Users()
-        db.update_history(self.ctx.author.id, loss_entry)
-
-        # Update user stats
-        db.collection.update_one(
-            {"discord_id": self.ctx.author.id},
-            {"$inc": {
-                "total_lost": 1,
-            }}
-        )
-
-        # Update server stats if in a guild
-        try:
-            server_db = Servers()
-            # Update server profit using the correct method
-            server_db.update_server_profit(self.ctx, self.ctx.guild.id, self.bet_amount, game="tower")
-
-            # Add to server history
-            server_bet_entry = loss_entry.copy()
-            server_bet_entry.update({
-                "user_id": self.ctx.author.id,
-                "user_name": self.ctx.author.name
-            })
-            server_db.update_history(self.ctx.guild.id, server_bet_entry)
-        except Exception as e:
-            print(f"Error updating server profit: {e}")
+        })
 
         # Create play again view for loss scenario
         play_again_view = PlayAgainView(
@@ -534,12 +439,6 @@ class TowerGameView(discord.ui.View):
         if hasattr(self.ctx.author, 'id') and self.ctx.author.id in self.cog.ongoing_games:
             del self.cog.ongoing_games[self.ctx.author.id]
 
-        server_bet_entry = loss_entry.copy()
-        server_bet_entry.update({
-                "user_id": self.ctx.author.id,
-                "user_name": self.ctx.author.name
-            })
-
     async def send_curse_webhook(self, user, game, bet_amount, multiplier):
         """Send curse trigger notification to webhook"""
         webhook_url = os.environ.get("LOSE_WEBHOOK")
@@ -560,8 +459,7 @@ class TowerGameView(discord.ui.View):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -635,13 +533,6 @@ class TowerCog(commands.Cog):
         # Validate difficulty
 
 
-        # Record game stats
-        db = Users()
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {"$inc": {"total_played": 1, "total_spent": total_bet}}
-        )
-
         # Deduct bet amount from user's balance
         #db.update_balance(ctx.author.id, -tokens_used, "tokens", "$inc")
         #db.update_balance(ctx.author.id, -credits_used, "credits", "$inc")
@@ -679,7 +570,7 @@ class TowerCog(commands.Cog):
             
             # Refund the bet if game creation fails
             db = Users()
-            db.update_balance(ctx.author.id, tokens_used, "points", "$inc")
+            await db.update_balance(ctx.author.id, tokens_used, "points", "$inc")
             
             # Delete loading message and show error
             try:
@@ -705,7 +596,7 @@ class TowerCog(commands.Cog):
                 "user_name": user_name,
                 "timestamp": time.time()
             }
-            server_db.update_history(server_id, server_history)
+            await server_db.update_history(server_id, server_history)
         except Exception as e:
             print(f"Error updating server history: {e}")
 
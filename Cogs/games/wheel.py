@@ -1,13 +1,15 @@
 
 import discord
 import asyncio
-import random
 import time
 import os
-import aiohttp
+from Cogs.utils.http_client import http
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users
+from Cogs.utils.settlement import settlement
 from Cogs.utils.emojis import emoji
+from Cogs.utils.spin_engine import WheelEngine
+from Cogs.utils.paytables import WHEEL_COLORS, WHEEL_HOUSE_EDGE
 
 class WheelSelectionView(discord.ui.View):
     def __init__(self, cog, ctx, bet_amount, spins, game_id, timeout=30):
@@ -112,24 +114,8 @@ class WheelCog(commands.Cog):
         self.bot = bot
         self.ongoing_games = {}
         
-        # Define color multipliers with better win chances for players
-        self.colors = {
-            "gray": {"emoji": "⚫", "multiplier": 0, "chance": 58, "name": "BUST"},
-            "yellow": {"emoji": "🟡", "multiplier": 1.5, "chance": 25, "name": "BRONZE"},
-            "red": {"emoji": "🔴", "multiplier": 2.5, "chance": 10, "name": "SILVER"},
-            "blue": {"emoji": "🔵", "multiplier": 4.0, "chance": 5, "name": "GOLD"},
-            "green": {"emoji": "🟢", "multiplier": 8.0, "chance": 1.5, "name": "DIAMOND"},
-            "purple": {"emoji": "🟣", "multiplier": 15.0, "chance": 0.4, "name": "RUBY"},
-            "orange": {"emoji": "🟠", "multiplier": 25.0, "chance": 0.1, "name": "LEGENDARY"}
-        }
-        # Calculate total chance (now uses weighted system for better precision)
-        self.total_chance = 1000  # Using 1000 for precise decimal chances
-        
-        # Convert percentages to weighted ranges for precise probability
-        self.weighted_colors = []
-        for color, data in self.colors.items():
-            weight = int(data["chance"] * 10)  # Convert to integer weights
-            self.weighted_colors.extend([color] * weight)
+        self.colors = WHEEL_COLORS
+        self.engine = WheelEngine(WHEEL_COLORS, WHEEL_HOUSE_EDGE)
 
     async def send_curse_webhook(self, user, game, bet_amount, multiplier):
         """Send curse trigger notification to webhook"""
@@ -151,8 +137,7 @@ class WheelCog(commands.Cog):
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
 
-            async with aiohttp.ClientSession() as session:
-                await session.post(webhook_url, json={"embeds": [embed]})
+            await http.post(webhook_url, json={"embeds": [embed]})
         except Exception as e:
             print(f"Error sending curse webhook: {e}")
 
@@ -240,7 +225,7 @@ class WheelCog(commands.Cog):
             try:
                 if bet_amount.lower() in ["all", "max", "half"]:
                     # For "all", "half", divide by spins to get per-spin amount, then multiply back
-                    user_data = db.fetch_user(ctx.author.id)
+                    user_data = await db.fetch_user(ctx.author.id, "balance")
                     if user_data == False:
                         await loading_message.delete()
                         embed = discord.Embed(
@@ -270,7 +255,7 @@ class WheelCog(commands.Cog):
                     total_bet_needed = bet_amount_value * spins
                     
                 # Check if user has enough for total bet
-                user_data = db.fetch_user(ctx.author.id)
+                user_data = await db.fetch_user(ctx.author.id, "balance")
                 current_balance = user_data.get("points", 0)
                 if current_balance < total_bet_needed:
                     await loading_message.delete()
@@ -282,7 +267,7 @@ class WheelCog(commands.Cog):
                     return await ctx.reply(embed=embed)
                 
                 # Deduct the total amount
-                db.update_balance(ctx.author.id, -total_bet_needed, "points", "$inc")
+                await db.update_balance(ctx.author.id, -total_bet_needed, "points", "$inc")
                 tokens_used = 0
                 
             except ValueError:
@@ -328,12 +313,7 @@ class WheelCog(commands.Cog):
         if game_id in self.ongoing_games:
             del self.ongoing_games[game_id]
 
-        # Calculate results for all spins with improved house edge (8%)
-        house_edge = 0.08  # 8% house edge for better player experience
-
         # Store results for all spins
-        spin_results = []
-        total_winnings = 0
         bet_total = bet_amount  # Each spin uses the full bet amount
         total_bet_amount = bet_total * spins  # Total deducted is bet × spins
 
@@ -353,43 +333,12 @@ class WheelCog(commands.Cog):
                 0
             )
 
-        # Calculate results for each spin instantly
-        for spin_num in range(spins):
-            # Use new weighted random selection for precise probabilities
-            if force_loss and spin_num == 0:  # Force first spin to be BUST if cursed
-                result_color = "gray"  # Force BUST
-            else:
-                result_color = random.choice(self.weighted_colors)
-
-            # Get base multiplier for the result
-            base_multiplier = self.colors[result_color]["multiplier"]
-            result_emoji = self.colors[result_color]["emoji"]
-            result_name = self.colors[result_color]["name"]
-
-            # Apply house edge to multiplier (15% reduction on all wins)
-            if base_multiplier > 0:
-                result_multiplier = base_multiplier * (1 - house_edge)
-            else:
-                result_multiplier = 0  # BUST stays 0
-
-            # Calculate winnings for this spin
-            winnings = bet_total * result_multiplier
-            
-            # Keep original display values for consistency
-            display_multiplier = result_multiplier
-            display_name = result_name
-            total_winnings += winnings
-
-            # Add this result to our results list
-            spin_results.append({
-                "color": result_color,
-                "emoji": result_emoji,
-                "multiplier": display_multiplier,
-                "actual_multiplier": result_multiplier,  # Keep actual for calculations
-                "winnings": winnings,
-                "spin_number": spin_num + 1,
-                "name": display_name
-            })
+        # Spin every color at once
+        spun = self.engine.spin(spins)
+        if force_loss:
+            spun[0] = self.engine.colors.index("gray")  # Force first spin to be BUST if cursed
+        spin_results = self.engine.results(spun, bet_total)
+        total_winnings = sum(result["winnings"] for result in spin_results)
 
         # Show instant results with excitement
         await self.show_wheel_results(ctx, message, spin_results, bet_total, total_bet_amount, total_winnings, spins)
@@ -465,11 +414,11 @@ class WheelCog(commands.Cog):
                 inline=False
             )
 
-        # Always credit individual wins regardless of net result
-        db = Users()
-        if total_winnings > 0:
-            # Credit the total winnings
-            db.update_balance(ctx.author.id, total_winnings, "points", "$inc")
+        # Settle every spin with one credit
+        await settlement.settle_rounds(ctx.author, ctx.guild, "wheel", [(bet_total, result["winnings"]) for result in spin_results], {
+            "spins": spins,
+            "colors": [result["name"] for result in spin_results],
+        })
 
         # Add overall result field
         if total_winnings > 0:
@@ -492,93 +441,6 @@ class WheelCog(commands.Cog):
                 inline=False
             )
 
-        # Process stats and history (always process, regardless of net result)
-        server_db = Servers()
-        server_data = server_db.fetch_server(ctx.guild.id) if ctx.guild else None
-
-        # Track wins and losses for stats
-        wins_count = 0
-        losses_count = 0
-        house_profit = 0
-
-        # History entries for batch update
-        history_entries = []
-        server_history_entries = []
-
-        for i, result in enumerate(spin_results):
-            # Process individual spin history
-            if result["multiplier"] > 0:
-                # This spin was a win
-                wins_count += 1
-                history_entry = {
-                    "type": "win",
-                    "game": "wheel",
-                    "bet": bet_total,
-                    "amount": result["winnings"],
-                    "multiplier": result.get("actual_multiplier", result["multiplier"]),
-                    "timestamp": int(time.time()) + i
-                }
-
-                if server_data:
-                    server_bet_history_entry = {
-                        "type": "win",
-                        "game": "wheel",
-                        "user_id": ctx.author.id,
-                        "user_name": ctx.author.name,
-                        "bet": bet_total,
-                        "amount": result["winnings"],
-                        "multiplier": result.get("actual_multiplier", result["multiplier"]),
-                        "timestamp": int(time.time()) + i
-                    }
-                    server_history_entries.append(server_bet_history_entry)
-                    house_profit += bet_total - result["winnings"]
-            else:
-                # This spin was a loss
-                losses_count += 1
-                history_entry = {
-                    "type": "loss",
-                    "game": "wheel",
-                    "bet": bet_total,
-                    "amount": bet_total,
-                    "multiplier": result.get("actual_multiplier", result["multiplier"]),
-                    "timestamp": int(time.time()) + i
-                }
-
-                if server_data:
-                    server_bet_history_entry = {
-                        "type": "loss",
-                        "game": "wheel",
-                        "user_id": ctx.author.id,
-                        "user_name": ctx.author.name,
-                        "bet": bet_total,
-                        "amount": bet_total,
-                        "multiplier": result.get("actual_multiplier", result["multiplier"]),
-                        "timestamp": int(time.time()) + i
-                    }
-                    server_history_entries.append(server_bet_history_entry)
-                    house_profit += bet_total
-
-            history_entries.append(history_entry)
-
-        # Update user's stats with all spins
-        db.collection.update_one(
-            {"discord_id": ctx.author.id},
-            {
-                "$push": {"history": {"$each": history_entries, "$slice": -100}},
-                "$inc": {
-                    "total_played": spins,
-                    "total_won": wins_count,
-                    "total_lost": losses_count,
-                    "total_earned": total_winnings,
-                    "total_spent": total_bet_amount - total_winnings if total_winnings < total_bet_amount else 0
-                }
-            }
-        )
-
-        # Update server data with all spins
-        if server_data and server_history_entries:
-            server_db.update_server_profit(ctx, ctx.guild.id, house_profit, game="wheel")
-
         embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1345317103158431805.png")
         embed.set_footer(text="🎰 BetSync Casino • Instant action awaits!", icon_url=self.bot.user.avatar.url)
 
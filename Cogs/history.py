@@ -1,101 +1,63 @@
 
 import discord
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, BetHistory
 from Cogs.utils.emojis import emoji
 import datetime
 
 class HistoryView(discord.ui.View):
-    def __init__(self, bot, user, history_data, author_id, category="all", page=0):
+    # Entry types shown under each category button
+    CATEGORY_TYPES = {
+        "all": None,
+        "win": ["win"],
+        "loss": ["loss"],
+        "push": ["push", "draw"],
+    }
+
+    def __init__(self, bot, user, author_id, category="all"):
         super().__init__(timeout=120)
         self.bot = bot
         self.user = user
-        self.history_data = history_data
         self.author_id = author_id
         self.category = category
-        self.page = page
+        self.page = 0
         self.per_page = 10
-        self.max_pages = 0
+        self.history_data = []
         self.message = None
 
-        # Calculate the initial max pages
-        self._calculate_max_pages()
-
-        # Add the buttons to the view
+        # Cursor each visited page starts after; pages are fetched by keyset, not offset
+        self._page_cursors = [None]
+        self._next_cursor = None
+
+    async def load_page(self):
+        """Fetch the current page for the selected category and rebuild the buttons"""
+        records, self._next_cursor = await BetHistory().fetch_page(
+            "user_id",
+            self.user.id,
+            types=self.CATEGORY_TYPES[self.category],
+            after=self._page_cursors[self.page],
+            limit=self.per_page
+        )
+        self.history_data = [record["entry"] for record in records]
         self._update_buttons()
 
-    def _calculate_max_pages(self):
-        """Calculate the maximum number of pages for the current category"""
-        filtered = self._get_filtered_history(full=True)
-        self.max_pages = max(1, (len(filtered) + self.per_page - 1) // self.per_page)
-
     def _update_buttons(self):
         """Update all buttons in the view based on current state"""
         self.clear_items()
 
         # Add category buttons
         self.add_item(discord.ui.Button(label="All", style=discord.ButtonStyle.primary if self.category == "all" else discord.ButtonStyle.secondary, custom_id="all"))
-        self.add_item(discord.ui.Button(label="Deposits", style=discord.ButtonStyle.primary if self.category == "deposit" else discord.ButtonStyle.secondary, custom_id="deposit"))
-        self.add_item(discord.ui.Button(label="Withdrawals", style=discord.ButtonStyle.primary if self.category == "withdraw" else discord.ButtonStyle.secondary, custom_id="withdraw"))
         self.add_item(discord.ui.Button(label="Wins", style=discord.ButtonStyle.primary if self.category == "win" else discord.ButtonStyle.secondary, custom_id="win"))
         self.add_item(discord.ui.Button(label="Losses", style=discord.ButtonStyle.primary if self.category == "loss" else discord.ButtonStyle.secondary, custom_id="loss"))
         self.add_item(discord.ui.Button(label="Pushes", style=discord.ButtonStyle.primary if self.category == "push" else discord.ButtonStyle.secondary, custom_id="push"))
 
         # Add pagination buttons
         self.add_item(discord.ui.Button(emoji="⬅️", style=discord.ButtonStyle.secondary, custom_id="prev", disabled=self.page == 0))
-        self.add_item(discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary, custom_id="next", disabled=self.page >= self.max_pages - 1))
-
-    def _get_filtered_history(self, full=False):
-        """Get filtered history based on the selected category"""
-        if self.category == "all":
-            filtered = self.history_data
-        elif self.category == "deposit":
-            # Handle all deposit types (btc_deposit, ltc_deposit, eth_deposit, etc.)
-            filtered = [item for item in self.history_data if item.get("type", "").endswith("_deposit") or item.get("type") == "deposit"]
-        elif self.category == "withdraw":
-            # Handle all withdrawal types (btc_withdraw, ltc_withdraw, etc.)
-            filtered = [item for item in self.history_data if item.get("type", "").endswith("_withdraw") or item.get("type") == "withdraw"]
-        elif self.category == "push":
-            # Handle both "push" and "draw" types for pushes
-            filtered = [item for item in self.history_data if item.get("type") in ["push", "draw"]]
-        else:
-            filtered = [item for item in self.history_data if item.get("type") == self.category]
-
-        # Sort by timestamp (most recent first)
-        def get_timestamp(item):
-            timestamp = item.get("timestamp", 0)
-            if isinstance(timestamp, str):
-                try:
-                    # Try to parse ISO format timestamps
-                    if 'T' in timestamp or 'Z' in timestamp:
-                        if timestamp.endswith('Z'):
-                            timestamp = timestamp[:-1] + '+00:00'
-                        dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        return int(dt.timestamp())
-                    elif timestamp.isdigit():
-                        return int(timestamp)
-                    else:
-                        return 0
-                except:
-                    return 0
-            elif isinstance(timestamp, (int, float)):
-                return int(timestamp)
-            else:
-                return 0
-
-        filtered.sort(key=get_timestamp, reverse=True)
-
-        if not full:
-            # Get items for current page
-            start_idx = self.page * self.per_page
-            end_idx = min(start_idx + self.per_page, len(filtered))
-            return filtered[start_idx:end_idx]
-
-        return filtered
+        self.add_item(discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary, custom_id="next", disabled=self._next_cursor is None))
 
     def create_embed(self):
-        """Create the history embed with the filtered data"""
-        filtered_data = self._get_filtered_history()
+        """Create the history embed for the loaded page"""
+        filtered_data = self.history_data
 
         # Prepare embed
         embed = discord.Embed(
@@ -168,7 +130,7 @@ class HistoryView(discord.ui.View):
                 embed.add_field(name=field_name, value=field_value, inline=False)
 
         # Add page info
-        embed.set_footer(text=f"Page {self.page + 1}/{self.max_pages} • BetSync Casino", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
+        embed.set_footer(text=f"Page {self.page + 1} • BetSync Casino", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
         
         # Set thumbnail to user's avatar
         if self.user.avatar:
@@ -188,37 +150,22 @@ class HistoryView(discord.ui.View):
         custom_id = interaction.data.get("custom_id")
         
         # Handle the different button actions
-        if custom_id == "all":
-            self.category = "all"
-            self.page = 0
-        elif custom_id == "deposit":
-            self.category = "deposit"
-            self.page = 0
-        elif custom_id == "withdraw":
-            self.category = "withdraw"
-            self.page = 0
-        elif custom_id == "win":
-            self.category = "win"
-            self.page = 0
-        elif custom_id == "loss":
-            self.category = "loss"
-            self.page = 0
-        elif custom_id == "push":
-            self.category = "push"
+        if custom_id in self.CATEGORY_TYPES:
+            self.category = custom_id
             self.page = 0
+            self._page_cursors = [None]
         elif custom_id == "prev":
             if self.page > 0:
                 self.page -= 1
         elif custom_id == "next":
-            if self.page < self.max_pages - 1:
+            if self._next_cursor is not None:
                 self.page += 1
-                
-        # Recalculate max pages
-        self._calculate_max_pages()
-        
-        # Update buttons
-        self._update_buttons()
-        
+                del self._page_cursors[self.page:]
+                self._page_cursors.append(self._next_cursor)
+
+        # Fetch the page and update buttons
+        await self.load_page()
+
         # Update the message
         await interaction.response.edit_message(embed=self.create_embed(), view=self)
         return False  # Return False to prevent default handling
@@ -257,7 +204,7 @@ class History(commands.Cog):
                 user = ctx.author
 
             db = Users()
-            user_data = db.fetch_user(user.id)
+            user_data = await db.fetch_user(user.id, "balance")
 
             if user_data == False:
                 embed = discord.Embed(
@@ -268,15 +215,9 @@ class History(commands.Cog):
                 await loading_message.delete()
                 return await ctx.reply(embed=embed)
 
-            # Get history from user data
-            history_data = user_data.get("history", [])
-            
-            # Ensure history_data is a list
-            if not isinstance(history_data, list):
-                history_data = []
-                
-            # Create view with buttons
-            view = HistoryView(self.bot, user, history_data, ctx.author.id)
+            # Create view with buttons and load the first page
+            view = HistoryView(self.bot, user, ctx.author.id)
+            await view.load_page()
 
             # Send initial embed
             embed = view.create_embed()
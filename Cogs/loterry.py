@@ -1,29 +1,27 @@
-import os
 import discord
 import datetime
 import time
 import random
 import asyncio
 from discord.ext import commands, tasks
-from Cogs.utils.mongo import Users, MongoClient
+from Cogs.utils.mongo import Users, mongodb, usernames
 from Cogs.utils.emojis import emoji
 from colorama import Fore
 
 class Lottery(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.lottery_collection = MongoClient(os.getenv("MONGO"))["BetSync"]["lottery"]
+        self.lottery_collection = mongodb["BetSync"]["lottery"]
         self.current_lottery = None
         self.lottery_cooldown = {}
-        self.initialize_lottery()
         self.lottery_reset.start()
 
     def cog_unload(self):
         self.lottery_reset.cancel()
 
-    def initialize_lottery(self):
+    async def initialize_lottery(self):
         """Initialize or fetch the current lottery"""
-        current = self.lottery_collection.find_one({"status": "active"})
+        current = await self.lottery_collection.find_one({"status": "active"})
         
         if not current:
             # Create a new lottery if none is active
@@ -36,7 +34,7 @@ class Lottery(commands.Cog):
                 "draw_time": next_draw_time,
                 "winner": None
             }
-            self.lottery_collection.insert_one(new_lottery)
+            await self.lottery_collection.insert_one(new_lottery)
             self.current_lottery = new_lottery
         else:
             self.current_lottery = current
@@ -58,7 +56,7 @@ class Lottery(commands.Cog):
         """Check if it's time to draw the lottery"""
         try:
             if not self.current_lottery:
-                self.initialize_lottery()
+                await self.initialize_lottery()
                 return
                 
             now = int(time.time())
@@ -66,13 +64,14 @@ class Lottery(commands.Cog):
             # If current time has passed the draw time
             if now >= self.current_lottery["draw_time"]:
                 await self.draw_lottery()
-                self.initialize_lottery()  # Create new lottery
+                await self.initialize_lottery()  # Create new lottery
         except Exception as e:
             print(f"{Fore.RED}[-] Lottery reset error: {e}")
 
     @lottery_reset.before_loop
     async def before_lottery_reset(self):
         await self.bot.wait_until_ready()
+        await self.initialize_lottery()
 
     async def draw_lottery(self):
         """Draw the lottery and announce the winner"""
@@ -84,7 +83,7 @@ class Lottery(commands.Cog):
         
         if not entries:
             # No entries, no winner
-            self.lottery_collection.update_one(
+            await self.lottery_collection.update_one(
                 {"_id": self.current_lottery["_id"]},
                 {"$set": {"status": "completed", "winner": None}}
             )
@@ -110,17 +109,16 @@ class Lottery(commands.Cog):
         # Draw a winner
         winner_id = random.choice(weighted_entries)
         winner_entries = user_entries[winner_id]
-        winner_user = await self.bot.fetch_user(winner_id)
         
         # Update lottery record
-        self.lottery_collection.update_one(
+        await self.lottery_collection.update_one(
             {"_id": self.current_lottery["_id"]},
             {
                 "$set": {
                     "status": "completed", 
                     "winner": {
                         "user_id": winner_id,
-                        "username": winner_user.name if winner_user else "Unknown",
+                        "username": await usernames.resolve(winner_id),
                         "entries": winner_entries,
                         "winnings": winning_amount
                     }
@@ -130,7 +128,7 @@ class Lottery(commands.Cog):
         
         # Update winner's balance
         db = Users()
-        db.update_balance(winner_id, winning_amount, "tokens", "$inc")
+        await db.update_balance(winner_id, winning_amount, "tokens", "$inc")
         
         # Add to winner's history
         history_entry = {
@@ -139,10 +137,7 @@ class Lottery(commands.Cog):
             "amount": winning_amount,
             "timestamp": int(time.time())
         }
-        db.collection.update_one(
-            {"discord_id": winner_id},
-            {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}
-        )
+        await db.update_history(winner_id, history_entry)
         
         # No longer announcing to all servers, only DMing the winner
         
@@ -163,8 +158,8 @@ class Lottery(commands.Cog):
             )
             dm_embed.set_footer(text="BetSync Casino • Thanks for playing!")
             
-            if winner_user:
-                await winner_user.send(embed=dm_embed)
+            winner_user = self.bot.get_user(winner_id) or await self.bot.fetch_user(winner_id)
+            await winner_user.send(embed=dm_embed)
         except Exception as e:
             print(f"Failed to DM lottery winner {winner_id}: {e}")
 
@@ -198,7 +193,7 @@ class Lottery(commands.Cog):
     async def process_ticket_purchase(self, ctx, quantity=1):
         """Process a ticket purchase for the lottery"""
         if not self.current_lottery:
-            self.initialize_lottery()
+            await self.initialize_lottery()
             
         if ctx.author.id in self.lottery_cooldown and time.time() - self.lottery_cooldown[ctx.author.id] < 5:
             embed = discord.Embed(
@@ -214,7 +209,7 @@ class Lottery(commands.Cog):
         
         # Process payment through currency helper
         db = Users()
-        balance = db.fetch_user(ctx.author.id)
+        balance = await db.fetch_user(ctx.author.id)
         
         if not balance:
             embed = discord.Embed(
@@ -232,11 +227,11 @@ class Lottery(commands.Cog):
         if tokens_balance >= cost:
             # Use tokens
             currency_used = "tokens"
-            success = db.update_balance(ctx.author.id, -cost, currency_used, "$inc")
+            success = await db.update_balance(ctx.author.id, -cost, currency_used, "$inc")
         elif credits_balance >= cost:
             # Use credits
             currency_used = "credits"
-            success = db.update_balance(ctx.author.id, -cost, currency_used, "$inc")
+            success = await db.update_balance(ctx.author.id, -cost, currency_used, "$inc")
         else:
             # Not enough funds
             embed = discord.Embed(
@@ -268,7 +263,7 @@ class Lottery(commands.Cog):
             new_entries.append(entry)
             
         # Update the lottery in the database
-        self.lottery_collection.update_one(
+        await self.lottery_collection.update_one(
             {"_id": self.current_lottery["_id"]},
             {
                 "$push": {"entries": {"$each": new_entries}},
@@ -289,7 +284,7 @@ class Lottery(commands.Cog):
     async def loterry(self, ctx, action=None, quantity: int = 1):
         """View or participate in the current lottery"""
         if not self.current_lottery:
-            self.initialize_lottery()
+            await self.initialize_lottery()
             
         if action and action.lower() in ["buy", "purchase"]:
             # Validate quantity
@@ -399,7 +394,7 @@ class Lottery(commands.Cog):
             )
             
             # Get last lottery winner
-            last_lottery = self.lottery_collection.find_one(
+            last_lottery = await self.lottery_collection.find_one(
                 {"status": "completed", "winner": {"$ne": None}},
                 sort=[("draw_time", -1)]
             )
@@ -422,11 +417,11 @@ class Lottery(commands.Cog):
     async def loterryhistory(self, ctx):
         """View lottery history"""
         # Get the last 5 completed lotteries
-        history = list(self.lottery_collection.find(
+        history = await self.lottery_collection.find(
             {"status": "completed"},
             sort=[("draw_time", -1)],
             limit=5
-        ))
+        ).to_list(None)
         
         if not history:
             embed = discord.Embed(
@@ -3,13 +3,11 @@
 import discord
 from discord.ext import commands, tasks
 import os
-import requests
 import qrcode
 import io
 import asyncio
 import datetime
 import time
-import aiohttp
 import json
 import re
 from dotenv import load_dotenv
@@ -21,6 +19,9 @@ from Cogs.utils.mongo import Users
 from Cogs.utils.notifier import Notifier
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import get_crypto_price
+from Cogs.utils.http_client import http
+from Cogs.utils.assets import atlas
+from Cogs.utils.qr_cache import qr_codes
 
 # Load environment variables
 load_dotenv()
@@ -59,16 +60,16 @@ def generate_qr_code(address: str, username: str):
     # 2. Prepare fonts and text
     try:
         # Adjust font paths if necessary relative to the workspace root
-        title_font = ImageFont.truetype("Helvetica-Bold.ttf", 30)
-        subtitle_font = ImageFont.truetype("Helvetica.ttf", 18)
-        brand_font = ImageFont.truetype("Helvetica-Bold.ttf", 36)
+        title_font = atlas.font("Helvetica-Bold.ttf", 30)
+        subtitle_font = atlas.font("Helvetica.ttf", 18)
+        brand_font = atlas.font("Helvetica-Bold.ttf", 36)
     except IOError:
         print(f"{Fore.YELLOW}[!] Warning: Font files not found. Using default font.{Style.RESET_ALL}")
         # Fallback to default font if specific fonts aren't found
         try:
-            title_font = ImageFont.truetype("arial.ttf", 30) # Try Arial as fallback
-            subtitle_font = ImageFont.truetype("arial.ttf", 18)
-            brand_font = ImageFont.truetype("arial.ttf", 36)
+            title_font = atlas.font("arial.ttf", 30) # Try Arial as fallback
+            subtitle_font = atlas.font("arial.ttf", 18)
+            brand_font = atlas.font("arial.ttf", 36)
         except IOError:
              title_font = ImageFont.load_default()
              subtitle_font = ImageFont.load_default()
@@ -188,7 +189,7 @@ class DepositView(discord.ui.View):
             return
 
         # Check if user's primary currency is set to LTC (fetch fresh data)
-        fresh_user_data = self.cog.users_db.fetch_user(self.user_id)
+        fresh_user_data = await self.cog.users_db.fetch_user(self.user_id)
         if not fresh_user_data:
             await interaction.response.send_message("Error: User data not found.", ephemeral=True)
             return
@@ -253,7 +254,7 @@ class DepositView(discord.ui.View):
                     )
 
                 # Show new balance
-                updated_user = self.cog.users_db.fetch_user(self.user_id)
+                updated_user = await self.cog.users_db.fetch_user(self.user_id)
                 ltc_balance = updated_user.get("wallet", {}).get("LTC", "N/A") if updated_user else "N/A"
                 main_embed.add_field(name="New LTC Balance", value=f"<:ltc:1339343445675868191> {ltc_balance:,.8f} LTC", inline=True)
                 
@@ -346,7 +347,7 @@ class LtcDeposit(commands.Cog):
     async def _get_next_address_index(self, user_id: int) -> int:
         """Finds the next unused address index for a user."""
         # This is a simple approach. A more robust way would be to query the max index used.
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if user_data and 'ltc_address_index' in user_data:
             # If index exists, assume the next one is needed for a *new* address generation request.
             # However, for deposits, we usually reuse the *last* generated address.
@@ -362,7 +363,7 @@ class LtcDeposit(commands.Cog):
 
     async def _generate_ltc_address(self, user_id: int) -> tuple[str | None, str | None]:
         """Generates or retrieves a unique LTC deposit address for the user."""
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
 
         # 1. Check if address already exists
         if user_data and user_data.get("ltc_address"):
@@ -381,7 +382,7 @@ class LtcDeposit(commands.Cog):
         try:
             # --- Atomic index generation to prevent race conditions ---
             # Use MongoDB's findOneAndUpdate with increment to atomically get next index
-            counter_result = self.users_db.collection.find_one_and_update(
+            counter_result = await self.users_db.collection.find_one_and_update(
                 {"_id": "ltc_address_counter"},
                 {"$inc": {"next_index": 1}},
                 upsert=True,
@@ -392,7 +393,7 @@ class LtcDeposit(commands.Cog):
                 next_index = counter_result["next_index"]
             else:
                 # Fallback to old method if counter document creation fails
-                highest_index_user = self.users_db.collection.find_one(
+                highest_index_user = await self.users_db.collection.find_one(
                     {"ltc_address_index": {"$exists": True}},
                     sort=[("ltc_address_index", -1)]
                 )
@@ -455,12 +456,12 @@ class LtcDeposit(commands.Cog):
                  print(f"{Fore.RED}[!] Error: Attempted to generate address for non-existent user {user_id}. Registering user first.{Style.RESET_ALL}")
                  # You might need to call the registration logic here or handle it upstream
                  # For now, let's assume the user exists and update fails gracefully if not.
-                 result = self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                 result = await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
                  if result.matched_count == 0:
                       print(f"{Fore.RED}[!] Failed to store address for user {user_id} - user document not found.{Style.RESET_ALL}")
                       return None, "User document not found to store address."
             else:
-                 self.users_db.collection.update_one({"discord_id": user_id}, update_data)
+                 await self.users_db.collection.update_one({"discord_id": user_id}, update_data)
 
             print(f"{Fore.GREEN}[+] Generated LTC address {address} (Index: {next_index}) for user {user_id}{Style.RESET_ALL}")
             return address, None
@@ -476,38 +477,35 @@ class LtcDeposit(commands.Cog):
         """Checks Blockstream API for confirmed deposits to the address."""
         try:
             # Fetch user data at the beginning
-            user_data = self.users_db.fetch_user(user_id)
+            user_data = await self.users_db.fetch_user(user_id)
             if not user_data:
                  print(f"{Fore.RED}[!] User data not found for user {user_id} at start of deposit check.{Style.RESET_ALL}")
                  return "error", {"error": "User data not found."}
 
             try:
-                timeout = aiohttp.ClientTimeout(total=30)  # 30 second timeout
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    # Get address transactions from Mempool.space
-                    txs_url = f"{MEMPOOL_API_URL}/address/{address}/txs"
-                    async with session.get(txs_url) as response:
-                        if response.status == 429:  # Rate limited
-                            print(f"{Fore.YELLOW}[!] Rate limited by Mempool API for {address}. Waiting before retry.{Style.RESET_ALL}")
-                            await asyncio.sleep(5)  # Wait 5 seconds before retrying
-                            return "error", {"error": "API rate limited. Please try again in a moment."}
-                        elif response.status != 200:
-                            print(f"{Fore.RED}[!] Mempool API Error ({response.status}) fetching transactions for {address}. Response: {await response.text()}{Style.RESET_ALL}")
-                            return "error", {"error": f"API Error ({response.status}) fetching transactions."}
-
-                        try:
-                            transactions = await response.json()
-                        except Exception as e:
-                            print(f"{Fore.RED}[!] Error parsing transactions for {address}: {e}{Style.RESET_ALL}")
-                            return "error", {"error": "Failed to parse transaction data"}
-
-                    # Get current block height
-                    tip_url = f"{MEMPOOL_API_URL}/blocks/tip/height"
-                    async with session.get(tip_url) as tip_response:
-                        if tip_response.status != 200:
-                            print(f"{Fore.RED}[!] API Error ({tip_response.status}) fetching block height.{Style.RESET_ALL}")
-                            return "error", {"error": f"API Error ({tip_response.status}) fetching block height."}
-                        current_block_height = int(await tip_response.text())
+                # Get address transactions from Mempool.space (rate limits are retried by the client)
+                txs_url = f"{MEMPOOL_API_URL}/address/{address}/txs"
+                response = await http.get(txs_url, timeout=30)
+                if response.status == 429:  # Still rate limited after retries
+                    print(f"{Fore.YELLOW}[!] Rate limited by Mempool API for {address}.{Style.RESET_ALL}")
+                    return "error", {"error": "API rate limited. Please try again in a moment."}
+                elif response.status != 200:
+                    print(f"{Fore.RED}[!] Mempool API Error ({response.status}) fetching transactions for {address}. Response: {response.text()}{Style.RESET_ALL}")
+                    return "error", {"error": f"API Error ({response.status}) fetching transactions."}
+
+                try:
+                    transactions = response.json()
+                except Exception as e:
+                    print(f"{Fore.RED}[!] Error parsing transactions for {address}: {e}{Style.RESET_ALL}")
+                    return "error", {"error": "Failed to parse transaction data"}
+
+                # Get current block height
+                tip_url = f"{MEMPOOL_API_URL}/blocks/tip/height"
+                tip_response = await http.get(tip_url, timeout=30)
+                if tip_response.status != 200:
+                    print(f"{Fore.RED}[!] API Error ({tip_response.status}) fetching block height.{Style.RESET_ALL}")
+                    return "error", {"error": f"API Error ({tip_response.status}) fetching block height."}
+                current_block_height = int(tip_response.text())
 
                 if not transactions:
                     return "no_new", {}
@@ -606,12 +604,12 @@ class LtcDeposit(commands.Cog):
                 # --- Database Update with Atomic Duplicate Prevention ---
                 # Ensure wallet structure exists
                 if "wallet" not in user_data:
-                    self.users_db.collection.update_one(
+                    await self.users_db.collection.update_one(
                         {"discord_id": user_id},
                         {"$set": {"wallet": {}}}
                     )
                 if "LTC" not in user_data.get("wallet", {}):
-                    self.users_db.collection.update_one(
+                    await self.users_db.collection.update_one(
                         {"discord_id": user_id},
                         {"$set": {"wallet.LTC": 0}}
                     )
@@ -621,7 +619,7 @@ class LtcDeposit(commands.Cog):
 
                 # Use atomic operation to prevent duplicate processing
                 # This will only update if the txid is NOT already in processed_ltc_txids
-                update_result_wallet = self.users_db.collection.update_one(
+                update_result_wallet = await self.users_db.collection.update_one(
                     {
                         "discord_id": user_id,
                         "processed_ltc_txids": {"$ne": txid}  # Only update if txid is NOT already processed
@@ -647,7 +645,7 @@ class LtcDeposit(commands.Cog):
                 ltc_price = await get_crypto_price('litecoin')
                 usd_value = amount_crypto * ltc_price if ltc_price else 0
                 if usd_value > 0:
-                    self.users_db.collection.update_one(
+                    await self.users_db.collection.update_one(
                         {"discord_id": user_id},
                         {"$inc": {"total_deposit_amount_usd": usd_value}}
                     )
@@ -667,7 +665,7 @@ class LtcDeposit(commands.Cog):
                     "confirmations": confirmations,
                     "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
                 }
-                history_update_success = self.users_db.update_history(user_id, history_entry)
+                history_update_success = await self.users_db.update_history(user_id, history_entry)
                 if not history_update_success:
                      print(f"{Fore.YELLOW}[!] Failed to update history for user {user_id}, txid {txid}. Balance was updated.{Style.RESET_ALL}")
                      # Balance is already updated, log this inconsistency
@@ -705,7 +703,7 @@ class LtcDeposit(commands.Cog):
             # --- Loop finished ---
             if new_deposit_processed_in_this_check:
                 # Get updated user data to show accurate totals
-                updated_user_data = self.users_db.fetch_user(user_id)
+                updated_user_data = await self.users_db.fetch_user(user_id)
                 if not updated_user_data:
                     return "error", {"error": "Could not fetch updated user data after processing."}
                 
@@ -767,7 +765,7 @@ class LtcDeposit(commands.Cog):
 
     async def _show_deposit_history(self, user_id: int) -> discord.Embed:
         """Fetches and formats the user's LTC deposit history."""
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if not user_data:
             return discord.Embed(title="Error", description="Could not fetch user data.", color=discord.Color.red())
 
@@ -820,7 +818,7 @@ class LtcDeposit(commands.Cog):
     async def deposit_ltc(self, ctx, currency: str = None):
         """Handles cryptocurrency deposits"""
         # Ensure user is registered in database
-        user_data = self.users_db.fetch_user(ctx.author.id)
+        user_data = await self.users_db.fetch_user(ctx.author.id)
         if not user_data:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | User Not Registered",
@@ -896,7 +894,7 @@ class LtcDeposit(commands.Cog):
 
         # Generate styled QR Code in thread
         try:
-            qr_buffer = await asyncio.to_thread(generate_qr_code, address, ctx.author.name) # Pass address and username
+            qr_buffer = await qr_codes.get("LTC", address, ctx.author.name, generate_qr_code, address, ctx.author.name) # Pass address and username
             qr_file = discord.File(qr_buffer, filename="ltc_deposit_qr.png")
         except Exception as qr_err:
              print(f"{Fore.RED}[!] Failed to generate QR code for {address}: {qr_err}{Style.RESET_ALL}")
@@ -52,7 +52,7 @@ class Profile(commands.Cog):
 
         # Fetch user data from database
         db = Users()
-        user_data = db.fetch_user(user.id)
+        user_data = await db.fetch_user(user.id)
 
         if user_data == False:
             # User not found in database
@@ -1,13 +1,12 @@
 
 import discord
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, Servers, mongodb
 from Cogs.utils.emojis import emoji
 import os
 import datetime
 import json
 from dotenv import load_dotenv
-from pymongo import MongoClient
 
 load_dotenv()
 
@@ -55,7 +54,7 @@ class ReferralView(discord.ui.View):
         
         try:
             # Get top 10 users by current invites
-            leaderboard = list(self.cog.referral_collection.find().sort("current_invites", -1).limit(10))
+            leaderboard = await self.cog.referral_collection.find().sort("current_invites", -1).limit(10).to_list(None)
             
             if not leaderboard:
                 embed = discord.Embed(
@@ -115,7 +114,7 @@ class ReferralView(discord.ui.View):
             user_in_top_10 = any(data.get("user_id") == target_user_id for data in leaderboard[:10])
             
             if not user_in_top_10:
-                all_users = list(self.cog.referral_collection.find().sort("current_invites", -1))
+                all_users = await self.cog.referral_collection.find().sort("current_invites", -1).to_list(None)
                 user_rank = next((i + 1 for i, data in enumerate(all_users) if data.get("user_id") == target_user_id), None)
                 
                 if user_rank:
@@ -193,10 +192,10 @@ class ReferralClaimView(discord.ui.View):
         try:
             # Add points to user balance
             users_db = Users()
-            users_db.update_balance(self.user_id, self.ltc_points, "points", "$inc")
+            await users_db.update_balance(self.user_id, self.ltc_points, "points", "$inc")
             
             # Reset LTC points in database
-            self.cog.referral_collection.update_one(
+            await self.cog.referral_collection.update_one(
                 {"user_id": self.user_id, "type": "rewards"},
                 {"$set": {"ltc_points": 0}}
             )
@@ -241,10 +240,10 @@ class ReferralClaimView(discord.ui.View):
         try:
             # Add points to user balance
             users_db = Users()
-            users_db.update_balance(self.user_id, self.btc_points, "points", "$inc")
+            await users_db.update_balance(self.user_id, self.btc_points, "points", "$inc")
             
             # Reset BTC points in database
-            self.cog.referral_collection.update_one(
+            await self.cog.referral_collection.update_one(
                 {"user_id": self.user_id, "type": "rewards"},
                 {"$set": {"btc_points": 0}}
             )
@@ -276,7 +275,7 @@ class ReferralsCog(commands.Cog):
         self.main_server_id = int(os.environ.get('MAINSERVER_ID', 0))
         
         # Initialize referral tracking database
-        self.mongodb = MongoClient(os.environ["MONGO"])
+        self.mongodb = mongodb
         self.db = self.mongodb["BetSync"]
         self.referral_collection = self.db["referrals"]
         
@@ -308,7 +307,7 @@ class ReferralsCog(commands.Cog):
         
         try:
             # Get referral data from database
-            referral_data = self.referral_collection.find_one({"user_id": target_user.id})
+            referral_data = await self.referral_collection.find_one({"user_id": target_user.id})
             
             if not referral_data:
                 # Initialize referral data if not exists
@@ -322,7 +321,7 @@ class ReferralsCog(commands.Cog):
                     "left_user_ids": [],
                     "rejoined_user_ids": []
                 }
-                self.referral_collection.insert_one(referral_data)
+                await self.referral_collection.insert_one(referral_data)
             
             # Extract statistics
             total_joins = referral_data.get("total_joins", 0)
@@ -388,7 +387,7 @@ class ReferralsCog(commands.Cog):
             # Leaderboard position
             try:
                 # Get all users sorted by current invites
-                leaderboard = list(self.referral_collection.find().sort("current_invites", -1))
+                leaderboard = await self.referral_collection.find().sort("current_invites", -1).to_list(None)
                 user_rank = next((i + 1 for i, data in enumerate(leaderboard) if data["user_id"] == target_user.id), "N/A")
                 
                 embed.add_field(
@@ -414,7 +413,7 @@ class ReferralsCog(commands.Cog):
                         total_won = 0
                         
                         for user_id in invited_user_ids:
-                            user_data = users_db.fetch_user(user_id)
+                            user_data = await users_db.fetch_user(user_id)
                             if user_data:
                                 total_wagered += user_data.get("total_spent", 0)
                                 total_won += user_data.get("total_earned", 0)
@@ -504,7 +503,7 @@ class ReferralsCog(commands.Cog):
             return await ctx.reply(embed=embed)
         
         # Get or create user referral data
-        referral_data = self.referral_collection.find_one({"user_id": user.id})
+        referral_data = await self.referral_collection.find_one({"user_id": user.id})
         if not referral_data:
             referral_data = {
                 "user_id": user.id,
@@ -516,7 +515,7 @@ class ReferralsCog(commands.Cog):
                 "left_user_ids": [],
                 "rejoined_user_ids": []
             }
-            self.referral_collection.insert_one(referral_data)
+            await self.referral_collection.insert_one(referral_data)
         
         action = action.lower()
         
@@ -530,7 +529,7 @@ class ReferralsCog(commands.Cog):
                     )
                     return await ctx.reply(embed=embed)
                 
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": user.id},
                     {"$inc": {"current_invites": amount, "total_joins": amount}}
                 )
@@ -554,7 +553,7 @@ class ReferralsCog(commands.Cog):
                 current_invites = referral_data.get("current_invites", 0)
                 remove_amount = min(amount, current_invites)
                 
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": user.id},
                     {"$inc": {"current_invites": -remove_amount}}
                 )
@@ -574,7 +573,7 @@ class ReferralsCog(commands.Cog):
                     )
                     return await ctx.reply(embed=embed)
                 
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": user.id},
                     {"$inc": {"rejoins": amount}}
                 )
@@ -598,7 +597,7 @@ class ReferralsCog(commands.Cog):
                 current_rejoins = referral_data.get("rejoins", 0)
                 remove_amount = min(amount, current_rejoins)
                 
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": user.id},
                     {"$inc": {"rejoins": -remove_amount}}
                 )
@@ -610,7 +609,7 @@ class ReferralsCog(commands.Cog):
                 )
                 
             elif action == "reset":
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": user.id},
                     {"$set": {
                         "total_joins": 0,
@@ -674,7 +673,7 @@ class ReferralsCog(commands.Cog):
             
             if inviter_id:
                 # Check if this person was previously invited by anyone (including this inviter)
-                previous_inviter_data = self.referral_collection.find_one(
+                previous_inviter_data = await self.referral_collection.find_one(
                     {"left_user_ids": member.id}
                 )
                 
@@ -688,7 +687,7 @@ class ReferralsCog(commands.Cog):
                         # Same inviter - this is a rejoin
                         is_rejoin = True
                         # Ensure inviter data exists first
-                        self.referral_collection.update_one(
+                        await self.referral_collection.update_one(
                             {"user_id": inviter_id},
                             {
                                 "$setOnInsert": {
@@ -705,7 +704,7 @@ class ReferralsCog(commands.Cog):
                             upsert=True
                         )
                         # Remove from left users and add to rejoined (but don't increment current_invites for rejoins)
-                        self.referral_collection.update_one(
+                        await self.referral_collection.update_one(
                             {"user_id": inviter_id},
                             {
                                 "$pull": {"left_user_ids": member.id},
@@ -717,14 +716,14 @@ class ReferralsCog(commands.Cog):
                         # Different inviter - this is an invite switch
                         is_invite_switch = True
                         # Remove from previous inviter's left_user_ids (no changes to their stats)
-                        self.referral_collection.update_one(
+                        await self.referral_collection.update_one(
                             {"user_id": previous_inviter_id},
                             {"$pull": {"left_user_ids": member.id}}
                         )
                         
                         # For invite switches, this should count as a rejoin for the new inviter, NOT a new invite
                         # Ensure new inviter data exists first
-                        self.referral_collection.update_one(
+                        await self.referral_collection.update_one(
                             {"user_id": inviter_id},
                             {
                                 "$setOnInsert": {
@@ -742,7 +741,7 @@ class ReferralsCog(commands.Cog):
                         )
                         
                         # Add as rejoin for new inviter (not a new invite)
-                        self.referral_collection.update_one(
+                        await self.referral_collection.update_one(
                             {"user_id": inviter_id},
                             {
                                 "$inc": {"rejoins": 1},
@@ -759,7 +758,7 @@ class ReferralsCog(commands.Cog):
                     }
                     
                     # Ensure inviter data exists and update (use upsert to create if doesn't exist)
-                    self.referral_collection.update_one(
+                    await self.referral_collection.update_one(
                         {"user_id": inviter_id},
                         {
                             "$inc": {"total_joins": 1, "current_invites": 1},
@@ -793,7 +792,7 @@ class ReferralsCog(commands.Cog):
             
         try:
             # Find who invited this user
-            referral_data = self.referral_collection.find_one(
+            referral_data = await self.referral_collection.find_one(
                 {"invited_users.user_id": member.id}
             )
             
@@ -801,7 +800,7 @@ class ReferralsCog(commands.Cog):
                 inviter_id = referral_data["user_id"]
                 
                 # Update referral statistics
-                self.referral_collection.update_one(
+                await self.referral_collection.update_one(
                     {"user_id": inviter_id},
                     {
                         "$inc": {"left_users": 1, "current_invites": -1},
@@ -817,7 +816,7 @@ class ReferralsCog(commands.Cog):
     async def get_stored_invites(self, guild_id):
         """Get stored invite data for comparison"""
         try:
-            stored_data = self.db["invite_cache"].find_one({"guild_id": guild_id})
+            stored_data = await self.db["invite_cache"].find_one({"guild_id": guild_id})
             return stored_data.get("invites", {}) if stored_data else {}
         except:
             return {}
@@ -833,7 +832,7 @@ class ReferralsCog(commands.Cog):
                         "inviter_id": invite.inviter.id
                     }
             
-            self.db["invite_cache"].update_one(
+            await self.db["invite_cache"].update_one(
                 {"guild_id": guild_id},
                 {"$set": {"invites": invite_data}},
                 upsert=True
@@ -3,7 +3,7 @@ import asyncio
 import time
 import random
 from discord.ext import commands
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, Servers, BetHistory
 from Cogs.utils.emojis import emoji
 
 class AirdropButton(discord.ui.Button):
@@ -23,12 +23,12 @@ class AirdropButton(discord.ui.Button):
 
         # Register user if needed
         db = Users()
-        if db.fetch_user(interaction.user.id) == False:
+        if await db.fetch_user(interaction.user.id) == False:
             dump = {"discord_id": interaction.user.id, "name": interaction.user.name, "tokens": 0, "credits": 0, "history": [], 
                    "total_deposit_amount": 0, "total_withdraw_amount": 0, "total_spent": 0, 
                    "total_earned": 0, 'total_played': 0, 'total_won': 0, 'total_lost': 0,
                    'xp': 0, 'level': 1, 'rank': 0, 'rakeback_tokens': 0}
-            db.register_new_user(dump)
+            await db.register_new_user(dump)
 
         # Update participant count on the embed
         embed = interaction.message.embeds[0]
@@ -55,29 +55,40 @@ class AirdropView(discord.ui.View):
         # Message will be edited in the airdrop_end_handler
 
 class ServerBetHistoryView(discord.ui.View):
-    def __init__(self, bot, server_data, author_id, category="all", page=0):
+    # Entry types shown under each category button
+    CATEGORY_TYPES = {
+        "all": None,
+        "win": ["win"],
+        "loss": ["loss"],
+    }
+
+    def __init__(self, bot, server_data, author_id, category="all"):
         super().__init__(timeout=120)
         self.bot = bot
         self.server_data = server_data
-        self.server_bet_history = server_data.get("server_bet_history", [])
+        self.server_bet_history = []
         self.author_id = author_id
         self.category = category
-        self.page = page
+        self.page = 0
         self.per_page = 10
-        self.max_pages = 0
         self.message = None
 
-        # Calculate the initial max pages
-        self._calculate_max_pages()
-
-        # Add the buttons to the view
+        # Cursor each visited page starts after; pages are fetched by keyset, not offset
+        self._page_cursors = [None]
+        self._next_cursor = None
+
+    async def load_page(self):
+        """Fetch the current page for the selected category and rebuild the buttons"""
+        records, self._next_cursor = await BetHistory().fetch_page(
+            "server_id",
+            self.server_data["server_id"],
+            types=self.CATEGORY_TYPES[self.category],
+            after=self._page_cursors[self.page],
+            limit=self.per_page
+        )
+        self.server_bet_history = [record["entry"] for record in records]
         self._update_buttons()
 
-    def _calculate_max_pages(self):
-        """Calculate the maximum number of pages for the current category"""
-        filtered = self._get_filtered_history(full=True)
-        self.max_pages = max(1, (len(filtered) + self.per_page - 1) // self.per_page)
-
     def _update_buttons(self):
         """Update all buttons in the view based on current state"""
         self.clear_items()
@@ -89,34 +100,11 @@ class ServerBetHistoryView(discord.ui.View):
 
         # Add pagination buttons
         self.add_item(discord.ui.Button(emoji="⬅️", style=discord.ButtonStyle.secondary, custom_id="prev", disabled=self.page == 0))
-        self.add_item(discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary, custom_id="next", disabled=self.page >= self.max_pages - 1))
-
-    def _get_filtered_history(self, full=False):
-        """Get filtered history based on the selected category
-
-        Args:
-            full: If True, return all items in category, otherwise return just current page items
-        """
-        if self.category == "all":
-            filtered = self.server_bet_history
-        else:
-            filtered = [item for item in self.server_bet_history if item.get("type") == self.category]
-
-        # Sort by timestamp (most recent first)
-        filtered.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-
-        # Limit to items per page if not requesting full list
-        if not full:
-            # Get items for current page
-            start_idx = self.page * self.per_page
-            end_idx = min(start_idx + self.per_page, len(filtered))
-            return filtered[start_idx:end_idx]
-
-        return filtered
+        self.add_item(discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary, custom_id="next", disabled=self._next_cursor is None))
 
     def create_embed(self):
-        """Create the server bet history embed with the filtered data"""
-        filtered_data = self._get_filtered_history()
+        """Create the server bet history embed for the loaded page"""
+        filtered_data = self.server_bet_history
         server_name = self.server_data.get("server_name", "Unknown Server")
 
         # Prepare embed
@@ -161,7 +149,7 @@ class ServerBetHistoryView(discord.ui.View):
                 embed.add_field(name=field_name, value=field_value, inline=False)
 
         # Add page info
-        embed.set_footer(text=f"Page {self.page + 1}/{self.max_pages} • BetSync Casino", icon_url=self.bot.user.avatar.url)
+        embed.set_footer(text=f"Page {self.page + 1} • BetSync Casino", icon_url=self.bot.user.avatar.url)
 
         return embed
 
@@ -179,27 +167,21 @@ class ServerBetHistoryView(discord.ui.View):
         """Handle button interactions"""
         custom_id = interaction.data.get("custom_id")
 
-        if custom_id == "all":
-            self.category = "all"
-            self.page = 0
-        elif custom_id == "win":
-            self.category = "win"
-            self.page = 0
-        elif custom_id == "loss":
-            self.category = "loss"
+        if custom_id in self.CATEGORY_TYPES:
+            self.category = custom_id
             self.page = 0
+            self._page_cursors = [None]
         elif custom_id == "prev":
             if self.page > 0:
                 self.page -= 1
         elif custom_id == "next":
-            if self.page < self.max_pages - 1:
+            if self._next_cursor is not None:
                 self.page += 1
+                del self._page_cursors[self.page:]
+                self._page_cursors.append(self._next_cursor)
 
-        # Recalculate max pages
-        self._calculate_max_pages()
-
-        # Update buttons
-        self._update_buttons()
+        # Fetch the page and update buttons
+        await self.load_page()
 
         # Update the message
         await interaction.response.edit_message(embed=self.create_embed(), view=self)
@@ -228,7 +210,7 @@ class ServersCog(commands.Cog):
         """
         # Check if user is authorized (in admins.txt or server_admins)
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id)
 
         if not server_data:
             embed = discord.Embed(
@@ -286,7 +268,7 @@ class ServersCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id, {"server_id": 1, "server_name": 1})
 
         if server_data == False:
             embed = discord.Embed(
@@ -297,8 +279,9 @@ class ServersCog(commands.Cog):
             await loading_message.delete()
             return await ctx.reply(embed=embed)
 
-        # Create view with buttons
+        # Create view with buttons and load the first page
         view = ServerBetHistoryView(self.bot, server_data, ctx.author.id)
+        await view.load_page()
 
         # Send initial embed
         embed = view.create_embed()
@@ -342,7 +325,7 @@ class ServersCog(commands.Cog):
 
         # Get user data from database
         db = Users()
-        user_data = db.fetch_user(ctx.author.id)
+        user_data = await db.fetch_user(ctx.author.id)
 
         if not user_data:
             embed = discord.Embed(
@@ -499,7 +482,7 @@ class ServersCog(commands.Cog):
 
         # Deduct from user's balance
         new_balance = user_balance - amount_value
-        db.update_balance(ctx.author.id, new_balance, db_field)
+        await db.update_balance(ctx.author.id, new_balance, db_field)
 
         # Create airdrop data
         airdrop_data = {
@@ -645,11 +628,11 @@ class ServersCog(commands.Cog):
             if participant_count == 0:
                 # No participants - refund the creator (minus fee)
                 db = Users()
-                creator_data = db.fetch_user(airdrop_data["author_id"])
+                creator_data = await db.fetch_user(airdrop_data["author_id"])
                 if creator_data:
                     current_balance = creator_data.get(airdrop_data["currency"], 0)
                     new_balance = current_balance + airdrop_data["amount"]
-                    db.update_balance(airdrop_data["author_id"], new_balance, airdrop_data["currency"])
+                    await db.update_balance(airdrop_data["author_id"], new_balance, airdrop_data["currency"])
 
                     embed.description = f"No one joined the airdrop. The amount has been refunded to {airdrop_data['author_name']}."
 
@@ -681,12 +664,12 @@ class ServersCog(commands.Cog):
                 participants_notified = 0
 
                 for participant_id in participants:
-                    participant_data = db.fetch_user(participant_id)
+                    participant_data = await db.fetch_user(participant_id)
                     if participant_data:
                         # Update participant balance
                         current_balance = participant_data.get(airdrop_data["currency"], 0)
                         new_balance = current_balance + share_amount
-                        db.update_balance(participant_id, new_balance, airdrop_data["currency"])
+                        await db.update_balance(participant_id, new_balance, airdrop_data["currency"])
 
                         # Add to history
                         history_entry = {
@@ -697,7 +680,7 @@ class ServersCog(commands.Cog):
                             "from_name": airdrop_data["author_name"],
                             "timestamp": int(time.time())
                         }
-                        db.collection.update_one(
+                        await db.collection.update_one(
                             {"discord_id": participant_id},
                             {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}
                         )
@@ -774,7 +757,7 @@ class ServersCog(commands.Cog):
 
         # Get server data
         db = Servers()
-        server_data = db.fetch_server(ctx.guild.id)
+        server_data = await db.fetch_server(ctx.guild.id, {"server_id": 1, "server_name": 1})
 
         if server_data == False:
             embed = discord.Embed(
@@ -785,8 +768,9 @@ class ServersCog(commands.Cog):
             await loading_message.delete()
             return await ctx.reply(embed=embed)
 
-        # Create view with buttons
+        # Create view with buttons and load the first page
         view = ServerBetHistoryView(self.bot, server_data, ctx.author.id)
+        await view.load_page()
 
         # Send initial embed
         embed = view.create_embed()
@@ -5,10 +5,8 @@ from discord.ext import commands, tasks
 import os
 import qrcode
 import io
-import asyncio
 import datetime
 import time
-import aiohttp
 import json
 from dotenv import load_dotenv
 from solders.keypair import Keypair
@@ -27,6 +25,8 @@ from Cogs.utils.mongo import Users
 from Cogs.utils.notifier import Notifier
 from Cogs.utils.emojis import emoji
 from Cogs.utils.currency_helper import get_crypto_price
+from Cogs.utils.assets import atlas
+from Cogs.utils.qr_cache import qr_codes
 
 # Load environment variables
 load_dotenv()
@@ -62,14 +62,14 @@ def generate_qr_code(address: str, username: str):
     qr_width, qr_height = qr_img.size
 
     try:
-        title_font = ImageFont.truetype("Helvetica-Bold.ttf", 30)
-        subtitle_font = ImageFont.truetype("Helvetica.ttf", 18)
-        brand_font = ImageFont.truetype("Helvetica-Bold.ttf", 36)
+        title_font = atlas.font("Helvetica-Bold.ttf", 30)
+        subtitle_font = atlas.font("Helvetica.ttf", 18)
+        brand_font = atlas.font("Helvetica-Bold.ttf", 36)
     except IOError:
         try:
-            title_font = ImageFont.truetype("arial.ttf", 30)
-            subtitle_font = ImageFont.truetype("arial.ttf", 18)
-            brand_font = ImageFont.truetype("arial.ttf", 36)
+            title_font = atlas.font("arial.ttf", 30)
+            subtitle_font = atlas.font("arial.ttf", 18)
+            brand_font = atlas.font("arial.ttf", 36)
         except IOError:
             title_font = ImageFont.load_default()
             subtitle_font = ImageFont.load_default()
@@ -184,7 +184,7 @@ class DepositView(discord.ui.View):
 
                 total_sol = sum(d['amount_crypto'] for d in deposits)
 
-                updated_user = self.cog.users_db.fetch_user(self.user_id)
+                updated_user = await self.cog.users_db.fetch_user(self.user_id)
                 if not updated_user:
                     await interaction.followup.send("Deposit processed, but failed to fetch updated balance.", ephemeral=True)
                     return
@@ -219,10 +219,10 @@ class DepositView(discord.ui.View):
                         "status": "confirmed",
                         "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
                     }
-                    self.cog.users_db.update_history(self.user_id, history_entry)
+                    await self.cog.users_db.update_history(self.user_id, history_entry)
 
                     if usd_value:
-                        self.cog.users_db.collection.update_one(
+                        await self.cog.users_db.collection.update_one(
                             {"discord_id": self.user_id},
                             {"$inc": {"total_deposit_amount_usd": usd_value}}
                         )
@@ -342,7 +342,7 @@ class SolDeposit(commands.Cog):
                 return None, "PHANTOM_SEED environment variable is not configured."
 
             # Check if user already has an address
-            user_data = self.users_db.fetch_user(user_id)
+            user_data = await self.users_db.fetch_user(user_id)
             if user_data and user_data.get('sol_address'):
                 existing_address = user_data.get('sol_address')
                 print(f"{Fore.GREEN}[+] Using existing SOL address for user {user_id}: {existing_address}{Style.RESET_ALL}")
@@ -353,7 +353,7 @@ class SolDeposit(commands.Cog):
             bip44_mst_ctx = Bip44.FromSeed(seed_bytes, Bip44Coins.SOLANA)
 
             # Get the next available address index
-            highest_index_user = self.users_db.collection.find_one(
+            highest_index_user = await self.users_db.collection.find_one(
                 {"sol_address_index": {"$exists": True}},
                 sort=[("sol_address_index", -1)]
             )
@@ -372,7 +372,7 @@ class SolDeposit(commands.Cog):
                 }
             }
 
-            result = self.users_db.collection.update_one(
+            result = await self.users_db.collection.update_one(
                 {"discord_id": user_id},
                 update_data,
                 upsert=True
@@ -392,7 +392,7 @@ class SolDeposit(commands.Cog):
     async def _check_for_deposits(self, user_id: int, address: str) -> tuple[str, dict]:
         """Check for deposits to the address and credit user's wallet."""
         try:
-            user_data = self.users_db.fetch_user(user_id)
+            user_data = await self.users_db.fetch_user(user_id)
             if not user_data:
                 return "error", {"error": "User data not found."}
 
@@ -437,7 +437,7 @@ class SolDeposit(commands.Cog):
 
                         if not tx_detail_response or not tx_detail_response.value:
                             # Mark as processed to avoid checking again
-                            self.users_db.collection.update_one(
+                            await self.users_db.collection.update_one(
                                 {"discord_id": user_id},
                                 {"$addToSet": {"processed_sol_txids": tx_hash}}
                             )
@@ -447,7 +447,7 @@ class SolDeposit(commands.Cog):
 
                         # Skip if transaction failed
                         if not tx_data.transaction or not tx_data.transaction.meta or tx_data.transaction.meta.err:
-                            self.users_db.collection.update_one(
+                            await self.users_db.collection.update_one(
                                 {"discord_id": user_id},
                                 {"$addToSet": {"processed_sol_txids": tx_hash}}
                             )
@@ -506,7 +506,7 @@ class SolDeposit(commands.Cog):
 
                         if lamports_received <= 0:
                             # Mark as processed to skip in future
-                            self.users_db.collection.update_one(
+                            await self.users_db.collection.update_one(
                                 {"discord_id": user_id},
                                 {"$addToSet": {"processed_sol_txids": tx_hash}}
                             )
@@ -519,7 +519,7 @@ class SolDeposit(commands.Cog):
                         points_to_add = amount_sol / SOL_CONVERSION_RATE
 
                         # Update user's SOL wallet balance AND points
-                        update_result = self.users_db.collection.update_one(
+                        update_result = await self.users_db.collection.update_one(
                             {"discord_id": user_id},
                             {
                                 "$inc": {
@@ -534,7 +534,7 @@ class SolDeposit(commands.Cog):
                             continue
 
                         # Mark transaction as processed
-                        self.users_db.collection.update_one(
+                        await self.users_db.collection.update_one(
                             {"discord_id": user_id},
                             {"$addToSet": {"processed_sol_txids": tx_hash}}
                         )
@@ -550,7 +550,7 @@ class SolDeposit(commands.Cog):
                     except Exception as e:
                         print(f"{Fore.RED}[!] Error processing transaction {tx_hash}: {e}{Style.RESET_ALL}")
                         # Mark as processed to avoid infinite retries
-                        self.users_db.collection.update_one(
+                        await self.users_db.collection.update_one(
                             {"discord_id": user_id},
                             {"$addToSet": {"processed_sol_txids": tx_hash}}
                         )
@@ -572,7 +572,7 @@ class SolDeposit(commands.Cog):
 
     async def _show_deposit_history(self, user_id: int) -> discord.Embed:
         """Show user's SOL deposit history."""
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         if not user_data:
             return discord.Embed(title="Error", description="Could not fetch user data.", color=discord.Color.red())
 
@@ -643,7 +643,7 @@ class SolDeposit(commands.Cog):
             return
 
         # Generate QR Code
-        qr_buffer = await asyncio.to_thread(generate_qr_code, address, username)
+        qr_buffer = await qr_codes.get("SOL", address, username, generate_qr_code, address, username)
         qr_file = discord.File(qr_buffer, filename=f"sol_deposit_{user_id}.png")
 
         # Create Embed
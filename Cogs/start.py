@@ -13,7 +13,7 @@ class MainView(discord.ui.View):
     async def signup(self,button, interaction: discord.Interaction):
         dump = {"discord_id": self.user.id, "tokens": 0, "credits": 0, "history": []}
         money = emoji()["money"]
-        response = Users().register_new_user(dump)
+        response = await Users().register_new_user(dump)
 
         if response is False:
             embed = discord.Embed(
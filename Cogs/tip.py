@@ -71,7 +71,7 @@ class Tip(commands.Cog):
 
         # Check if sender has an account
         db = Users()
-        sender_data = db.fetch_user(ctx.author.id)
+        sender_data = await db.fetch_user(ctx.author.id)
         if not sender_data:
             embed = discord.Embed(
                 title="<:no:1344252518305234987> | Account Required",
@@ -81,14 +81,14 @@ class Tip(commands.Cog):
             return await ctx.reply(embed=embed)
 
         # Check if recipient has an account
-        recipient_data = db.fetch_user(recipient.id)
+        recipient_data = await db.fetch_user(recipient.id)
         if not recipient_data:
             # Auto-register recipient
             dump = {"discord_id": recipient.id, "points": 0, "history": [], 
                    "total_deposit_amount": 0, "total_withdraw_amount": 0, "total_spent": 0, 
                    "total_earned": 0, 'total_played': 0, 'total_won': 0, 'total_lost': 0}
-            db.register_new_user(dump)
-            recipient_data = db.fetch_user(recipient.id)
+            await db.register_new_user(dump)
+            recipient_data = await db.fetch_user(recipient.id)
 
         # Check if sender has enough balance
         sender_balance = sender_data.get("points", 0)
@@ -105,7 +105,7 @@ class Tip(commands.Cog):
         sender_primary_coin = sender_data.get("primary_coin", "BTC")
         
         # Deduct from sender
-        db.update_balance(ctx.author.id, sender_balance - amount, "points", "$set")
+        await db.update_balance(ctx.author.id, sender_balance - amount, "points", "$set")
         
         # Instead of adding to recipient's primary currency, add directly to their wallet in sender's currency
         # First get recipient's wallet
@@ -134,7 +134,7 @@ class Tip(commands.Cog):
         new_wallet_amount = current_wallet_amount + crypto_amount
         
         # Update recipient's wallet
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": recipient.id},
             {"$set": {f"wallet.{sender_primary_coin}": new_wallet_amount}}
         )
@@ -145,7 +145,7 @@ class Tip(commands.Cog):
         if recipient_primary_coin == sender_primary_coin:
             recipient_points = recipient_data.get("points", 0)
             new_recipient_points = recipient_points + amount
-            db.update_balance(recipient.id, new_recipient_points, "points", "$set")
+            await db.update_balance(recipient.id, new_recipient_points, "points", "$set")
         
         # Record in history for both users
         timestamp = int(datetime.datetime.now().timestamp())
@@ -158,7 +158,7 @@ class Tip(commands.Cog):
             "recipient": recipient.id,
             "timestamp": timestamp
         }
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": ctx.author.id},
             {"$push": {"history": {"$each": [sender_history], "$slice": -100}}}
         )
@@ -171,7 +171,7 @@ class Tip(commands.Cog):
             "sender": ctx.author.id,
             "timestamp": timestamp
         }
-        db.collection.update_one(
+        await db.collection.update_one(
             {"discord_id": recipient.id},
             {"$push": {"history": {"$each": [recipient_history], "$slice": -100}}}
         )
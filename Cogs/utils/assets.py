@@ -0,0 +1,114 @@
+import datetime
+import os
+import time
+
+from colorama import Fore
+from PIL import Image, ImageFont
+
+ASSET_DIR = "assests"
+CARD_SUITS = ("hearts", "diamonds", "clubs", "spades")
+CARD_RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+
+# (font file, size) pairs the renderers use, loaded by preload()
+PRELOAD_FONTS = [
+    ("roboto.ttf", size) for size in (16, 18, 20, 22, 24, 26, 28, 32, 34, 36, 42, 48, 80)
+] + [
+    ("arial.ttf", size) for size in (16, 18, 20, 22, 24, 30, 36, 42, 46)
+] + [
+    ("Helvetica.ttf", 18), ("Helvetica-Bold.ttf", 30), ("Helvetica-Bold.ttf", 36),
+]
+# Card sizes the renderers draw at: blackjack, hilo, poker
+PRELOAD_CARD_SIZES = [(120, 170), (144, 216), (150, 220)]
+
+
+class AssetAtlas:
+    """
+    Load-once registry of the fonts, card faces and backgrounds renderers
+    draw with.
+
+    Every asset is read from disk once per process and every scaled
+    variant is produced once, then shared. The images handed out are
+    shared between frames: paste or copy them, never draw on them.
+    Missing files raise OSError like ImageFont.truetype and Image.open do,
+    so existing fallbacks keep working, and the miss is remembered so the
+    disk isn't hit again every frame.
+    """
+
+    def __init__(self, asset_dir=ASSET_DIR):
+        self.asset_dir = asset_dir
+        self._fonts = {}  # (path, size) -> FreeTypeFont, or the OSError it raised
+        self._images = {}  # (path, size, mode) -> Image, or the OSError it raised
+        self.loads = 0
+
+    @staticmethod
+    def _cached(cache, key, load):
+        value = cache.get(key)
+        if value is None:
+            try:
+                value = load()
+            except OSError as e:
+                value = e
+            cache[key] = value
+        if isinstance(value, OSError):
+            raise value
+        return value
+
+    def font(self, path, size):
+        """A TrueType font at a size; raises OSError if the file is missing."""
+        def load():
+            self.loads += 1
+            return ImageFont.truetype(path, size)
+        return self._cached(self._fonts, (path, size), load)
+
+    def image(self, path, size=None, mode="RGBA"):
+        """An image converted to mode and, if size is given, resized to it."""
+        def load():
+            if size is not None:
+                return self.image(path, None, mode).resize(size, Image.Resampling.LANCZOS)
+            self.loads += 1
+            with Image.open(path) as source:
+                return source.convert(mode)
+        return self._cached(self._images, (path, size, mode), load)
+
+    def card(self, rank, suit, size=None):
+        """A card face such as ("10", "hearts"), optionally pre-scaled."""
+        return self.image(os.path.join(self.asset_dir, f"{suit}_{rank}.png"), size)
+
+    def card_back(self, size=None):
+        return self.image(os.path.join(self.asset_dir, "back_card.png"), size)
+
+    def background(self, name, size=None):
+        """A background image, or None if it isn't there."""
+        try:
+            return self.image(os.path.join(self.asset_dir, name), size, "RGB")
+        except OSError:
+            return None
+
+    def preload(self):
+        """Load every font size and card size the renderers use, so no frame pays for it."""
+        start = time.perf_counter()
+        for path, size in PRELOAD_FONTS:
+            try:
+                self.font(path, size)
+            except OSError:
+                pass
+        for size in PRELOAD_CARD_SIZES:
+            for suit in CARD_SUITS:
+                for rank in CARD_RANKS:
+                    try:
+                        self.card(rank, suit, size)
+                    except OSError:
+                        pass
+            try:
+                self.card_back(size)
+            except OSError:
+                pass
+        rn = datetime.datetime.now().strftime("%X")
+        print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Asset atlas loaded: {len(self._fonts)} fonts, {len(self._images)} images in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    def clear(self):
+        self._fonts.clear()
+        self._images.clear()
+
+
+atlas = AssetAtlas()
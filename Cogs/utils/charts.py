@@ -0,0 +1,230 @@
+import asyncio
+import datetime
+import io
+
+from colorama import Fore
+
+from Cogs.utils.render_service import render_service
+
+CHART_VIEWS = ("daily", "monthly", "all_time")
+TOKEN_USD = 0.0212  # 1 token = 0.0212$
+
+
+def _parse_date(value):
+    """profit_data dates are "YYYY-MM-DD" strings; anything unparsable is skipped."""
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    if isinstance(value, datetime.date):
+        return value
+    return None
+
+
+def profit_series(days, view_type):
+    """
+    Builds the points of a profit chart.
+
+    Args:
+        days (dict): datetime.date -> total_profit in tokens.
+        view_type (str): "daily" (last 30 days), "monthly" or "all_time".
+
+    Returns:
+        dict: dates, profits and cumulative_profits (USD), x_label and title.
+    """
+    if view_type == "daily":
+        # Last 30 days, zero for days without data
+        end_date = datetime.date.today()
+        start_date = end_date - datetime.timedelta(days=30)
+        points = {start_date + datetime.timedelta(days=i): 0 for i in range(31)}
+        for date, profit in days.items():
+            if start_date <= date <= end_date:
+                points[date] = profit
+        x_label, title = "Day", "Daily Profit (Last 30 Days)"
+    elif view_type == "monthly":
+        points = {}
+        for date, profit in days.items():
+            month_key = datetime.date(date.year, date.month, 1)
+            points[month_key] = points.get(month_key, 0) + profit
+        x_label, title = "Month", "Monthly Profit"
+    else:
+        points = dict(days)
+        x_label, title = "Date", "All-Time Profit"
+
+    dates, profits, cumulative_profits = [], [], []
+    total_profit = 0
+    for date, profit in sorted(points.items()):
+        dates.append(date)
+        profits.append(profit * TOKEN_USD)
+        total_profit += profit
+        cumulative_profits.append(total_profit * TOKEN_USD)
+    return {"dates": dates, "profits": profits, "cumulative_profits": cumulative_profits, "x_label": x_label, "title": title}
+
+
+def render_profit_chart(view_type, dates, cumulative_profits, x_label):
+    """Draw the !tp chart; matplotlib is only imported here, inside the render worker"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.dates as mdates
+    import matplotlib.pyplot as plt
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.patches import Rectangle
+
+    plt.style.use('dark_background')
+
+    # Create the plot with a modern gray background
+    fig, ax = plt.subplots(figsize=(12, 6), dpi=100)
+    fig.patch.set_facecolor('#2B2D31')  # Modern dark gray for outer background
+    ax.set_facecolor('#36393F')  # Slightly lighter gray for plot area
+
+    try:
+        if cumulative_profits:
+            # Plot the profit trend with the area under the curve filled
+            ax.plot(dates, cumulative_profits, color='#00FFAE', linewidth=2.5, marker='', zorder=3)
+            ax.fill_between(dates, cumulative_profits, color='#00FFAE', alpha=0.2)
+
+            # Dot and "tooltip" annotation at the highest value
+            max_idx = max(range(len(cumulative_profits)), key=cumulative_profits.__getitem__)
+            max_date = dates[max_idx]
+            max_value = cumulative_profits[max_idx]
+            ax.plot(max_date, max_value, 'o', color='white', markersize=8, zorder=4)
+            bbox_props = dict(boxstyle="round,pad=0.5", facecolor='black', alpha=0.8, edgecolor='gray')
+            ax.annotate(f"{max_date.strftime('%d %b %Y')}\nCumulative: ${max_value:,.2f}",
+                        (max_date, max_value),
+                        xytext=(10, 10),
+                        textcoords="offset points",
+                        bbox=bbox_props,
+                        color='white',
+                        zorder=5)
+
+            # Format the y-axis with dollar signs
+            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+            # Format x-axis dates
+            if view_type == "daily":
+                ax.xaxis.set_major_locator(mdates.DayLocator(interval=5))
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%d %b'))
+            elif view_type == "monthly":
+                ax.xaxis.set_major_locator(mdates.MonthLocator())
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+            else:
+                ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%d %b'))
+
+            ax.grid(True, linestyle='--', alpha=0.3, zorder=1)
+            ax.set_xlabel(x_label, color='white', fontsize=12)
+            ax.set_ylabel('Profit (USD)', color='white', fontsize=12)
+
+            title_text = f"Total Revenue\n${cumulative_profits[-1]:,.2f}"
+            try:
+                helvetica_font = FontProperties(fname="Helvetica-Bold.ttf")
+                ax.set_title(title_text, size=32, color='white', pad=20, fontproperties=helvetica_font)
+            except Exception:
+                print("Could not load Helvetica font, using default")
+                ax.set_title(title_text, fontsize=20, color='white', pad=20)
+
+            # Style the axes and ticks
+            ax.tick_params(colors='white', which='both')
+            for spine in ax.spines.values():
+                spine.set_edgecolor('#555555')
+
+            # BetSync watermark, padding, and a subtle shadow for the frame
+            plt.figtext(0.5, 0.01, "BetSync Casino", fontsize=10, color='white', alpha=0.4, ha='center')
+            plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+            fig.patches.append(Rectangle((0, 0), 1, 1, transform=fig.transFigure,
+                                         facecolor='black', alpha=0.2, zorder=-1))
+
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', facecolor=fig.get_facecolor())
+        return buf.getvalue()
+    finally:
+        # Close the figure to prevent memory leaks in the long-lived worker
+        plt.close(fig)
+
+
+class ProfitCharts:
+    """
+    Cached data and renders for the !tp profit charts.
+
+    The profit_data documents are read once; after that only the days the
+    write-behind queue flushed are re-read. Charts are rendered in the
+    render pool and kept as PNG bytes keyed by (view, last data date, data
+    version), so switching between views or asking again reuses them until
+    a flush changes the data. A miss also renders the other views in the
+    background so the buttons respond from cache.
+    """
+
+    def __init__(self, collection, max_bytes=4 * 1024 * 1024):
+        self.collection = collection
+        self.memory = render_service.cache("profit_chart", max_bytes)
+        self._days = None  # datetime.date -> total_profit, None until loaded
+        self._dirty = set()  # "YYYY-MM-DD" dates flushed since they were read
+        self._lock = asyncio.Lock()
+        self.version = 0
+
+    async def on_flush(self, updates):
+        """Write-behind hook: the flushed days have to be re-read."""
+        self._dirty.update(update["filter"]["date"] for update in updates)
+
+    def invalidate(self):
+        """Forget everything, e.g. after profit_data was cleared."""
+        self._days = None
+        self._dirty.clear()
+        self.version += 1
+
+    async def _load(self):
+        async with self._lock:
+            if self._days is None:
+                query = {}
+            elif self._dirty:
+                query = {"date": {"$in": list(self._dirty)}}
+            else:
+                return
+            dirty, self._dirty = self._dirty, set()
+            try:
+                documents = await self.collection.find(query, {"date": 1, "total_profit": 1}).to_list(None)
+            except Exception:
+                self._dirty |= dirty
+                raise
+            days = {} if self._days is None else self._days
+            for document in documents:
+                date = _parse_date(document.get("date"))
+                if date is not None:
+                    days[date] = document.get("total_profit", 0)
+            self._days = days
+            self.version += 1
+
+    async def _render(self, view_type, series):
+        key = (view_type, series["dates"][-1] if series["dates"] else None, self.version)
+        return await render_service.render_cached(
+            "profit_chart", key, render_profit_chart,
+            view_type, series["dates"], series["cumulative_profits"], series["x_label"]
+        )
+
+    async def _warm(self, view_type):
+        try:
+            await self._render(view_type, profit_series(self._days, view_type))
+        except Exception as e:
+            print(f"{Fore.YELLOW}[!] {Fore.WHITE}Failed to pre-render {view_type} profit chart: {e}")
+
+    async def chart(self, view_type):
+        """
+        Args:
+            view_type (str): "daily", "monthly" or "all_time".
+
+        Returns:
+            tuple: (series from profit_series, PNG bytes).
+
+        Raises:
+            ValueError: When there is no profit data at all.
+        """
+        await self._load()
+        if not self._days:
+            raise ValueError("No profit data available")
+        series = profit_series(self._days, view_type)
+        png = await self._render(view_type, series)
+        for other in CHART_VIEWS:
+            if other != view_type:
+                asyncio.ensure_future(self._warm(other))
+        return series, png
@@ -1,133 +1,104 @@
 import discord
-from Cogs.utils.mongo import Users
+from Cogs.utils.mongo import Users, USER_VIEWS
 import datetime
+import math
 from colorama import Fore, Back, Style
 import os
 import json
-import aiohttp # Add import for http requests
+from Cogs.utils.price_oracle import price_oracle
 from dotenv import load_dotenv
 load_dotenv()
 
-# CoinGecko API endpoint
-COINGECKO_API_URL = "https://api.coingecko.com/api/v3/simple/price"
-async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
-    """
-    Processes bet amounts based on user's token balance.
+# Rank table, loaded once rather than on every bet
+with open('static_data/ranks.json', 'r') as f:
+    RANK_DATA = json.load(f)
+SORTED_RANKS = sorted(RANK_DATA.items(), key=lambda x: x[1]['level_requirement'])
 
-    Args:
-        ctx: The command context
-        bet_amount: The amount to bet (can be a number, string, "all", or "max")
-        currency_type: Optional currency type (no longer used but kept for backward compatibility)
-        loading_message: Optional message to update with bet information
-        user: Optional user object to process bet for (defaults to ctx.author)
+# Fields the bet debit needs back from the user document
+BET_PROJECTION = {**USER_VIEWS["progression"], **USER_VIEWS["wallet"]}
 
-    Returns:
-        tuple: (success, bet_info, error_embed)
-            - success: Boolean indicating if bet processing was successful
-            - bet_info: Dict with processed bet information (if successful)
-            - error_embed: Error embed to return to user (if not successful)
-    """
-    author = ctx.author
-    user = ctx.author if user is None else user
-    db = Users()
-    user_data = db.fetch_user(user.id)
-
-    if not user_data:
-        error_embed = discord.Embed(
-            title="<:no:1344252518305234987> | Account Required",
-            description=f"{user.mention} needs an account to place bets. Use a command to create one.",
-            color=0xFF0000
-        )
-        return False, None, error_embed
-
-    tokens_balance = user_data.get('points', 0)
 
-    # Process bet amount and determine value
-    try:
-        # Handle special bet amounts
-        if bet_amount.lower() in ["all", "max"]:
-            # Use all available balance
-            available_balance = user_data.get("points", 0)
-            if available_balance <= 0:
-                error_embed = discord.Embed(
-                    title="<:no:1344252518305234987> | Insufficient Balance",
-                    description="You don't have enough points to bet.",
-                    color=0xFF0000
-                )
-                return False, None, error_embed
-
-            bet_amount_value = available_balance
-        elif bet_amount.lower() == "half":
-            # Use half of available balance
-            available_balance = user_data.get("points", 0)
-            if available_balance <= 0:
-                error_embed = discord.Embed(
-                    title="<:no:1344252518305234987> | Insufficient Balance",
-                    description="You don't have enough points to bet.",
-                    color=0xFF0000
-                )
-                return False, None, error_embed
-
-            bet_amount_value = available_balance // 2  # Use integer division to avoid decimals
-            if bet_amount_value <= 0:
-                error_embed = discord.Embed(
-                    title="<:no:1344252518305234987> | Insufficient Balance",
-                    description="You need at least 2 points to bet half your balance.",
-                    color=0xFF0000
-                )
-                return False, None, error_embed
-        else:
-            # Try to parse as number
-            try:
-                bet_amount_value = float(bet_amount)
-                if bet_amount_value <= 0:
-                    error_embed = discord.Embed(
-                        title="<:no:1344252518305234987> | Invalid Amount",
-                        description="Bet amount must be greater than 0.",
-                        color=0xFF0000
-                    )
-                    return False, None, error_embed
-            except ValueError:
-                error_embed = discord.Embed(
-                    title="<:no:1344252518305234987> | Invalid Amount",
-                    description="Please enter a valid number, 'all', or 'half'.",
-                    color=0xFF0000
-                )
-                return False, None, error_embed
-
-    except ValueError:
-        error_embed = discord.Embed(
-            title="<:no:1344252518305234987> | Invalid Amount",
-            description="Please enter a valid number or 'all'.",
-            color=0xFF0000
-        )
-        return False, None, error_embed
+def _levels_cost(levels, xp_limit):
+    """Aggregation expression for the XP needed to climb `levels` levels from a level with limit `xp_limit`."""
+    return {"$add": [
+        {"$multiply": [levels, xp_limit]},
+        {"$divide": [{"$multiply": [levels, {"$subtract": [levels, 1]}]}, 2]}
+    ]}
 
-    # Now determine if the user has enough tokens
-    tokens_used = 0
 
-    if bet_amount_value <= tokens_balance:
-        tokens_used = bet_amount_value
-    else:
-        error_embed = discord.Embed(
-            title="<:no:1344252518305234987> | Insufficient Points",
-            description=f"{user.mention} doesn't have enough points. Your balance: **{tokens_balance:.2f} points**",
-            color=0xFF0000
-        )
-        return False, None, error_embed
+def bet_debit_pipeline(bet):
+    """
+    Builds the pipeline update that debits a bet and accrues XP, level, rank
+    and rakeback on the server, mirroring apply_bet_progression.
 
-    # Update the user's balance by deducting the tokens
-    db.update_balance(user.id, -tokens_used, "points", "$inc")
+    Args:
+        bet: The amount to debit, either a number or an aggregation expression
+             (e.g. "$points" for all-in bets)
 
-    # Calculate the total bet amount
-    total_bet_amount = tokens_used
+    Returns:
+        list: Pipeline stages for Users.debit_bet
+    """
+    # The XP limit is 10 at level 1 and grows by 10% of the base per level,
+    # so climbing k levels from limit a costs k*a + k*(k-1)/2 XP.
+    b = {"$subtract": [{"$multiply": [2, "$_xp_limit"]}, 1]}
+    rank_branches = [
+        {"case": {"$gte": ["$level", info['level_requirement']]}, "then": info['level_requirement']}
+        for _, info in reversed(SORTED_RANKS)
+    ]
+    rakeback_branches = [
+        {"case": {"$gte": ["$level", info['level_requirement']]}, "then": info['rakeback_percentage'] / 100}
+        for _, info in reversed(SORTED_RANKS)
+    ]
+    return [
+        {"$set": {"_bet": bet}},
+        {"$set": {
+            "_xp_limit": {"$add": [{"$ifNull": ["$level", 1]}, 9]},
+            "_xp": {"$add": [{"$ifNull": ["$xp", 0]}, "$_bet"]}
+        }},
+        # Closed form of the level-up loop: the largest k with cost(k) <= xp
+        {"$set": {"_levels": {"$floor": {"$divide": [
+            {"$subtract": [{"$sqrt": {"$add": [{"$multiply": [b, b]}, {"$multiply": [8, "$_xp"]}]}}, b]},
+            2
+        ]}}}},
+        # Correct any off-by-one from floating point error in the square root
+        {"$set": {"_levels": {"$switch": {
+            "branches": [
+                {"case": {"$lte": [_levels_cost({"$add": ["$_levels", 1]}, "$_xp_limit"), "$_xp"]},
+                 "then": {"$add": ["$_levels", 1]}},
+                {"case": {"$gt": [_levels_cost("$_levels", "$_xp_limit"), "$_xp"]},
+                 "then": {"$subtract": ["$_levels", 1]}}
+            ],
+            "default": "$_levels"
+        }}}},
+        {"$set": {
+            "points": {"$subtract": ["$points", "$_bet"]},
+            "level": {"$add": [{"$ifNull": ["$level", 1]}, "$_levels"]},
+            "xp": {"$subtract": ["$_xp", _levels_cost("$_levels", "$_xp_limit")]}
+        }},
+        {"$set": {
+            "rank": {"$switch": {"branches": rank_branches, "default": {"$ifNull": ["$rank", 0]}}},
+            "rakeback_tokens": {"$add": [
+                {"$ifNull": ["$rakeback_tokens", 0]},
+                {"$multiply": ["$_bet", {"$switch": {"branches": rakeback_branches, "default": 0}}]}
+            ]}
+        }},
+        {"$unset": ["_bet", "_xp_limit", "_xp", "_levels"]}
+    ]
+
+
+def apply_bet_progression(user_data, tokens_used):
+    """
+    Computes the XP, level, rank and rakeback a bet produces for a user.
 
-    # Log the bet amount for debugging
-    rn = datetime.datetime.now().strftime("%X")
-    print(f"{Back.CYAN}  {Style.DIM}{user.id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.RED}-{tokens_used:.2f} tokens{Style.RESET_ALL}  {Fore.MAGENTA}bet{Fore.WHITE}")
+    Args:
+        user_data: The user document as it was before the bet
+        tokens_used: The amount wagered
 
+    Returns:
+        dict: new_xp, new_level, new_rank, rank_changed, rank_name,
+              rakeback_percentage and rakeback_amount
+    """
     # Calculate and add XP (1 XP per token wagered)
-    xp_to_add = tokens_used
     current_xp = user_data.get('xp', 0)
     current_level = user_data.get('level', 1)
 
@@ -136,7 +107,7 @@ async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
     xp_limit = round(xp_limit)
 
     # Calculate new XP and check if level up is needed
-    new_xp = current_xp + xp_to_add
+    new_xp = current_xp + tokens_used
     new_level = current_level
 
     # Handle level progression
@@ -147,62 +118,137 @@ async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
         xp_limit = 10 * (1 + (new_level - 1) * 0.1)
         xp_limit = round(xp_limit)
 
-    # Update XP and level in database
-    db.collection.update_one(
-        {"discord_id": user.id},
-        {"$set": {"xp": new_xp, "level": new_level}}
-    )
-
-    # Load rank data from JSON file
-    with open('static_data/ranks.json', 'r') as f:
-        rank_data = json.load(f)
-
-    # Get current rank and check if user is eligible for a rank up
+    # The user holds the highest rank whose level requirement they meet
     current_rank = user_data.get('rank', 0)
     new_rank = current_rank
-    rank_changed = False
     rank_name = "Bronze"  # Default rank name
-
-    # Sort ranks by level requirement to find the highest applicable rank
-    sorted_ranks = sorted(rank_data.items(), key=lambda x: x[1]['level_requirement'])
-    for rank_name, rank_info in sorted_ranks:
+    for _, rank_info in SORTED_RANKS:
         if new_level >= rank_info['level_requirement']:
-            if current_rank != rank_info['level_requirement']:
-                new_rank = rank_info['level_requirement']
-                rank_changed = True
-
-    # Find current rank name
-    for name, info in rank_data.items():
-        if info['level_requirement'] == current_rank:
-            rank_name = name
-            break
+            new_rank = rank_info['level_requirement']
 
     # Calculate rakeback based on rank
     rakeback_percentage = 0.0
-    for name, info in rank_data.items():
-        if info['level_requirement'] == (new_rank if rank_changed else current_rank):
+    for name, info in RANK_DATA.items():
+        if info['level_requirement'] == new_rank:
             rakeback_percentage = info['rakeback_percentage']
             rank_name = name
             break
 
-    # Calculate rakeback tokens to be added
-    total_bet = tokens_used
-    rakeback_amount = total_bet * (rakeback_percentage / 100)
+    return {
+        "new_xp": new_xp,
+        "new_level": new_level,
+        "new_rank": new_rank,
+        "rank_changed": new_rank != current_rank,
+        "rank_name": rank_name,
+        "rakeback_percentage": rakeback_percentage,
+        "rakeback_amount": tokens_used * (rakeback_percentage / 100)
+    }
 
-    # Update user's rakeback_tokens in the database
-    if rakeback_amount > 0:
-        current_rakeback = user_data.get('rakeback_tokens', 0)
-        db.collection.update_one(
-            {"discord_id": user.id},
-            {"$set": {"rakeback_tokens": current_rakeback + rakeback_amount}}
-        )
-
-    # Update user's rank if changed
-    if rank_changed:
-        db.collection.update_one(
-            {"discord_id": user.id},
-            {"$set": {"rank": new_rank}}
-        )
+
+async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
+    """
+    Processes bet amounts based on user's token balance.
+
+    The debit, XP, level, rank and rakeback updates are applied in a single
+    conditional find_one_and_update, so concurrent bets cannot overdraw.
+
+    Args:
+        ctx: The command context
+        bet_amount: The amount to bet (can be a number, string, "all", or "max")
+        currency_type: Optional currency type (no longer used but kept for backward compatibility)
+        loading_message: Optional message to update with bet information
+        user: Optional user object to process bet for (defaults to ctx.author)
+
+    Returns:
+        tuple: (success, bet_info, error_embed)
+            - success: Boolean indicating if bet processing was successful
+            - bet_info: Dict with processed bet information (if successful)
+            - error_embed: Error embed to return to user (if not successful)
+    """
+    user = ctx.author if user is None else user
+    db = Users()
+    bet_amount = str(bet_amount).lower()
+
+    # Work out what to debit; "all" and "half" are resolved against the stored balance
+    if bet_amount in ["all", "max"]:
+        bet_expression = "$points"
+        balance_filter = {"points": {"$gt": 0}}
+    elif bet_amount == "half":
+        # Use integer division to avoid decimals
+        bet_expression = {"$floor": {"$divide": ["$points", 2]}}
+        balance_filter = {"points": {"$gte": 2}}
+    else:
+        # Try to parse as number
+        try:
+            bet_amount_value = float(bet_amount)
+        except ValueError:
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Invalid Amount",
+                description="Please enter a valid number, 'all', or 'half'.",
+                color=0xFF0000
+            )
+            return False, None, error_embed
+        if bet_amount_value <= 0:
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Invalid Amount",
+                description="Bet amount must be greater than 0.",
+                color=0xFF0000
+            )
+            return False, None, error_embed
+        bet_expression = bet_amount_value
+        balance_filter = {"points": {"$gte": bet_amount_value}}
+
+    user_data = await db.debit_bet(user.id, balance_filter, bet_debit_pipeline(bet_expression), BET_PROJECTION)
+
+    if not user_data:
+        # Nothing was debited; look the user up to explain why
+        user_data = await db.fetch_user(user.id, "balance")
+        if not user_data:
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Account Required",
+                description=f"{user.mention} needs an account to place bets. Use a command to create one.",
+                color=0xFF0000
+            )
+            return False, None, error_embed
+
+        tokens_balance = user_data.get('points', 0)
+        if bet_amount in ["all", "max", "half"] and tokens_balance <= 0:
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Insufficient Balance",
+                description="You don't have enough points to bet.",
+                color=0xFF0000
+            )
+        elif bet_amount == "half":
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Insufficient Balance",
+                description="You need at least 2 points to bet half your balance.",
+                color=0xFF0000
+            )
+        else:
+            error_embed = discord.Embed(
+                title="<:no:1344252518305234987> | Insufficient Points",
+                description=f"{user.mention} doesn't have enough points. Your balance: **{tokens_balance:.2f} points**",
+                color=0xFF0000
+            )
+        return False, None, error_embed
+
+    # user_data is the pre-image; derive what the pipeline applied from it
+    tokens_balance = user_data.get('points', 0)
+    if bet_amount in ["all", "max"]:
+        tokens_used = tokens_balance
+    elif bet_amount == "half":
+        tokens_used = tokens_balance // 2
+    else:
+        tokens_used = bet_amount_value
+
+    progression = apply_bet_progression(user_data, tokens_used)
+    current_level = user_data.get('level', 1)
+    rank_name = progression["rank_name"]
+    rakeback_amount = progression["rakeback_amount"]
+
+    # Log the bet amount for debugging
+    rn = datetime.datetime.now().strftime("%X")
+    print(f"{Back.CYAN}  {Style.DIM}{user.id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.RED}-{tokens_used:.2f} tokens{Style.RESET_ALL}  {Fore.MAGENTA}bet{Fore.WHITE}")
 
     # Create a result dictionary with all relevant information
     bet_info = {
@@ -210,13 +256,13 @@ async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
         "total_bet_amount": tokens_used,
         "user_id": user.id,
         "remaining_tokens": tokens_balance - tokens_used,
-        "xp_gained": xp_to_add,
-        "current_xp": new_xp,
-        "current_level": new_level,
-        "leveled_up": new_level > current_level,
+        "xp_gained": tokens_used,
+        "current_xp": progression["new_xp"],
+        "current_level": progression["new_level"],
+        "leveled_up": progression["new_level"] > current_level,
         "rakeback_added": rakeback_amount,
         "current_rank": rank_name,
-        "rank_changed": rank_changed
+        "rank_changed": progression["rank_changed"]
     }
 
     now = datetime.datetime.now()
@@ -225,10 +271,10 @@ async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
 
     # Add debug log for rakeback
     if rakeback_amount > 0:
-        print(f"{Back.YELLOW}  {Style.DIM}{user.id}{Style.RESET_ALL}{Back.RESET}{Fore.YELLOW}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.GREEN}+{rakeback_amount:.6f} ({rank_name} {rakeback_percentage}%){Fore.WHITE}{Style.RESET_ALL}  {Fore.MAGENTA}rakeback{Fore.WHITE}")
+        print(f"{Back.YELLOW}  {Style.DIM}{user.id}{Style.RESET_ALL}{Back.RESET}{Fore.YELLOW}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.GREEN}+{rakeback_amount:.6f} ({rank_name} {progression['rakeback_percentage']}%){Fore.WHITE}{Style.RESET_ALL}  {Fore.MAGENTA}rakeback{Fore.WHITE}")
 
     # Add debug log for rank change only if rank actually changed
-    if rank_changed and new_rank != current_rank:
+    if progression["rank_changed"]:
         print(f"{Back.MAGENTA}  {Style.DIM}{user.id}{Style.RESET_ALL}{Back.RESET}{Fore.MAGENTA}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.GREEN}RANK UP: {rank_name}{Fore.WHITE}{Style.RESET_ALL}  {Fore.MAGENTA}rank_change{Fore.WHITE}")
 
     # Update loading message if provided
@@ -246,39 +292,63 @@ async def process_bet_amount(ctx, bet_amount, loading_message=None, user=None):
     await update_loading(f"{user.mention}'s Bet: `{tokens_used:.2f} points`")
     from Cogs.utils.notifier import Notifier
     n = Notifier()
-    await n.bet_event(os.getenv("USER_WEBHOOK"), ctx.author.id, bet_info["total_bet_amount"])
+    # Hand the post-bet state to the notifier so it doesn't re-read the user
+    post_bet_user = {
+        "points": bet_info["remaining_tokens"],
+        "primary_coin": user_data.get("primary_coin"),
+        "wallet": user_data.get("wallet", {})
+    }
+    await n.bet_event(os.getenv("USER_WEBHOOK"), user.id, bet_info["total_bet_amount"], user_data=post_bet_user)
 
     return True, bet_info, None
 
+
+async def authorize_bets(user_id, bet_amount, count):
+    """
+    Pre-authorizes a batch of equal bets with one conditional debit.
+
+    As many of the `count` bets as the balance covers are debited together,
+    with the same XP, level, rank and rakeback accrual process_bet_amount
+    applies, so auto-betting games only touch the user document once per
+    batch and concurrent bets can still never overdraw it.
+
+    Args:
+        user_id (int): The Discord ID of the user.
+        bet_amount (float): The amount of each bet.
+        count (int): How many bets to authorize at most.
+
+    Returns:
+        int: How many bets were debited; 0 if not even one was affordable.
+    """
+    if count <= 0 or bet_amount <= 0:
+        return 0
+    affordable = {"$min": [count, {"$floor": {"$divide": ["$points", bet_amount]}}]}
+    user_data = await Users().debit_bet(
+        user_id,
+        {"points": {"$gte": bet_amount}},
+        bet_debit_pipeline({"$multiply": [bet_amount, affordable]}),
+        BET_PROJECTION
+    )
+    if not user_data:
+        return 0
+
+    # user_data is the pre-image; derive how many bets the pipeline took from it
+    authorized = min(count, math.floor(user_data.get('points', 0) / bet_amount))
+    rn = datetime.datetime.now().strftime("%X")
+    print(f"{Back.CYAN}  {Style.DIM}{user_id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.RED}-{bet_amount * authorized:.2f} tokens{Style.RESET_ALL}  {Fore.MAGENTA}bet x{authorized}{Fore.WHITE}")
+    return authorized
+
 async def get_crypto_price(crypto_id: str) -> float | None:
     """
-    Fetches the current price of a cryptocurrency in USD from CoinGecko.
+    Reads the current price of a cryptocurrency in USD from the price oracle.
 
     Args:
-        crypto_id: The CoinGecko ID of the cryptocurrency (e.g., 'litecoin', 'bitcoin').
+        crypto_id: The CoinGecko ID (e.g., 'litecoin', 'bitcoin') or ticker (e.g., 'LTC').
 
     Returns:
-        The price in USD as a float, or None if fetching fails.
+        The price in USD as a float, or None if no price is available.
     """
-    params = {
-        'ids': crypto_id,
-        'vs_currencies': 'usd'
-    }
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(COINGECKO_API_URL, params=params) as response:
-                response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-                data = await response.json()
-                # Example response: {'litecoin': {'usd': 75.5}}
-                price = data.get(crypto_id, {}).get('usd')
-                if price is not None:
-                    return float(price)
-                else:
-                    print(f"{Fore.RED}[!] Could not find USD price for '{crypto_id}' in CoinGecko response.{Style.RESET_ALL}")
-                    return None
-    except aiohttp.ClientError as e:
-        print(f"{Fore.RED}[!] aiohttp error fetching price for {crypto_id}: {e}{Style.RESET_ALL}")
-        return None
-    except Exception as e:
-        print(f"{Fore.RED}[!] Unexpected error fetching price for {crypto_id}: {e}{Style.RESET_ALL}")
-        return None
\ No newline at end of file
+    price = await price_oracle.get_price(crypto_id)
+    if price is None:
+        print(f"{Fore.RED}[!] No USD price available for '{crypto_id}'.{Style.RESET_ALL}")
+    return price
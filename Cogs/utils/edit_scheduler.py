@@ -0,0 +1,178 @@
+import asyncio
+import os
+import time
+
+from colorama import Fore
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ChannelBucket:
+    """Token bucket for the edits one channel may make; Discord allows about 5 per 5 seconds."""
+
+    def __init__(self, rate, per):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def delay(self):
+        """Seconds until an edit may be sent; takes the token if that's now."""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) * self.per / self.rate
+
+    def block(self, seconds):
+        """A 429 came back anyway: send nothing else to the channel for a while."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class EditScheduler:
+    """
+    Coalesces message edits so animations never queue up behind Discord's
+    rate limits.
+
+    Each message has at most one pending frame. Fields submitted while a
+    frame is waiting are merged into it (embed, file, view and content from
+    the newest call win), so one request carries the latest state and the
+    superseded frames are counted as dropped. Edits are paced per channel
+    with a token bucket, and a 429 pauses the channel for its retry_after.
+    """
+
+    def __init__(self, rate=5, per=5.0):
+        self.rate = rate
+        self.per = per
+        self._buckets = {}  # channel id -> ChannelBucket
+        self._pending = {}  # message id -> (message, fields, waiters)
+        self._tasks = {}  # message id -> sender task
+        self.submitted = 0
+        self.sent = 0
+        self.dropped = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.throttled_seconds = 0.0
+
+    def _bucket(self, channel_id):
+        if channel_id not in self._buckets:
+            self._buckets[channel_id] = ChannelBucket(self.rate, self.per)
+        return self._buckets[channel_id]
+
+    def _queue(self, message, fields, waiter=None):
+        self.submitted += 1
+        pending = self._pending.get(message.id)
+        if pending is None:
+            pending = (message, {}, [])
+            self._pending[message.id] = pending
+        elif pending[1]:
+            self.dropped += 1
+        pending[1].update(fields)
+        if waiter is not None:
+            pending[2].append(waiter)
+        if message.id not in self._tasks:
+            self._tasks[message.id] = asyncio.get_running_loop().create_task(self._run(message.id))
+
+    def submit(self, message, **fields):
+        """Queue an edit without waiting for it; failures are logged."""
+        self._queue(message, fields)
+
+    async def edit(self, message, **fields):
+        """
+        Edits a message through the scheduler.
+
+        Args:
+            message (discord.Message): The message to edit.
+            **fields: Anything Message.edit accepts (embed, file, view, ...).
+
+        Returns:
+            discord.Message: The edited message, once the frame carrying
+            these fields was sent (possibly merged with later fields).
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._queue(message, fields, waiter)
+        return await waiter
+
+    def cancel(self, message):
+        """
+        Drops the message's pending frame and stops its sender, e.g. before
+        deleting the message. Anyone awaiting edit() for it gets CancelledError.
+        """
+        pending = self._pending.pop(message.id, None)
+        if pending is not None:
+            if pending[1]:
+                self.dropped += 1
+            for waiter in pending[2]:
+                waiter.cancel()
+        task = self._tasks.pop(message.id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _run(self, message_id):
+        try:
+            while message_id in self._pending:
+                message = self._pending[message_id][0]
+                bucket = self._bucket(message.channel.id)
+                delay = bucket.delay()
+                while delay > 0:
+                    self.throttled_seconds += delay
+                    await asyncio.sleep(delay)
+                    delay = bucket.delay()
+
+                message, fields, waiters = self._pending.pop(message_id)
+                try:
+                    edited = await message.edit(**fields)
+                except asyncio.CancelledError:
+                    # cancel() stopped the frame in flight
+                    for waiter in waiters:
+                        waiter.cancel()
+                    raise
+                except Exception as e:
+                    if getattr(e, "status", None) == 429:
+                        # Put the frame back unless a newer one replaced it, and back off
+                        self.rate_limited += 1
+                        bucket.block(getattr(e, "retry_after", None) or self.per / self.rate)
+                        if message_id in self._pending:
+                            self.dropped += 1
+                            fields.update(self._pending[message_id][1])
+                            waiters.extend(self._pending[message_id][2])
+                        self._pending[message_id] = (message, fields, waiters)
+                        continue
+                    self.failures += 1
+                    if not waiters:
+                        print(f"{Fore.RED}[!] {Fore.WHITE}Scheduled edit of message {message_id} failed: {e}")
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    continue
+                self.sent += 1
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(edited)
+        finally:
+            if self._tasks.get(message_id) is asyncio.current_task():
+                self._tasks.pop(message_id)
+
+    def stats(self):
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+            "failures": self.failures,
+            "throttled_seconds": self.throttled_seconds,
+            "pending": len(self._pending),
+        }
+
+
+edits = EditScheduler(
+    rate=int(os.getenv("EDIT_RATE", "5")),
+    per=float(os.getenv("EDIT_RATE_PER", "5"))
+)
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+import random
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+from colorama import Fore
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Statuses worth another attempt: rate limiting and transient upstream failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Methods that are safe to repeat after a connection error or a 5xx
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class HttpStatusError(aiohttp.ClientError):
+    """Raised by HttpResponse.raise_for_status for 4xx and 5xx responses."""
+
+    def __init__(self, status, url, message):
+        super().__init__(f"{status} from {url}: {message}")
+        self.status = status
+
+
+class HttpResponse:
+    """A fully read response; the connection is already back in the pool."""
+
+    def __init__(self, status, headers, body, url):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise HttpStatusError(self.status, self.url, self.text()[:200])
+
+
+class UpstreamStats:
+    """Request counters for one upstream host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency, status=None, error=False):
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if status == 429:
+            self.rate_limited += 1
+        if error or (status is not None and status >= 500):
+            self.errors += 1
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "avg_latency_ms": self.total_latency / self.requests * 1000 if self.requests else 0.0,
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+class HttpClient:
+    """
+    Bot-wide HTTP client for every outbound call (price APIs, block
+    explorers, Discord webhooks).
+
+    One aiohttp session is shared so connections to each host are pooled
+    and kept alive. Each host also gets a concurrency limit, requests have
+    a default timeout, and rate limits or transient failures are retried
+    with exponential backoff, honouring Retry-After. Latency, errors and
+    429s are tracked per upstream host.
+    """
+
+    def __init__(self, timeout=10.0, max_per_host=10, retries=2, backoff=0.5, max_backoff=10.0):
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._session = None
+        self._semaphores = {}  # host -> asyncio.Semaphore
+        self._stats = {}  # host -> UpstreamStats
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_per_host * 10,
+                limit_per_host=self.max_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    def _upstream(self, host):
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+            self._stats[host] = UpstreamStats()
+        return self._semaphores[host], self._stats[host]
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff)
+        return delay * (0.5 + random.random() / 2)
+
+    async def request(self, method, url, *, timeout=None, retries=None, **kwargs):
+        """
+        Sends a request through the shared session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            timeout (float): Total timeout in seconds for each attempt.
+            retries (int): Extra attempts; connection errors and 5xx are only
+                retried for idempotent methods, 429s always are.
+            **kwargs: Passed to aiohttp (params, json, data, headers).
+
+        Returns:
+            HttpResponse: The final response, including error statuses.
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: When the last attempt
+            fails without a response.
+        """
+        method = method.upper()
+        retries = self.retries if retries is None else retries
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        host = urlsplit(url).netloc
+        semaphore, stats = self._upstream(host)
+        idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                async with semaphore:
+                    async with self._get_session().request(method, url, **kwargs) as response:
+                        body = await response.read()
+                        result = HttpResponse(response.status, response.headers, body, str(response.url))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                stats.record(time.perf_counter() - start, error=True)
+                if attempt >= retries or not idempotent:
+                    raise
+                print(f"{Fore.YELLOW}[!] {Fore.WHITE}HTTP {method} {host} failed ({e.__class__.__name__}), retrying")
+            else:
+                stats.record(time.perf_counter() - start, status=result.status)
+                retryable = result.status == 429 or (idempotent and result.status in RETRY_STATUSES)
+                if not retryable or attempt >= retries:
+                    return result
+                if result.status == 429:
+                    retry_after = result.headers.get("Retry-After")
+                    print(f"{Fore.YELLOW}[!] {Fore.WHITE}Rate limited by {host}, backing off")
+
+            stats.retries += 1
+            await asyncio.sleep(self._delay(attempt, retry_after))
+            attempt += 1
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        """Close the shared session; called when the bot shuts down."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self):
+        """Per-upstream metrics keyed by host."""
+        return {host: stats.as_dict() for host, stats in self._stats.items()}
+
+
+http = HttpClient(
+    timeout=float(os.getenv("HTTP_TIMEOUT", "10")),
+    max_per_host=int(os.getenv("HTTP_MAX_PER_HOST", "10")),
+    retries=int(os.getenv("HTTP_RETRIES", "2"))
+)
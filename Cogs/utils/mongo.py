@@ -1,44 +1,179 @@
-from pymongo import MongoClient
+from bson import ObjectId
+from pymongo import AsyncMongoClient, ReturnDocument, ASCENDING, DESCENDING
 import os
+import time
 import datetime
 import asyncio # Added for create_task
 from colorama import Back, Fore, Style
 from dotenv import load_dotenv
 from Cogs.utils.notifier import Notifier # Import Notifier
+from Cogs.utils.user_cache import user_cache, InvalidatingCollection
+from Cogs.utils.write_behind import WriteBehindQueue
+from Cogs.utils.username_cache import UsernameDirectory
+from Cogs.utils.price_oracle import price_oracle
+from Cogs.utils.charts import ProfitCharts
 
 load_dotenv()
 
-mongodb = MongoClient(os.environ["MONGO"])
+# Native asyncio client: every query is awaited instead of blocking the event loop.
+# The connection pool is bounded so a burst of commands queues on the pool rather
+# than opening an unbounded number of sockets.
+MONGO_POOL_SIZE = int(os.getenv("MONGO_POOL_SIZE", "50"))
+mongodb = AsyncMongoClient(os.environ["MONGO"], maxPoolSize=MONGO_POOL_SIZE)
+
+# Bet history and profit bookkeeping are batched and flushed in the background
+write_behind = WriteBehindQueue(
+    mongodb["BetSync"],
+    flush_interval=float(os.getenv("WRITE_BEHIND_INTERVAL", "1")),
+    max_pending=int(os.getenv("WRITE_BEHIND_MAX_PENDING", "500"))
+)
+
+# Names for rendering lists of users without a Discord API call per row
+usernames = UsernameDirectory(
+    mongodb["BetSync"]["usernames"],
+    write_behind,
+    stale_after=float(os.getenv("USERNAME_STALE_AFTER", str(7 * 86400))),
+    refresh_rate=float(os.getenv("USERNAME_REFRESH_RATE", "2"))
+)
+
+# Admin profit charts, re-read and re-rendered only when profit_data changes
+profit_charts = ProfitCharts(
+    mongodb["BetSync"]["profit_data"],
+    max_bytes=int(float(os.getenv("PROFIT_CHART_CACHE_MB", "4")) * 1024 * 1024)
+)
+
+# Named projections for Users.fetch_user. Most callers only need a balance,
+# so they shouldn't pay for decoding the embedded 100-entry history array.
+USER_VIEWS = {
+    "balance": {"points": 1},
+    "wallet": {"points": 1, "primary_coin": 1, "wallet": 1},
+    "progression": {"points": 1, "xp": 1, "level": 1, "rank": 1, "rakeback_tokens": 1},
+    "full": None,
+}
+
+# Entry types that are bet outcomes. These live in the bet_history collection;
+# deposits, withdrawals, tips and rewards stay in the user document's history.
+BET_HISTORY_TYPES = ("win", "loss", "push", "draw")
+
+# Optional retention for bet_history in days; 0 keeps bet history forever
+BET_HISTORY_TTL_DAYS = int(os.getenv("BET_HISTORY_TTL_DAYS", "0"))
+
+# Leaderboard metric -> users field it ranks by; "usd" is computed from
+# wallet balances at current prices when the snapshot is rebuilt
+LEADERBOARDS = {
+    "wins": "total_won",
+    "wagered": "total_spent",
+    "usd": None,
+}
+USD_WALLET_COINS = ("BTC", "ETH", "LTC", "SOL", "USDT", "DOGE")
+
+# (collection, keys, options) for every index the bot's queries rely on
+INDEXES = [
+    ("users", [("discord_id", ASCENDING)], {"unique": True}),
+    ("servers", [("server_id", ASCENDING)], {"unique": True}),
+    ("profit_data", [("date", ASCENDING)], {}),
+    ("server_profit", [("server_id", ASCENDING), ("date", ASCENDING)], {}),
+    ("lottery", [("status", ASCENDING)], {}),
+    ("referrals", [("current_invites", DESCENDING)], {}),
+    ("referrals", [("left_user_ids", ASCENDING)], {}),
+    ("invite_cache", [("guild_id", ASCENDING)], {}),
+    ("bet_history", [("user_id", ASCENDING), ("ts", DESCENDING), ("_id", DESCENDING)],
+     {"partialFilterExpression": {"user_id": {"$exists": True}}}),
+    ("bet_history", [("server_id", ASCENDING), ("ts", DESCENDING), ("_id", DESCENDING)],
+     {"partialFilterExpression": {"server_id": {"$exists": True}}}),
+]
+for _metric, _field in LEADERBOARDS.items():
+    if _field:
+        INDEXES.append(("users", [(_field, DESCENDING), ("discord_id", ASCENDING)], {}))
+    INDEXES.append((f"leaderboard_{_metric}", [("rank", ASCENDING)], {}))
+    INDEXES.append((f"leaderboard_{_metric}", [("discord_id", ASCENDING)], {}))
+if BET_HISTORY_TTL_DAYS > 0:
+    INDEXES.append(("bet_history", [("ts", ASCENDING)], {"expireAfterSeconds": BET_HISTORY_TTL_DAYS * 86400}))
+
+
+async def ensure_indexes():
+    """
+    Creates any missing indexes from INDEXES and verifies they exist.
+    Reports how long the build and verification took.
+
+    Returns:
+        bool: True if every index is present, False otherwise.
+    """
+    db = mongodb["BetSync"]
+    start = time.perf_counter()
+    ok = True
+
+    for collection_name, keys, options in INDEXES:
+        try:
+            await db[collection_name].create_index(keys, **options)
+        except Exception as e:
+            ok = False
+            print(f"{Fore.RED}[!] {Fore.WHITE}Failed to create index {Fore.RED}{collection_name}{keys}{Fore.WHITE}: {e}")
+    build_time = time.perf_counter() - start
+
+    # Verify every index is actually present
+    start = time.perf_counter()
+    for collection_name, keys, options in INDEXES:
+        existing = await db[collection_name].index_information()
+        if not any(info["key"] == keys for info in existing.values()):
+            ok = False
+            print(f"{Fore.RED}[!] {Fore.WHITE}Missing index {Fore.RED}{collection_name}{keys}{Fore.WHITE}")
+    verify_time = time.perf_counter() - start
+
+    color = Fore.GREEN if ok else Fore.YELLOW
+    print(f"{color}[+] {Fore.WHITE}Indexes: {color}{len(INDEXES)}{Fore.WHITE} ensured in {color}{build_time * 1000:.0f}ms{Fore.WHITE}, verified in {color}{verify_time * 1000:.0f}ms{Fore.WHITE}")
+    return ok
 
 
 class Users:
 
     def __init__(self):
         self.db = mongodb["BetSync"]
-        self.collection = self.db["users"]
+        # Writes through this collection invalidate the shared user cache
+        self.collection = InvalidatingCollection(self.db["users"], user_cache)
         self._last_save_times = {}  # Track last save time per user
 
     def get_all_users(self):
         return self.collection.find()
 
-    def register_new_user(self, user_data):
+    async def register_new_user(self, user_data):
         discordid = user_data["discord_id"]
-        if self.collection.count_documents({"discord_id": discordid}):
+        if await self.collection.count_documents({"discord_id": discordid}):
             return False
         else:
-            new_user = self.collection.insert_one(user_data)
+            new_user = await self.collection.insert_one(user_data)
             return new_user.inserted_id
 
-    def fetch_user(self, user_id):
-        if self.collection.count_documents({"discord_id": user_id}):
-            return self.collection.find_one({"discord_id": user_id})
+    async def fetch_user(self, user_id, projection=None):
+        """
+        Fetches a user document, served from the shared user cache when a
+        fresh copy is available.
 
-        else:
+        Args:
+            user_id (int): The Discord ID of the user.
+            projection (str | dict): A view name from USER_VIEWS ("balance",
+                "wallet", "progression" or "full") or a projection dict.
+
+        Returns:
+            dict: The user document, or False if the user does not exist.
+        """
+        if isinstance(projection, str):
+            projection = USER_VIEWS[projection]
+
+        cached = user_cache.get(user_id, projection)
+        if cached is not None:
+            return cached
+
+        generation = user_cache.generation(user_id)
+        user = await self.collection.find_one({"discord_id": user_id}, projection)
+        if user is None:
             return False
+        user_cache.put(user_id, projection, user, generation)
+        return user
 
-    def update_balance(self, user_id, amount, currency="points", operation="$inc"):
+    async def update_balance(self, user_id, amount, currency="points", operation="$inc"):
         try:
-            result = self.collection.update_one(
+            result = await self.collection.update_one(
                 {"discord_id": user_id},
                 {operation: {currency: amount}},
                 upsert=True
@@ -48,10 +183,38 @@ class Users:
             print(f"Error updating balance: {e}")
             return None
 
-    def track_lifetime_deposit(self, user_id, points_amount):
+    async def debit_bet(self, user_id, balance_filter, pipeline, projection=None):
+        """
+        Debits a bet and applies its progression updates in a single round trip.
+
+        The update only matches while balance_filter holds (e.g. points >= bet),
+        so concurrent bets can never overdraw a balance.
+
+        Args:
+            user_id (int): The Discord ID of the user.
+            balance_filter (dict): Extra query conditions guarding the debit.
+            pipeline (list): Aggregation pipeline update to apply.
+            projection (dict): Optional projection for the returned document.
+
+        Returns:
+            dict: The user document before the debit, or None if the user does
+            not exist or cannot cover the bet.
+        """
+        try:
+            return await self.collection.find_one_and_update(
+                {"discord_id": user_id, **balance_filter},
+                pipeline,
+                projection=projection,
+                return_document=ReturnDocument.BEFORE
+            )
+        except Exception as e:
+            print(f"Error debiting bet: {e}")
+            return None
+
+    async def track_lifetime_deposit(self, user_id, points_amount):
         """Track lifetime deposit points for daily reward persistence"""
         try:
-            result = self.collection.update_one(
+            result = await self.collection.update_one(
                 {"discord_id": user_id},
                 {"$inc": {"lifetime_deposit_points": points_amount}},
                 upsert=True
@@ -61,19 +224,18 @@ class Users:
             print(f"Error tracking lifetime deposit: {e}")
             return None
 
-    def update_history(self, user_id, history_entry):
-        """Add an entry to user's bet history with 100 entry limit"""
-        try:
-            self.collection.update_one(
-                {"discord_id": user_id},
-                {"$push": {"history": {"$each": [history_entry], "$slice": -100}}}
-            )
-            return True
-        except Exception as e:
-            print(f"Error updating user history: {e}")
-            return False
+    async def update_history(self, user_id, history_entry):
+        """
+        Queues a history entry; written by the next batch flush. Bet outcomes
+        go to the bet_history collection, everything else to the user's
+        embedded history (100 entry limit).
+        """
+        if history_entry.get("type") in BET_HISTORY_TYPES:
+            return BetHistory().add("user_id", user_id, history_entry)
+        write_behind.push("users", {"discord_id": user_id}, "history", history_entry, slice_to=-100)
+        return True
 
-    def save(self, user_id):
+    async def save(self, user_id):
         """
         Syncs a user's wallet based on their points and primary coin.
         Updates the wallet value based on how many points the user has.
@@ -98,7 +260,7 @@ class Users:
 
         try:
             # Get user data
-            user_data = self.fetch_user(user_id)
+            user_data = await self.fetch_user(user_id, "wallet")
             if not user_data:
                 print(f"{Fore.RED}[!] {Fore.WHITE}Cannot save user {Fore.RED}{user_id}{Fore.WHITE}: User not found")
                 return False
@@ -130,7 +292,7 @@ class Users:
             wallet[current_primary_coin] = current_coin_amount
 
             # Update database with the wallet value
-            update_result = self.collection.update_one(
+            update_result = await self.collection.update_one(
                 {"discord_id": user_id},
                 {
                     "$set": {
@@ -157,37 +319,52 @@ class Servers:
         self.db = mongodb["BetSync"]
         self.collection = self.db["servers"]
 
-    def get_total_all_servers(self):
-        return self.collection.count_documents({})
+    async def get_total_all_servers(self):
+        return await self.collection.count_documents({})
 
-    def new_server(self, dump):
+    async def new_server(self, dump):
         server_id = dump["server_id"]
-        if self.collection.count_documents({"server_id": server_id}):
+        if await self.collection.count_documents({"server_id": server_id}):
             return False
         else:
-            new_server_ = self.collection.insert_one(dump) 
-            return self.collection.find_one({"server_id": server_id})
+            new_server_ = await self.collection.insert_one(dump) 
+            return await self.collection.find_one({"server_id": server_id})
 
-    def update_server_profit(self, ctx, server_id, amount, game=None):
-        """Updates server profit and sends a webhook notification."""
+    async def update_server_profit(self, ctx, server_id, amount, game=None):
+        """
+        Queues a server profit update in the primary coin of the user who
+        played (ctx.author). See record_profit.
+        """
         try:
-            # Get server info
-            server_info = self.collection.find_one({"server_id": server_id})
-            if not server_info:
-                print(f"Error: Server {server_id} not found.")
-                return False
-            server_name = server_info.get("server_name", f"Unknown Server ({server_id})")
-            current_wallet = server_info.get("wallet", {})
-
-            # Get user's primary coin and calculate crypto value
+            # Get user's primary coin
             users_db = Users()
-            user_data = users_db.fetch_user(ctx.author.id)
+            user_data = await users_db.fetch_user(ctx.author.id, "wallet")
             if not user_data:
                  print(f"Error: User {ctx.author.id} not found for server profit update.")
                  # For now, let's assume we need the user's primary coin
                  return False
-
             primary_coin = user_data.get("primary_coin", "BTC") # Default to BTC if not set
+        except Exception as e:
+            print(f"Error updating server profit: {e}")
+            return False
+        return await self.record_profit(server_id, amount, primary_coin, game)
+
+    async def record_profit(self, server_id, amount, primary_coin, game=None):
+        """
+        Queues a server profit update. The wallet and daily profit increments
+        are coalesced by the write-behind queue, and the webhook notification
+        is sent per server once the batch is flushed.
+
+        Args:
+            server_id (int): The Discord ID of the server.
+            amount (float): Profit in points; negative when the player won.
+            primary_coin (str): The coin the profit is booked in.
+            game (str): The game, for the log line.
+
+        Returns:
+            bool: True if the update was queued, False otherwise.
+        """
+        try:
             crypto_values = {
                 "BTC": 0.00000024,
                 "LTC": 0.00023,
@@ -198,40 +375,17 @@ class Servers:
             # Use .get() with default 0 to avoid KeyError if primary_coin isn't in crypto_values
             crypto_value_change = amount * crypto_values.get(primary_coin, 0) # Profit/Loss in crypto
 
-            # Get current balance for the specific coin before update
-            current_coin_balance = current_wallet.get(primary_coin, 0)
-
-            # Update server profit in DB
-            update_result = self.collection.update_one(
-                {"server_id": server_id},
-                {"$inc": {f"wallet.{primary_coin}": crypto_value_change}}
-            )
-
-            if update_result.modified_count == 0 and not update_result.upserted_id:
-                 print(f"Warning: Server profit update didn't modify document for server {server_id}.")
-                 # Continue for logging and notification, but be aware.
-
-            # Calculate new balance
-            new_coin_balance = current_coin_balance + crypto_value_change
+            # Queue the server profit update
+            write_behind.inc("servers", {"server_id": server_id}, {f"wallet.{primary_coin}": crypto_value_change})
 
             # Update daily profit data
             PD = ProfitData()
-            PD.update_daily_profit(primary_coin, crypto_value_change)
+            await PD.update_daily_profit(primary_coin, crypto_value_change)
 
             # Log the update
             rn = datetime.datetime.now().strftime("%X")
             profit_color = Fore.GREEN if crypto_value_change >= 0 else Fore.RED
-            print(f"{Back.CYAN}  {Style.DIM}{server_name} - {server_id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{profit_color}{amount} Points ({crypto_value_change:+.8f} {primary_coin}){Fore.WHITE}{Style.RESET_ALL}  {Fore.MAGENTA}{game}, sv_profit{Fore.WHITE}")
-
-            # Send webhook notification asynchronously
-            notifier = Notifier()
-            asyncio.create_task(notifier.server_profit_update(
-                server_id=server_id,
-                server_name=server_name,
-                profit_loss_amount=crypto_value_change,
-                new_wallet_balance=new_coin_balance,
-                currency=primary_coin
-            ))
+            print(f"{Back.CYAN}  {Style.DIM}{server_id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{profit_color}{amount} Points ({crypto_value_change:+.8f} {primary_coin}){Fore.WHITE}{Style.RESET_ALL}  {Fore.MAGENTA}{game}, sv_profit{Fore.WHITE}")
 
             return True
         except Exception as e:
@@ -241,35 +395,253 @@ class Servers:
             # traceback.print_exc()
             return False
 
-    def get_np(self, game=None):
+    async def get_np(self, game=None):
         if game:
             npc = self.db["net_profit"]
-            return npc.find_one({"game": game})
+            return await npc.find_one({"game": game})
         else:
             npc = self.db["net_profit"]
-            return npc.find_one({})
+            return await npc.find_one({})
+
+    async def update_history(self, server_id, history_entry):
+        """Queue an entry for the server's bet history; written by the next batch flush"""
+        return BetHistory().add("server_id", server_id, history_entry)
+
+    async def add_bet_to_history(self, server_id, history_entry):
+        """Alias for update_history for backward compatibility"""
+        return await self.update_history(server_id, history_entry)
+
+    async def fetch_server(self, server_id, projection=None):
+        """
+        Fetches a server document.
+
+        Args:
+            server_id (int): The Discord ID of the server.
+            projection (dict): Optional projection to limit the returned fields.
+
+        Returns:
+            dict: The server document, or False if the server does not exist.
+        """
+        server = await self.collection.find_one({"server_id": server_id}, projection)
+        return server if server is not None else False
+
+
+def history_timestamp(entry, default=None):
+    """
+    Reads a history entry's timestamp, which older code stored as epoch
+    seconds, a digit string or an ISO 8601 string.
+
+    Args:
+        entry (dict): The history entry.
+        default (datetime.datetime): Returned when there is no parseable
+            timestamp; now if not given.
+
+    Returns:
+        datetime.datetime: The entry time.
+    """
+    timestamp = entry.get("timestamp")
+    try:
+        if isinstance(timestamp, datetime.datetime):
+            return timestamp
+        if isinstance(timestamp, (int, float)):
+            return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+        if isinstance(timestamp, str):
+            if timestamp.isdigit():
+                return datetime.datetime.fromtimestamp(int(timestamp), datetime.timezone.utc)
+            return datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, OverflowError, OSError):
+        pass
+    return default or datetime.datetime.now(datetime.timezone.utc)
+
+
+class BetHistory:
+    """
+    Append-only bet history for users and servers, one document per entry:
+    {user_id | server_id, ts, type, entry}. Recording a bet never rewrites
+    the user or server document and history is no longer capped at 100
+    entries; BET_HISTORY_TTL_DAYS optionally expires old records.
+    """
+
+    def __init__(self):
+        self.db = mongodb["BetSync"]
+        self.collection = self.db["bet_history"]
+
+    @staticmethod
+    def make_record(owner_field, owner_id, entry, record_id=None):
+        """
+        Builds a bet_history document.
+
+        Args:
+            owner_field (str): "user_id" or "server_id".
+            owner_id (int): The Discord ID of the user or server.
+            entry (dict): The history entry as the games build it.
+            record_id (ObjectId): Optional fixed _id (used by the migration).
+
+        Returns:
+            dict: The document to insert.
+        """
+        return {
+            "_id": record_id or ObjectId(),
+            owner_field: owner_id,
+            "ts": history_timestamp(entry),
+            "type": entry.get("type"),
+            "entry": entry,
+        }
+
+    def add(self, owner_field, owner_id, entry):
+        """Queue a history record; written by the next batch flush"""
+        write_behind.insert("bet_history", self.make_record(owner_field, owner_id, entry))
+        return True
+
+    async def fetch_page(self, owner_field, owner_id, types=None, after=None, limit=10):
+        """
+        Fetches one page of history, newest first. Pages are keyed on the
+        last (ts, _id) seen rather than skipped over, so every page is a
+        bounded index range scan however deep the history goes.
+
+        Args:
+            owner_field (str): "user_id" or "server_id".
+            owner_id (int): The Discord ID of the user or server.
+            types (list): Entry types to include, or None for all.
+            after (tuple): The cursor returned with the previous page.
+            limit (int): Records per page.
+
+        Returns:
+            tuple: (records, cursor) where cursor is None on the last page.
+        """
+        query = {owner_field: owner_id}
+        if types:
+            query["type"] = {"$in": list(types)}
+        if after:
+            ts, record_id = after
+            query["$or"] = [{"ts": {"$lt": ts}}, {"ts": ts, "_id": {"$lt": record_id}}]
+
+        records = await self.collection.find(query).sort(
+            [("ts", DESCENDING), ("_id", DESCENDING)]
+        ).limit(limit + 1).to_list(None)
+
+        if len(records) <= limit:
+            return records, None
+        records = records[:limit]
+        return records, (records[-1]["ts"], records[-1]["_id"])
+
+
+class Leaderboards:
+    """
+    Ranked leaderboard snapshots, one collection per metric
+    (leaderboard_<metric>: {rank, discord_id, amount}), rebuilt server-side
+    by a single aggregation. Serving a page is a range read on rank and a
+    rank lookup is one indexed find, however many users there are.
+    """
+
+    def __init__(self):
+        self.db = mongodb["BetSync"]
+        self.meta = self.db["leaderboard_meta"]
+
+    @staticmethod
+    def _pipeline(metric, prices=None):
+        if metric == "usd":
+            # Same valuation as Fetches.calculate_total_usd: USDT at 1.0, rounded to cents
+            rates = {
+                coin: 1.0 if coin == "USDT" else prices.get(price_oracle.coin_id(coin), {}).get("usd", 0)
+                for coin in USD_WALLET_COINS
+            }
+            amount = {"$round": [{"$add": [
+                {"$multiply": [{"$ifNull": [f"$wallet.{coin}", 0]}, rate]} for coin, rate in rates.items()
+            ]}, 2]}
+            field = "amount"
+            stages = [
+                {"$project": {"discord_id": 1, "amount": amount}},
+                {"$match": {"amount": {"$gt": 0}}},
+            ]
+        else:
+            # Ranking on the raw field lets the (field, discord_id) index drive the sort
+            field = LEADERBOARDS[metric]
+            stages = [{"$match": {field: {"$gt": 0}}}]
+
+        return stages + [
+            {"$setWindowFields": {
+                "sortBy": {field: -1, "discord_id": 1},
+                "output": {"rank": {"$documentNumber": {}}}
+            }},
+            {"$project": {"_id": 0, "rank": 1, "discord_id": 1, "amount": f"${field}"}},
+            {"$out": f"leaderboard_{metric}"},
+        ]
+
+    async def rebuild(self, metric):
+        """
+        Rebuilds one leaderboard snapshot.
+
+        Args:
+            metric (str): A key of LEADERBOARDS.
 
-    def update_history(self, server_id, history_entry):
-        """Add an entry to server's bet history with 100 entry limit"""
+        Returns:
+            bool: True if the snapshot was rebuilt.
+        """
         try:
-            self.collection.update_one(
-                {"server_id": server_id},
-                {"$push": {"server_bet_history": {"$each": [history_entry], "$slice": -100}}}
+            start = time.perf_counter()
+            prices = None
+            if metric == "usd":
+                prices = await price_oracle.get_prices()
+                if not prices:
+                    print(f"{Fore.YELLOW}[!] {Fore.WHITE}Skipping usd leaderboard rebuild: no prices available")
+                    return False
+
+            cursor = await self.db["users"].aggregate(self._pipeline(metric, prices))
+            await cursor.to_list(None)
+            total = await self.db[f"leaderboard_{metric}"].count_documents({})
+            await self.meta.update_one(
+                {"metric": metric},
+                {"$set": {"total": total, "updated_at": datetime.datetime.now(datetime.timezone.utc)}},
+                upsert=True
             )
+
+            rn = datetime.datetime.now().strftime("%X")
+            print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Rebuilt {Fore.GREEN}{metric}{Fore.WHITE} leaderboard: {total} ranked in {(time.perf_counter() - start) * 1000:.0f}ms")
             return True
         except Exception as e:
-            print(f"Error updating server history: {e}")
+            print(f"{Fore.RED}[!] {Fore.WHITE}Error rebuilding {metric} leaderboard: {e}")
             return False
 
-    def add_bet_to_history(self, server_id, history_entry):
-        """Alias for update_history for backward compatibility"""
-        return self.update_history(server_id, history_entry)
+    async def rebuild_all(self):
+        for metric in LEADERBOARDS:
+            await self.rebuild(metric)
 
-    def fetch_server(self, server_id):
-        if self.collection.count_documents({"server_id": server_id}):
-            return self.collection.find_one({"server_id": server_id})
-        else:
-            return False
+    async def info(self, metric):
+        """
+        Snapshot metadata, building the snapshot first if it has never been built.
+
+        Returns:
+            dict: {"metric", "total", "updated_at"}, or None if it can't be built.
+        """
+        info = await self.meta.find_one({"metric": metric})
+        if info is None and await self.rebuild(metric):
+            info = await self.meta.find_one({"metric": metric})
+        return info
+
+    async def fetch_page(self, metric, page, page_size=10):
+        """
+        Args:
+            metric (str): A key of LEADERBOARDS.
+            page (int): Zero-based page number.
+            page_size (int): Entries per page.
+
+        Returns:
+            list: {"rank", "discord_id", "amount"} entries for the page, in rank order.
+        """
+        start = page * page_size
+        return await self.db[f"leaderboard_{metric}"].find(
+            {"rank": {"$gt": start, "$lte": start + page_size}}
+        ).sort("rank", ASCENDING).to_list(None)
+
+    async def rank_of(self, metric, user_id):
+        """
+        Looks up where a user stands on a leaderboard.
+
+        Returns:
+            dict: {"rank", "discord_id", "amount"}, or None if the user isn't ranked.
+        """
+        return await self.db[f"leaderboard_{metric}"].find_one({"discord_id": user_id})
 
 
 class ServerProfit:
@@ -277,7 +649,7 @@ class ServerProfit:
         self.db = mongodb["BetSync"]
         self.collection = self.db["server_profit"]
 
-    def get_server_profit(self, server_id=None, date=None):
+    async def get_server_profit(self, server_id=None, date=None):
         """
         Get server profit data for a specific server, date, or all servers
 
@@ -294,12 +666,12 @@ class ServerProfit:
 
         # If server_id is provided, return just that server's data
         if server_id:
-            return self.collection.find_one({"server_id": server_id, "date": date})
+            return await self.collection.find_one({"server_id": server_id, "date": date})
 
         # Otherwise return all servers for the date
-        return list(self.collection.find({"date": date}))
+        return await self.collection.find({"date": date}).to_list(None)
 
-    def update_server_profit(self, server_id, server_name, amount):
+    async def update_server_profit(self, server_id, server_name, amount):
         """
         Update server profit for today
 
@@ -315,17 +687,12 @@ class ServerProfit:
             # Get today's date
             today = datetime.date.today().strftime("%Y-%m-%d")
 
-            # Use upsert to handle both new records and updates
-            result = self.collection.update_one(
+            # Queue an upsert; increments for the same server and day are merged
+            write_behind.inc(
+                "server_profit",
                 {"server_id": server_id, "date": today},
-                {
-                    "$inc": {"profit": amount},
-                    "$setOnInsert": {
-                        "date": today,
-                        "server_id": server_id,
-                        "server_name": server_name
-                    }
-                },
+                {"profit": amount},
+                set_on_insert={"server_name": server_name},
                 upsert=True
             )
 
@@ -337,12 +704,12 @@ class ServerProfit:
             print(f"Error updating server profit: {e}")
             return False
 
-    def get_all_server_profits(self, date=None):
+    async def get_all_server_profits(self, date=None):
         """Get profit data for all servers on a specific date"""
         if date is None:
             date = datetime.date.today().strftime("%Y-%m-%d")
 
-        return list(self.collection.find({"date": date}))
+        return await self.collection.find({"date": date}).to_list(None)
 
 
 class ProfitData:
@@ -350,36 +717,58 @@ class ProfitData:
         self.db = mongodb["BetSync"]
         self.collection = self.db["profit_data"]
 
-    def update_daily_profit(self, coin, amount, game=None):
+    async def update_daily_profit(self, coin, amount, game=None):
         # Convert datetime.date to string format (YYYY-MM-DD)
         today = datetime.date.today().strftime("%Y-%m-%d")
         try:
-            # Use upsert to handle both document creation and updating
-            # This creates the document if it doesn't exist, or updates it if it does
-            # The setOnInsert ensures we set initial values only if creating a new document
-            result = self.collection.update_one(
-                {"date": today},
-                {
-                    "$inc": {f"wallet.{coin}": amount},
-                    "$setOnInsert": {
-                        "date": today,
-                        #"games": {}  # Initialize games object if needed
-                    }
-                },
-                upsert=True  # Create document if it doesn't exist
-            )
-
-            return result
+            # Queue an upsert; increments for the same day and coin are merged
+            # until the write-behind queue flushes them
+            write_behind.inc("profit_data", {"date": today}, {f"wallet.{coin}": amount}, upsert=True)
+            return True
         except Exception as e:
             print(f"Error updating daily profit: {e}")
             print(f"Details: {str(e)}")  # More detailed error logging
             return False
 
-    def get_profit_data(self, date=None):
+    async def get_profit_data(self, date=None):
         if date:
             # Convert date to string if it's a datetime object
             if isinstance(date, (datetime.date, datetime.datetime)):
                 date = date.strftime("%Y-%m-%d")
-            return self.collection.find_one({"date": date})
+            return await self.collection.find_one({"date": date})
         else:
-            return list(self.collection.find())
\ No newline at end of file
+            return await self.collection.find().to_list(None)
+
+
+async def _invalidate_flushed_users(updates):
+    """Flushed history pushes change full user documents, so drop them from the cache."""
+    for update in updates:
+        user_cache.invalidate(update["filter"]["discord_id"])
+
+
+async def _notify_server_profit(updates):
+    """Sends one profit webhook per server and coin for each flushed batch of wallet changes."""
+    changes = {update["filter"]["server_id"]: update["inc"] for update in updates if update["inc"]}
+    if not changes:
+        return
+    servers = await mongodb["BetSync"]["servers"].find(
+        {"server_id": {"$in": list(changes)}},
+        {"server_id": 1, "server_name": 1, "wallet": 1}
+    ).to_list(None)
+    notifier = Notifier()
+    for server in servers:
+        server_id = server["server_id"]
+        for field, change in changes[server_id].items():
+            currency = field.split(".", 1)[1]
+            asyncio.create_task(notifier.server_profit_update(
+                server_id=server_id,
+                server_name=server.get("server_name", f"Unknown Server ({server_id})"),
+                profit_loss_amount=change,
+                new_wallet_balance=server.get("wallet", {}).get(currency, 0),
+                currency=currency
+            ))
+
+
+write_behind.add_flush_hook("users", _invalidate_flushed_users)
+write_behind.add_flush_hook("servers", _notify_server_profit)
+write_behind.add_flush_hook("profit_data", profit_charts.on_flush)
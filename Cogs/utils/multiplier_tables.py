@@ -0,0 +1,107 @@
+from functools import lru_cache
+
+# Multipliers of the step games (Mines, Tower, Pump, Cross the Road) depend
+# only on the settings and the steps taken, so they are built once here and
+# the games and the RTP suite read the same values. Tables are indexed
+# [setting][steps], steps 0 being the start.
+
+MINES_CELLS = 25
+# Multipliers are 1 / (chance of getting this far) times this, an ~8% house edge
+MINES_MULTIPLIER_EDGE = 0.92
+
+TOWER_LEVELS = 9
+# Difficulty -> tiles per row, diamonds per row and the multiplier after each level
+TOWER_DIFFICULTIES = {
+    "easy": {"tiles": 4, "diamonds": 3, "multipliers": [1.27, 1.69, 2.25, 3.00, 4.00, 5.34, 7.12, 9.49, 12.65]},
+    "medium": {"tiles": 3, "diamonds": 2, "multipliers": [1.43, 2.14, 3.21, 4.81, 7.21, 10.82, 16.23, 24.35, 36.52]},
+    "hard": {"tiles": 2, "diamonds": 1, "multipliers": [1.90, 3.80, 7.60, 15.20, 30.40, 60.80, 121.60, 243.20, 486.40]},
+    "expert": {"tiles": 2, "diamonds": 1, "multipliers": [2.85, 8.55, 25.65, 76.95, 230.85, 693.55, 2077.65, 6232.95, 18798.85]},
+    "master": {"tiles": 4, "diamonds": 1, "multipliers": [3.80, 15.20, 60.80, 243.20, 972.80, 3891.20, 15564.80, 62259.20, 249036.80]},
+}
+
+MAX_PUMPS = 12
+# Difficulty -> chance of the first pump popping the balloon, and the
+# multiplier after each number of pumps (index 0 is before any pump)
+PUMP_DIFFICULTIES = {
+    "easy": {"failure_rate": 0.25, "multipliers": [1.00, 1.27, 1.69, 2.25, 3.00, 4.00, 5.34, 7.13, 9.49, 12.65, 16.87, 22.49, 29.98]},
+    "medium": {"failure_rate": 0.50, "multipliers": [1.00, 1.90, 3.80, 7.60, 15.20, 30.40, 60.80, 121.60, 243.20, 486.40, 972.80, 1945.60, 3891.20]},
+    "hard": {"failure_rate": 0.70, "multipliers": [1.00, 3.17, 10.56, 35.19, 117.28, 390.95, 1303.15, 4344.32, 14480.00, 48288.50, 161019.30, 536257.00, 1788234.00]},
+    "extreme": {"failure_rate": 0.85, "multipliers": [1.00, 6.33, 42.22, 281.48, 1876.54, 12511.60, 83333.34, 556206.00, 3707317.00, 24675324.70, 164502000.00, 1099530000.00, 7330200000.00]},
+}
+
+MAX_LANES = 25
+# Difficulty -> (chance to be hit crossing a lane, multiplier growth per lane)
+CTR_DIFFICULTIES = {
+    "easy": (0.16, 1.10),
+    "medium": (0.25, 1.30),
+    "hard": (0.37, 1.50),
+    "extreme": (0.47, 1.70),
+}
+
+
+@lru_cache(maxsize=None)
+def mines_tables(cells):
+    """
+    Mines multipliers and survival chances for a board of `cells` tiles.
+
+    Returns:
+        tuple: (multipliers, survival), each indexed [mines][safe tiles revealed].
+            The multiplier is 1 / survival less the house edge, rounded to
+            2 places and at least 1.0.
+    """
+    multipliers, survival = [], []
+    for mines in range(cells):
+        safe = cells - mines
+        inverse, chance = 1.0, 1.0
+        row_multipliers, row_survival = [1.0], [1.0]
+        for revealed in range(safe):
+            probability = (safe - revealed) / (cells - revealed)
+            inverse /= probability
+            chance *= probability
+            row_multipliers.append(max(1.0, round(inverse * MINES_MULTIPLIER_EDGE, 2)))
+            row_survival.append(chance)
+        multipliers.append(tuple(row_multipliers))
+        survival.append(tuple(row_survival))
+    return tuple(multipliers), tuple(survival)
+
+
+def _tower_tables():
+    multipliers, survival = {}, {}
+    for difficulty, settings in TOWER_DIFFICULTIES.items():
+        levels = settings["multipliers"]
+        # Clearing the top level keeps the multiplier of the level below
+        multipliers[difficulty] = (1.0,) + tuple(levels[:TOWER_LEVELS - 1]) + (levels[TOWER_LEVELS - 2],)
+        chance = settings["diamonds"] / settings["tiles"]
+        survival[difficulty] = tuple(chance ** level for level in range(TOWER_LEVELS + 1))
+    return multipliers, survival
+
+
+def _pump_tables():
+    pop_chances, survival = {}, {}
+    for difficulty, settings in PUMP_DIFFICULTIES.items():
+        # Grows 10% per pump, capped at 95% to always give some chance
+        pop_chances[difficulty] = tuple(min(settings["failure_rate"] * (1.1 ** pumps), 0.95) for pumps in range(MAX_PUMPS))
+        chances = [1.0]
+        for pop in pop_chances[difficulty]:
+            chances.append(chances[-1] * (1 - pop))
+        survival[difficulty] = tuple(chances)
+    return pop_chances, survival
+
+
+def _ctr_tables():
+    multipliers, survival = {}, {}
+    for difficulty, (hit_chance, increment) in CTR_DIFFICULTIES.items():
+        row_multipliers, row_survival = [1.0], [1.0]
+        for _ in range(MAX_LANES):
+            row_multipliers.append(row_multipliers[-1] * increment)
+            row_survival.append(row_survival[-1] * (1 - hit_chance))
+        multipliers[difficulty] = tuple(row_multipliers)
+        survival[difficulty] = tuple(row_survival)
+    return multipliers, survival
+
+
+MINES_MULTIPLIERS, MINES_SURVIVAL = mines_tables(MINES_CELLS)
+TOWER_MULTIPLIERS, TOWER_SURVIVAL = _tower_tables()
+PUMP_MULTIPLIERS = {difficulty: tuple(settings["multipliers"]) for difficulty, settings in PUMP_DIFFICULTIES.items()}
+PUMP_POP_CHANCES, PUMP_SURVIVAL = _pump_tables()
+CTR_MULTIPLIERS, CTR_SURVIVAL = _ctr_tables()
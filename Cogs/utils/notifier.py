@@ -1,8 +1,6 @@
 import discord
-from discord_webhook import DiscordWebhook, DiscordEmbed
 #from Cogs.utils.mongo import Users # Avoid circular import if possible
-import aiohttp
-import asyncio
+from Cogs.utils.http_client import http
 import os
 import datetime # Needed for timestamp
 from dotenv import load_dotenv
@@ -14,8 +12,18 @@ class Notifier:
     Utility class for sending notifications via Discord webhooks
     """
 
+    @staticmethod
+    async def _send(webhook_url, embed):
+        """Post one embed to a webhook through the shared HTTP client; 429s are retried there"""
+        embed["timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        response = await http.post(webhook_url, json={"embeds": [embed]})
+        if response.status >= 300:
+            print(f"Webhook returned {response.status}: {response.text()[:200]}")
+            return False
+        return True
+
     #@staticmethod # Keep methods as instance methods if they might need self later
-    async def bet_event(self, webhook_url, user_id, bet_amount):
+    async def bet_event(self, webhook_url, user_id, bet_amount, user_data=None):
         """
         Send a bet event notification to a webhook
 
@@ -23,14 +31,18 @@ class Notifier:
         - webhook_url: Discord webhook URL
         - user_id: Discord user ID
         - bet_amount: Amount bet in the transaction
+        - user_data: Optional post-bet user state (points, primary_coin, wallet);
+          fetched from the database when not provided
         """
         from Cogs.utils.mongo import Users # Import locally to potentially avoid circular issues
         if not webhook_url:
             return False
 
         try:
-            userd = Users()
-            resp = userd.fetch_user(user_id=user_id)
+            resp = user_data
+            if resp is None:
+                userd = Users()
+                resp = await userd.fetch_user(user_id=user_id, projection="wallet")
             if not resp: # Handle case where user might not be found
                  print(f"Notifier: User {user_id} not found for bet_event.")
                  return False
@@ -40,48 +52,36 @@ class Notifier:
             wallet = resp.get("wallet", {})
             coin_balance = wallet.get(primary_currency, 0) # Use .get for safety
 
-            # Create webhook
-            webhook = DiscordWebhook(url=webhook_url, rate_limit_retry=True)
-
             # Create embed
-            embed = DiscordEmbed(
-                title="🎮 New Bet Placed",
-                description="A user has placed a new bet in BetSync Casino",
-                color=0x00FFAE
-            )
-
-            # User details field
-            embed.add_embed_field(
-                name="👤 User Details",
-                value=(
-                    f"**User:** <@{user_id}>\n"
-                    f"**ID:** `{user_id}`"
-                ),
-                inline=False
-            )
-
-            # Bet and wallet details field
-            embed.add_embed_field(
-                name="💰 Bet Details",
-                value=(
-                    f"**Bet Amount:** {float(bet_amount):,.2f} points\n" # Ensure float conversion
-                    f"**Balance Before:** {float(current_balance + bet_amount):,.2f} points\n" # Approx balance before
-                    f"**Balance After:** {float(current_balance):,.2f} points ({coin_balance:.8f} {primary_currency})"
-                ),
-                inline=False
-            )
-
-            embed.set_footer(text="BetSync Casino Notification System")
-            embed.set_timestamp() # Add timestamp
-
-            # Add embed to webhook
-            webhook.add_embed(embed)
-
-            # Send webhook (async)
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, webhook.execute)
-            # Check response status if needed
-            return True
+            embed = {
+                "title": "🎮 New Bet Placed",
+                "description": "A user has placed a new bet in BetSync Casino",
+                "color": 0x00FFAE,
+                "fields": [
+                    # User details field
+                    {
+                        "name": "👤 User Details",
+                        "value": (
+                            f"**User:** <@{user_id}>\n"
+                            f"**ID:** `{user_id}`"
+                        ),
+                        "inline": False
+                    },
+                    # Bet and wallet details field
+                    {
+                        "name": "💰 Bet Details",
+                        "value": (
+                            f"**Bet Amount:** {float(bet_amount):,.2f} points\n" # Ensure float conversion
+                            f"**Balance Before:** {float(current_balance + bet_amount):,.2f} points\n" # Approx balance before
+                            f"**Balance After:** {float(current_balance):,.2f} points ({coin_balance:.8f} {primary_currency})"
+                        ),
+                        "inline": False
+                    }
+                ],
+                "footer": {"text": "BetSync Casino Notification System"}
+            }
+
+            return await self._send(webhook_url, embed)
 
         except Exception as e:
             print(f"Error sending bet_event webhook notification: {e}")
@@ -104,9 +104,6 @@ class Notifier:
             return False
 
         try:
-            # Create webhook
-            webhook = DiscordWebhook(url=webhook_url, rate_limit_retry=True)
-
             # Determine color and title based on profit/loss
             if profit_loss_amount >= 0:
                 color = 0x00FF00  # Green for profit
@@ -118,43 +115,34 @@ class Notifier:
                 change_indicator = "" # Amount already includes negative sign
 
             # Create embed
-            embed = DiscordEmbed(
-                title=title,
-                description=f"Profit/Loss recorded for server: **{server_name}**",
-                color=color
-            )
-
-            # Server details field
-            embed.add_embed_field(
-                name="🏢 Server Details",
-                value=(
-                    f"**Name:** {server_name}\n"
-                    f"**ID:** `{server_id}`"
-                ),
-                inline=False
-            )
-
-            # Profit/Loss and Wallet details field
-            embed.add_embed_field(
-                name="📊 Update Details",
-                value=(
-                    f"**Change:** {change_indicator}{profit_loss_amount:.8f} {currency}\n"
-                    f"**New {currency} Balance:** {new_wallet_balance:.8f} {currency}"
-                ),
-                inline=False
-            )
-
-            embed.set_footer(text="BetSync Casino Server Profit Notification")
-            embed.set_timestamp() # Add timestamp
-
-            # Add embed to webhook
-            webhook.add_embed(embed)
-
-            # Send webhook (async)
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, webhook.execute)
-            # Check response status if needed
-            return True
+            embed = {
+                "title": title,
+                "description": f"Profit/Loss recorded for server: **{server_name}**",
+                "color": color,
+                "fields": [
+                    # Server details field
+                    {
+                        "name": "🏢 Server Details",
+                        "value": (
+                            f"**Name:** {server_name}\n"
+                            f"**ID:** `{server_id}`"
+                        ),
+                        "inline": False
+                    },
+                    # Profit/Loss and Wallet details field
+                    {
+                        "name": "📊 Update Details",
+                        "value": (
+                            f"**Change:** {change_indicator}{profit_loss_amount:.8f} {currency}\n"
+                            f"**New {currency} Balance:** {new_wallet_balance:.8f} {currency}"
+                        ),
+                        "inline": False
+                    }
+                ],
+                "footer": {"text": "BetSync Casino Server Profit Notification"}
+            }
+
+            return await self._send(webhook_url, embed)
 
         except Exception as e:
             print(f"Error sending server profit webhook notification: {e}")
@@ -180,55 +168,44 @@ class Notifier:
             return False
 
         try:
-            webhook = DiscordWebhook(url=webhook_url, rate_limit_retry=True)
-
-            embed = DiscordEmbed(
-                title=f"✅ New {currency} Deposit Received",
-                description=f"A deposit has been confirmed and credited.",
-                color=0x00AEEF # Blue color for deposits
-            )
-
-            embed.add_embed_field(
-                name="👤 User",
-                value=f"{username} (`{user_id}`)",
-                inline=False
-            )
-
-            embed.add_embed_field(
-                name="💰 Deposit Details",
-                value=(
-                    f"**Amount:** {amount_crypto:.8f} {currency}\n"
-                    f"**Points Credited:** {points_credited:,.2f}\n"
-                    f"**TXID:** `{txid}`"
-                ),
-                inline=False
-            )
-
-            embed.add_embed_field(
-                name="⚖️ Balance Update",
-                value=(
-                    f"**Before:** {balance_before:,.2f} points\n"
-                    f"**After:** {balance_after:,.2f} points"
-                ),
-                inline=False
-            )
+            embed = {
+                "title": f"✅ New {currency} Deposit Received",
+                "description": "A deposit has been confirmed and credited.",
+                "color": 0x00AEEF, # Blue color for deposits
+                "fields": [
+                    {
+                        "name": "👤 User",
+                        "value": f"{username} (`{user_id}`)",
+                        "inline": False
+                    },
+                    {
+                        "name": "💰 Deposit Details",
+                        "value": (
+                            f"**Amount:** {amount_crypto:.8f} {currency}\n"
+                            f"**Points Credited:** {points_credited:,.2f}\n"
+                            f"**TXID:** `{txid}`"
+                        ),
+                        "inline": False
+                    },
+                    {
+                        "name": "⚖️ Balance Update",
+                        "value": (
+                            f"**Before:** {balance_before:,.2f} points\n"
+                            f"**After:** {balance_after:,.2f} points"
+                        ),
+                        "inline": False
+                    }
+                ],
+                "footer": {"text": "BetSync Casino Deposit System"}
+            }
 
             # Add link to block explorer (using Blockstream for LTC)
             if currency == "LTC":
                  explorer_url = f"https://blockstream.info/ltc/tx/{txid}"
-                 embed.add_embed_field(name="🔗 Explorer Link", value=f"[View on Blockstream]({explorer_url})", inline=False)
+                 embed["fields"].append({"name": "🔗 Explorer Link", "value": f"[View on Blockstream]({explorer_url})", "inline": False})
             # Add other explorers if needed
 
-            embed.set_footer(text="BetSync Casino Deposit System")
-            embed.set_timestamp() # Add timestamp
-
-            webhook.add_embed(embed)
-
-            # Send webhook asynchronously
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, webhook.execute)
-            # Optionally check response.status_code
-            return True
+            return await self._send(webhook_url, embed)
 
         except Exception as e:
             print(f"Error sending deposit webhook notification for user {user_id}, txid {txid}: {e}")
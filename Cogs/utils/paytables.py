@@ -0,0 +1,176 @@
+import numpy as np
+
+# Payout tables and odds of the games, kept apart from the cogs so the RTP
+# suite (algorithms/) can read them without a database connection.
+
+# Multiplier paid when the hand bet on wins; player and banker bets lose on a tie
+BACCARAT_PAYOUTS = {"player": 1.85, "banker": 1.85, "tie": 4}
+
+BUILD_MAX_LEVELS = 15
+
+# Block types with different risk/reward ratios (10% house edge built in)
+BUILD_BLOCK_TYPES = {
+    "🟢": {"name": "Safe Block", "success_rate": 0.85, "multiplier": 1.12},
+    "🟡": {"name": "Balanced Block", "success_rate": 0.70, "multiplier": 1.25},
+    "🟠": {"name": "Risky Block", "success_rate": 0.55, "multiplier": 1.45},
+    "🔴": {"name": "Extreme Block", "success_rate": 0.40, "multiplier": 1.80}
+}
+
+# Case multipliers and their chances
+CASE_MULTIPLIERS = [
+    {"value": 23.0, "chance": 0.01, "emoji": "💎", "name": "LEGENDARY", "color": (255, 215, 0)},
+    {"value": 10.0, "chance": 0.02, "emoji": "🌟", "name": "EPIC", "color": (148, 0, 211)},
+    {"value": 3.0, "chance": 0.04, "emoji": "✨", "name": "RARE", "color": (255, 69, 0)},
+    {"value": 2.0, "chance": 0.07, "emoji": "🔷", "name": "UNCOMMON", "color": (30, 144, 255)},
+    {"value": 1.09, "chance": 0.10, "emoji": "🔹", "name": "COMMON", "color": (0, 191, 255)},
+    {"value": 0.4, "chance": 0.35, "emoji": "💢", "name": "BAD LUCK", "color": (128, 128, 128)},
+    {"value": 0.1, "chance": 0.41, "emoji": "💀", "name": "TERRIBLE", "color": (255, 0, 0)}
+]
+
+# Paid on a correct call
+COINFLIP_MULTIPLIER = 1.90
+
+# Payout multipliers when the player's die beats the dealer's and when they tie
+DICE_WIN_MULTIPLIER = 1.90
+DICE_TIE_MULTIPLIER = 0.80
+
+# Payouts based on number of picks and hits
+KENO_PAYOUTS = {
+    1: {1: 3.72},
+    2: {1: 1, 2: 10},
+    3: {1: 0.5, 2: 1.5, 3: 25},
+    4: {1: 0.0, 2: 1.35, 3: 10.0, 4: 100},
+    5: {1: 0.0, 2: 0.0, 3: 3, 4: 50.0, 5: 100.0},
+    6: {1: 0.0, 2: 0.5, 3: 3.0, 4: 12.0, 5: 300.0},
+    7: {1: 0.0, 2: 0.0, 3: 2.0, 4: 8.0, 5: 100.0},
+    8: {1: 0.0, 2: 0.0, 3: 1.5, 4: 5.0, 5: 50.0},
+    9: {1: 0.0, 2: 0.0, 3: 1.0, 4: 3.0, 5: 30.0},
+    10: {1: 0.0, 2: 0.0, 3: 0.5, 4: 2.0, 5: 20.0}
+}
+
+# Rolls are 1 / (1 - R) with R uniform in [0, range): a 10% house edge for fixed rolls, 15% in auto mode
+LIMBO_FIXED_ROLL_RANGE = 0.90
+LIMBO_AUTO_ROLL_RANGE = 0.85
+
+
+def roll_multipliers(count, roll_range):
+    """
+    Rolls `count` crash multipliers in one vectorized draw.
+
+    Args:
+        count (int): How many rolls.
+        roll_range (float): Upper bound of R; LIMBO_FIXED_ROLL_RANGE or LIMBO_AUTO_ROLL_RANGE.
+
+    Returns:
+        numpy.ndarray: The multipliers, rounded to 2 decimal places.
+    """
+    return np.round(1.0 / (1.0 - np.random.random(count) * roll_range), 2)
+
+
+MATCH_BOARD_ROWS = 4
+MATCH_BOARD_COLUMNS = 5
+# 3 tiles of each multiplier plus an extra 0.2x and 0.5x fill the 4x5 board;
+# the first multiplier revealed 3 times pays
+MATCH_MULTIPLIERS = [0.2, 0.5, 1.25, 1.75, 2.0, 3.0]
+MATCH_EXTRA_TILES = [0.2, 0.5]
+
+
+def match_board_tiles():
+    """Every tile of a board, unshuffled."""
+    return [multi for multi in MATCH_MULTIPLIERS for _ in range(3)] + MATCH_EXTRA_TILES
+
+
+# Payouts: the striker wins by shooting where the keeper doesn't dive (2 in 3),
+# the keeper by diving where the striker shoots (1 in 3)
+PENALTY_STRIKER_MULTIPLIER = 1.45
+PENALTY_KEEPER_MULTIPLIER = 2.1
+
+# Plinko multiplier of every landing slot, by risk and row count
+PLINKO_MULTIPLIER_TABLES = {
+    "low_risk": {
+        "8_rows": [5.5, 2.0, 1.1, 1.0, 0.5, 1.0, 1.1, 2.0, 5.5],
+        "9_rows": [5.5, 2, 1.6, 1.0, 0.7, 0.7, 1.0, 1.6, 2.0, 5.5],
+        "10_rows": [8.8, 2.9, 1.4, 1.1, 0.9, 0.5, 0.9, 1.1, 1.4, 2.9, 8.8],
+        "11_rows": [8.3, 2.9, 1.9, 1.3, 1.0, 0.7, 0.7, 1.0, 1.3, 1.9, 2.9, 8.3],
+        "12_rows": [9.9, 3, 1.6, 1.4, 1.1, 1.0, 0.5, 1.0, 1.1, 1.4, 1.6, 3, 9.9],
+        "13_rows": [8, 4, 2.9, 1.8, 1.2, 0.9, 0.7, 0.7, 0.9, 1.2, 1.8, 2.9, 4, 8],
+        "14_rows": [7, 4, 1.8, 1.4, 1.3, 1.1, 1.0, 0.5, 1.0, 1.1, 1.3, 1.4, 1.8, 4, 7],
+        "15_rows": [15, 8, 3, 2, 1.5, 1.1, 1.0, 0.7, 0.7, 1.0, 1.1, 1.5, 2, 3, 8, 15],
+        "16_rows": [15.5, 9, 2, 1.4, 1.3, 1.2, 1.1, 1.0, 0.5, 1.0, 1.1, 1.2, 1.3, 1.4, 2, 9, 15.5]
+    },
+    "medium_risk": {
+        "8_rows": [12, 2.9, 1.3, 0.7, 0.4, 0.7, 1.3, 2.9, 12],
+        "9_rows": [17, 3.8, 1.7, 0.9, 0.5, 0.5, 0.9, 1.7, 3.8, 17],
+        "10_rows": [20, 4.8, 1.9, 1.4, 0.6, 0.4, 0.6, 1.4, 1.9, 4.8, 20],
+        "11_rows": [23, 5.8, 2.9, 1.7, 0.7, 0.5, 0.5, 0.7, 1.7, 2.9, 5.8, 23],
+        "12_rows": [30, 10.2, 3.8, 1.9, 1.1, 0.6, 0.3, 0.6, 1.1, 1.9, 3.8, 10.2, 30],
+        "13_rows": [40, 12, 5.7, 2.8, 1.3, 0.7, 0.4, 0.4, 0.7, 1.3, 2.8, 5.7, 12, 40],
+        "14_rows": [55.0, 15, 6.8, 3.7, 1.9, 1.0, 0.5, 0.2, 0.5, 1.0, 1.9, 3.7, 6.8, 15, 55],
+        "15_rows": [85, 17, 10.5, 5, 3, 1.3, 0.5, 0.3, 0.3, 0.5, 1.3, 3, 5, 10.5, 17, 85],
+        "16_rows": [105, 40, 10, 4.9, 3, 1.5, 1.0, 0.5, 0.3, 0.5, 1.0, 1.5, 3, 4.9, 10, 40, 105]
+    },
+    "high_risk": {
+        "8_rows": [28, 3.9, 1.5, 0.3, 0.2, 0.3, 1.5, 3.9, 28],
+        "9_rows": [41, 6.6, 2.0, 0.6, 0.2, 0.2, 0.6, 2.0, 6.6, 41],
+        "10_rows": [75, 9.5, 2.9, 0.9, 0.3, 0.2, 0.3, 0.9, 2.9, 9.5, 75],
+        "11_rows": [110, 13, 5.1, 1.4, 0.4, 0.2, 0.2, 0.4, 1.4, 5.1, 13, 110],
+        "12_rows": [165, 22, 7.9, 2.0, 0.7, 0.2, 0.2, 0.2, 0.7, 2.0, 7.9, 22, 165],
+        "13_rows": [250, 35, 10, 3.9, 1, 0.2, 0.2, 0.2, 0.2, 1, 3.9, 10, 35, 250],
+        "14_rows": [400, 52, 17, 4.9, 1.9, 0.3, 0.2, 0.2, 0.2, 0.3, 1.9, 4.9, 17, 52, 400],
+        "15_rows": [600, 80, 25, 7.8, 3, 0.5, 0.2, 0.2, 0.2, 0.2, 0.5, 3, 7.8, 25, 80, 600],
+        "16_rows": [950, 126, 24, 8.2, 3.8, 2.0, 0.2, 0.2, 0.2, 0.2, 0.2, 2.0, 3.8, 8.2, 24, 126, 950]
+    }
+}
+
+# Poker payout multiplier for each hand type
+POKER_PAYTABLE = {
+    "Royal Flush": 100,
+    "Straight Flush": 50,
+    "Four of a Kind": 30,
+    "Full House": 15,
+    "Flush": 10,
+    "Straight": 5,
+    "Three of a Kind": 3,
+    "Two Pair": 2,
+    "One Pair": 0,
+    "High Card": 0
+}
+
+# Every correct call multiplies the winnings by this, up to PCF_MAX_FLIPS calls
+PCF_FLIP_MULTIPLIER = 1.96
+PCF_MAX_FLIPS = 15
+
+RACE_CARS = 4
+RACE_TRACK_LENGTH = 15
+# Every tick each car, in order, moves one of these (1-2 mostly, occasionally 3)
+RACE_CAR_MOVES = [1, 1, 2, 2, 3]
+RACE_WIN_MULTIPLIER = 3
+
+# Reduced payout symbols with lower weights for better house edge
+SLOTS_SYMBOLS = {
+    "🍎": {"weight": 30, "payout": 1.1, "rarity": "Common"},
+    "🍊": {"weight": 28, "payout": 1.2, "rarity": "Common"},
+    "🍋": {"weight": 25, "payout": 1.3, "rarity": "Common"},
+    "🍇": {"weight": 20, "payout": 1.8, "rarity": "Uncommon"},
+    "🍒": {"weight": 15, "payout": 2.2, "rarity": "Uncommon"},
+    "🔔": {"weight": 8, "payout": 3.5, "rarity": "Rare"},
+    "💎": {"weight": 3, "payout": 6.0, "rarity": "Epic"},
+    "🍀": {"weight": 1, "payout": 15.0, "rarity": "Legendary"},
+    "🎰": {"weight": 0.2, "payout": 35.0, "rarity": "Mythic"}
+}
+# Taken off every spin's total multiplier
+SLOTS_HOUSE_EDGE = 0.10
+
+# Define color multipliers with better win chances for players; chances are
+# percentages with one decimal place, drawn as weights out of 1000
+WHEEL_COLORS = {
+    "gray": {"emoji": "⚫", "multiplier": 0, "chance": 58, "name": "BUST"},
+    "yellow": {"emoji": "🟡", "multiplier": 1.5, "chance": 25, "name": "BRONZE"},
+    "red": {"emoji": "🔴", "multiplier": 2.5, "chance": 10, "name": "SILVER"},
+    "blue": {"emoji": "🔵", "multiplier": 4.0, "chance": 5, "name": "GOLD"},
+    "green": {"emoji": "🟢", "multiplier": 8.0, "chance": 1.5, "name": "DIAMOND"},
+    "purple": {"emoji": "🟣", "multiplier": 15.0, "chance": 0.4, "name": "RUBY"},
+    "orange": {"emoji": "🟠", "multiplier": 25.0, "chance": 0.1, "name": "LEGENDARY"}
+}
+# 8% house edge on every winning multiplier
+WHEEL_HOUSE_EDGE = 0.08
@@ -0,0 +1,139 @@
+import math
+from bisect import bisect_left
+from itertools import combinations
+
+import numpy as np
+
+SUITS = 4
+# One prime per rank, 2 through ace: the product of a hand's primes identifies its ranks
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+HAND_NAMES = [
+    "Royal Flush", "Straight Flush", "Four of a Kind", "Full House", "Flush",
+    "Straight", "Three of a Kind", "Two Pair", "One Pair", "High Card"
+]
+# Weakest strength of each hand in HAND_NAMES; strength 1 is the best hand, 7462 the worst
+WORST_STRENGTH = [1, 10, 166, 322, 1599, 1609, 2467, 3325, 6185, 7462]
+
+
+def card_id(rank, suit):
+    """Card number 0-51 for rank 0-12 (2 through ace) and suit 0-3."""
+    return rank * SUITS + suit
+
+
+def _hand_classes():
+    """Every distinct 5-card hand, best first, as (ranks, is a flush)."""
+    ranks = range(12, -1, -1)
+    straights = [tuple(range(high, high - 5, -1)) for high in range(12, 3, -1)] + [(3, 2, 1, 0, 12)]
+    straight_sets = {frozenset(straight) for straight in straights}
+    high_cards = [hand for hand in combinations(ranks, 5) if frozenset(hand) not in straight_sets]
+
+    def others(*excluded):
+        return [rank for rank in ranks if rank not in excluded]
+
+    return (
+        [(straight, True) for straight in straights]
+        + [((quad,) * 4 + (kicker,), False) for quad in ranks for kicker in others(quad)]
+        + [((trip,) * 3 + (pair,) * 2, False) for trip in ranks for pair in others(trip)]
+        + [(hand, True) for hand in high_cards]
+        + [(straight, False) for straight in straights]
+        + [((trip,) * 3 + kickers, False) for trip in ranks for kickers in combinations(others(trip), 2)]
+        + [((high,) * 2 + (low,) * 2 + (kicker,), False) for high, low in combinations(ranks, 2) for kicker in others(high, low)]
+        + [((pair,) * 2 + kickers, False) for pair in ranks for kickers in combinations(others(pair), 3)]
+        + [(hand, False) for hand in high_cards]
+    )
+
+
+def _multiset_index(ranks):
+    """
+    Index 0-6187 of a 5-rank multiset given ascending: rank i shifted up by i
+    makes the ranks distinct, and the combinatorial number system numbers them.
+    """
+    return sum(math.comb(rank + i, i + 1) for i, rank in enumerate(ranks))
+
+
+def _build_tables():
+    flushes, others = {}, {}
+    # Strength by multiset index, non-flushes first then flushes
+    strengths = np.zeros(2 * MULTISETS, dtype=np.int16)
+    for strength, (ranks, flush) in enumerate(_hand_classes(), 1):
+        (flushes if flush else others)[math.prod(PRIMES[rank] for rank in ranks)] = strength
+        strengths[_multiset_index(sorted(ranks)) + flush * MULTISETS] = strength
+    return flushes, others, strengths
+
+
+# 5 ranks out of 13 with repetition
+MULTISETS = math.comb(13 + 5 - 1, 5)
+# Built once at import: prime product -> strength for flushes and for everything
+# else (one card at a time), and strength by multiset index (batches)
+_FLUSHES, _OTHERS, _STRENGTHS = _build_tables()
+_CARD_PRIMES = tuple(PRIMES[card // SUITS] for card in range(52))
+# _INDEX_TERMS[i][rank] is the i-th ascending rank's term of the multiset index
+_INDEX_TERMS = [np.array([math.comb(rank + i, i + 1) for rank in range(13)], dtype=np.int16) for i in range(5)]
+_SORTING_NETWORK = ((0, 1), (3, 4), (2, 4), (2, 3), (0, 3), (0, 2), (1, 4), (1, 3), (1, 2))
+_COMBINATIONS = {size: np.array(list(combinations(range(size), 5))) for size in (6, 7)}
+
+
+def _evaluate5(c0, c1, c2, c3, c4):
+    primes = _CARD_PRIMES
+    product = primes[c0] * primes[c1] * primes[c2] * primes[c3] * primes[c4]
+    suit = c0 & 3
+    if suit == c1 & 3 == c2 & 3 == c3 & 3 == c4 & 3:
+        return _FLUSHES[product]
+    return _OTHERS[product]
+
+
+def evaluate(cards):
+    """
+    Strength of the best 5-card hand among 5 to 7 cards.
+
+    Args:
+        cards (list): Card numbers from card_id().
+
+    Returns:
+        int: 1 (royal flush) to 7462 (7-5-4-3-2 offsuit); lower is better.
+    """
+    if len(cards) == 5:
+        return _evaluate5(*cards)
+    return min(_evaluate5(*hand) for hand in combinations(cards, 5))
+
+
+def evaluate_batch(hands):
+    """
+    Strengths of many hands at once.
+
+    Args:
+        hands (numpy.ndarray): (hands, 5), (hands, 6) or (hands, 7) card numbers.
+
+    Returns:
+        numpy.ndarray: The strength of every hand, as evaluate() gives it.
+    """
+    hands = np.asarray(hands)
+    if hands.shape[1] == 5:
+        return _evaluate5_batch(hands)
+    fives = hands[:, _COMBINATIONS[hands.shape[1]]].reshape(-1, 5)
+    return _evaluate5_batch(fives).reshape(len(hands), -1).min(axis=1)
+
+
+def _evaluate5_batch(hands):
+    # Work on one card position at a time: long contiguous columns vectorize best
+    columns = np.ascontiguousarray(hands.T, dtype=np.int16)
+    ranks = list(columns >> 2)
+    suits = columns & 3
+    flush = (suits[0] == suits[1]) & (suits[0] == suits[2]) & (suits[0] == suits[3]) & (suits[0] == suits[4])
+    for low, high in _SORTING_NETWORK:
+        ranks[low], ranks[high] = np.minimum(ranks[low], ranks[high]), np.maximum(ranks[low], ranks[high])
+    index = flush * MULTISETS
+    for terms, column in zip(_INDEX_TERMS, ranks):
+        index += terms[column]
+    return _STRENGTHS[index]
+
+
+def hand_name(strength):
+    """"Royal Flush", "Two Pair", ... for a strength."""
+    return HAND_NAMES[bisect_left(WORST_STRENGTH, strength)]
+
+
+def hand_indexes(strengths):
+    """HAND_NAMES index of every strength in an array."""
+    return np.searchsorted(WORST_STRENGTH, strengths)
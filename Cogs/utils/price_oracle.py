@@ -0,0 +1,187 @@
+import asyncio
+import datetime
+import json
+import os
+import time
+
+from colorama import Fore
+from dotenv import load_dotenv
+
+from Cogs.utils.http_client import http
+
+load_dotenv()
+
+COINGECKO_API_URL = "https://api.coingecko.com/api/v3/simple/price"
+
+# Ticker -> CoinGecko id for every coin the bot prices
+COINGECKO_IDS = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "LTC": "litecoin",
+    "SOL": "solana",
+    "USDT": "tether",
+    "DOGE": "dogecoin",
+}
+
+
+class CoinGeckoProvider:
+    """Fetches USD prices from the CoinGecko simple price API."""
+
+    async def fetch(self, ids):
+        response = await http.get(COINGECKO_API_URL, params={"ids": ",".join(ids), "vs_currencies": "usd"})
+        response.raise_for_status()
+        data = response.json()
+        return {coin_id: float(data[coin_id]["usd"]) for coin_id in ids if data.get(coin_id, {}).get("usd") is not None}
+
+
+class FixtureProvider:
+    """
+    Serves fixed prices so the bot can run without reaching CoinGecko.
+    Set PRICE_FIXTURE to a JSON file such as {"bitcoin": 65000, "litecoin": 80}.
+    """
+
+    def __init__(self, prices):
+        self.prices = {coin_id: float(price) for coin_id, price in prices.items()}
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    async def fetch(self, ids):
+        return {coin_id: self.prices[coin_id] for coin_id in ids if coin_id in self.prices}
+
+
+class PriceOracle:
+    """
+    Single source of USD prices for every cog.
+
+    Prices are kept in memory and refreshed by a background task, so reads
+    are a dict lookup. A read that finds the snapshot older than ttl
+    triggers a refresh; concurrent misses share one upstream request. While
+    the upstream is failing or rate limiting, the last good prices keep
+    being served for up to stale_ttl seconds.
+    """
+
+    def __init__(self, provider, ttl=60.0, stale_ttl=900.0, refresh_interval=30.0):
+        self.provider = provider
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_interval = refresh_interval
+        self._prices = {}  # CoinGecko id -> USD
+        self._fetched_at = 0.0
+        self._inflight = None
+        self._task = None
+        self.refreshes = 0
+        self.failures = 0
+
+    @staticmethod
+    def coin_id(coin):
+        """Accepts a ticker ("LTC", "ltc") or a CoinGecko id ("litecoin")."""
+        return COINGECKO_IDS.get(coin.upper(), coin.lower())
+
+    def age(self):
+        return time.monotonic() - self._fetched_at if self._fetched_at else float("inf")
+
+    async def _refresh(self):
+        try:
+            prices = await self.provider.fetch(list(COINGECKO_IDS.values()))
+            if not prices:
+                raise ValueError("provider returned no prices")
+            self._prices = {**self._prices, **prices}
+            self._fetched_at = time.monotonic()
+            self.refreshes += 1
+        except Exception as e:
+            self.failures += 1
+            print(f"{Fore.RED}[!] {Fore.WHITE}Price refresh failed, serving prices {self.age():.0f}s old: {e}")
+
+    async def refresh(self):
+        """Refresh prices; callers arriving while a refresh is running wait on the same one."""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+            self._inflight.add_done_callback(lambda _: setattr(self, "_inflight", None))
+        await asyncio.shield(self._inflight)
+
+    async def _ensure_fresh(self):
+        age = self.age()
+        if age < self.ttl:
+            return
+        if age < self.stale_ttl and self._prices:
+            # Serve what we have and revalidate in the background
+            if self._inflight is None:
+                asyncio.ensure_future(self.refresh())
+            return
+        await self.refresh()
+
+    def _snapshot(self):
+        # Past stale_ttl the old prices are worse than no prices
+        return self._prices if self.age() < self.stale_ttl else {}
+
+    async def get_prices(self):
+        """
+        Returns:
+            dict: CoinGecko-shaped prices, e.g. {"bitcoin": {"usd": 65000.0}}.
+            Empty if there are no prices younger than stale_ttl.
+        """
+        await self._ensure_fresh()
+        return {coin_id: {"usd": price} for coin_id, price in self._snapshot().items()}
+
+    async def get_price(self, coin):
+        """
+        Args:
+            coin (str): A ticker or CoinGecko id.
+
+        Returns:
+            float: The USD price, or None if it isn't known.
+        """
+        await self._ensure_fresh()
+        return self._snapshot().get(self.coin_id(coin))
+
+    def cached_price(self, coin):
+        """The last known USD price without touching the upstream, or None."""
+        return self._snapshot().get(self.coin_id(coin))
+
+    async def _run(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self):
+        """Start the background refresher (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            rn = datetime.datetime.now().strftime("%X")
+            print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Price oracle started ({self.provider.__class__.__name__}, every {self.refresh_interval:.0f}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self):
+        return {
+            "provider": self.provider.__class__.__name__,
+            "age": self.age(),
+            "coins": len(self._prices),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+
+def _default_provider():
+    fixture = os.getenv("PRICE_FIXTURE")
+    if fixture:
+        return FixtureProvider.from_file(fixture)
+    return CoinGeckoProvider()
+
+
+price_oracle = PriceOracle(
+    _default_provider(),
+    ttl=float(os.getenv("PRICE_TTL", "60")),
+    stale_ttl=float(os.getenv("PRICE_STALE_TTL", "900")),
+    refresh_interval=float(os.getenv("PRICE_REFRESH_INTERVAL", "30"))
+)
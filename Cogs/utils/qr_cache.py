@@ -0,0 +1,101 @@
+import asyncio
+import hashlib
+import io
+import os
+
+from colorama import Fore
+from dotenv import load_dotenv
+
+from Cogs.utils.render_service import render_service
+
+load_dotenv()
+
+
+class QRCodeCache:
+    """
+    Deposit QR cards, rendered once per (currency, address, username).
+
+    A user's deposit address never changes once assigned, so the card only
+    needs redrawing when they rename. Cards are kept as PNG bytes in the
+    render service's "deposit_qr" frame cache and on disk, content addressed:
+
+        <directory>/<sha256(currency:address)>/<sha256(username)>.png
+
+    Writing a card for a new username removes the other cards for that
+    address, which is how a rename invalidates the old one.
+    """
+
+    def __init__(self, directory, max_bytes=8 * 1024 * 1024):
+        self.directory = directory
+        self.memory = render_service.cache("deposit_qr", max_bytes)
+        self.disk_hits = 0
+
+    @staticmethod
+    def _digest(value):
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    def _address_dir(self, currency, address):
+        return os.path.join(self.directory, self._digest(f"{currency.upper()}:{address}"))
+
+    def _path(self, currency, address, username):
+        return os.path.join(self._address_dir(currency, address), f"{self._digest(username)}.png")
+
+    def _read(self, currency, address, username):
+        try:
+            with open(self._path(currency, address, username), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, currency, address, username, png):
+        address_dir = self._address_dir(currency, address)
+        path = self._path(currency, address, username)
+        os.makedirs(address_dir, exist_ok=True)
+        # Write then rename so a reader never sees half a file
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(png)
+        os.replace(f"{path}.tmp", path)
+        # Cards drawn for this address under an old username are stale now
+        for name in os.listdir(address_dir):
+            if os.path.join(address_dir, name) != path:
+                os.remove(os.path.join(address_dir, name))
+
+    async def get(self, currency, address, username, renderer, *args):
+        """
+        Returns the deposit card, rendering it only if it isn't cached.
+
+        Args:
+            currency (str): Ticker, e.g. "LTC".
+            address (str): The user's deposit address.
+            username (str): The name drawn on the card.
+            renderer (callable): The cog's generate_qr_code.
+            *args: Arguments for the renderer.
+
+        Returns:
+            BytesIO: The PNG.
+        """
+        key = (currency.upper(), address, username)
+        if key not in self.memory:
+            try:
+                png = await asyncio.to_thread(self._read, currency, address, username)
+            except OSError as e:
+                print(f"{Fore.YELLOW}[!] {Fore.WHITE}Failed to read cached QR code: {e}")
+                png = None
+            if png is not None:
+                self.memory.put(key, png)
+                self.disk_hits += 1
+
+        rendered = key not in self.memory
+        png = await render_service.render_cached("deposit_qr", key, renderer, *args)
+        if rendered:
+            try:
+                await asyncio.to_thread(self._write, currency, address, username, png)
+            except OSError as e:
+                print(f"{Fore.YELLOW}[!] {Fore.WHITE}Failed to store QR code: {e}")
+        return io.BytesIO(png)
+
+
+qr_codes = QRCodeCache(
+    os.getenv("QR_CACHE_DIR", ".cache/qr_codes"),
+    max_bytes=int(float(os.getenv("QR_CACHE_MB", "8")) * 1024 * 1024)
+)
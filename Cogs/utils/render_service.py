@@ -0,0 +1,295 @@
+import asyncio
+import datetime
+import io
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from colorama import Fore
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class RenderQueueFull(Exception):
+    """Raised when a render waited longer than queue_timeout for a slot."""
+
+
+def _render_png(renderer, args, kwargs):
+    """Worker entry point: run a renderer and return (PNG bytes, seconds spent rendering)."""
+    start = time.perf_counter()
+    result = renderer(*args, **kwargs)
+    if isinstance(result, io.BytesIO):
+        png = result.getvalue()
+    elif isinstance(result, (bytes, bytearray)):
+        png = bytes(result)
+    else:
+        buffer = io.BytesIO()
+        result.save(buffer, format="PNG")
+        png = buffer.getvalue()
+    return png, time.perf_counter() - start
+
+
+def _ready():
+    """No-op submitted at start so every worker is up before the first render."""
+
+
+class RendererStats:
+    """Counters for one named renderer."""
+
+    def __init__(self):
+        self.renders = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.total_render_time = 0.0
+        self.cache_hits = 0
+
+    def as_dict(self):
+        return {
+            "renders": self.renders,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "avg_latency_ms": self.total_latency / self.renders * 1000 if self.renders else 0.0,
+            "max_latency_ms": self.max_latency * 1000,
+            "avg_render_ms": self.total_render_time / self.renders * 1000 if self.renders else 0.0,
+            "cache_hits": self.cache_hits,
+        }
+
+
+class RenderCache:
+    """
+    LRU of finished frames for a renderer whose output is fully determined
+    by a small key. Frames are kept as encoded PNG bytes, so a hit costs no
+    drawing and no encoding. The cache is capped by the total size of the
+    bytes it holds.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()  # key -> PNG bytes
+        self._pending = {}  # key -> render in flight, shared by concurrent misses
+        self.size = 0
+
+    def get(self, key):
+        png = self._frames.get(key)
+        if png is not None:
+            self._frames.move_to_end(key)
+        return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return
+        previous = self._frames.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._frames[key] = png
+        self.size += len(png)
+        while self.size > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+
+class RenderService:
+    """
+    Runs Pillow renderers in a process pool so drawing a game image never
+    blocks the event loop.
+
+    A renderer is any module-level function that returns a PIL image,
+    BytesIO or PNG bytes; its arguments must be picklable. At most
+    max_queue renders are in flight, later callers wait up to queue_timeout
+    seconds for a slot before RenderQueueFull is raised. Cancelling the
+    awaiting task (or hitting timeout) drops a render that hasn't started.
+    Latency, render time and queue depth are tracked per renderer name.
+    Renderers with a small key space can keep their frames in a RenderCache
+    and go through render_cached.
+
+    Workers come from a forkserver: a fresh single-threaded process that
+    imports Cogs.utils.render_worker (the renderer modules and the asset
+    atlas) once and forks every worker from there, the first ones and the
+    ones replacing a broken pool alike. No worker is ever forked from the
+    bot itself, whose threads could be holding a lock at the time. With
+    workers=0 renders run on a thread pool instead.
+    """
+
+    def __init__(self, workers=2, max_queue=32, queue_timeout=10.0, timeout=15.0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.timeout = timeout
+        self._executor = None
+        self._slots = None
+        self._stats = {}  # renderer name -> RendererStats
+        self._caches = {}  # renderer name -> RenderCache
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def start(self):
+        """Starts the fork server and every worker; main.py calls this before the bot runs."""
+        executor = self._get_executor()
+        for _ in range(self.workers):
+            executor.submit(_ready)
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.workers > 0:
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["Cogs.utils.render_worker"])
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="render")
+            rn = datetime.datetime.now().strftime("%X")
+            kind = f"{self.workers} processes" if self.workers > 0 else "threads"
+            print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Render service started ({kind}, queue {self.max_queue})")
+        return self._executor
+
+    def _renderer_stats(self, name):
+        if name not in self._stats:
+            self._stats[name] = RendererStats()
+        return self._stats[name]
+
+    async def render(self, name, renderer, *args, timeout=None, **kwargs):
+        """
+        Renders an image off the event loop.
+
+        Args:
+            name (str): Renderer name for metrics, e.g. "blackjack".
+            renderer (callable): Module-level function returning a PIL image,
+                BytesIO or PNG bytes.
+            *args, **kwargs: Picklable arguments for the renderer.
+            timeout (float): Seconds to wait for the result once queued.
+
+        Returns:
+            bytes: The PNG.
+
+        Raises:
+            RenderQueueFull: When no slot frees up within queue_timeout.
+            asyncio.TimeoutError: When the render takes longer than timeout.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_queue)
+        stats = self._renderer_stats(name)
+        start = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            stats.failures += 1
+            raise RenderQueueFull(f"render queue full ({self.max_queue} in flight), dropped {name}")
+
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                future = asyncio.wrap_future(executor.submit(_render_png, renderer, args, kwargs))
+                try:
+                    png, render_time = await asyncio.wait_for(future, timeout=timeout or self.timeout)
+                    break
+                except BrokenProcessPool:
+                    # A worker died (OOM, segfault in a codec); start a fresh pool and try once more.
+                    # Concurrent renders see the same broken pool, so only the first replaces it.
+                    if self._executor is executor:
+                        print(f"{Fore.RED}[!] {Fore.WHITE}Render pool broke while rendering {name}, restarting it")
+                        # Stops the dead pool's management thread and closes its pipes
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        self._executor = None
+                    if attempt:
+                        raise
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            stats.queued -= 1
+            self.in_flight -= 1
+            self._slots.release()
+
+        latency = time.perf_counter() - start
+        stats.renders += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        stats.total_render_time += render_time
+        return png
+
+    def cache(self, name, max_bytes):
+        """The frame cache for a renderer, created on first use; see render_cached."""
+        if name not in self._caches:
+            self._caches[name] = RenderCache(max_bytes)
+        return self._caches[name]
+
+    async def render_cached(self, name, key, renderer, *args, **kwargs):
+        """
+        Like render, but frames are looked up by key in the renderer's cache
+        first. Concurrent misses for the same key share one render.
+
+        Args:
+            name (str): Renderer name; its cache must exist, see cache().
+            key (hashable): Everything the frame depends on.
+
+        Returns:
+            bytes: The PNG.
+        """
+        cache = self._caches[name]
+        png = cache.get(key)
+        if png is not None:
+            self._renderer_stats(name).cache_hits += 1
+            return png
+
+        pending = cache._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self.render(name, renderer, *args, **kwargs))
+            cache._pending[key] = pending
+
+            def store(future):
+                cache._pending.pop(key, None)
+                if not future.cancelled() and future.exception() is None:
+                    cache.put(key, future.result())
+            pending.add_done_callback(store)
+        # Shielded so one impatient caller doesn't cancel the render for everyone waiting on it
+        return await asyncio.shield(pending)
+
+    async def render_file(self, name, renderer, *args, **kwargs):
+        """Like render, but returns a BytesIO ready for discord.File."""
+        return io.BytesIO(await self.render(name, renderer, *args, **kwargs))
+
+    def close(self):
+        """Stop the workers; renders that haven't started are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self):
+        """Per-renderer metrics keyed by renderer name."""
+        stats = {name: renderer.as_dict() for name, renderer in self._stats.items()}
+        for name, cache in self._caches.items():
+            renderer = stats.setdefault(name, RendererStats().as_dict())
+            renderer["cached_frames"] = len(cache)
+            renderer["cache_bytes"] = cache.size
+        return stats
+
+
+render_service = RenderService(
+    workers=int(os.getenv("RENDER_WORKERS", "2")),
+    max_queue=int(os.getenv("RENDER_MAX_QUEUE", "32")),
+    queue_timeout=float(os.getenv("RENDER_QUEUE_TIMEOUT", "10")),
+    timeout=float(os.getenv("RENDER_TIMEOUT", "15"))
+)
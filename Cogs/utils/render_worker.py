@@ -0,0 +1,27 @@
+import datetime
+import importlib
+
+from colorama import Fore
+
+from Cogs.utils.assets import atlas
+
+# Imported once by the render service's fork server, a fresh single-threaded
+# process that every render worker is forked from. What is loaded here is
+# shared by all workers, including the ones started after a worker crash.
+
+# Modules whose renderers run in the pool. Anything else (the deposit cogs'
+# QR renderers) is imported by a worker the first time it is needed.
+RENDERER_MODULES = [
+    "Cogs.games.blackjack", "Cogs.games.cases", "Cogs.games.hilo", "Cogs.games.keno",
+    "Cogs.games.limbo", "Cogs.games.plinko", "Cogs.games.poker", "Cogs.utils.charts",
+]
+
+for module in RENDERER_MODULES:
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        # The fork server exits on anything but an ImportError; a worker imports the module on demand instead
+        rn = datetime.datetime.now().strftime("%X")
+        print(f"{Fore.RED}[!] {Fore.WHITE}{rn} Render workers could not preload {module}: {e}")
+
+atlas.preload()
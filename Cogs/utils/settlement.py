@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+import time
+
+from colorama import Fore
+from pymongo import ReturnDocument
+
+from Cogs.utils.mongo import Users, Servers
+
+
+class GameSettlementStats:
+    """Counters for one game's settlements."""
+
+    def __init__(self):
+        self.settlements = 0
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.wagered = 0.0
+        self.paid = 0.0
+        self.failures = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def as_dict(self):
+        return {
+            "settlements": self.settlements,
+            "rounds": self.rounds,
+            "wins": self.wins,
+            "losses": self.losses,
+            "pushes": self.pushes,
+            "wagered": self.wagered,
+            "paid": self.paid,
+            "rtp": self.paid / self.wagered if self.wagered else 0.0,
+            "failures": self.failures,
+            "avg_latency_ms": self.total_latency / self.settlements * 1000 if self.settlements else 0.0,
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+def round_outcome(bet, payout):
+    """History type for one round: "win" when the payout beats the bet, "push" when it returns it."""
+    if payout > bet:
+        return "win"
+    if payout == bet and bet > 0:
+        return "push"
+    return "loss"
+
+
+class SettlementEngine:
+    """
+    Pays out finished games.
+
+    The payout and the player's stats are applied to the user document in
+    one atomic update, which also returns the new balance and the primary
+    coin the server profit is booked in, so settling never needs a read
+    first. User and server bet history and the server profit are queued
+    on the write-behind queue. Listeners get a settlement event (a dict)
+    afterwards.
+    """
+
+    def __init__(self):
+        self.users = Users()
+        self.servers = Servers()
+        self._listeners = []
+        self._stats = {}  # game -> GameSettlementStats
+
+    def add_listener(self, listener):
+        """Call `await listener(event)` after every settlement."""
+        self._listeners.append(listener)
+
+    def _game_stats(self, game):
+        if game not in self._stats:
+            self._stats[game] = GameSettlementStats()
+        return self._stats[game]
+
+    async def settle(self, user, guild, game, bet, payout, metadata=None, outcome=None):
+        """
+        Settles one finished round.
+
+        Args:
+            user (discord.abc.User): The player.
+            guild (discord.Guild): The server the game was played in, or None.
+            game (str): Game name, e.g. "mines".
+            bet (float): The amount that was debited for the round.
+            payout (float): The amount to credit back; 0 for a loss.
+            metadata (dict): Extra fields for the history entry (mines_count,
+                multiplier, ...); these override the defaults.
+            outcome (str): History type, if not the one round_outcome gives.
+
+        Returns:
+            dict: The settlement event, or None if the credit failed.
+        """
+        return await self.settle_rounds(user, guild, game, [(bet, payout)], metadata, outcome)
+
+    async def settle_rounds(self, user, guild, game, rounds, metadata=None, outcome=None):
+        """
+        Settles several rounds of one game (multi-spin, auto bets) with a
+        single credit, a single history entry and a single profit update.
+
+        Args:
+            user (discord.abc.User): The player.
+            guild (discord.Guild): The server the game was played in, or None.
+            game (str): Game name.
+            rounds (list): (bet, payout) for every round.
+            metadata (dict): Extra fields for the history entry.
+            outcome (str): History type, if not the one the totals give.
+
+        Returns:
+            dict: The settlement event, or None if the credit failed.
+        """
+        start = time.perf_counter()
+        stats = self._game_stats(game)
+        bet = sum(round_bet for round_bet, _ in rounds)
+        payout = sum(round_payout for _, round_payout in rounds)
+        outcomes = [round_outcome(round_bet, round_payout) for round_bet, round_payout in rounds]
+        wins, losses = outcomes.count("win"), outcomes.count("loss")
+        if outcome is None:
+            outcome = outcomes[0] if len(rounds) == 1 else round_outcome(bet, payout)
+
+        try:
+            user_data = await self.users.collection.find_one_and_update(
+                {"discord_id": user.id},
+                {"$inc": {
+                    "points": payout,
+                    "total_played": len(rounds),
+                    "total_won": wins,
+                    "total_lost": losses,
+                    "total_spent": bet,
+                    "total_earned": payout,
+                }},
+                projection={"points": 1, "primary_coin": 1},
+                return_document=ReturnDocument.AFTER
+            )
+            if user_data is None:
+                raise LookupError(f"user {user.id} not found")
+        except Exception as e:
+            stats.failures += 1
+            print(f"{Fore.RED}[!] {Fore.WHITE}Failed to settle {game} for {user.id} (bet {bet}, payout {payout}): {e}")
+            return None
+
+        entry = {
+            "type": outcome,
+            "game": game,
+            "amount": payout if outcome != "loss" else bet,
+            "bet": bet,
+            "multiplier": round(payout / bet, 2) if bet else 0,
+            "timestamp": int(time.time()),
+        }
+        if len(rounds) > 1:
+            entry["rounds"] = len(rounds)
+        if metadata:
+            entry.update(metadata)
+        await self.users.update_history(user.id, entry)
+
+        if guild is not None:
+            await self.servers.update_history(guild.id, {**entry, "user_id": user.id, "user_name": user.name})
+            await self.servers.record_profit(
+                guild.id, bet - payout, user_data.get("primary_coin", "BTC"), game
+            )
+
+        latency = time.perf_counter() - start
+        stats.settlements += 1
+        stats.rounds += len(rounds)
+        stats.wins += wins
+        stats.losses += losses
+        stats.pushes += len(rounds) - wins - losses
+        stats.wagered += bet
+        stats.paid += payout
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+        event = {
+            "game": game,
+            "user_id": user.id,
+            "guild_id": guild.id if guild is not None else None,
+            "bet": bet,
+            "payout": payout,
+            "rounds": len(rounds),
+            "outcome": outcome,
+            "balance": user_data.get("points", 0),
+            "entry": entry,
+            "settled_at": datetime.datetime.now(datetime.timezone.utc),
+        }
+        for listener in self._listeners:
+            asyncio.create_task(self._notify(listener, event))
+        return event
+
+    @staticmethod
+    async def _notify(listener, event):
+        try:
+            await listener(event)
+        except Exception as e:
+            print(f"{Fore.YELLOW}[!] {Fore.WHITE}Settlement listener failed: {e}")
+
+    def stats(self):
+        return {game: stats.as_dict() for game, stats in self._stats.items()}
+
+
+settlement = SettlementEngine()
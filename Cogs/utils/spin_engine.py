@@ -0,0 +1,203 @@
+import numpy as np
+
+rng = np.random.default_rng()
+
+
+def draw(cumulative, size, generator):
+    """Weighted draws of outcome indexes by inverting the cumulative distribution."""
+    # Clip in case rounding leaves the last cumulative value a hair under 1
+    return np.minimum(cumulative.searchsorted(generator.random(size), side="right"), len(cumulative) - 1)
+
+
+class SlotsSpins:
+    """
+    The outcome of a batch of slot spins, as arrays.
+
+    grid holds symbol indexes, shape (spins, 15), row by row; multipliers
+    the house-edged multiplier of each spin; winning the cells that are
+    part of a paying line.
+    """
+
+    def __init__(self, engine, grid, row_counts, column_counts, multipliers, winning):
+        self.engine = engine
+        self.grid = grid
+        self.row_counts = row_counts  # (spins, 3, symbols)
+        self.column_counts = column_counts  # (spins, 5, symbols)
+        self.multipliers = multipliers
+        self.winning = winning
+
+    def __len__(self):
+        return len(self.multipliers)
+
+    def void(self, spin):
+        """Turns a spin into a loss (admin curse); its symbols stay as drawn."""
+        self.multipliers[spin] = 0.0
+        self.winning[spin] = False
+        self.row_counts[spin] = 0
+        self.column_counts[spin] = 0
+
+    def winnings(self, bet_amount):
+        """Payout of every spin for a bet of bet_amount each."""
+        return self.multipliers * bet_amount
+
+    def winning_spins(self):
+        return int((self.multipliers > 0).sum())
+
+    def combination_count(self):
+        """Paying (line, symbol) pairs over the whole batch."""
+        return int((self.row_counts >= 3).sum() + (self.column_counts >= 3).sum())
+
+    def result(self, spin, bet_amount):
+        """
+        One spin in the shape the Slots cog displays.
+
+        Returns:
+            dict: symbols (emoji), winnings, combinations (one dict per paying
+            symbol and line, rows first), multiplier and winning_positions.
+        """
+        engine = self.engine
+        combinations = []
+        lines = [(f"Row {row + 1}", counts) for row, counts in enumerate(self.row_counts[spin].tolist())]
+        lines += [(f"Column {column + 1}", counts) for column, counts in enumerate(self.column_counts[spin].tolist())]
+        for line_name, counts in lines:
+            for symbol, count in enumerate(counts):
+                if count >= 3:
+                    combinations.append({
+                        "symbol": engine.symbols[symbol],
+                        "count": count,
+                        "multiplier": engine.payouts[symbol] * engine.count_bonus[count],
+                        "line": line_name,
+                        "rarity": engine.rarities[symbol]
+                    })
+        multiplier = float(self.multipliers[spin])
+        return {
+            "symbols": [engine.symbols[symbol] for symbol in self.grid[spin]],
+            "winnings": multiplier * bet_amount,
+            "combinations": combinations,
+            "multiplier": multiplier,
+            "winning_positions": np.flatnonzero(self.winning[spin]).tolist()
+        }
+
+
+class SlotsEngine:
+    """
+    Spins the 3x5 slot machine in batches.
+
+    Every line (3 rows of 5, 5 columns of 3) pays for each symbol showing at
+    least 3 times on it: the symbol's payout, x1.3 for 4 and x2 for 5. A
+    spin pays the sum over all lines, less the house edge. All spins of a
+    batch are drawn with one NumPy call and scored with array operations.
+    """
+
+    ROWS = 3
+    COLUMNS = 5
+    CELLS = ROWS * COLUMNS
+
+    def __init__(self, symbols, house_edge=0.10):
+        """
+        Args:
+            symbols (dict): emoji -> {"weight", "payout", "rarity"}, the cog's table.
+            house_edge (float): Fraction taken off every spin's multiplier.
+        """
+        self.symbols = list(symbols)
+        weights = np.array([data["weight"] for data in symbols.values()], dtype=float)
+        self.probabilities = weights / weights.sum()
+        self.cumulative = np.cumsum(self.probabilities)
+        self.payouts = [data["payout"] for data in symbols.values()]
+        self.rarities = [data["rarity"] for data in symbols.values()]
+        self.house_edge = house_edge
+        # Line multiplier per symbol count: 3 pays the base, 4 and 5 pay a bonus
+        self.count_bonus = [0, 0, 0, 1.0, 1.3, 2.0]
+        # Multiplier of a line by (symbol count, symbol)
+        self.line_table = np.outer(self.count_bonus, self.payouts)
+
+    def _counts(self, lines):
+        """lines: (spins, lines, cells) symbol indexes -> (spins, lines, symbols) counts."""
+        return (lines[..., None] == np.arange(len(self.symbols))).sum(axis=2)
+
+    def spin(self, spins, generator=None):
+        """
+        Args:
+            spins (int): How many spins to draw.
+            generator (numpy.random.Generator): Defaults to the module's.
+
+        Returns:
+            SlotsSpins: The batch.
+        """
+        generator = rng if generator is None else generator
+        grid = draw(self.cumulative, (spins, self.CELLS), generator)
+        cells = grid.reshape(spins, self.ROWS, self.COLUMNS)
+        row_counts = self._counts(cells)
+        column_counts = self._counts(cells.transpose(0, 2, 1))
+
+        symbol_indexes = np.arange(len(self.symbols))
+        line_multipliers = self.line_table[row_counts, symbol_indexes].sum(axis=(1, 2))
+        line_multipliers += self.line_table[column_counts, symbol_indexes].sum(axis=(1, 2))
+        multipliers = line_multipliers * (1 - self.house_edge)
+
+        # A cell wins when its symbol shows 3+ times on its row or on its column
+        row_hits = (cells[..., None] == cells[..., None, :]).sum(axis=3) >= 3
+        column_hits = (cells[:, :, None] == cells[:, None]).sum(axis=1) >= 3
+        winning = (row_hits | column_hits).reshape(spins, self.CELLS)
+        return SlotsSpins(self, grid, row_counts, column_counts, multipliers, winning)
+
+
+class WheelEngine:
+    """
+    Spins the Fortune Wheel in batches.
+
+    Each color is hit with its table chance (in tenths of a percent) and
+    pays its multiplier less the house edge; BUST pays nothing.
+    """
+
+    def __init__(self, colors, house_edge=0.08):
+        """
+        Args:
+            colors (dict): color -> {"emoji", "multiplier", "chance", "name"}, the cog's table.
+            house_edge (float): Fraction taken off every winning multiplier.
+        """
+        self.colors = list(colors)
+        self.table = colors
+        weights = np.array([int(data["chance"] * 10) for data in colors.values()], dtype=float)
+        self.probabilities = weights / weights.sum()
+        self.cumulative = np.cumsum(self.probabilities)
+        self.multipliers = np.array([data["multiplier"] for data in colors.values()], dtype=float) * (1 - house_edge)
+
+    def spin(self, spins, generator=None):
+        """
+        Args:
+            spins (int): How many spins to draw.
+            generator (numpy.random.Generator): Defaults to the module's.
+
+        Returns:
+            numpy.ndarray: The color index of every spin.
+        """
+        generator = rng if generator is None else generator
+        return draw(self.cumulative, spins, generator)
+
+    def results(self, spun, bet_amount):
+        """
+        The spins in the shape the Wheel cog displays.
+
+        Args:
+            spun (numpy.ndarray): Color indexes from spin().
+            bet_amount (float): Bet of each spin.
+
+        Returns:
+            list: One dict per spin: color, emoji, multiplier, actual_multiplier,
+            winnings, spin_number and name.
+        """
+        multipliers = self.multipliers.tolist()
+        results = []
+        for spin, color_index in enumerate(spun.tolist()):
+            color = self.colors[color_index]
+            results.append({
+                "color": color,
+                "emoji": self.table[color]["emoji"],
+                "multiplier": multipliers[color_index],
+                "actual_multiplier": multipliers[color_index],
+                "winnings": multipliers[color_index] * bet_amount,
+                "spin_number": spin + 1,
+                "name": self.table[color]["name"]
+            })
+        return results
@@ -0,0 +1,149 @@
+import copy
+import os
+import time
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class UserCache:
+    """
+    Process-wide LRU cache of user documents keyed by discord_id.
+
+    One command tends to read the same user several times within a few
+    milliseconds (on_command, channel checks, the game, the notifier), so
+    entries only live for a short TTL. Every write to the users collection
+    invalidates the affected user, and conditional updates always go to the
+    database, so the cache never decides whether a balance can cover a bet.
+    """
+
+    def __init__(self, max_size=10000, ttl=3.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # discord_id -> {projection key: (expires_at, document)}
+        self._generations = {}  # discord_id -> write counter, guards against stale fills
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _projection_key(projection):
+        if projection is None:
+            return None
+        return tuple(sorted(projection.items()))
+
+    def get(self, user_id, projection=None):
+        """Return a copy of the cached document, or None on a miss."""
+        views = self._entries.get(user_id)
+        if views is not None:
+            now = time.monotonic()
+            # An exact view match, or the full document which covers any inclusion view
+            keys = [self._projection_key(projection)]
+            if projection is not None and all(projection.values()):
+                keys.append(None)
+            for key in keys:
+                entry = views.get(key)
+                if entry and entry[0] > now:
+                    self._entries.move_to_end(user_id)
+                    self.hits += 1
+                    document = entry[1]
+                    if key is None and projection is not None:
+                        document = {k: v for k, v in document.items() if k == "_id" or projection.get(k)}
+                    return copy.deepcopy(document)
+        self.misses += 1
+        return None
+
+    def generation(self, user_id):
+        """Snapshot to take before a read; put() ignores fills older than the last write."""
+        return self._epoch, self._generations.get(user_id, 0)
+
+    def put(self, user_id, projection, document, generation):
+        """Cache a document read with the given projection, unless a write happened since generation."""
+        if generation != self.generation(user_id):
+            return
+        views = self._entries.setdefault(user_id, {})
+        views[self._projection_key(projection)] = (time.monotonic() + self.ttl, copy.deepcopy(document))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        """Drop every cached view of a user."""
+        self._entries.pop(user_id, None)
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        self.invalidations += 1
+        if len(self._generations) > self.max_size * 4:
+            # Bumping the epoch keeps in-flight fills from outliving the reset
+            self._generations.clear()
+            self._epoch += 1
+
+    def clear(self):
+        """Drop the whole cache (bulk writes, database wipes)."""
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+        self.invalidations += 1
+
+    def invalidate_filter(self, query):
+        """Invalidate whatever a write with this filter (or inserted document) may touch."""
+        user_id = query.get("discord_id") if isinstance(query, dict) else None
+        if isinstance(user_id, int):
+            self.invalidate(user_id)
+        else:
+            self.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+        }
+
+
+class InvalidatingCollection:
+    """
+    Wraps the users collection so that every write, including the raw
+    collection.update_one calls made by cogs, invalidates the cache.
+    """
+
+    WRITE_METHODS = {
+        "insert_one", "update_one", "update_many", "replace_one", "delete_one",
+        "delete_many", "find_one_and_update", "find_one_and_replace", "find_one_and_delete",
+    }
+
+    def __init__(self, collection, cache):
+        self._collection = collection
+        self._cache = cache
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name == "bulk_write":
+            async def bulk_write(*args, **kwargs):
+                try:
+                    return await attr(*args, **kwargs)
+                finally:
+                    self._cache.clear()
+            return bulk_write
+        if name not in self.WRITE_METHODS:
+            return attr
+
+        async def write(query, *args, **kwargs):
+            try:
+                return await attr(query, *args, **kwargs)
+            finally:
+                self._cache.invalidate_filter(query)
+        return write
+
+
+user_cache = UserCache(
+    max_size=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "3"))
+)
@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import time
+from collections import OrderedDict
+
+from colorama import Fore
+
+
+class UsernameDirectory:
+    """
+    Discord id -> username directory for everything that renders lists of
+    users (leaderboards, the blacklist and curse lists, lottery draws).
+
+    Names live in memory and are persisted to the usernames collection
+    ({_id: discord_id, name, updated_at}). They are kept warm from the
+    gateway: the client's user cache at startup, user updates and command
+    authors. Resolving a page of names is a dict lookup plus at most one
+    $in query; ids nobody has seen, and names older than stale_after, go to
+    a background refresher that calls the Discord API at refresh_rate
+    lookups per second. Rendering never waits on it.
+    """
+
+    def __init__(self, collection, write_behind, stale_after=7 * 86400, refresh_rate=2.0, max_queue=5000):
+        self.collection = collection
+        self.write_behind = write_behind
+        self.stale_after = stale_after
+        self.refresh_rate = refresh_rate
+        self.max_queue = max_queue
+        self.bot = None
+        self._names = {}  # discord_id -> (name, updated_at as epoch seconds)
+        self._refresh_queue = OrderedDict()  # discord_ids waiting for an API lookup
+        self._wakeup = None
+        self._task = None
+        self.hits = 0
+        self.misses = 0
+        self.api_lookups = 0
+
+    @staticmethod
+    def _updated_at(document):
+        # Mongo hands datetimes back naive, in UTC
+        updated_at = document.get("updated_at")
+        return updated_at.replace(tzinfo=datetime.timezone.utc).timestamp() if updated_at else 0.0
+
+    def _remember(self, user_id, name, updated_at, persist):
+        self._names[user_id] = (name, updated_at)
+        if persist:
+            self.write_behind.set(
+                "usernames", {"_id": user_id},
+                {"name": name, "updated_at": datetime.datetime.fromtimestamp(updated_at, datetime.timezone.utc)},
+                upsert=True
+            )
+
+    def observe(self, user):
+        """Record the name of a user object the gateway handed us; only changes are written."""
+        if user is None or getattr(user, "bot", False):
+            return
+        now = time.time()
+        known = self._names.get(user.id)
+        # Unchanged names are re-persisted once they are halfway to stale so they never go stale
+        if known is None or known[0] != user.name or now - known[1] > self.stale_after / 2:
+            self._remember(user.id, user.name, now, True)
+        self._refresh_queue.pop(user.id, None)
+
+    async def warm(self, bot):
+        """Load the persisted directory, then record every user in the client's cache."""
+        self.bot = bot
+        start = time.perf_counter()
+        try:
+            async for document in self.collection.find({}, {"name": 1, "updated_at": 1}):
+                self._names[document["_id"]] = (document.get("name"), self._updated_at(document))
+        except Exception as e:
+            print(f"{Fore.RED}[!] {Fore.WHITE}Failed to load usernames: {e}")
+        for user in bot.users:
+            self.observe(user)
+        rn = datetime.datetime.now().strftime("%X")
+        print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Username directory warmed: {len(self._names):,} names in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    def get(self, user_id):
+        """The known name of a user, or None; never touches the database or the API."""
+        entry = self._names.get(user_id)
+        return entry[0] if entry else None
+
+    async def resolve_many(self, user_ids):
+        """
+        Resolves names for a batch of users without waiting on the Discord API.
+
+        Args:
+            user_ids (list): Discord ids.
+
+        Returns:
+            dict: discord_id -> name; ids that can't be resolved yet map to
+            "User <id>" and are queued for a background lookup.
+        """
+        names, missing = {}, []
+        now = time.time()
+        for user_id in user_ids:
+            entry = self._names.get(user_id)
+            if entry:
+                self.hits += 1
+                names[user_id] = entry[0]
+                if now - entry[1] > self.stale_after:
+                    self._schedule(user_id)
+                continue
+            user = self.bot.get_user(user_id) if self.bot else None
+            if user is not None:
+                self.hits += 1
+                self.observe(user)
+                names[user_id] = user.name
+                continue
+            missing.append(user_id)
+
+        if missing:
+            try:
+                async for document in self.collection.find({"_id": {"$in": missing}}, {"name": 1, "updated_at": 1}):
+                    updated_at = self._updated_at(document)
+                    self._remember(document["_id"], document.get("name"), updated_at, False)
+                    names[document["_id"]] = document.get("name")
+                    if now - updated_at > self.stale_after:
+                        self._schedule(document["_id"])
+            except Exception as e:
+                print(f"{Fore.RED}[!] {Fore.WHITE}Username lookup failed: {e}")
+
+        for user_id in missing:
+            if user_id not in names:
+                self.misses += 1
+                self._schedule(user_id)
+                names[user_id] = f"User {user_id}"
+        return names
+
+    async def resolve(self, user_id):
+        return (await self.resolve_many([user_id]))[user_id]
+
+    def _schedule(self, user_id):
+        if user_id in self._refresh_queue or len(self._refresh_queue) >= self.max_queue:
+            return
+        self._refresh_queue[user_id] = None
+        self._ensure_started()
+        self._wakeup.set()
+
+    def _ensure_started(self):
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            if not self._refresh_queue or self.bot is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            user_id, _ = self._refresh_queue.popitem(last=False)
+            try:
+                self.api_lookups += 1
+                self.observe(await self.bot.fetch_user(user_id))
+            except Exception as e:
+                if getattr(e, "status", None) == 404:
+                    # Deleted account: remember the placeholder so it isn't looked up again
+                    self._remember(user_id, f"User {user_id}", time.time(), True)
+                else:
+                    print(f"{Fore.YELLOW}[!] {Fore.WHITE}Username refresh for {user_id} failed: {e}")
+            await asyncio.sleep(1 / self.refresh_rate)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self):
+        return {
+            "names": len(self._names),
+            "hits": self.hits,
+            "misses": self.misses,
+            "api_lookups": self.api_lookups,
+            "refresh_queue": len(self._refresh_queue),
+        }
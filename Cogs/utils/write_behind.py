@@ -0,0 +1,229 @@
+import asyncio
+import datetime
+from collections import OrderedDict
+
+from colorama import Fore
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Write error codes worth another attempt: elections, shutdowns, timeouts and
+# upsert races. Anything else (validation, bad operators, documents too large)
+# fails the same way every time, so the update is logged and dropped.
+RETRYABLE_WRITE_CODES = {
+    6, 7, 50, 89, 91, 112, 189, 262, 9001, 10107, 11000, 11600, 11602, 13435, 13436,
+}
+
+
+class WriteBehindQueue:
+    """
+    Background batching stage for bookkeeping writes (bet history, server
+    profit, daily profit) that nothing needs to read back immediately.
+
+    Writes are coalesced per document: $inc amounts on the same filter are
+    summed, history pushes are merged into one $push/$each and later $set
+    values replace earlier ones. Inserts into
+    append-only collections are batched as they are. Pending
+    updates are flushed as unordered bulk_write batches once max_pending
+    documents are waiting or every flush_interval seconds, and once more on
+    shutdown. Balance credits never go through here.
+
+    An update rejected with a retryable write error is tried again at the
+    next flush, up to max_attempts times; one rejected for any other reason
+    is logged and dropped.
+    """
+
+    def __init__(self, db, flush_interval=1.0, max_pending=500, max_attempts=5):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._pending = OrderedDict()  # (collection, filter key) -> pending update
+        self._flush_hooks = {}  # collection -> [async fn(flushed updates)]
+        self._wakeup = None
+        self._lock = None
+        self._task = None
+        self._stopping = False
+        self.queued = 0
+        self.flushed_updates = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    def add_flush_hook(self, collection_name, hook):
+        """Register `async hook(updates)` to run after updates to a collection are flushed."""
+        self._flush_hooks.setdefault(collection_name, []).append(hook)
+
+    def _entry(self, collection_name, query, upsert):
+        key = (collection_name, tuple(sorted(query.items())))
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = {"filter": query, "inc": {}, "push": {}, "set": {}, "set_on_insert": {}, "upsert": upsert, "attempts": 0}
+            self._pending[key] = entry
+        entry["upsert"] = entry["upsert"] or upsert
+        return entry
+
+    def inc(self, collection_name, query, increments, set_on_insert=None, upsert=False):
+        """Queue an $inc; amounts for the same document are summed until the next flush."""
+        entry = self._entry(collection_name, query, upsert)
+        for field, amount in increments.items():
+            entry["inc"][field] = entry["inc"].get(field, 0) + amount
+        if set_on_insert:
+            entry["set_on_insert"].update(set_on_insert)
+        self._queued()
+
+    def insert(self, collection_name, document):
+        """Queue an insert; the document gets its _id now so a retried batch can't write it twice."""
+        document.setdefault("_id", ObjectId())
+        key = (collection_name, (("_id", document["_id"]),))
+        self._pending[key] = {"filter": None, "document": document, "inc": {}, "push": {}, "set": {}, "set_on_insert": {}, "upsert": False, "attempts": 0}
+        self._queued()
+
+    def set(self, collection_name, query, fields, upsert=False):
+        """Queue a $set; the latest value for each field wins at the next flush."""
+        entry = self._entry(collection_name, query, upsert)
+        entry["set"].update(fields)
+        self._queued()
+
+    def push(self, collection_name, query, field, item, slice_to=None):
+        """Queue a $push; items for the same document keep their order and share one update."""
+        entry = self._entry(collection_name, query, False)
+        entry["push"].setdefault(field, {"items": [], "slice": slice_to})["items"].append(item)
+        self._queued()
+
+    def _queued(self):
+        self.queued += 1
+        self._ensure_started()
+        if len(self._pending) >= self.max_pending and self._wakeup:
+            self._wakeup.set()
+
+    def _ensure_started(self):
+        if self._task is not None or self._stopping:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    @staticmethod
+    def _to_operation(entry):
+        if entry.get("document") is not None:
+            return InsertOne(entry["document"])
+        update = {}
+        if entry["inc"]:
+            update["$inc"] = entry["inc"]
+        if entry["push"]:
+            update["$push"] = {}
+            for field, push in entry["push"].items():
+                spec = {"$each": push["items"]}
+                if push["slice"] is not None:
+                    spec["$slice"] = push["slice"]
+                update["$push"][field] = spec
+        if entry["set"]:
+            update["$set"] = entry["set"]
+        if entry["set_on_insert"]:
+            update["$setOnInsert"] = entry["set_on_insert"]
+        return UpdateOne(entry["filter"], update, upsert=entry["upsert"])
+
+    def _requeue(self, key, entry):
+        """
+        Merge an update that failed with a retryable error back in front of
+        anything queued since. The merged update keeps the failed one's
+        attempt count, so a document that keeps failing can't hold on to new
+        writes for good.
+        """
+        current = self._pending.pop(key, None)
+        if current:
+            for field, amount in current["inc"].items():
+                entry["inc"][field] = entry["inc"].get(field, 0) + amount
+            for field, push in current["push"].items():
+                entry["push"].setdefault(field, {"items": [], "slice": push["slice"]})["items"].extend(push["items"])
+            entry["set"].update(current["set"])
+            entry["set_on_insert"].update(current["set_on_insert"])
+            entry["upsert"] = entry["upsert"] or current["upsert"]
+        self._pending[key] = entry
+        self._pending.move_to_end(key, last=False)
+
+    async def flush(self):
+        """Write everything pending as one bulk_write per collection."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, OrderedDict()
+            by_collection = OrderedDict()
+            for key, entry in batch.items():
+                by_collection.setdefault(key[0], []).append((key, entry))
+
+            for collection_name, items in by_collection.items():
+                failed = []
+                rejected = []
+                try:
+                    await self.db[collection_name].bulk_write(
+                        [self._to_operation(entry) for _, entry in items], ordered=False
+                    )
+                except BulkWriteError as e:
+                    for error in e.details.get("writeErrors", []):
+                        key, entry = items[error["index"]]
+                        code = error.get("code")
+                        if code == 11000 and entry.get("document") is not None:
+                            # A duplicate _id means an insert already landed in an earlier attempt
+                            continue
+                        entry["attempts"] = entry.get("attempts", 0) + 1
+                        if code in RETRYABLE_WRITE_CODES and entry["attempts"] < self.max_attempts:
+                            failed.append((key, entry))
+                            retry_error = error
+                        else:
+                            rejected.append((key, entry))
+                            print(f"{Fore.RED}[!] {Fore.WHITE}Write-behind: dropping update to {collection_name} {entry['filter'] or entry['document']['_id']} after {entry['attempts']} attempts (code {code}): {error.get('errmsg')}")
+                    if failed:
+                        print(f"{Fore.RED}[!] {Fore.WHITE}Write-behind: {len(failed)} updates to {collection_name} failed, retrying: {retry_error}")
+                except Exception as e:
+                    # Nothing is known to have been applied; keep everything for the next flush
+                    failed = items
+                    print(f"{Fore.RED}[!] {Fore.WHITE}Write-behind flush to {collection_name} failed, retrying: {e}")
+
+                for key, entry in reversed(failed):
+                    self._requeue(key, entry)
+                self.dropped += len(rejected)
+                failed_keys = {key for key, _ in failed + rejected}
+                written = [entry for key, entry in items if key not in failed_keys]
+                self.flushed_updates += len(written)
+
+                for hook in self._flush_hooks.get(collection_name, []):
+                    try:
+                        await hook(written)
+                    except Exception as e:
+                        print(f"{Fore.RED}[!] {Fore.WHITE}Write-behind hook for {collection_name} failed: {e}")
+            self.flushes += 1
+
+    async def stop(self):
+        """Stop the background flusher and write out anything still pending."""
+        self._stopping = True
+        if self._task:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        rn = datetime.datetime.now().strftime("%X")
+        print(f"{Fore.GREEN}[+] {Fore.WHITE}{rn} Write-behind queue flushed ({self.flushed_updates} updates in {self.flushes} batches)")
+
+    def stats(self):
+        return {
+            "queued": self.queued,
+            "pending": len(self._pending),
+            "flushed_updates": self.flushed_updates,
+            "flushes": self.flushes,
+            "dropped": self.dropped,
+        }
@@ -12,7 +12,7 @@ class Withdraw(commands.Cog):
     async def withdraw(self, ctx, *, args: str = None):
         """Unified withdraw command that routes to BTC or LTC based on primary currency"""
         user_id = ctx.author.id
-        user_data = self.users_db.fetch_user(user_id)
+        user_data = await self.users_db.fetch_user(user_id)
         
         if not user_data:
             embed = discord.Embed(
@@ -0,0 +1 @@
+"""Offline analysis of the games' payout tables: exact and simulated RTP (python -m algorithms.rtp)."""
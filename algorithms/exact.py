@@ -0,0 +1,298 @@
+"""
+Exact return-to-player of every game, computed from the live payout tables.
+
+Every function returns a list of (game, variant, rtp) rows: rtp is the
+expected payout per unit bet of one round, so the house edge is 1 - rtp.
+Games where the player decides when to stop (mines, tower, pump, ...)
+get one row per setting and number of steps before cashing out; the
+curse mechanics are left out.
+"""
+import math
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from Cogs.utils.multiplier_tables import (
+    CTR_MULTIPLIERS, CTR_SURVIVAL, MINES_MULTIPLIERS, MINES_SURVIVAL, PUMP_MULTIPLIERS, PUMP_SURVIVAL,
+    TOWER_MULTIPLIERS, TOWER_SURVIVAL
+)
+from Cogs.utils.paytables import (
+    BACCARAT_PAYOUTS, BUILD_BLOCK_TYPES as BLOCK_TYPES, BUILD_MAX_LEVELS as MAX_LEVELS, CASE_MULTIPLIERS,
+    COINFLIP_MULTIPLIER, DICE_TIE_MULTIPLIER, DICE_WIN_MULTIPLIER, KENO_PAYOUTS,
+    LIMBO_AUTO_ROLL_RANGE as AUTO_ROLL_RANGE, LIMBO_FIXED_ROLL_RANGE as FIXED_ROLL_RANGE, MATCH_MULTIPLIERS,
+    PCF_FLIP_MULTIPLIER as FLIP_MULTIPLIER, PCF_MAX_FLIPS as MAX_FLIPS, PENALTY_KEEPER_MULTIPLIER as KEEPER_MULTIPLIER,
+    PENALTY_STRIKER_MULTIPLIER as STRIKER_MULTIPLIER, PLINKO_MULTIPLIER_TABLES as MULTIPLIER_TABLES, POKER_PAYTABLE,
+    RACE_CAR_MOVES as CAR_MOVES, RACE_CARS as CARS, RACE_TRACK_LENGTH as TRACK_LENGTH,
+    RACE_WIN_MULTIPLIER as RACE_MULTIPLIER, SLOTS_HOUSE_EDGE, SLOTS_SYMBOLS as SYMBOLS, WHEEL_COLORS as COLORS,
+    WHEEL_HOUSE_EDGE, match_board_tiles as board_tiles
+)
+from Cogs.utils.poker_eval import HAND_NAMES, evaluate_batch, hand_indexes
+from Cogs.utils.spin_engine import SlotsEngine, WheelEngine
+
+KENO_NUMBERS = 20
+KENO_DRAWN = 5
+# Targets the limbo rows are reported for
+LIMBO_TARGETS = (1.01, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+
+def coinflip():
+    return [("coinflip", "call", COINFLIP_MULTIPLIER / 2)]
+
+
+def dice():
+    # The player's d6 against the dealer's: 15 of 36 win, 6 tie
+    return [("dice", "roll", (15 * DICE_WIN_MULTIPLIER + 6 * DICE_TIE_MULTIPLIER) / 36)]
+
+
+def penalty():
+    # The keeper dives, and the striker shoots, at one of 3 spots uniformly
+    return [
+        ("penalty", "striker", STRIKER_MULTIPLIER * 2 / 3),
+        ("penalty", "keeper", KEEPER_MULTIPLIER / 3),
+    ]
+
+
+def cases():
+    return [("cases", "case", sum(item["value"] * item["chance"] for item in CASE_MULTIPLIERS))]
+
+
+def wheel():
+    engine = WheelEngine(COLORS, WHEEL_HOUSE_EDGE)
+    return [("wheel", "spin", float((engine.probabilities * engine.multipliers).sum()))]
+
+
+def slots():
+    """
+    By linearity of expectation the spin pays the sum of its lines' expected
+    payouts; a symbol's count on a line of n cells is Binomial(n, p).
+    """
+    engine = SlotsEngine(SYMBOLS, SLOTS_HOUSE_EDGE)
+    expected = 0.0
+    for cells, lines in ((engine.COLUMNS, engine.ROWS), (engine.ROWS, engine.COLUMNS)):
+        for probability, payout in zip(engine.probabilities.tolist(), engine.payouts):
+            for count in range(3, cells + 1):
+                chance = math.comb(cells, count) * probability ** count * (1 - probability) ** (cells - count)
+                expected += lines * chance * payout * engine.count_bonus[count]
+    return [("slots", "spin", expected * (1 - SLOTS_HOUSE_EDGE))]
+
+
+def limbo_win_chance(target, roll_range):
+    """Chance that round(1 / (1 - u * roll_range), 2) >= target for uniform u."""
+    # The roll rounds up to target from target - 0.005
+    threshold = (1 - 1 / (target - 0.005)) / roll_range
+    return min(1.0, max(0.0, 1 - threshold))
+
+
+def limbo():
+    return [
+        ("limbo", f"{mode} {target:.2f}x", target * limbo_win_chance(target, roll_range))
+        for mode, roll_range in (("fixed", FIXED_ROLL_RANGE), ("auto", AUTO_ROLL_RANGE))
+        for target in LIMBO_TARGETS
+    ]
+
+
+def keno():
+    """Picks against 5 numbers drawn from 20: hits are hypergeometric."""
+    rows = []
+    total = math.comb(KENO_NUMBERS, KENO_DRAWN)
+    for picks, payouts in KENO_PAYOUTS.items():
+        expected = sum(
+            math.comb(picks, hits) * math.comb(KENO_NUMBERS - picks, KENO_DRAWN - hits) / total * multiplier
+            for hits, multiplier in payouts.items()
+        )
+        rows.append(("keno", f"{picks} picks", expected))
+    return rows
+
+
+def plinko_landing(rows):
+    """
+    Landing slot distribution of PlinkoGame.simulate_ball_path.
+
+    The path is not binomial: every row pulls the ball towards the middle
+    by 3% per position away from it, so the distribution is pushed forward
+    row by row instead.
+    """
+    actual_rows = rows + 2
+    slots = rows + 1
+    positions = [0.5, 0.5]
+    for row in range(1, actual_rows):
+        center = (row + 2) / 2
+        moved = [0.0] * (row + 2)
+        for position, chance in enumerate(positions):
+            left = min(1.0, max(0.0, 0.5 - 0.03 * abs(position - center)))
+            moved[min(position, row + 1)] += chance * left
+            moved[min(position + 1, row + 1)] += chance * (1 - left)
+        positions = moved
+    landing = [0.0] * slots
+    for position, chance in enumerate(positions):
+        landing[max(0, min(int(position * (slots - 1) / actual_rows + 0.5), slots - 1))] += chance
+    return landing
+
+
+def plinko():
+    rows = []
+    for risk, tables in MULTIPLIER_TABLES.items():
+        for name, table in tables.items():
+            landing = plinko_landing(int(name.split("_")[0]))
+            rows.append(("plinko", f"{risk} {name.replace('_', ' ')}", sum(p * m for p, m in zip(landing, table))))
+    return rows
+
+
+def stepped(game, unit, multipliers, survival):
+    """Cashing out after every number of steps, from the games' own multiplier tables."""
+    return [
+        (game, f"{setting} {steps} {unit}", survival[setting][steps] * multiplier)
+        for setting, row in multipliers.items()
+        for steps, multiplier in enumerate(row)
+        if steps
+    ]
+
+
+def mines():
+    tables = {f"{count} mines": row for count, row in enumerate(MINES_MULTIPLIERS) if count}
+    survival = {f"{count} mines": row for count, row in enumerate(MINES_SURVIVAL) if count}
+    return stepped("mines", "picks", tables, survival)
+
+
+def tower():
+    return stepped("tower", "levels", TOWER_MULTIPLIERS, TOWER_SURVIVAL)
+
+
+def pump():
+    return stepped("pump", "pumps", PUMP_MULTIPLIERS, PUMP_SURVIVAL)
+
+
+def crosstheroad():
+    return stepped("crosstheroad", "lanes", CTR_MULTIPLIERS, CTR_SURVIVAL)
+
+
+def build():
+    # Mixing block types multiplies the per-block returns, so one type per row covers it
+    return [
+        ("build", f"{block['name'].split()[0].lower()} {levels} levels", (block["success_rate"] * block["multiplier"]) ** levels)
+        for block in BLOCK_TYPES.values()
+        for levels in range(1, MAX_LEVELS + 1)
+    ]
+
+
+def progressivecf():
+    return [("progressivecf", f"{flips} flips", (FLIP_MULTIPLIER / 2) ** flips) for flips in range(1, MAX_FLIPS + 1)]
+
+
+def baccarat():
+    """Two cards each off one shuffled deck, no third card rule."""
+    # Card value -> cards in the deck: A-9 are 1-9, 10 and faces are 0
+    deck = {value: 4 for value in range(1, 10)}
+    deck[0] = 16
+    chances = {"player": 0.0, "banker": 0.0, "tie": 0.0}
+
+    def deal(drawn, weight, remaining, cards):
+        if len(drawn) == 4:
+            player, banker = (drawn[0] + drawn[1]) % 10, (drawn[2] + drawn[3]) % 10
+            chances["player" if player > banker else "banker" if banker > player else "tie"] += weight
+            return
+        for value, count in remaining.items():
+            if count:
+                remaining[value] -= 1
+                deal(drawn + [value], weight * count / cards, remaining, cards - 1)
+                remaining[value] += 1
+
+    deal([], 1.0, deck, 52)
+    return [("baccarat", bet, chances[bet] * multiplier) for bet, multiplier in BACCARAT_PAYOUTS.items()]
+
+
+def poker():
+    """
+    Standing on the dealt hand, over all 2,598,960 of them. Drawing five
+    new cards gives the same distribution; held draws are strategies,
+    simulated by algorithms.poker.
+    """
+    hands = np.array(list(combinations(range(52), 5)), dtype=np.int8)
+    counts = np.bincount(hand_indexes(evaluate_batch(hands)), minlength=len(HAND_NAMES))
+    payouts = np.array([POKER_PAYTABLE[name] for name in HAND_NAMES])
+    return [("poker", "no draw", float((counts * payouts).sum() / len(hands)))]
+
+
+def race_finish_ticks():
+    """Chance that a car crosses the line on tick t, for t = 1, 2, ..."""
+    finish = [0.0]
+    positions = {0: 1.0}
+    while positions:
+        moved = {}
+        finished = 0.0
+        for position, chance in positions.items():
+            for move in CAR_MOVES:
+                step = chance / len(CAR_MOVES)
+                if position + move >= TRACK_LENGTH:
+                    finished += step
+                else:
+                    moved[position + move] = moved.get(position + move, 0.0) + step
+        finish.append(finished)
+        positions = moved
+    return finish
+
+
+def race():
+    """
+    Cars move one after another within a tick, so on a tick where several
+    finish the lowest numbered car wins.
+    """
+    finish = race_finish_ticks()
+    later = [sum(finish[tick + 1:]) for tick in range(len(finish))]  # P(finish after tick)
+    rows = []
+    for car in range(CARS):
+        win = sum(
+            finish[tick] * (later[tick - 1] ** (CARS - car - 1)) * (later[tick] ** car)
+            for tick in range(1, len(finish))
+        )
+        rows.append(("race", f"car {car + 1}", win * RACE_MULTIPLIER))
+    return rows
+
+
+def match():
+    """
+    The board is shuffled, so tiles come up in uniformly random order
+    whatever the player clicks; the first multiplier seen 3 times pays.
+    """
+    tiles = board_tiles()
+    totals = tuple(tiles.count(multiplier) for multiplier in MATCH_MULTIPLIERS)
+
+    @lru_cache(maxsize=None)
+    def expected(seen):
+        left = sum(totals) - sum(seen)
+        value = 0.0
+        for i, multiplier in enumerate(MATCH_MULTIPLIERS):
+            remaining = totals[i] - seen[i]
+            if not remaining:
+                continue
+            if seen[i] == 2:
+                value += remaining / left * multiplier
+            else:
+                value += remaining / left * expected(seen[:i] + (seen[i] + 1,) + seen[i + 1:])
+        return value
+
+    return [("match", "board", expected((0,) * len(MATCH_MULTIPLIERS)))]
+
+
+GAMES = {
+    "baccarat": baccarat,
+    "build": build,
+    "cases": cases,
+    "coinflip": coinflip,
+    "crosstheroad": crosstheroad,
+    "dice": dice,
+    "keno": keno,
+    "limbo": limbo,
+    "match": match,
+    "mines": mines,
+    "penalty": penalty,
+    "plinko": plinko,
+    "poker": poker,
+    "progressivecf": progressivecf,
+    "pump": pump,
+    "race": race,
+    "slots": slots,
+    "tower": tower,
+    "wheel": wheel,
+}
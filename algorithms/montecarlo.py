@@ -0,0 +1,209 @@
+"""
+Vectorized Monte Carlo return-to-player estimates.
+
+These replay each game's random mechanics with NumPy (the slots, wheel
+and limbo ones through the cogs' own engines) instead of using the
+formulas in algorithms.exact, so comparing the two checks the models the
+exact numbers are built on. Every function takes the number of rounds
+and a numpy Generator and returns (game, variant, mean, standard error)
+rows; one batch of draws serves all variants of a game.
+"""
+import numpy as np
+
+from Cogs.utils.paytables import (
+    BACCARAT_PAYOUTS, CASE_MULTIPLIERS, DICE_TIE_MULTIPLIER, DICE_WIN_MULTIPLIER, KENO_PAYOUTS,
+    LIMBO_AUTO_ROLL_RANGE as AUTO_ROLL_RANGE, LIMBO_FIXED_ROLL_RANGE as FIXED_ROLL_RANGE, MATCH_MULTIPLIERS,
+    PLINKO_MULTIPLIER_TABLES as MULTIPLIER_TABLES, POKER_PAYTABLE, RACE_CAR_MOVES as CAR_MOVES, RACE_CARS as CARS,
+    RACE_TRACK_LENGTH as TRACK_LENGTH, RACE_WIN_MULTIPLIER as RACE_MULTIPLIER, SLOTS_HOUSE_EDGE,
+    SLOTS_SYMBOLS as SYMBOLS, WHEEL_COLORS as COLORS, WHEEL_HOUSE_EDGE, match_board_tiles as board_tiles,
+    roll_multipliers
+)
+from Cogs.utils.poker_eval import HAND_NAMES, evaluate_batch, hand_indexes
+from Cogs.utils.spin_engine import SlotsEngine, WheelEngine, draw
+
+from algorithms.exact import KENO_DRAWN, KENO_NUMBERS, LIMBO_TARGETS
+
+CHUNK = 1_000_000
+
+
+class Tally:
+    """Running sum and sum of squares of the payouts of every variant."""
+
+    def __init__(self, game, variants):
+        self.game = game
+        self.variants = list(variants)
+        self.rounds = 0
+        self.sums = np.zeros(len(self.variants))
+        self.squares = np.zeros(len(self.variants))
+
+    def add(self, payouts):
+        """payouts: (variants, rounds) array."""
+        self.rounds += payouts.shape[1]
+        self.sums += payouts.sum(axis=1)
+        self.squares += np.square(payouts).sum(axis=1)
+
+    def rows(self):
+        means = self.sums / self.rounds
+        variances = np.maximum(self.squares / self.rounds - np.square(means), 0.0)
+        errors = np.sqrt(variances / self.rounds)
+        return [
+            (self.game, variant, float(mean), float(error))
+            for variant, mean, error in zip(self.variants, means, errors)
+        ]
+
+
+def chunks(trials, size=CHUNK):
+    while trials > 0:
+        yield min(size, trials)
+        trials -= size
+
+
+def slots(trials, generator):
+    engine = SlotsEngine(SYMBOLS, SLOTS_HOUSE_EDGE)
+    tally = Tally("slots", ["spin"])
+    # The per-line symbol counts make slot batches memory hungry
+    for size in chunks(trials, CHUNK // 5):
+        tally.add(engine.spin(size, generator).multipliers[None])
+    return tally.rows()
+
+
+def wheel(trials, generator):
+    engine = WheelEngine(COLORS, WHEEL_HOUSE_EDGE)
+    tally = Tally("wheel", ["spin"])
+    for size in chunks(trials):
+        tally.add(engine.multipliers[engine.spin(size, generator)][None])
+    return tally.rows()
+
+
+def cases(trials, generator):
+    cumulative = np.cumsum([item["chance"] for item in CASE_MULTIPLIERS])
+    values = np.array([item["value"] for item in CASE_MULTIPLIERS])
+    tally = Tally("cases", ["case"])
+    for size in chunks(trials):
+        tally.add(values[draw(cumulative, size, generator)][None])
+    return tally.rows()
+
+
+def dice(trials, generator):
+    tally = Tally("dice", ["roll"])
+    for size in chunks(trials):
+        player, dealer = generator.integers(1, 7, (2, size))
+        tally.add(np.where(player > dealer, DICE_WIN_MULTIPLIER, np.where(player == dealer, DICE_TIE_MULTIPLIER, 0.0))[None])
+    return tally.rows()
+
+
+def limbo(trials, generator):
+    """Rolls through the cog's roll_multipliers, which uses NumPy's global generator."""
+    np.random.seed(generator.integers(2 ** 32))
+    targets = np.array(LIMBO_TARGETS)[:, None]
+    rows = []
+    for mode, roll_range in (("fixed", FIXED_ROLL_RANGE), ("auto", AUTO_ROLL_RANGE)):
+        tally = Tally("limbo", [f"{mode} {target:.2f}x" for target in LIMBO_TARGETS])
+        for size in chunks(trials):
+            tally.add(np.where(roll_multipliers(size, roll_range) >= targets, targets, 0.0))
+        rows += tally.rows()
+    return rows
+
+
+def keno(trials, generator):
+    """By symmetry the player's picks are numbers 0..picks-1."""
+    tables = [np.array([payouts.get(hits, 0.0) for hits in range(KENO_DRAWN + 1)]) for payouts in KENO_PAYOUTS.values()]
+    tally = Tally("keno", [f"{picks} picks" for picks in KENO_PAYOUTS])
+    for size in chunks(trials):
+        drawn = generator.random((size, KENO_NUMBERS)).argpartition(KENO_DRAWN, axis=1)[:, :KENO_DRAWN]
+        tally.add(np.stack([table[(drawn < picks).sum(axis=1)] for picks, table in zip(KENO_PAYOUTS, tables)]))
+    return tally.rows()
+
+
+def plinko_landing(rows, size, generator):
+    """PlinkoGame.simulate_ball_path for `size` balls at once."""
+    actual_rows = rows + 2
+    slots = rows + 1
+    position = generator.integers(0, 2, size)
+    for row in range(1, actual_rows):
+        left = np.clip(0.5 - 0.03 * np.abs(position - (row + 2) / 2), 0.0, 1.0)
+        position = np.minimum(position + (generator.random(size) >= left), row + 1)
+    return np.clip((position * (slots - 1) / actual_rows + 0.5).astype(int), 0, slots - 1)
+
+
+def plinko(trials, generator):
+    rows = []
+    names = next(iter(MULTIPLIER_TABLES.values()))
+    for name in names:
+        tables = {risk: np.array(MULTIPLIER_TABLES[risk][name]) for risk in MULTIPLIER_TABLES}
+        tally = Tally("plinko", [f"{risk} {name.replace('_', ' ')}" for risk in tables])
+        for size in chunks(trials):
+            landing = plinko_landing(int(name.split("_")[0]), size, generator)
+            tally.add(np.stack([table[landing] for table in tables.values()]))
+        rows += tally.rows()
+    return rows
+
+
+def baccarat(trials, generator):
+    values = np.array([min(rank, 10) % 10 for rank in range(1, 14) for _ in range(4)])
+    bets = list(BACCARAT_PAYOUTS)
+    tally = Tally("baccarat", bets)
+    for size in chunks(trials):
+        # The 4 lowest of 52 random keys, in key order, are the top of a shuffled deck
+        keys = generator.random((size, len(values)))
+        top = keys.argpartition(4, axis=1)[:, :4]
+        top = np.take_along_axis(top, np.take_along_axis(keys, top, axis=1).argsort(axis=1), axis=1)
+        cards = values[top]
+        player = (cards[:, 0] + cards[:, 1]) % 10
+        banker = (cards[:, 2] + cards[:, 3]) % 10
+        winner = np.where(player > banker, 0, np.where(banker > player, 1, 2))
+        tally.add(np.stack([np.where(winner == i, BACCARAT_PAYOUTS[bet], 0.0) for i, bet in enumerate(bets)]))
+    return tally.rows()
+
+
+def poker(trials, generator):
+    payouts = np.array([POKER_PAYTABLE[name] for name in HAND_NAMES], dtype=float)
+    tally = Tally("poker", ["no draw"])
+    for size in chunks(trials):
+        hands = generator.random((size, 52)).argpartition(5, axis=1)[:, :5]
+        tally.add(payouts[hand_indexes(evaluate_batch(hands))][None])
+    return tally.rows()
+
+
+def race(trials, generator):
+    moves = np.array(CAR_MOVES)
+    tally = Tally("race", [f"car {car + 1}" for car in range(CARS)])
+    for size in chunks(trials):
+        positions = np.zeros((size, CARS), dtype=int)
+        winner = np.full(size, -1)
+        while (winner < 0).any():
+            racing = np.flatnonzero(winner < 0)
+            # Cars move in order and the first across the line ends the tick
+            for car in range(CARS):
+                racing = racing[winner[racing] < 0]
+                positions[racing, car] += moves[generator.integers(0, len(moves), len(racing))]
+                winner[racing[positions[racing, car] >= TRACK_LENGTH]] = car
+        tally.add(np.stack([np.where(winner == car, RACE_MULTIPLIER, 0.0) for car in range(CARS)]))
+    return tally.rows()
+
+
+def match(trials, generator):
+    tiles = np.array([MATCH_MULTIPLIERS.index(tile) for tile in board_tiles()])
+    multipliers = np.array(MATCH_MULTIPLIERS)
+    tally = Tally("match", ["board"])
+    for size in chunks(trials):
+        order = tiles[generator.random((size, len(tiles))).argsort(axis=1)]
+        # Reveal index at which each multiplier shows for the third time
+        third = np.stack([((order == i).cumsum(axis=1) == 3).argmax(axis=1) for i in range(len(multipliers))], axis=1)
+        tally.add(multipliers[third.argmin(axis=1)][None])
+    return tally.rows()
+
+
+GAMES = {
+    "baccarat": baccarat,
+    "cases": cases,
+    "dice": dice,
+    "keno": keno,
+    "limbo": limbo,
+    "match": match,
+    "plinko": plinko,
+    "poker": poker,
+    "race": race,
+    "slots": slots,
+    "wheel": wheel,
+}
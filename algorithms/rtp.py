@@ -0,0 +1,139 @@
+"""
+Return-to-player report for every game, from the live payout tables.
+
+Prints the exact RTP of each game (algorithms.exact) and checks it
+against a NumPy Monte Carlo replay of the game (algorithms.montecarlo)
+with a 95% confidence interval. Variants paying back more than they take
+are flagged.
+
+    python -m algorithms.rtp [--games plinko,keno] [--trials 10000000] [--all]
+
+As a regression test, --check exits with status 1 when an exact RTP
+moved from algorithms/rtp_baseline.json (a payout table or game rule
+changed) or a simulation disagrees with its exact RTP by more than
+4 standard errors; --update-baseline rewrites the baseline after an
+intended change. tests/test_rtp.py runs the same checks under pytest.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from algorithms import exact, montecarlo
+
+BASELINE = os.path.join(os.path.dirname(__file__), "rtp_baseline.json")
+EXACT_TOLERANCE = 1e-9
+MAX_Z = 4.0
+
+
+def exact_rtps(games):
+    """{game: {variant: rtp}} for the given games."""
+    rtps = {}
+    for game in games:
+        for name, variant, rtp in exact.GAMES[game]():
+            rtps.setdefault(name, {})[variant] = rtp
+    return rtps
+
+
+def print_exact(game, rtps, show_all):
+    values = list(rtps.values())
+    favorable = [variant for variant, rtp in rtps.items() if rtp > 1]
+    if show_all or len(values) == 1:
+        for variant, rtp in rtps.items():
+            flag = "  player-favorable" if rtp > 1 else ""
+            print(f"{game:>14} {variant:<24} {rtp:10.6f} {1 - rtp:+10.4%}{flag}")
+        return
+    print(
+        f"{game:>14} {len(values)} variants: RTP {min(values):.6f} to {max(values):.6f}"
+        + (f", {len(favorable)} player-favorable (e.g. {favorable[0]})" if favorable else "")
+    )
+
+
+def compare_baseline(rtps, baseline):
+    """Lines describing every exact RTP that differs from the baseline."""
+    problems = []
+    for game, variants in rtps.items():
+        expected = baseline.get(game)
+        if expected is None:
+            problems.append(f"{game}: not in the baseline")
+            continue
+        for variant in sorted(set(variants) | set(expected)):
+            if variant not in variants or variant not in expected:
+                problems.append(f"{game} {variant}: {'added' if variant not in expected else 'removed'}")
+            elif abs(variants[variant] - expected[variant]) > EXACT_TOLERANCE:
+                problems.append(f"{game} {variant}: {expected[variant]:.9f} -> {variants[variant]:.9f}")
+    return problems
+
+
+def run_simulations(games, rtps, trials, generator):
+    """Prints every simulated variant next to its exact RTP; returns the ones that disagree."""
+    problems = []
+    for game in games:
+        if game not in montecarlo.GAMES:
+            continue
+        start = time.perf_counter()
+        rows = montecarlo.GAMES[game](trials, generator)
+        elapsed = time.perf_counter() - start
+        for name, variant, mean, error in rows:
+            expected = rtps[name][variant]
+            z = (mean - expected) / error if error else (0.0 if mean == expected else float("inf"))
+            flag = "" if abs(z) <= MAX_Z else "  MISMATCH"
+            print(f"{name:>14} {variant:<24} {expected:10.6f} {mean:10.6f} ±{1.96 * error:.6f} {z:+6.2f}{flag}")
+            if flag:
+                problems.append(f"{name} {variant}: simulated {mean:.6f} ± {1.96 * error:.6f}, exact {expected:.6f}")
+        print(f"{'':>14} ({trials:,} rounds in {elapsed:.1f}s)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact and Monte Carlo RTP of every game.")
+    parser.add_argument("--games", help="comma separated games (default: all)")
+    parser.add_argument("--trials", type=int, default=10_000_000, help="simulated rounds per game (0 skips simulation)")
+    parser.add_argument("--seed", type=int, help="seed for the simulations")
+    parser.add_argument("--all", action="store_true", help="print every variant, not a range per game")
+    parser.add_argument("--check", action="store_true", help="exit 1 on a baseline change or a simulation mismatch")
+    parser.add_argument("--update-baseline", action="store_true", help="write the exact RTPs to the baseline")
+    args = parser.parse_args()
+
+    games = args.games.split(",") if args.games else list(exact.GAMES)
+    unknown = [game for game in games if game not in exact.GAMES]
+    if unknown:
+        parser.error(f"unknown games: {', '.join(unknown)}")
+
+    rtps = exact_rtps(games)
+    print("Exact RTP (house edge)")
+    for game, variants in rtps.items():
+        print_exact(game, variants, args.all)
+
+    problems = []
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE):
+            with open(BASELINE) as f:
+                baseline = json.load(f)
+        baseline.update(rtps)
+        with open(BASELINE, "w") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+        print(f"Wrote {BASELINE}")
+    elif args.check:
+        with open(BASELINE) as f:
+            problems += compare_baseline(rtps, json.load(f))
+
+    if args.trials > 0:
+        print(f"\n{'game':>14} {'variant':<24} {'exact':>10} {'simulated':>10} {'95% CI':>9} {'z':>6}")
+        problems += run_simulations(games, rtps, args.trials, np.random.default_rng(args.seed))
+
+    if problems:
+        print("\nRTP check failed:")
+        for problem in problems:
+            print(f"  {problem}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: bets/sec per Mongo connection for the bet debit path.
+
+Compares the old process_bet_amount sequence (fetch, $inc points, $set xp/level,
+$set rakeback, $set rank, notifier fetch) with the single conditional
+find_one_and_update used now.
+
+Runs against a scratch database on the MONGO server, using one connection:
+
+    python -m benchmarks.bet_debit [bets]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from pymongo import AsyncMongoClient, ReturnDocument
+
+from Cogs.utils.currency_helper import BET_PROJECTION, apply_bet_progression, bet_debit_pipeline
+
+BENCH_DB = os.getenv("BENCH_DB", "BetSyncBench")
+USER_ID = 1
+BET = 3.0
+
+
+async def legacy_bet(collection):
+    """The round trips process_bet_amount used to make for one bet."""
+    if await collection.count_documents({"discord_id": USER_ID}):
+        user_data = await collection.find_one({"discord_id": USER_ID})
+    if user_data["points"] < BET:
+        return False
+    await collection.update_one({"discord_id": USER_ID}, {"$inc": {"points": -BET}})
+    progression = apply_bet_progression(user_data, BET)
+    await collection.update_one(
+        {"discord_id": USER_ID},
+        {"$set": {"xp": progression["new_xp"], "level": progression["new_level"]}}
+    )
+    if progression["rakeback_amount"] > 0:
+        await collection.update_one(
+            {"discord_id": USER_ID},
+            {"$set": {"rakeback_tokens": user_data.get("rakeback_tokens", 0) + progression["rakeback_amount"]}}
+        )
+    if progression["rank_changed"]:
+        await collection.update_one({"discord_id": USER_ID}, {"$set": {"rank": progression["new_rank"]}})
+    # Notifier.bet_event re-read the user
+    if await collection.count_documents({"discord_id": USER_ID}):
+        await collection.find_one({"discord_id": USER_ID})
+    return True
+
+
+async def atomic_bet(collection):
+    """The single conditional debit process_bet_amount makes now."""
+    user_data = await collection.find_one_and_update(
+        {"discord_id": USER_ID, "points": {"$gte": BET}},
+        bet_debit_pipeline(BET),
+        projection=BET_PROJECTION,
+        return_document=ReturnDocument.BEFORE
+    )
+    return user_data is not None
+
+
+async def run(name, bet_fn, collection, bets):
+    await collection.delete_many({})
+    await collection.insert_one({
+        "discord_id": USER_ID, "points": BET * bets, "xp": 0, "level": 1, "rank": 0,
+        "rakeback_tokens": 0, "primary_coin": "BTC", "wallet": {"BTC": 0},
+        "history": [{"game": "bench", "amount": BET}] * 100
+    })
+    start = time.perf_counter()
+    for _ in range(bets):
+        await bet_fn(collection)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>8}: {bets / elapsed:10.1f} bets/sec ({elapsed / bets * 1000:.3f} ms/bet)")
+
+
+async def main():
+    bets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    client = AsyncMongoClient(os.environ["MONGO"], maxPoolSize=1)
+    collection = client[BENCH_DB]["users"]
+    try:
+        await run("legacy", legacy_bet, collection, bets)
+        await run("atomic", atomic_bet, collection, bets)
+    finally:
+        await client.drop_database(BENCH_DB)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark: Limbo rolls/sec for one player, rolling one at a time versus in
+batches of N per display tick.
+
+The per-roll path is what auto mode used to do for every roll: read the
+balance, write the debit, roll, then credit the payout and push a history
+entry. A batch debits N bets with one conditional update, rolls them with
+roll_multipliers and credits them with one update and one history entry,
+as authorize_bets and settlement.settle_rounds do now. Display ticks
+(sleeping and editing the message) are left out.
+
+Runs against a scratch database on the MONGO server, using one connection:
+
+    python -m benchmarks.limbo_rolls [rolls]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+from pymongo import AsyncMongoClient, ReturnDocument
+
+from Cogs.utils.currency_helper import BET_PROJECTION, bet_debit_pipeline
+from Cogs.utils.paytables import LIMBO_AUTO_ROLL_RANGE as AUTO_ROLL_RANGE, roll_multipliers
+
+BENCH_DB = os.getenv("BENCH_DB", "BetSyncBench")
+USER_ID = 1
+BET = 1.0
+TARGET = 2.0
+
+
+async def credit(collection, bet, payout, rounds):
+    await collection.find_one_and_update(
+        {"discord_id": USER_ID},
+        {"$inc": {"points": payout, "total_played": rounds, "total_spent": bet, "total_earned": payout}},
+        projection={"points": 1, "primary_coin": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    await collection.update_one(
+        {"discord_id": USER_ID},
+        {"$push": {"history": {"$each": [{"game": "limbo", "bet": bet, "amount": payout}], "$slice": -100}}}
+    )
+
+
+async def per_roll(collection, rolls):
+    """One read, one debit and one credit per roll."""
+    for _ in range(rolls):
+        user_data = await collection.find_one({"discord_id": USER_ID}, {"points": 1})
+        if user_data["points"] < BET:
+            return
+        await collection.update_one({"discord_id": USER_ID}, {"$inc": {"points": -BET}})
+        rolled = round(1.0 / (1.0 - random.random() * AUTO_ROLL_RANGE), 2)
+        payout = BET * TARGET if rolled >= TARGET else 0
+        await credit(collection, BET, payout, 1)
+
+
+def batched(batch):
+    async def run_batches(collection, rolls):
+        """One guarded debit and one credit per batch of rolls."""
+        for _ in range(0, rolls, batch):
+            user_data = await collection.find_one_and_update(
+                {"discord_id": USER_ID, "points": {"$gte": BET * batch}},
+                bet_debit_pipeline(BET * batch),
+                projection=BET_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
+            if user_data is None:
+                return
+            multipliers = roll_multipliers(batch, AUTO_ROLL_RANGE)
+            payout = float((multipliers >= TARGET).sum()) * BET * TARGET
+            await credit(collection, BET * batch, payout, batch)
+    return run_batches
+
+
+async def run(name, roll_fn, collection, rolls):
+    await collection.delete_many({})
+    await collection.insert_one({
+        "discord_id": USER_ID, "points": BET * rolls, "xp": 0, "level": 1, "rank": 0,
+        "rakeback_tokens": 0, "primary_coin": "BTC", "wallet": {"BTC": 0},
+        "history": [{"game": "bench", "amount": BET}] * 100
+    })
+    start = time.perf_counter()
+    await roll_fn(collection, rolls)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>10}: {rolls / elapsed:10.1f} rolls/sec ({elapsed / rolls * 1000:.3f} ms/roll)")
+
+
+async def main():
+    rolls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    client = AsyncMongoClient(os.environ["MONGO"], maxPoolSize=1)
+    collection = client[BENCH_DB]["users"]
+    try:
+        await run("per roll", per_roll, collection, rolls)
+        for batch in (1, 10, 100):
+            await run(f"batch {batch}", batched(batch), collection, rolls)
+    finally:
+        await client.drop_database(BENCH_DB)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
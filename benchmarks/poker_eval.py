@@ -0,0 +1,102 @@
+"""
+Benchmark: poker hands evaluated per second, the string/Counter evaluator
+the poker cog used to have versus the lookup-table evaluator, one hand at
+a time and in NumPy batches, for 5 and 7 cards.
+
+The legacy 5-card column reproduces Poker.evaluate_hand as it was. It
+only names the hand type and cannot rank hands against each other, so
+it has no 7-card column.
+
+No database or bot is needed:
+
+    MONGO=mongodb://localhost:1 python -m benchmarks.poker_eval [hands]
+"""
+import sys
+import time
+
+import numpy as np
+
+from Cogs.games.poker import RANKS, SUITS
+from Cogs.utils.poker_eval import evaluate, evaluate_batch, hand_name, hand_indexes
+
+FACE_VALUES = {"A": 14, "K": 13, "Q": 12, "J": 11}
+
+
+def legacy_evaluate_hand(cards):
+    """Poker.evaluate_hand before the lookup tables."""
+    ranks = [card[0] for card in cards]
+    suits = [card[1] for card in cards]
+    rank_values = [FACE_VALUES[rank] if rank in FACE_VALUES else int(rank) for rank in ranks]
+
+    rank_counts = {}
+    for r in rank_values:
+        if r in rank_counts:
+            rank_counts[r] += 1
+        else:
+            rank_counts[r] = 1
+
+    is_flush = len(set(suits)) == 1
+    sorted_values = sorted(rank_values)
+    is_straight = False
+    if sorted_values == list(range(sorted_values[0], sorted_values[0] + 5)):
+        is_straight = True
+    elif sorted_values == [2, 3, 4, 5, 14]:
+        is_straight = True
+
+    if is_flush and sorted_values == [10, 11, 12, 13, 14]:
+        return "Royal Flush"
+    if is_straight and is_flush:
+        return "Straight Flush"
+    if 4 in rank_counts.values():
+        return "Four of a Kind"
+    if 3 in rank_counts.values() and 2 in rank_counts.values():
+        return "Full House"
+    if is_flush:
+        return "Flush"
+    if is_straight:
+        return "Straight"
+    if 3 in rank_counts.values():
+        return "Three of a Kind"
+    if list(rank_counts.values()).count(2) == 2:
+        return "Two Pair"
+    if 2 in rank_counts.values():
+        return "One Pair"
+    return "High Card"
+
+
+def hands_per_sec(evaluate_all, count):
+    start = time.perf_counter()
+    evaluate_all()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    generator = np.random.default_rng()
+    dealt = generator.random((count, 52)).argsort(axis=1)[:, :7]
+    fives = dealt[:, :5]
+    five_lists = fives.tolist()
+    seven_lists = dealt.tolist()
+    legacy_cards = [[(RANKS[card // 4], SUITS[card % 4]) for card in hand] for hand in five_lists]
+
+    # Both evaluators must name every hand the same way
+    names = [hand_name(strength) for strength in evaluate_batch(fives).tolist()]
+    assert names == [legacy_evaluate_hand(cards) for cards in legacy_cards]
+
+    rows = [
+        ("5 cards", "legacy", lambda: [legacy_evaluate_hand(cards) for cards in legacy_cards]),
+        ("5 cards", "lookup", lambda: [evaluate(hand) for hand in five_lists]),
+        ("5 cards", "batch", lambda: hand_indexes(evaluate_batch(fives))),
+        ("7 cards", "lookup", lambda: [evaluate(hand) for hand in seven_lists]),
+        ("7 cards", "batch", lambda: evaluate_batch(dealt)),
+    ]
+    baseline = {}
+    print(f"{'hand':>8} {'evaluator':>10} {'hands/s':>12} {'speedup':>8}")
+    for size, name, evaluate_all in rows:
+        rate = hands_per_sec(evaluate_all, count)
+        baseline.setdefault(size, rate)
+        print(f"{size:>8} {name:>10} {rate:>12.0f} {rate / baseline[size]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: frame time per game renderer with a cold asset atlas versus a
+preloaded one.
+
+Before the atlas every frame opened its fonts with ImageFont.truetype and
+read and rescaled its card PNGs from disk. The cold column reproduces that
+by clearing the atlas before each frame; the warm column is what a render
+worker does after atlas.preload().
+
+Runs the renderers in-process, from the repository root (fonts and
+assests/ are looked up relative to it):
+
+    MONGO=mongodb://localhost:1 python -m benchmarks.render_assets [frames]
+"""
+import sys
+import time
+
+from Cogs.games.blackjack import render_table
+from Cogs.games.carddraw import render_duel
+from Cogs.games.cases import render_case_result
+from Cogs.games.hilo import render_game_image
+from Cogs.games.keno import render_keno_board, render_mini_paytable
+from Cogs.games.limbo import render_multiplier
+from Cogs.games.plinko import render_board
+from Cogs.games.poker import render_hand
+from Cogs.utils.assets import atlas
+
+# One representative frame per game
+FRAMES = {
+    "blackjack": (render_table, ([("10", "hearts"), ("A", "spades")], [("K", "clubs"), ("7", "diamonds")], False)),
+    "hilo": (render_game_image, ((12, "hearts"), 1.08, 12.0, 1.0, 0)),
+    "poker": (render_hand, ([("A", "spades"), ("K", "spades"), ("Q", "spades"), ("J", "spades"), ("10", "spades")], [True] * 5, True, "Royal Flush")),
+    "carddraw": (render_duel, ("player1", "player2", ("Q", "hearts"), ("4", "clubs"))),
+    "limbo": (render_multiplier, (3.57, True, 2.0)),
+    "cases": (render_case_result, ({"value": 3.0, "chance": 0.04, "emoji": "", "name": "RARE", "color": (255, 69, 0)}, "roboto.ttf")),
+    "keno": (render_keno_board, ([3, 14, 22, 35, 40], [1, 3, 9, 14, 18, 22, 27, 31, 33, 38], True)),
+    "keno_paytable": (render_mini_paytable, (5,)),
+    "plinko": (render_board, (16, "medium_risk", [[0, 1, 1, 2, 3, 3, 4, 4, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10]])),
+}
+
+
+def frame_ms(renderer, args, frames, cold):
+    """Mean milliseconds per frame, including PNG encoding."""
+    renderer(*args)  # warm PIL plugins and, for the warm run, the atlas
+    total = 0.0
+    for _ in range(frames):
+        if cold:
+            atlas.clear()
+        start = time.perf_counter()
+        renderer(*args)
+        total += time.perf_counter() - start
+    return total / frames * 1000
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'game':>14} {'cold ms':>9} {'warm ms':>9} {'speedup':>8}")
+    for name, (renderer, args) in FRAMES.items():
+        cold = frame_ms(renderer, args, frames, True)
+        warm = frame_ms(renderer, args, frames, False)
+        print(f"{name:>14} {cold:>9.2f} {warm:>9.2f} {cold / warm:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
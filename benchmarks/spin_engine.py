@@ -0,0 +1,108 @@
+"""
+Benchmark: Slots and Wheel spins/sec, one spin at a time versus the
+batched NumPy engine.
+
+The per-spin columns reproduce how the cogs used to play: 15
+random.choices calls and a Python payline scan per slot spin, and a
+random.choice over the 1000-entry expanded color list per wheel spin.
+The batch columns draw and score all spins of a command with one
+SlotsEngine.spin / WheelEngine.spin call and total the winnings, then
+build what the cogs display: the last slot spin's grid and lines, and
+every wheel spin's result.
+
+No database or bot is needed:
+
+    MONGO=mongodb://localhost:1 python -m benchmarks.spin_engine [repeats]
+"""
+import random
+import sys
+import time
+
+from Cogs.utils.paytables import SLOTS_HOUSE_EDGE, SLOTS_SYMBOLS as SYMBOLS, WHEEL_COLORS as COLORS, WHEEL_HOUSE_EDGE
+from Cogs.utils.spin_engine import SlotsEngine, WheelEngine
+
+BET = 1.0
+SPIN_COUNTS = (1, 10, 1000)
+
+
+def legacy_slots_spin():
+    """generate_slot_result + calculate_winnings as the cog had them."""
+    symbol_list = list(SYMBOLS)
+    weights = [data["weight"] for data in SYMBOLS.values()]
+    symbols = [random.choices(symbol_list, weights=weights)[0] for _ in range(15)]
+    grid = [symbols[i:i + 5] for i in range(0, 15, 5)]
+    lines = [(f"Row {row_idx + 1}", row, [row_idx * 5 + i for i in range(5)]) for row_idx, row in enumerate(grid)]
+    lines += [(f"Column {col + 1}", [grid[row][col] for row in range(3)], [col + row * 5 for row in range(3)]) for col in range(5)]
+    total_multiplier = 0
+    winning_combinations = []
+    winning_positions = set()
+    for line_name, line, positions in lines:
+        for symbol, data in SYMBOLS.items():
+            count = line.count(symbol)
+            if count >= 3:
+                multiplier = data["payout"] * {3: 1.0, 4: 1.3, 5: 2.0}[count]
+                total_multiplier += multiplier
+                winning_combinations.append({
+                    "symbol": symbol, "count": count, "multiplier": multiplier,
+                    "line": line_name, "rarity": data["rarity"]
+                })
+                winning_positions.update(pos for i, pos in enumerate(positions) if line[i] == symbol)
+    multiplier = total_multiplier * (1 - SLOTS_HOUSE_EDGE)
+    return {
+        "symbols": symbols, "winnings": BET * multiplier, "combinations": winning_combinations,
+        "multiplier": multiplier, "winning_positions": list(winning_positions)
+    }
+
+
+def legacy_wheel_spin(weighted_colors, spin_num):
+    """One iteration of the old start_wheel_spin loop."""
+    color = random.choice(weighted_colors)
+    multiplier = COLORS[color]["multiplier"] * (1 - WHEEL_HOUSE_EDGE)
+    return {
+        "color": color, "emoji": COLORS[color]["emoji"], "multiplier": multiplier,
+        "actual_multiplier": multiplier, "winnings": BET * multiplier,
+        "spin_number": spin_num + 1, "name": COLORS[color]["name"]
+    }
+
+
+def play_slots_batch(engine, spins):
+    spun = engine.spin(spins)
+    return spun.winnings(BET).sum(), spun.result(spins - 1, BET)
+
+
+def spins_per_sec(play, spins, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        play(spins)
+    return spins * repeats / (time.perf_counter() - start)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    slots = SlotsEngine(SYMBOLS, SLOTS_HOUSE_EDGE)
+    wheel = WheelEngine(COLORS, WHEEL_HOUSE_EDGE)
+    weighted_colors = [color for color, data in COLORS.items() for _ in range(int(data["chance"] * 10))]
+
+    games = {
+        "slots": (
+            lambda spins: [legacy_slots_spin() for _ in range(spins)],
+            lambda spins: play_slots_batch(slots, spins),
+        ),
+        "wheel": (
+            lambda spins: [legacy_wheel_spin(weighted_colors, spin_num) for spin_num in range(spins)],
+            lambda spins: wheel.results(wheel.spin(spins), BET),
+        ),
+    }
+
+    print(f"{'game':>6} {'spins':>6} {'per-spin/s':>12} {'batch/s':>12} {'speedup':>8}")
+    for name, (legacy, batched) in games.items():
+        for spins in SPIN_COUNTS:
+            # Fewer repeats for the big batches so every row takes about as long
+            count = max(1, repeats * 10 // spins)
+            before = spins_per_sec(legacy, spins, count)
+            after = spins_per_sec(batched, spins, count)
+            print(f"{name:>6} {spins:>6} {before:>12.0f} {after:>12.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: bytes transferred and BSON decode time per bet, full user
+documents versus the USER_VIEWS projections.
+
+Before projections a bet read the full user document three times
+(process_bet_amount, Notifier.bet_event and Servers.update_server_profit).
+Now the bet debit returns the progression+wallet fields and
+update_server_profit reads the wallet view.
+
+Runs offline against a representative document with a full history array:
+
+    python -m benchmarks.user_projection [iterations]
+"""
+import datetime
+import sys
+import time
+
+import bson
+
+from Cogs.utils.currency_helper import BET_PROJECTION
+from Cogs.utils.mongo import USER_VIEWS
+
+
+def sample_user():
+    """A long-time player: full 100-entry history and every tracked field."""
+    now = datetime.datetime.now()
+    return {
+        "_id": bson.ObjectId(),
+        "discord_id": 123456789012345678,
+        "name": "player",
+        "points": 1520.75,
+        "primary_coin": "LTC",
+        "wallet": {"BTC": 0, "SOL": 0, "ETH": 0, "LTC": 0.349, "USDT": 0},
+        "history": [
+            {"type": "win" if i % 2 else "loss", "game": "mines", "bet": 10.0, "amount": 19.6,
+             "multiplier": 1.96, "timestamp": now}
+            for i in range(100)
+        ],
+        "total_deposit_amount": 5000, "total_withdraw_amount": 1200, "total_spent": 40210.5,
+        "total_earned": 39880.25, "total_played": 4021, "total_won": 1980, "total_lost": 2041,
+        "xp": 14.5, "level": 88, "rank": 45, "rakeback_tokens": 31.2,
+        "ltc_address": "ltc1q" + "x" * 38, "processed_ltc_txids": ["f" * 64] * 20,
+    }
+
+
+def project(document, projection):
+    """Apply an inclusion projection the way the server would."""
+    if projection is None:
+        return document
+    return {k: v for k, v in document.items() if k == "_id" or projection.get(k)}
+
+
+def measure(document, iterations):
+    """Encoded size in bytes and mean decode time in microseconds."""
+    raw = bson.encode(document)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        bson.decode(raw)
+    return len(raw), (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    user = sample_user()
+
+    print(f"{'view':>12} {'bytes':>8} {'decode us':>10}")
+    results = {}
+    for name, projection in list(USER_VIEWS.items()) + [("bet_debit", BET_PROJECTION)]:
+        results[name] = measure(project(user, projection), iterations)
+        size, decode = results[name]
+        print(f"{name:>12} {size:>8} {decode:>10.2f}")
+
+    before = [results["full"]] * 3
+    after = [results["bet_debit"], results["wallet"]]
+    for label, reads in (("before", before), ("after", after)):
+        print(f"{label:>6}: {sum(r[0] for r in reads):>7} bytes/bet, {sum(r[1] for r in reads):8.2f} us decode/bet")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,21 @@
 import datetime
 import os
 import time
-os.system("pip uninstall discord.py discord py-cord -y && pip install py-cord")
-time.sleep(3)
-os.system("clear")
+# Render workers import this file as __mp_main__; only the bot process reinstalls, starts workers and runs
+if __name__ == "__main__":
+    os.system("pip uninstall discord.py discord py-cord -y && pip install py-cord")
+    time.sleep(3)
+    os.system("clear")
 import discord
 import asyncio
 from colorama import Fore, Back, Style
 from discord.ext import commands
 from pymongo import ReturnDocument
-from Cogs.utils.mongo import Users, Servers
+from Cogs.utils.mongo import Users, Servers, ensure_indexes, write_behind, usernames
+from Cogs.utils.http_client import http
+from Cogs.utils.price_oracle import price_oracle
+from Cogs.utils.render_service import render_service
+from Cogs.utils.assets import atlas
 from Cogs.utils.emojis import emoji
 from dotenv import load_dotenv
 
@@ -34,9 +40,24 @@ if not os.environ.get('TOKEN'):
     print(f"{Fore.YELLOW}[*] {Fore.WHITE}Please make sure you have added a TOKEN secret in the Secrets tab.")
     exit(1)
 
+# Start the render workers before anything starts threads
+if __name__ == "__main__":
+    render_service.start()
+
+class BetSyncBot(commands.Bot):
+    async def close(self):
+        # Write out queued history/profit bookkeeping before disconnecting
+        await usernames.stop()
+        await write_behind.stop()
+        await price_oracle.stop()
+        await http.close()
+        render_service.close()
+        await super().close()
+
+
 # Initialize bot with intents
 intents = discord.Intents.all()
-bot = commands.Bot(command_prefix=["!", "."], intents=intents, case_insensitive=True)
+bot = BetSyncBot(command_prefix=["!", "."], intents=intents, case_insensitive=True)
 bot.remove_command("help")
 
 # List of cogs to load
@@ -85,9 +106,8 @@ async def on_guild_join(guild):
             },
             "giveaway_channel": None,
             "server_admins": [],
-            "server_bet_history": [],
         }
-        resp = db.new_server(dump)
+        resp = await db.new_server(dump)
         if resp:
             print(f"{Fore.GREEN}[+] {Fore.WHITE}New Server Registered: {Fore.GREEN}{guild.name} ({guild.id}){Fore.WHITE}")
             rn = datetime.datetime.now().strftime("%X")
@@ -97,6 +117,8 @@ async def on_guild_join(guild):
 
 @bot.event
 async def on_command(ctx):
+    usernames.observe(ctx.author)
+
     # Check if user is blacklisted
     async def bg():
         try:
@@ -112,7 +134,7 @@ async def on_command(ctx):
 
         # Register new user if needed
             db = Users()
-            if not db.fetch_user(ctx.author.id):
+            if not await db.fetch_user(ctx.author.id, "balance"):
                 dump = {
                 "discord_id": ctx.author.id,
                 "name": ctx.author.name,
@@ -138,7 +160,7 @@ async def on_command(ctx):
                 'rank': 0,
                 'rakeback_tokens': 0
                 }
-                db.register_new_user(dump)
+                await db.register_new_user(dump)
                 rn = datetime.datetime.now().strftime("%X")
                 print(f"{Back.CYAN}  {Style.DIM}{ctx.author.id}{Style.RESET_ALL}{Back.RESET}{Fore.CYAN}{Fore.WHITE}    {Fore.LIGHTWHITE_EX}{rn}{Fore.WHITE}    {Style.BRIGHT}{Fore.GREEN}{dump}{Style.RESET_ALL}  {Fore.MAGENTA}new_user{Fore.WHITE}")
                 #print(f"{Fore.GREEN}[+] {Fore.WHITE}New User Registered: {Fore.GREEN}{ctx.author.name} ({ctx.author.id}){Fore.WHITE}")
@@ -162,6 +184,12 @@ async def on_command(ctx):
     await bg_task
 
 
+@bot.event
+async def on_user_update(before, after):
+    if before.name != after.name:
+        usernames.observe(after)
+
+
 @bot.event
 async def on_ready():
     try:
@@ -171,6 +199,20 @@ async def on_ready():
         # Set bot status
         await bot.change_presence(activity=discord.Game(name="!help | BetSync Casino"))
 
+        # Create and verify database indexes before any cog starts querying
+        print(f"{Fore.CYAN}[*] {Fore.WHITE}Ensuring database indexes...")
+        await ensure_indexes()
+
+        # Keep USD prices warm so price lookups never wait on CoinGecko
+        price_oracle.start()
+
+        # Load known usernames and record everyone the gateway already gave us
+        await usernames.warm(bot)
+
+        # Render workers load fonts and card faces in their fork server; renders drawn in this process need them here
+        if render_service.workers == 0:
+            await asyncio.to_thread(atlas.preload)
+
         # Load cogs
         print(f"{Fore.CYAN}[*] {Fore.WHITE}Loading cogs...")
         for cog in cogs:
@@ -201,10 +243,11 @@ async def on_ready():
         print(f"{Fore.RED}[!] {Fore.WHITE}Error in on_ready: {Fore.RED}{e}")
 
 # Start the bot
-print(f"{Fore.CYAN}[*] {Fore.WHITE}Starting bot...")
-try:
-    bot.run(os.environ['TOKEN'])
-except discord.errors.LoginFailure:
-    print(f"{Fore.RED}[!] {Fore.WHITE}ERROR: Invalid token provided. Please check your TOKEN in the Secrets tab.")
-except Exception as e:
-    print(f"{Fore.RED}[!] {Fore.WHITE}Error starting bot: {Fore.RED}{e}")
\ No newline at end of file
+if __name__ == "__main__":
+    print(f"{Fore.CYAN}[*] {Fore.WHITE}Starting bot...")
+    try:
+        bot.run(os.environ['TOKEN'])
+    except discord.errors.LoginFailure:
+        print(f"{Fore.RED}[!] {Fore.WHITE}ERROR: Invalid token provided. Please check your TOKEN in the Secrets tab.")
+    except Exception as e:
+        print(f"{Fore.RED}[!] {Fore.WHITE}Error starting bot: {Fore.RED}{e}")
\ No newline at end of file
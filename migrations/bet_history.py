@@ -0,0 +1,153 @@
+"""
+Migration: move embedded bet history into the bet_history collection.
+
+Copies every bet outcome (BET_HISTORY_TYPES) out of users.history and every
+entry of servers.server_bet_history into bet_history, then removes the
+copied entries from the source documents. Deposits, withdrawals, tips and
+rewards stay in users.history.
+
+Record ids are derived from the owner and the entry itself, so an
+interrupted run can simply be started again without duplicating history.
+Only bet outcomes are pulled from users.history, so it is safe to run while
+the bot is up:
+
+    python -m migrations.bet_history [--dry-run] [--keep-embedded]
+"""
+import argparse
+import asyncio
+import datetime
+import hashlib
+
+import bson
+from bson import ObjectId
+from colorama import Fore
+from pymongo.errors import BulkWriteError
+
+from Cogs.utils.mongo import BET_HISTORY_TYPES, BetHistory, ensure_indexes, history_timestamp, mongodb
+
+BATCH_SIZE = 500
+# Time part of the id of an entry without a parseable timestamp, so its id is the same on every run
+UNDATED = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
+
+
+def record_id(owner_field, owner_id, index, entry):
+    """
+    A stable ObjectId for an embedded entry: its timestamp plus a hash of
+    where it came from. Nothing in it depends on when the migration runs.
+    """
+    ts = int(history_timestamp(entry, default=UNDATED).timestamp())
+    digest = hashlib.sha1(f"{owner_field}:{owner_id}:{index}:".encode() + bson.encode(entry)).digest()
+    # ObjectIds hold 4 bytes of seconds
+    return ObjectId(min(max(ts, 0), 2 ** 32 - 1).to_bytes(4, "big") + digest[:8])
+
+
+async def insert_records(collection, records):
+    """Insert a batch, treating records copied by an earlier run as done."""
+    if not records:
+        return 0
+    try:
+        result = await collection.insert_many(records, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        unexpected = [error for error in errors if error.get("code") != 11000]
+        if unexpected:
+            raise
+        return len(records) - len(errors)
+
+
+async def migrate(source_name, owner_key, owner_field, history_field, is_bet, prune, dry_run):
+    """
+    Copies one collection's embedded history arrays into bet_history.
+
+    Args:
+        source_name (str): "users" or "servers".
+        owner_key (str): The source document's ID field.
+        owner_field (str): "user_id" or "server_id" on the bet_history record.
+        history_field (str): The embedded array to read.
+        is_bet (callable): Selects which entries move.
+        prune (dict): Update that removes the moved entries from a document.
+        dry_run (bool): Count only, write nothing.
+
+    Returns:
+        tuple: (documents touched, records copied)
+    """
+    db = mongodb["BetSync"]
+    source = db[source_name]
+    target = BetHistory().collection
+    documents = copied = 0
+    records, owners = [], []
+
+    async def flush():
+        nonlocal copied
+        copied += await insert_records(target, records)
+        # Only prune once the copies are safely in bet_history
+        if owners:
+            await source.update_many({owner_key: {"$in": owners}}, prune)
+        records.clear()
+        owners.clear()
+
+    cursor = source.find(
+        {f"{history_field}.0": {"$exists": True}},
+        {owner_key: 1, history_field: 1}
+    )
+    async for document in cursor:
+        owner_id = document.get(owner_key)
+        entries = [
+            (index, entry) for index, entry in enumerate(document.get(history_field) or [])
+            if isinstance(entry, dict) and is_bet(entry)
+        ]
+        if owner_id is None or not entries:
+            continue
+
+        documents += 1
+        if dry_run:
+            copied += len(entries)
+            continue
+
+        for index, entry in entries:
+            records.append(BetHistory.make_record(
+                owner_field, owner_id, entry, record_id(owner_field, owner_id, index, entry)
+            ))
+        if prune:
+            owners.append(owner_id)
+        if len(records) >= BATCH_SIZE:
+            await flush()
+
+    if not dry_run:
+        await flush()
+    return documents, copied
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Move embedded bet history into the bet_history collection.")
+    parser.add_argument("--dry-run", action="store_true", help="count what would be moved without writing")
+    parser.add_argument("--keep-embedded", action="store_true", help="copy only, leave the embedded arrays in place")
+    args = parser.parse_args()
+
+    if not args.dry_run:
+        await ensure_indexes()
+
+    keep = args.keep_embedded
+    plans = [
+        ("users", "discord_id", "user_id", "history",
+         lambda entry: entry.get("type") in BET_HISTORY_TYPES,
+         None if keep else {"$pull": {"history": {"type": {"$in": list(BET_HISTORY_TYPES)}}}}),
+        ("servers", "server_id", "server_id", "server_bet_history",
+         lambda entry: True,
+         None if keep else {"$unset": {"server_bet_history": ""}}),
+    ]
+
+    try:
+        for source_name, owner_key, owner_field, history_field, is_bet, prune in plans:
+            documents, copied = await migrate(
+                source_name, owner_key, owner_field, history_field, is_bet, prune, args.dry_run
+            )
+            verb = "would copy" if args.dry_run else "copied"
+            print(f"{Fore.GREEN}[+] {Fore.WHITE}{source_name}.{history_field}: {verb} {Fore.GREEN}{copied}{Fore.WHITE} entries from {Fore.GREEN}{documents}{Fore.WHITE} documents")
+    finally:
+        await mongodb.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+import json
+
+import numpy as np
+import pytest
+
+from algorithms import exact, montecarlo
+from algorithms.rtp import BASELINE, MAX_Z, compare_baseline, exact_rtps
+
+# Enough rounds to catch a simulation that no longer matches its game, at a few seconds per game
+SIMULATED_ROUNDS = 200_000
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    with open(BASELINE) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("game", list(exact.GAMES))
+def test_exact_rtp_matches_baseline(game, baseline):
+    assert compare_baseline(exact_rtps([game]), baseline) == []
+
+
+@pytest.mark.parametrize("game", list(montecarlo.GAMES))
+def test_simulation_agrees_with_exact_rtp(game):
+    rtps = exact_rtps([game])
+    for name, variant, mean, error in montecarlo.GAMES[game](SIMULATED_ROUNDS, np.random.default_rng(0)):
+        assert abs(mean - rtps[name][variant]) <= MAX_Z * error + 1e-12, f"{name} {variant}"